@@ -0,0 +1,65 @@
+"""
+Time to split blocks into `AppendBlockChildrenRequest` batches: serializing the candidate request with `model_dump_json` after each added block vs. `AppendBlockChildrenRequest.plan`, which serializes each block once.
+
+Run with:
+
+    python -m benchmarks.bench_append_planner [--blocks N] [--max-bytes B]
+"""
+
+import time
+import uuid
+import argparse
+
+from pydantic import TypeAdapter
+
+from pydantic_api.notion.models import (
+    BlockObject,
+    MAX_APPEND_CHILDREN,
+    AppendBlockChildrenRequest,
+)
+
+from .fixtures import BLOCK_TYPES, PayloadGenerator
+
+PAGE_ID = str(uuid.uuid4())
+
+
+def _previous(blocks: list, max_bytes: int) -> list[AppendBlockChildrenRequest]:
+    requests = []
+    batch: list = []
+    for block in blocks:
+        batch.append(block)
+        request = AppendBlockChildrenRequest(block_id=PAGE_ID, children=batch)
+        if len(batch) > MAX_APPEND_CHILDREN or len(request.model_dump_json(exclude={"block_id"}).encode()) > max_bytes:  # fmt: skip
+            batch.pop()
+            requests.append(AppendBlockChildrenRequest(block_id=PAGE_ID, children=batch))  # fmt: skip
+            batch = [block]
+    if batch:
+        requests.append(AppendBlockChildrenRequest(block_id=PAGE_ID, children=batch))
+    return requests
+
+
+def _planned(blocks: list, max_bytes: int) -> list[AppendBlockChildrenRequest]:
+    return list(AppendBlockChildrenRequest.plan(PAGE_ID, blocks, max_bytes=max_bytes))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--blocks", type=int, default=5000)
+    parser.add_argument("--max-bytes", type=int, default=100_000)
+    args = parser.parse_args()
+
+    gen = PayloadGenerator(seed=0)
+    adapter = TypeAdapter(BlockObject)
+    types = [t for t in BLOCK_TYPES if t not in ("table_row", "column", "child_page", "child_database")]  # fmt: skip
+    blocks = [adapter.validate_python(gen.block(types[i % len(types)])) for i in range(args.blocks)]  # fmt: skip
+
+    print(f"{'planner':<12}{'requests':>10}{'time':>12}")
+    for label, split in (("previous", _previous), ("planned", _planned)):
+        start = time.perf_counter()
+        requests = split(blocks, args.max_bytes)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<12}{len(requests):>10}{elapsed * 1e3:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
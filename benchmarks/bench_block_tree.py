@@ -0,0 +1,51 @@
+"""
+Time to assemble a `BlockTree` from pages of block children, and to traverse and look it up.
+
+Run with:
+
+    python -m benchmarks.bench_block_tree [--depth D] [--width W]
+"""
+
+import time
+import uuid
+import argparse
+
+from pydantic_api.notion.models import BlockTree, RetrieveBlockChildrenResponse
+
+from .fixtures import PayloadGenerator
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--width", type=int, default=46)
+    args = parser.parse_args()
+
+    page_id = str(uuid.uuid4())
+    responses = PayloadGenerator(seed=0).block_children_pages(page_id, args.depth, args.width)  # fmt: skip
+    pages = [(parent_id, RetrieveBlockChildrenResponse.model_validate(response)) for parent_id, response in responses]  # fmt: skip
+
+    start = time.perf_counter()
+    tree = BlockTree(page_id)
+    for parent_id, page in pages:
+        tree.append(page, parent_id=parent_id)
+    timings = {"append": time.perf_counter() - start}
+
+    ids = [node.id for node in tree]
+    for label, run in (
+        ("depth_first", lambda: sum(1 for _ in tree.depth_first())),
+        ("breadth_first", lambda: sum(1 for _ in tree.breadth_first())),
+        ("lookup", lambda: [tree[block_id] for block_id in ids]),
+    ):
+        start = time.perf_counter()
+        run()
+        timings[label] = time.perf_counter() - start
+
+    print(f"{len(tree)} blocks in {len(pages)} pages")
+    print(f"{'operation':<16}{'time':>12}")
+    for label, seconds in timings.items():
+        print(f"{label:<16}{seconds * 1e3:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Per-block validation cost of `BlockObject`: plain smart-mode `Union` vs. the discriminated union.
+
+The "before" union is rebuilt from the members of `BlockObject`, so both sides validate exactly the same classes.
+
+Run with:
+
+    python -m benchmarks.bench_block_union [--blocks N] [--repeat R]
+"""
+
+import argparse
+import timeit
+import uuid
+from typing import Union, get_args
+
+from pydantic import TypeAdapter
+
+from pydantic_api.notion.models.objects.block.block import (
+    BlockObject,
+    OriginalSyncedBlock,
+    DupliateSyncedBlock,
+)
+
+
+def _rich_text(content: str) -> list[dict]:
+    return [
+        {
+            "type": "text",
+            "text": {"content": content, "link": None},
+            "annotations": {
+                "bold": False,
+                "italic": False,
+                "strikethrough": False,
+                "underline": False,
+                "code": False,
+                "color": "default",
+            },
+            "plain_text": content,
+            "href": None,
+        }
+    ]
+
+
+def _block(type_: str, data: dict) -> dict:
+    return {
+        "object": "block",
+        "id": str(uuid.uuid4()),
+        "parent": {"type": "page_id", "page_id": str(uuid.uuid4())},
+        "created_time": "2024-11-01T10:00:00.000Z",
+        "created_by": {"object": "user", "id": str(uuid.uuid4())},
+        "last_edited_time": "2024-11-01T10:00:00.000Z",
+        "last_edited_by": {"object": "user", "id": str(uuid.uuid4())},
+        "archived": False,
+        "in_trash": False,
+        "has_children": False,
+        "type": type_,
+        type_: data,
+    }
+
+
+SAMPLE_BLOCKS: dict[str, dict] = {
+    "paragraph": _block("paragraph", {"rich_text": _rich_text("Lorem ipsum"), "color": "default"}),
+    "heading_1": _block("heading_1", {"rich_text": _rich_text("Title"), "color": "default", "is_toggleable": False}),
+    "bulleted_list_item": _block("bulleted_list_item", {"rich_text": _rich_text("item"), "color": "default"}),
+    "to_do": _block("to_do", {"rich_text": _rich_text("task"), "checked": True, "color": "default"}),
+    "code": _block("code", {"rich_text": _rich_text("print(1)"), "caption": [], "language": "python"}),
+    "quote": _block("quote", {"rich_text": _rich_text("quote"), "color": "default"}),
+    "divider": _block("divider", {}),
+    "toggle": _block("toggle", {"rich_text": _rich_text("toggle"), "color": "default"}),
+    "video": _block("video", {"type": "external", "external": {"url": "https://example.com/v.mp4"}, "caption": []}),
+    "synced_block": _block("synced_block", {"synced_from": {"block_id": str(uuid.uuid4())}}),
+}
+
+
+def _legacy_union():
+    """The undiscriminated `Union` that `BlockObject` used to be."""
+    members = []
+    for member in get_args(get_args(BlockObject)[0]):
+        if get_args(member) and OriginalSyncedBlock in get_args(get_args(member)[0]):
+            members.extend([OriginalSyncedBlock, DupliateSyncedBlock])
+        else:
+            members.append(member)
+    return Union[tuple(members)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--blocks", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    adapters = {
+        "before (Union)": TypeAdapter(list[_legacy_union()]),
+        "after (discriminated)": TypeAdapter(list[BlockObject]),
+    }
+
+    print(f"{'block type':<22}" + "".join(f"{name:>24}" for name in adapters))
+    for type_, block in SAMPLE_BLOCKS.items():
+        payload = [block] * args.blocks
+        row = f"{type_:<22}"
+        for adapter in adapters.values():
+            best = min(
+                timeit.repeat(
+                    lambda: adapter.validate_python(payload),
+                    number=1,
+                    repeat=args.repeat,
+                )
+            )
+            row += f"{best / args.blocks * 1e6:>21.2f} us"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
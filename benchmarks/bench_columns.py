@@ -0,0 +1,66 @@
+"""
+Memory and time to turn database rows into per-property columns: validated `Page` models, the usual loop over `Page.properties` into lists, and `extract_columns` over the models or straight over the raw payloads.
+
+Run with:
+
+    python -m benchmarks.bench_columns [--pages N] [--mix title=1,number=2,...]
+"""
+
+import gc
+import time
+import argparse
+import tracemalloc
+
+from pydantic_api.notion.models import Page, extract_columns
+
+from .fixtures import DEFAULT_PROPERTY_MIX, PayloadGenerator, parse_mix
+
+
+def _loop(pages: list[Page]) -> dict[str, list]:
+    """What reporting jobs do by hand: one list of property objects per column."""
+    columns: dict[str, list] = {}
+    for page in pages:
+        for name, prop in page.properties.items():
+            columns.setdefault(name, []).append(getattr(prop, prop.type))
+    return columns
+
+
+def _measure(build, *args):
+    gc.collect()
+    start = time.perf_counter()
+    build(*args)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    tracemalloc.start()
+    result = build(*args)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=5000)
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_PROPERTY_MIX)
+    args = parser.parse_args()
+
+    gen = PayloadGenerator(seed=0)
+    payloads = [gen.page(args.mix) for _ in range(args.pages)]
+    pages = [Page.model_validate(payload) for payload in payloads]
+
+    rows = (
+        ("validated pages", lambda: [Page.model_validate(p) for p in payloads]),
+        ("loop over pages", lambda: _loop(pages)),
+        ("columns of pages", lambda: extract_columns(pages)),
+        ("columns of payloads", lambda: extract_columns(payloads)),
+    )
+    print(f"{args.pages} pages of {sum(args.mix.values())} properties")
+    print(f"{'mode':<22}{'time':>12}{'memory':>12}{'per row':>12}")
+    for label, build in rows:
+        elapsed, size = _measure(build)
+        print(f"{label:<22}{elapsed * 1e3:>9.1f} ms{size / 2**20:>9.1f} MB{size / args.pages:>10.0f} B")  # fmt: skip
+
+
+if __name__ == "__main__":
+    main()
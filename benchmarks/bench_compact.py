@@ -0,0 +1,70 @@
+"""
+Memory of decoded query results with `datetime` and with compacted `EpochMillis` timestamps, and the time to sort the pages by `last_edited_time`.
+
+Run with:
+
+    python -m benchmarks.bench_compact [--pages N] [--blocks B]
+"""
+
+import gc
+import time
+import argparse
+import tracemalloc
+
+from pydantic_api.notion.models import (
+    QueryDatabaseResponse,
+    RetrieveBlockChildrenResponse,
+    compact_timestamps,
+)
+
+from .fixtures import PayloadGenerator
+
+
+def _measure(build) -> tuple[float, int, object]:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, size, result
+
+
+def _sort_time(response: QueryDatabaseResponse) -> float:
+    start = time.perf_counter()
+    for _ in range(20):
+        sorted(response.results, key=lambda page: page.last_edited_time)
+    return (time.perf_counter() - start) / 20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=5000)
+    parser.add_argument("--blocks", type=int, default=5000)
+    args = parser.parse_args()
+
+    gen = PayloadGenerator(seed=0)
+    pages = gen.paginated([gen.page() for _ in range(args.pages)], "page_or_database")  # fmt: skip
+    ((_, blocks),) = gen.block_children_pages(gen.uuid(), 1, args.blocks, page_size=args.blocks)  # fmt: skip
+    # Build the schemas before measuring
+    QueryDatabaseResponse.model_validate(gen.paginated(pages["results"][:1], "page_or_database"))  # fmt: skip
+    RetrieveBlockChildrenResponse.model_validate(gen.paginated(blocks["results"][:1], "block"))  # fmt: skip
+    rows = (
+        ("pages", lambda: QueryDatabaseResponse.model_validate(pages)),
+        ("pages + compacted", lambda: compact_timestamps(QueryDatabaseResponse.model_validate(pages))),  # fmt: skip
+        ("blocks", lambda: RetrieveBlockChildrenResponse.model_validate(blocks)),
+        ("blocks + compacted", lambda: compact_timestamps(RetrieveBlockChildrenResponse.model_validate(blocks))),  # fmt: skip
+    )
+    print(f"{args.pages} pages, {args.blocks} blocks")
+    print(f"{'mode':<22}{'time':>12}{'memory':>12}{'per row':>12}{'sort':>12}")
+    for label, build in rows:
+        elapsed, size, result = _measure(build)
+        count = len(result.results)
+        sort = f"{_sort_time(result) * 1e3:>9.2f} ms" if label.startswith("pages") else ""  # fmt: skip
+        print(f"{label:<22}{elapsed * 1e3:>9.1f} ms{size / 2**20:>9.1f} MB{size / count:>10.0f} B{sort:>12}")  # fmt: skip
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Validation cost of wide database schemas: plain smart-mode `Union` vs. the discriminated `DatabaseProperty`.
+
+The "before" union is rebuilt from the members of `DatabaseProperty`, with the relation sub-union flattened, so both sides validate exactly the same classes.
+
+Run with:
+
+    python -m benchmarks.bench_database_property_union [--repeat R]
+"""
+
+import argparse
+import timeit
+import uuid
+from typing import Union, get_args
+
+from pydantic import TypeAdapter
+
+from pydantic_api.notion.models.objects.properties.database_property import (
+    DatabaseProperty,
+    SinglePropertyRelationDatabaseProperty,
+    DualPropertyRelationDatabaseProperty,
+)
+
+
+COLUMN_TEMPLATES: list[dict] = [
+    {"type": "checkbox", "checkbox": {}},
+    {"type": "date", "date": {}},
+    {"type": "email", "email": {}},
+    {"type": "number", "number": {"format": "number"}},
+    {"type": "people", "people": {}},
+    {"type": "rich_text", "rich_text": {}},
+    {"type": "url", "url": {}},
+    {
+        "type": "select",
+        "select": {"options": [{"id": "a", "name": "A", "color": "blue"}]},
+    },
+    {
+        "type": "multi_select",
+        "multi_select": {"options": [{"id": "b", "name": "B", "color": "red"}]},
+    },
+    {"type": "formula", "formula": {"expression": "prop(\"Price\") * 2"}},
+    {
+        "type": "relation",
+        "relation": {
+            "type": "dual_property",
+            "database_id": str(uuid.uuid4()),
+            "dual_property": {},
+        },
+    },
+]
+
+
+def _schema(columns: int) -> dict[str, dict]:
+    schema = {"Name": {"id": "title", "name": "Name", "type": "title", "title": {}}}
+    for i in range(columns - 1):
+        template = COLUMN_TEMPLATES[i % len(COLUMN_TEMPLATES)]
+        schema[f"Column {i}"] = {"id": f"c{i}", "name": f"Column {i}", **template}
+    return schema
+
+
+def _legacy_union():
+    """The undiscriminated `Union` that `DatabaseProperty` used to be."""
+    members = []
+    for member in get_args(get_args(DatabaseProperty)[0]):
+        if get_args(member) and SinglePropertyRelationDatabaseProperty in (
+            get_args(a)[0] for a in get_args(get_args(member)[0])
+        ):
+            members.extend(
+                [
+                    SinglePropertyRelationDatabaseProperty,
+                    DualPropertyRelationDatabaseProperty,
+                ]
+            )
+        else:
+            members.append(member)
+    return Union[tuple(members)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    adapters = {
+        "before (Union)": TypeAdapter(dict[str, _legacy_union()]),
+        "after (discriminated)": TypeAdapter(dict[str, DatabaseProperty]),
+    }
+
+    print(f"{'columns':<10}" + "".join(f"{name:>24}" for name in adapters))
+    for columns in (10, 40, 80, 160):
+        schema = _schema(columns)
+        row = f"{columns:<10}"
+        for adapter in adapters.values():
+            best = min(
+                timeit.repeat(
+                    lambda: adapter.validate_python(schema),
+                    number=1,
+                    repeat=args.repeat,
+                )
+            )
+            row += f"{best * 1e3:>21.3f} ms"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Emoji validation: `emoji.is_emoji` vs. the precomputed index used by `EmojiObject`.
+
+Run with:
+
+    python -m benchmarks.bench_emoji_index [--icons N]
+"""
+
+import sys
+import time
+import random
+import argparse
+import subprocess
+
+from pydantic import TypeAdapter
+
+
+def _cold(setup: str, statement: str) -> float:
+    """Seconds to run `statement` in a fresh interpreter, after `setup`."""
+    code = f"{setup}; import time; t = time.perf_counter(); {statement}; print(time.perf_counter() - t)"
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    return float(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--icons", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print("cold start (import + first check in a fresh interpreter)")
+    emoji_package = _cold("pass", "import emoji; emoji.is_emoji(chr(0x1F63B))")
+    index = _cold(
+        "from pydantic_api.notion.models.objects.emoji import is_emoji",
+        "is_emoji(chr(0x1F63B))",
+    )
+    print(f"  {'emoji.is_emoji':<20}{emoji_package * 1e3:8.1f} ms")
+    print(f"  {'index':<20}{index * 1e3:8.1f} ms")
+
+    import emoji
+    from pydantic_api.notion.models.objects.emoji import is_emoji
+    from pydantic_api.notion.models.objects.common import IconObject
+
+    sequences = list(emoji.EMOJI_DATA)
+    icons = [random.choice(sequences) for _ in range(args.icons)]
+
+    print(f"\nlookup ({args.icons} icons)")
+    for label, check in [("emoji.is_emoji", emoji.is_emoji), ("index", is_emoji)]:
+        check(icons[0])
+        start = time.perf_counter()
+        for icon in icons:
+            check(icon)
+        elapsed = time.perf_counter() - start
+        print(f"  {label:<20}{elapsed / args.icons * 1e9:8.1f} ns/icon")
+
+    adapter = TypeAdapter(list[IconObject])
+    payload = [{"type": "emoji", "emoji": icon} for icon in icons]
+    start = time.perf_counter()
+    adapter.validate_python(payload)
+    elapsed = time.perf_counter() - start
+    print(f"\nIconObject validation  {elapsed / args.icons * 1e9:8.1f} ns/icon")
+
+
+if __name__ == "__main__":
+    main()
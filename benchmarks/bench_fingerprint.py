@@ -0,0 +1,71 @@
+"""
+Time to detect changed pages and blocks: re-serializing with `model_dump_json` and comparing, vs. `fingerprint`, and for a block tree, every block compared vs. `changed_nodes` walking down the Merkle hashes.
+
+Run with:
+
+    python -m benchmarks.bench_fingerprint [--pages N] [--depth D] [--width W]
+"""
+
+import time
+import uuid
+import argparse
+
+from pydantic_api.notion.models import (
+    Page,
+    BlockTree,
+    RetrieveBlockChildrenResponse,
+    fingerprint,
+    merkle_hashes,
+    changed_nodes,
+)
+
+from .fixtures import PayloadGenerator
+
+
+def _time(run) -> tuple[float, int]:
+    start = time.perf_counter()
+    count = run()
+    return time.perf_counter() - start, count
+
+
+def _tree(page_id: str, depth: int, width: int) -> BlockTree:
+    tree = BlockTree(page_id)
+    for parent_id, response in PayloadGenerator(seed=0).block_children_pages(page_id, depth, width):  # fmt: skip
+        tree.append(RetrieveBlockChildrenResponse.model_validate(response), parent_id=parent_id)  # fmt: skip
+    return tree
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=1000)
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--width", type=int, default=10)
+    args = parser.parse_args()
+
+    gen = PayloadGenerator(seed=0)
+    pages = [Page.model_validate(gen.page()) for _ in range(args.pages)]
+    dumps = [page.model_dump_json() for page in pages]
+    fingerprints = [fingerprint(page) for page in pages]
+
+    page_id = str(uuid.uuid4())
+    old, new = _tree(page_id, args.depth, args.width), _tree(page_id, args.depth, args.width)  # fmt: skip
+    leaf = next(node for node in new if node.depth == args.depth)
+    getattr(leaf.block, leaf.block.type).rich_text[0].text.content = "edited"
+    old_dumps = {node.id: node.block.model_dump_json() for node in old}
+    hashes = merkle_hashes(old)
+
+    rows = (
+        ("pages: dump", lambda: sum(p.model_dump_json() != d for p, d in zip(pages, dumps))),  # fmt: skip
+        ("pages: fingerprint", lambda: sum(fingerprint(p) != f for p, f in zip(pages, fingerprints))),  # fmt: skip
+        ("blocks: dump", lambda: sum(n.block.model_dump_json() != old_dumps[n.id] for n in new)),  # fmt: skip
+        ("blocks: merkle", lambda: sum(1 for _ in changed_nodes(new, hashes))),
+    )
+    print(f"{args.pages} pages, a tree of {len(new)} blocks")
+    print(f"{'mode':<20}{'time':>12}{'changed':>10}")
+    for label, run in rows:
+        elapsed, count = _time(run)
+        print(f"{label:<20}{elapsed * 1e3:>9.1f} ms{count:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Cold import time of each `pydantic_api.notion.models` submodule.
+
+Every measurement runs in a fresh interpreter, after `pydantic` and `pydantic_api.base` have been imported, so the numbers only cover this package. The last row imports every public name, i.e. what a star import (or the old eager `__init__`) costs.
+
+Run with:
+
+    python -m benchmarks.bench_import_time [--repeat R]
+"""
+
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+
+SUBMODULES = [
+    "pydantic_api.notion.models.objects.user",
+    "pydantic_api.notion.models.objects.parent",
+    "pydantic_api.notion.models.objects.file",
+    "pydantic_api.notion.models.objects.emoji",
+    "pydantic_api.notion.models.objects.common",
+    "pydantic_api.notion.models.objects.block.rich_text",
+    "pydantic_api.notion.models.objects.block.block",
+    "pydantic_api.notion.models.objects.properties.page_property",
+    "pydantic_api.notion.models.objects.properties.database_property",
+    "pydantic_api.notion.models.objects.page",
+    "pydantic_api.notion.models.objects.database",
+    "pydantic_api.notion.models.objects.comment",
+    "pydantic_api.notion.models.endpoints.base",
+    "pydantic_api.notion.models.endpoints.pages",
+    "pydantic_api.notion.models.endpoints.blocks",
+    "pydantic_api.notion.models.endpoints.databases",
+    "pydantic_api.notion.models.endpoints.search",
+]
+
+_PROBE = """
+import sys, time, json, importlib
+import pydantic_api.base
+from pydantic import BaseModel, Field, AnyUrl, EmailStr, TypeAdapter
+target = sys.argv[1]
+start = time.perf_counter()
+if target == "*":
+    exec("from pydantic_api.notion.models import *")
+else:
+    importlib.import_module(target)
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "seconds": elapsed,
+    "modules": sum(1 for m in sys.modules if m.startswith("pydantic_api.notion")),
+    "emoji": "emoji" in sys.modules,
+}))
+"""
+
+
+def _measure(target: str, repeat: int) -> dict:
+    samples = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", _PROBE, target],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        samples.append(json.loads(output))
+    return {
+        "seconds": statistics.median(s["seconds"] for s in samples),
+        "modules": samples[0]["modules"],
+        "emoji": samples[0]["emoji"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'module':<66}{'import':>10}{'modules':>9}{'emoji':>7}")
+    for target in SUBMODULES + ["*"]:
+        result = _measure(target, args.repeat)
+        label = "from pydantic_api.notion.models import *" if target == "*" else target
+        print(
+            f"{label:<66}{result['seconds'] * 1e3:>7.1f} ms"
+            f"{result['modules']:>9}{'yes' if result['emoji'] else 'no':>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Memory of decoded query results with and without an `InternPool`, for pages edited by a few users, in one database, whose select, multi-select and status properties share a few options.
+
+Run with:
+
+    python -m benchmarks.bench_interning [--pages N] [--users U] [--options O]
+"""
+
+import gc
+import time
+import argparse
+import tracemalloc
+
+from pydantic_api.notion.models import InternPool, QueryDatabaseResponse
+
+from .fixtures import PayloadGenerator
+
+
+def _payloads(pages: int, users: int, options: int) -> list[dict]:
+    gen = PayloadGenerator(seed=0)
+    people = [gen.partial_user() for _ in range(users)]
+    choices = [gen.option() for _ in range(options)]
+    parent = {"type": "database_id", "database_id": gen.uuid()}
+    payloads = []
+    for i in range(pages):
+        payload = gen.page()
+        payload["parent"] = dict(parent)
+        payload["created_by"] = dict(people[i % users])
+        payload["last_edited_by"] = dict(people[(i // 7) % users])
+        for prop in payload["properties"].values():
+            if prop["type"] in ("select", "status"):
+                prop[prop["type"]] = dict(choices[i % options])
+            elif prop["type"] == "multi_select":
+                prop["multi_select"] = [dict(choices[(i + j) % options]) for j in range(3)]  # fmt: skip
+        payloads.append(payload)
+    return payloads
+
+
+def _measure(build) -> tuple[float, int]:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=5000)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--options", type=int, default=10)
+    args = parser.parse_args()
+
+    response = PayloadGenerator(seed=0).paginated(_payloads(args.pages, args.users, args.options), "page_or_database")  # fmt: skip
+    pool = InternPool()
+    rows = (
+        ("decoded", lambda: QueryDatabaseResponse.model_validate(response)),
+        ("decoded + interned", lambda: pool.intern(QueryDatabaseResponse.model_validate(response))),  # fmt: skip
+    )
+    print(f"{args.pages} pages, {args.users} users, {args.options} options")
+    print(f"{'mode':<22}{'time':>12}{'memory':>12}{'per row':>12}")
+    for label, build in rows:
+        elapsed, size = _measure(build)
+        print(f"{label:<22}{elapsed * 1e3:>9.1f} ms{size / 2**20:>9.1f} MB{size / args.pages:>10.0f} B")  # fmt: skip
+    print(pool)
+
+
+if __name__ == "__main__":
+    main()
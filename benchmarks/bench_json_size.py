@@ -0,0 +1,83 @@
+"""
+Time to measure the body of request models: `len(model_dump_json().encode())` vs. `json_size`, on the first measurement and again after editing one block of each request.
+
+Run with:
+
+    python -m benchmarks.bench_json_size [--requests N] [--blocks B]
+"""
+
+import time
+import argparse
+
+from pydantic import TypeAdapter
+
+from pydantic_api.notion.models import (
+    Page,
+    BlockObject,
+    CreatePageRequest,
+    AppendBlockChildrenRequest,
+    UpdatePagePropertiesRequest,
+    json_size,
+)
+
+from .fixtures import BLOCK_TYPES, PayloadGenerator
+
+
+def _requests(count: int, blocks: int) -> list:
+    gen = PayloadGenerator(seed=0)
+    adapter = TypeAdapter(BlockObject)
+    types = [t for t in BLOCK_TYPES if t not in ("table_row", "column", "child_page", "child_database")]  # fmt: skip
+    requests = []
+    for i in range(count):
+        page = Page.model_validate(gen.page())
+        children = [adapter.validate_python(gen.block(types[j % len(types)])) for j in range(blocks)]  # fmt: skip
+        if i % 3 == 0:
+            requests.append(AppendBlockChildrenRequest(block_id=str(page.id), children=children))  # fmt: skip
+        elif i % 3 == 1:
+            requests.append(CreatePageRequest(parent=page.parent, properties=page.properties, children=children))  # fmt: skip
+        else:
+            requests.append(UpdatePagePropertiesRequest(page_id=page.id, properties=page.properties))  # fmt: skip
+    return requests
+
+
+def _edit(requests: list):
+    for request in requests:
+        children = getattr(request, "children", None)
+        if children:
+            children[0].archived = not children[0].archived
+        else:
+            request.archived = not request.archived
+
+
+def _dumped(requests: list) -> int:
+    return sum(len(r.model_dump_json(exclude_none=True).encode()) for r in requests)
+
+
+def _measured(requests: list) -> int:
+    return sum(json_size(r, exclude_none=True) for r in requests)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--blocks", type=int, default=50)
+    args = parser.parse_args()
+
+    check = _requests(3, args.blocks)
+    assert _dumped(check) == _measured(check)
+
+    print(f"{'mode':<12}{'bytes':>12}{'first':>12}{'after edit':>14}")
+    for label, measure in (("dumped", _dumped), ("json_size", _measured)):
+        requests = _requests(args.requests, args.blocks)
+        start = time.perf_counter()
+        size = measure(requests)
+        first = time.perf_counter() - start
+        _edit(requests)
+        start = time.perf_counter()
+        measure(requests)
+        again = time.perf_counter() - start
+        print(f"{label:<12}{size:>12}{first * 1e3:>9.1f} ms{again * 1e3:>11.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Decode time and retained memory of `Page` vs. `LazyPage` for pages of a wide database, reading only a few properties.
+
+Run with:
+
+    python -m benchmarks.bench_lazy_page [--pages N] [--properties P] [--read R]
+"""
+
+import gc
+import json
+import time
+import uuid
+import argparse
+import tracemalloc
+
+from pydantic_api.notion.models import Page, LazyPage
+
+
+def _rich_text(content: str) -> dict:
+    return {
+        "type": "text",
+        "text": {"content": content, "link": None},
+        "annotations": {
+            "bold": False,
+            "italic": False,
+            "strikethrough": False,
+            "underline": False,
+            "code": False,
+            "color": "default",
+        },
+        "plain_text": content,
+        "href": None,
+    }
+
+
+def _property(i: int) -> dict:
+    kind = i % 5
+    if kind == 0:
+        return {"id": f"p{i}", "type": "rich_text", "rich_text": [_rich_text("lorem ipsum " * 20) for _ in range(3)]}  # fmt: skip
+    if kind == 1:
+        return {"id": f"p{i}", "type": "relation", "relation": [{"id": str(uuid.uuid4())} for _ in range(10)], "has_more": False}  # fmt: skip
+    if kind == 2:
+        return {"id": f"p{i}", "type": "multi_select", "multi_select": [{"id": str(uuid.uuid4()), "name": f"Tag {j}", "color": "blue"} for j in range(5)]}  # fmt: skip
+    if kind == 3:
+        return {"id": f"p{i}", "type": "number", "number": i}
+    return {"id": f"p{i}", "type": "email", "email": f"user{i}@example.com"}
+
+
+def _page(properties: int) -> dict:
+    user = {"object": "user", "id": str(uuid.uuid4())}
+    return {
+        "object": "page",
+        "id": str(uuid.uuid4()),
+        "created_time": "2024-11-01T10:00:00.000Z",
+        "created_by": user,
+        "last_edited_time": "2024-11-01T10:00:00.000Z",
+        "last_edited_by": user,
+        "archived": False,
+        "in_trash": False,
+        "icon": None,
+        "cover": None,
+        "parent": {"type": "database_id", "database_id": str(uuid.uuid4())},
+        "url": "https://www.notion.so/page",
+        "public_url": None,
+        "properties": {
+            "Name": {"id": "title", "type": "title", "title": [_rich_text("Title")]},
+            **{f"Property {i}": _property(i) for i in range(properties - 1)},
+        },
+    }
+
+
+def _measure(model: type[Page], payloads: list[str], read: list[str]):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    pages = [model.model_validate_json(payload) for payload in payloads]
+    for page in pages:
+        for name in read:
+            page.properties[name]
+    elapsed = time.perf_counter() - start
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, retained
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--properties", type=int, default=100)
+    parser.add_argument("--read", type=int, default=3)
+    args = parser.parse_args()
+
+    payloads = [json.dumps(_page(args.properties)) for _ in range(args.pages)]
+    read = ["Name"] + [f"Property {i}" for i in range(args.read - 1)]
+    # Warm up the validators so that schema building is not measured.
+    _measure(Page, payloads[:1], read)
+    _measure(LazyPage, payloads[:1], read)
+
+    print(f"{'model':<10}{'time':>12}{'retained':>14}")
+    for model in (Page, LazyPage):
+        elapsed, retained = _measure(model, payloads, read)
+        print(f"{model.__name__:<10}{elapsed * 1e3:>9.1f} ms{retained / 2**20:>11.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Time to check a batch of write requests against Notion's limits with `lint_requests`, next to the time to serialize the same batch with `model_dump_json`, which every request pays before it is sent.
+
+Run with:
+
+    python -m benchmarks.bench_limits [--requests N] [--blocks B]
+"""
+
+import time
+import uuid
+import argparse
+
+from pydantic import TypeAdapter
+
+from pydantic_api.notion.models import (
+    Page,
+    BlockObject,
+    CreatePageRequest,
+    CreateCommentRequest,
+    AppendBlockChildrenRequest,
+    UpdatePagePropertiesRequest,
+    lint_requests,
+)
+
+from .fixtures import BLOCK_TYPES, PayloadGenerator
+
+
+def _requests(count: int, blocks: int) -> list:
+    gen = PayloadGenerator(seed=0)
+    adapter = TypeAdapter(BlockObject)
+    types = [t for t in BLOCK_TYPES if t not in ("table_row", "column", "child_page", "child_database")]  # fmt: skip
+    requests = []
+    for i in range(count):
+        page = Page.model_validate(gen.page())
+        children = [adapter.validate_python(gen.block(types[j % len(types)])) for j in range(blocks)]  # fmt: skip
+        kind = i % 4
+        if kind == 0:
+            requests.append(AppendBlockChildrenRequest(block_id=str(page.id), children=children))  # fmt: skip
+        elif kind == 1:
+            requests.append(CreatePageRequest(parent=page.parent, properties=page.properties, children=children))  # fmt: skip
+        elif kind == 2:
+            requests.append(UpdatePagePropertiesRequest(page_id=page.id, properties=page.properties))  # fmt: skip
+        else:
+            requests.append(CreateCommentRequest(discussion_id=uuid.uuid4(), rich_text=gen.rich_text(3)))  # fmt: skip
+    return requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--blocks", type=int, default=20)
+    args = parser.parse_args()
+
+    requests = _requests(args.requests, args.blocks)
+    for request in requests:
+        request.model_dump_json(exclude_none=True)
+
+    start = time.perf_counter()
+    violations = sum(1 for _ in lint_requests(requests))
+    linted = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for request in requests:
+        request.model_dump_json(exclude_none=True)
+    dumped = time.perf_counter() - start
+
+    print(f"{len(requests)} requests, {violations} violations")
+    print(f"{'mode':<16}{'time':>12}{'requests/s':>14}")
+    for label, elapsed in (("lint_requests", linted), ("model_dump_json", dumped)):  # fmt: skip
+        print(f"{label:<16}{elapsed * 1e3:>9.1f} ms{len(requests) / elapsed:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
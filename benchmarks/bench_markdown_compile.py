@@ -0,0 +1,101 @@
+"""
+Time to turn a generated Markdown report into blocks: the per-block `.new()` factories (given the already split text) vs. `AppendBlockChildrenRequest.from_markdown`, which also parses the Markdown and batches the requests.
+
+Run with:
+
+    python -m benchmarks.bench_markdown_compile [--sections N]
+"""
+
+import time
+import uuid
+import argparse
+import tracemalloc
+
+from pydantic_api.notion.models import (
+    CodeBlock,
+    Heading2Block,
+    ParagraphBlock,
+    TextRichTextObject,
+    BulletedListItemBlock,
+    AppendBlockChildrenRequest,
+)
+
+from .fixtures import PayloadGenerator
+
+ITEMS = 5
+
+PAGE_ID = str(uuid.uuid4())
+
+
+def _sections(count: int) -> list[tuple[str, list[str], list[str], str]]:
+    """(title, paragraph words, list items, code) for each section of the report."""
+    gen = PayloadGenerator(seed=0)
+    return [
+        (
+            gen.sentence(4),
+            gen.sentence(40).split(),
+            [gen.sentence(8) for _ in range(ITEMS)],
+            "\n".join(f"print({gen.sentence(3)!r})" for _ in range(5)),
+        )
+        for _ in range(count)
+    ]
+
+
+def _markdown(sections) -> list[str]:
+    lines = []
+    for title, words, items, code in sections:
+        lines.append(f"## {title}\n")
+        lines.append(f"{' '.join(words[:10])} **{' '.join(words[10:20])}** {' '.join(words[20:])}\n")  # fmt: skip
+        lines.extend(f"- {item}\n" for item in items)
+        lines.append("```python\n")
+        lines.append(code + "\n")
+        lines.append("```\n")
+    return lines
+
+
+def _factories(sections) -> int:
+    blocks = []
+    for title, words, items, code in sections:
+        blocks.append(Heading2Block.new(title))
+        blocks.append(
+            ParagraphBlock.new(
+                [
+                    TextRichTextObject.new(" ".join(words[:10]) + " "),
+                    TextRichTextObject.new(" ".join(words[10:20]), bold=True),
+                    TextRichTextObject.new(" " + " ".join(words[20:])),
+                ]
+            )
+        )
+        blocks.extend(BulletedListItemBlock.new(item) for item in items)
+        blocks.append(CodeBlock.new(code, language="python"))
+    return len(blocks)
+
+
+def _compiled(lines) -> int:
+    return sum(len(request.children) for request in AppendBlockChildrenRequest.from_markdown(PAGE_ID, iter(lines)))  # fmt: skip
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sections", type=int, default=10_000)
+    args = parser.parse_args()
+
+    sections = _sections(args.sections)
+    lines = _markdown(sections)
+    _factories(sections[:10])
+    _compiled(lines[:100])
+
+    print(f"{'mode':<12}{'blocks':>10}{'time':>12}{'peak memory':>16}")
+    for label, build, data in (("factories", _factories, sections), ("compiled", _compiled, lines)):  # fmt: skip
+        start = time.perf_counter()
+        blocks = build(data)
+        elapsed = time.perf_counter() - start
+        tracemalloc.start()
+        build(data)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{label:<12}{blocks:>10}{elapsed:>10.2f} s{peak / 2**20:>13.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
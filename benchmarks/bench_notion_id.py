@@ -0,0 +1,63 @@
+"""
+Memory and parse time of ids: `UUID` vs. `NotionId`, constructed from strings and validated from JSON by pydantic.
+
+Run with:
+
+    python -m benchmarks.bench_notion_id [--ids N]
+"""
+
+import gc
+import json
+import math
+import time
+import uuid
+import argparse
+import tracemalloc
+from typing import List
+
+from pydantic import TypeAdapter
+
+from pydantic_api.notion.models import NotionId
+
+
+def _measure(build, repeat: int = 5) -> tuple[float, int]:
+    """The best time of `repeat` runs, untraced, and the memory of one traced run, since tracing slows down Python allocations more than native ones."""
+    elapsed = math.inf
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = build()
+        elapsed = min(elapsed, time.perf_counter() - start)
+        del result
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--ids", type=int, default=200_000)
+    args = parser.parse_args()
+
+    strings = [str(uuid.uuid4()) for _ in range(args.ids)]
+    payload = json.dumps(strings)
+    uuids, ids = TypeAdapter(List[uuid.UUID]), TypeAdapter(List[NotionId])
+    rows = (
+        ("UUID(...)", lambda: [uuid.UUID(s) for s in strings]),
+        ("NotionId(...)", lambda: [NotionId(s) for s in strings]),
+        ("pydantic UUID", lambda: uuids.validate_json(payload)),
+        ("pydantic NotionId", lambda: ids.validate_json(payload)),
+    )
+    print(f"{args.ids} ids")
+    print(f"{'mode':<20}{'time':>12}{'memory':>12}{'per id':>10}")
+    for label, build in rows:
+        elapsed, size = _measure(build)
+        print(f"{label:<20}{elapsed * 1e3:>9.1f} ms{size / 2**20:>9.1f} MB{size / args.ids:>8.0f} B")  # fmt: skip
+
+
+if __name__ == "__main__":
+    main()
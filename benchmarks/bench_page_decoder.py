@@ -0,0 +1,61 @@
+"""
+Time to decode `QueryDatabaseResponse` pages of one database: the generic `QueryDatabaseResponse` vs. a decoder compiled from the database schema with `compile_page_decoder`, validated and constructed with `TrustedAdapter`.
+
+Run with:
+
+    python -m benchmarks.bench_page_decoder [--pages N] [--mix title=1,rich_text=3,...]
+"""
+
+import time
+import argparse
+
+from pydantic_api.notion.models import (
+    Database,
+    TrustedAdapter,
+    QueryDatabaseResponse,
+    compile_page_decoder,
+)
+
+from .fixtures import DEFAULT_PROPERTY_MIX, PayloadGenerator, encode, parse_mix
+
+
+def _best_of(runs: int, decode, raw: bytes) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        decode(raw)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=2000)
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_PROPERTY_MIX)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    gen = PayloadGenerator(seed=0)
+    database = Database.model_validate(gen.database(args.mix))
+    raw = encode(gen.paginated([gen.page(args.mix) for _ in range(args.pages)], "page_or_database"))  # fmt: skip
+
+    start = time.perf_counter()
+    decoder = compile_page_decoder(database)
+    compiled = time.perf_counter() - start
+
+    modes = {
+        "generic": QueryDatabaseResponse.model_validate_json,
+        "compiled": decoder.validate_response_json,
+        "trusted generic": TrustedAdapter(QueryDatabaseResponse).construct_json,
+        "trusted compiled": TrustedAdapter(decoder.response_type).construct_json,
+    }
+    print(f"{args.pages} pages of {sum(args.mix.values())} properties, compiled in {compiled * 1e3:.1f} ms")  # fmt: skip
+    print(f"{'mode':<18}{'time':>12}{'pages/s':>12}")
+    for label, decode in modes.items():
+        decode(raw)
+        elapsed = _best_of(args.runs, decode, raw)
+        print(f"{label:<18}{elapsed * 1e3:>9.1f} ms{args.pages / elapsed:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Peak memory and time of decoding a `QueryDatabaseResponse`: eager `model_validate_json` vs. `NotionPaginatedData.stream`.
+
+Run with:
+
+    python -m benchmarks.bench_paginated_stream [--pages N ...]
+"""
+
+import os
+import json
+import time
+import uuid
+import argparse
+import tempfile
+import tracemalloc
+
+from pydantic_api.notion.models.endpoints.databases import QueryDatabaseResponse
+
+
+def _rich_text(content: str) -> dict:
+    return {
+        "type": "text",
+        "text": {"content": content, "link": None},
+        "annotations": {
+            "bold": False,
+            "italic": False,
+            "strikethrough": False,
+            "underline": False,
+            "code": False,
+            "color": "default",
+        },
+        "plain_text": content,
+        "href": None,
+    }
+
+
+def _page() -> dict:
+    user = {"object": "user", "id": str(uuid.uuid4())}
+    return {
+        "object": "page",
+        "id": str(uuid.uuid4()),
+        "created_time": "2024-11-01T10:00:00.000Z",
+        "created_by": user,
+        "last_edited_time": "2024-11-01T10:00:00.000Z",
+        "last_edited_by": user,
+        "archived": False,
+        "in_trash": False,
+        "icon": {"type": "emoji", "emoji": "😻"},
+        "cover": None,
+        "parent": {"type": "database_id", "database_id": str(uuid.uuid4())},
+        "url": "https://www.notion.so/page",
+        "public_url": None,
+        "properties": {
+            "Name": {"id": "title", "type": "title", "title": [_rich_text("Title")]},
+            "Notes": {
+                "id": "n",
+                "type": "rich_text",
+                "rich_text": [_rich_text("lorem ipsum " * 150) for _ in range(10)],
+            },
+            "Related": {
+                "id": "r",
+                "type": "relation",
+                "relation": [{"id": str(uuid.uuid4())} for _ in range(25)],
+                "has_more": False,
+            },
+        },
+    }
+
+
+def _write_response(pages: int) -> str:
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as fp:
+        json.dump(
+            {
+                "object": "list",
+                "results": [_page() for _ in range(pages)],
+                "next_cursor": None,
+                "has_more": False,
+                "type": "page_or_database",
+                "page_or_database": {},
+                "request_id": str(uuid.uuid4()),
+            },
+            fp,
+        )
+        return fp.name
+
+
+def _eager(path: str) -> int:
+    with open(path, "rb") as fp:
+        return len(QueryDatabaseResponse.model_validate_json(fp.read()).results)
+
+
+def _streamed(path: str) -> int:
+    with open(path, "rb") as fp:
+        return sum(1 for _ in QueryDatabaseResponse.stream(fp))
+
+
+def _measure(decode, path: str) -> tuple[float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    decode(path)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[100, 1000])
+    args = parser.parse_args()
+
+    # Warm up the validators so that schema building is not measured.
+    path = _write_response(1)
+    _eager(path)
+    _streamed(path)
+    os.unlink(path)
+
+    print(f"{'pages':<8}{'mode':<10}{'time':>12}{'peak memory':>16}")
+    for pages in args.pages:
+        path = _write_response(pages)
+        for label, decode in [("eager", _eager), ("stream", _streamed)]:
+            elapsed, peak = _measure(decode, path)
+            print(f"{pages:<8}{label:<10}{elapsed * 1e3:>9.1f} ms{peak / 2**20:>13.1f} MB")
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    main()
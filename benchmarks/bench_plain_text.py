@@ -0,0 +1,49 @@
+"""
+Repeated plain-text title reads on pages: re-validating the title property on every access (the previous `Page.title_property`) vs. `Page.plain_text_title`, which finds it by type and reads the validated property.
+
+Run with:
+
+    python -m benchmarks.bench_plain_text [--pages N] [--reads R]
+"""
+
+import time
+import argparse
+
+from pydantic_api.notion.models import Page, TitleProperty
+
+from .fixtures import DEFAULT_PROPERTY_MIX, PayloadGenerator
+
+
+def _previous(page: Page) -> str:
+    """The previous `Page.plain_text_title`, except that it looks the title up by type."""
+    name = next(n for n, p in page.properties.items() if p.type == "title")
+    title = TitleProperty.model_validate(page.properties.get(name))
+    return "".join([t.plain_text for t in title.title if t.plain_text])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=1000)
+    parser.add_argument("--reads", type=int, default=10)
+    args = parser.parse_args()
+
+    gen = PayloadGenerator(seed=0)
+    # Database rows list the title column anywhere among their properties, here last.
+    mix = dict(DEFAULT_PROPERTY_MIX)
+    mix["title"] = mix.pop("title")
+    pages = [Page.model_validate(gen.page(mix)) for _ in range(args.pages)]
+
+    print(f"{'title':<12}{'time':>12}")
+    for label, read in (
+        ("previous", _previous),
+        ("current", lambda page: page.plain_text_title),
+    ):
+        start = time.perf_counter()
+        for page in pages:
+            for _ in range(args.reads):
+                read(page)
+        print(f"{label:<12}{(time.perf_counter() - start) * 1e3:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
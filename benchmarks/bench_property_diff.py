@@ -0,0 +1,70 @@
+"""
+Bytes sent to sync a batch of pages where one property in ten changed: every writable property sent back with `UpdatePagePropertiesRequest`, vs. the sparse requests of `diff_page`, against fresh snapshots or against stored fingerprints.
+
+Run with:
+
+    python -m benchmarks.bench_property_diff [--pages N] [--mix title=1,number=2,...]
+"""
+
+import time
+import random
+import argparse
+
+from pydantic_api.notion.models import (
+    Page,
+    NumberProperty,
+    UpdatePagePropertiesRequest,
+    READ_ONLY_PROPERTY_TYPES,
+    diff_page,
+    diff_properties,
+    encode_request,
+    property_fingerprints,
+)
+
+from .fixtures import DEFAULT_PROPERTY_MIX, PayloadGenerator, parse_mix
+
+
+def _full(page: Page, desired: Page) -> UpdatePagePropertiesRequest:
+    properties = {name: p for name, p in desired.properties.items() if p.type not in READ_ONLY_PROPERTY_TYPES}  # fmt: skip
+    return UpdatePagePropertiesRequest(page_id=page.id, properties=properties)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=1000)
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_PROPERTY_MIX)
+    args = parser.parse_args()
+
+    gen = PayloadGenerator(seed=0)
+    rng = random.Random(0)
+    pages = [Page.model_validate(gen.page(args.mix)) for _ in range(args.pages)]
+    desired = []
+    for page in pages:
+        copy = Page.model_validate_json(page.model_dump_json())
+        if rng.random() < 0.1:
+            name = next(n for n, p in copy.properties.items() if p.type == "number")
+            copy.properties[name] = NumberProperty(number=-1)
+        desired.append(copy)
+    fingerprints = [property_fingerprints(page) for page in pages]
+
+    modes = {
+        "every property": lambda: [_full(p, d) for p, d in zip(pages, desired)],
+        "diff snapshots": lambda: [diff_page(p, d) for p, d in zip(pages, desired)],
+        "diff fingerprints": lambda: [
+            UpdatePagePropertiesRequest(page_id=p.id, properties=changed)
+            for p, f, d in zip(pages, fingerprints, desired)
+            if (changed := diff_properties(f, d))
+        ],
+    }
+    print(f"{args.pages} pages of {sum(args.mix.values())} properties")
+    print(f"{'mode':<20}{'time':>12}{'requests':>10}{'sent':>12}")
+    for label, build in modes.items():
+        start = time.perf_counter()
+        requests = [r for r in build() if r is not None]
+        elapsed = time.perf_counter() - start
+        sent = sum(len(encode_request(r).body) for r in requests)
+        print(f"{label:<20}{elapsed * 1e3:>9.1f} ms{len(requests):>10}{sent / 2**10:>9.0f} KB")  # fmt: skip
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Splitting 1 MB documents into rich text: the previous word-list splitter vs. `iter_text_chunks`, on ASCII, CJK and emoji-heavy text.
+
+Also reports how many segments of the previous splitter exceed Notion's 2000 UTF-16 code unit limit.
+
+Run with:
+
+    python -m benchmarks.bench_rich_text_chunking [--size BYTES] [--repeat R]
+"""
+
+import time
+import random
+import argparse
+import tracemalloc
+
+from pydantic_api.notion.models import (
+    RichTextObjectFactory,
+    utf16_len,
+    iter_text_chunks,
+)
+
+from .fixtures import WORDS
+
+
+def _split_words(content: str, max_segment_len: int = 2000, separater: str = " "):
+    """The previous implementation of `RichTextObjectFactory.new_text`, minus object creation."""
+    words = content.split(separater)
+    segments = []
+    current_segment = []
+    current_length = 0
+    for word in words:
+        word_length = len(word)
+        if current_length + word_length + len(separater) > max_segment_len:
+            if current_segment:
+                segments.append(separater.join(current_segment))
+                current_segment = []
+                current_length = 0
+        while word_length > max_segment_len:
+            segments.append(word[:max_segment_len])
+            word = word[max_segment_len:]
+            word_length = len(word)
+        current_segment.append(word)
+        current_length += word_length + len(separater)
+    if current_segment:
+        segments.append(separater.join(current_segment))
+    return segments
+
+
+def _document(vocabulary: list[str], size: int) -> str:
+    rng = random.Random(0)
+    words, length = [], 0
+    while length < size:
+        word = rng.choice(vocabulary)
+        words.append(word)
+        length += len(word.encode()) + 1
+    return " ".join(words)
+
+
+def _measure(split, content: str, repeat: int):
+    tracemalloc.start()
+    segments = split(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        split(content)
+    return (time.perf_counter() - start) / repeat, peak, segments
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=2**20)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    documents = {
+        "ascii": _document(WORDS, args.size),
+        "cjk": _document(["中文", "日本語", "한국어", "漢字"], args.size),
+        "emoji": _document(["😻", "🎉🎉", "👍", "word"], args.size),
+    }
+    splitters = {
+        "word list": _split_words,
+        "chunker": lambda content: list(iter_text_chunks(content)),
+        "new_text": RichTextObjectFactory.new_text,
+    }
+
+    print(f"{'document':<10}{'splitter':<12}{'time':>12}{'peak':>12}{'segments':>10}{'over limit':>12}")  # fmt: skip
+    for label, content in documents.items():
+        for name, split in splitters.items():
+            elapsed, peak, segments = _measure(split, content, args.repeat)
+            if name == "new_text":
+                segments = [segment.text.content for segment in segments]
+            over = sum(utf16_len(segment) > 2000 for segment in segments)
+            print(
+                f"{label:<10}{name:<12}{elapsed * 1e3:>9.2f} ms{peak / 2**20:>9.2f} MB"
+                f"{len(segments):>10}{over:>12}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""
+Validation and serialization throughput of the main models, overall and per block and property type, with a machine-readable report.
+
+For each target, measures `validate_json` (from bytes), `validate_python` (from dicts), `model_dump` and `model_dump_json`. The report can be saved and compared against a baseline to catch regressions between releases.
+
+Run with:
+
+    python -m benchmarks.bench_throughput [--output report.json] [--compare baseline.json] [--quick]
+"""
+
+import sys
+import json
+import time
+import platform
+import argparse
+import subprocess
+from typing import Any, Callable
+
+import pydantic
+from pydantic import TypeAdapter
+
+from pydantic_api.notion.models import (
+    Page,
+    Database,
+    BlockObject,
+    PageProperty,
+    QueryDatabaseResponse,
+    RetrieveBlockChildrenResponse,
+)
+
+from .fixtures import (
+    BLOCK_TYPES,
+    PAGE_PROPERTY_TYPES,
+    DEFAULT_PROPERTY_MIX,
+    PayloadGenerator,
+    encode,
+    parse_mix,
+)
+
+OPERATIONS = ["validate_json", "validate_python", "dump_python", "dump_json"]
+
+
+def _operations(adapter: TypeAdapter, payload: Any) -> dict[str, Callable[[], Any]]:
+    raw = encode(payload)
+    instance = adapter.validate_json(raw)
+    return {
+        "validate_json": lambda: adapter.validate_json(raw),
+        "validate_python": lambda: adapter.validate_python(payload),
+        "dump_python": lambda: adapter.dump_python(instance),
+        "dump_json": lambda: adapter.dump_json(instance),
+    }
+
+
+def _best(operation: Callable[[], Any], min_time: float, repeat: int) -> float:
+    """Best time per call, over `repeat` rounds of at least `min_time` seconds each."""
+    operation()
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            operation()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            operation()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def _targets(args) -> list[tuple[str, str, TypeAdapter, Any, int]]:
+    """(group, name, adapter, payload, items) for each measured target; `items` is the number of pages/blocks in the payload."""
+    gen = PayloadGenerator(seed=args.seed)
+    mix = parse_mix(args.property_mix) if args.property_mix else DEFAULT_PROPERTY_MIX
+    tree = gen.block_tree(depth=args.depth, width=args.width)
+    tree_size = sum(args.width**level for level in range(1, args.depth + 1))
+
+    targets = [
+        ("model", "Page", TypeAdapter(Page), gen.page(mix), 1),
+        ("model", "Database", TypeAdapter(Database), gen.database(mix), 1),
+        ("model", "BlockObject", TypeAdapter(BlockObject), tree[0], tree_size // args.width),  # fmt: skip
+        (
+            "model",
+            "QueryDatabaseResponse",
+            TypeAdapter(QueryDatabaseResponse),
+            gen.paginated([gen.page(mix) for _ in range(args.pages)], "page_or_database"),  # fmt: skip
+            args.pages,
+        ),
+        (
+            "model",
+            "RetrieveBlockChildrenResponse",
+            TypeAdapter(RetrieveBlockChildrenResponse),
+            gen.paginated(tree, "block"),
+            tree_size,
+        ),
+    ]
+    block_adapter = TypeAdapter(BlockObject)
+    for type_ in BLOCK_TYPES:
+        targets.append(("block_type", type_, block_adapter, gen.block(type_), 1))
+    property_adapter = TypeAdapter(PageProperty)
+    for type_ in PAGE_PROPERTY_TYPES:
+        targets.append(("property_type", type_, property_adapter, gen.page_property(type_), 1))  # fmt: skip
+    return targets
+
+
+def run(args) -> dict:
+    results = []
+    for group, name, adapter, payload, items in _targets(args):
+        operations = _operations(adapter, payload)
+        for operation in OPERATIONS:
+            seconds = _best(operations[operation], args.min_time, args.repeat)
+            results.append(
+                {
+                    "group": group,
+                    "name": name,
+                    "operation": operation,
+                    "us_per_op": round(seconds * 1e6, 3),
+                    "ops_per_sec": round(1 / seconds, 1),
+                    "items_per_sec": round(items / seconds, 1),
+                    "payload_bytes": len(encode(payload)),
+                }
+            )
+    return {"meta": _meta(args), "results": results}
+
+
+def _meta(args) -> dict:
+    try:
+        revision = subprocess.run(
+            ["git", "describe", "--always", "--dirty", "--tags"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        revision = None
+    return {
+        "revision": revision,
+        "python": platform.python_version(),
+        "pydantic": pydantic.VERSION,
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "parameters": {
+            key: getattr(args, key)
+            for key in ("seed", "pages", "depth", "width", "property_mix", "min_time", "repeat")  # fmt: skip
+        },
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list[str]:
+    """The measurements of `report` that are more than `tolerance` (e.g. 0.2 = 20%) slower than in `baseline`."""
+    previous = {
+        (r["group"], r["name"], r["operation"]): r["us_per_op"]
+        for r in baseline["results"]
+    }
+    regressions = []
+    for r in report["results"]:
+        before = previous.get((r["group"], r["name"], r["operation"]))
+        if before and r["us_per_op"] > before * (1 + tolerance):
+            regressions.append(
+                f"{r['group']}/{r['name']}/{r['operation']}: "
+                f"{before:.2f} us -> {r['us_per_op']:.2f} us ({r['us_per_op'] / before - 1:+.0%})"
+            )
+    return regressions
+
+
+def _print_table(report: dict):
+    print(f"{'target':<40}" + "".join(f"{op:>17}" for op in OPERATIONS))
+    rows: dict[tuple[str, str], dict[str, float]] = {}
+    for r in report["results"]:
+        rows.setdefault((r["group"], r["name"]), {})[r["operation"]] = r["us_per_op"]
+    for (group, name), timings in rows.items():
+        label = name if group == "model" else f"{group}:{name}"
+        print(f"{label:<40}" + "".join(f"{timings[op]:>14.1f} us" for op in OPERATIONS))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--pages", type=int, default=100, help="Pages of the QueryDatabaseResponse.")  # fmt: skip
+    parser.add_argument("--depth", type=int, default=3, help="Depth of the block tree.")
+    parser.add_argument("--width", type=int, default=5, help="Children per block of the block tree.")  # fmt: skip
+    parser.add_argument("--property-mix", help='Property types of pages and databases, e.g. "title=1,rich_text=10".')  # fmt: skip
+    parser.add_argument("--min-time", type=float, default=0.2, help="Seconds per measurement round.")  # fmt: skip
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--quick", action="store_true", help="Shorter rounds, for smoke runs.")  # fmt: skip
+    parser.add_argument("--output", help="Write the JSON report to this file.")
+    parser.add_argument("--compare", help="Compare against a previous JSON report.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown against --compare.")  # fmt: skip
+    args = parser.parse_args()
+    if args.quick:
+        args.min_time, args.repeat = 0.02, 1
+
+    report = run(args)
+    _print_table(report)
+    if args.output:
+        with open(args.output, "w") as fp:
+            json.dump(report, fp, indent=2)
+    if args.compare:
+        with open(args.compare) as fp:
+            regressions = compare(report, json.load(fp), args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) against {args.compare}:")
+            print("\n".join(f"  {line}" for line in regressions))
+            sys.exit(1)
+        print(f"\nNo regression against {args.compare}.")
+
+
+if __name__ == "__main__":
+    main()
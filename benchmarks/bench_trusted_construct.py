@@ -0,0 +1,61 @@
+"""
+Throughput of `model_validate_json` vs. `TrustedAdapter.construct_json` on paginated responses.
+
+Run with:
+
+    python -m benchmarks.bench_trusted_construct [--items N] [--repeat R] [--sample-rate S]
+"""
+
+import time
+import argparse
+
+from pydantic_api.notion.models import (
+    TrustedAdapter,
+    QueryDatabaseResponse,
+    RetrieveCommentsResponse,
+    RetrieveBlockChildrenResponse,
+)
+
+from .fixtures import PayloadGenerator, encode
+
+PAGE_PROPERTIES = {"title": 1, "people": 1, "email": 1, "multi_select": 1, "select": 1, "url": 1, "date": 1}  # fmt: skip
+
+
+def _time(decode, payload: bytes, repeat: int) -> float:
+    decode(payload)  # warm up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        decode(payload)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--sample-rate", type=float, default=0.01)
+    args = parser.parse_args()
+
+    gen = PayloadGenerator(seed=0)
+    cases = [
+        ("pages", QueryDatabaseResponse, gen.paginated([gen.page(PAGE_PROPERTIES) for _ in range(args.items)], "page_or_database")),
+        ("blocks", RetrieveBlockChildrenResponse, gen.paginated([gen.block("paragraph") for _ in range(args.items)], "block")),
+        ("comments", RetrieveCommentsResponse, gen.paginated(gen.comment_thread(args.items), "comment")),
+    ]  # fmt: skip
+
+    print(f"{'response':<10}{'validate':>12}{'trusted':>12}{'sampled':>12}{'speedup':>10}")
+    for label, response_type, response in cases:
+        payload = encode(response)
+        trusted = TrustedAdapter(response_type)
+        sampled = TrustedAdapter(response_type, sample_rate=args.sample_rate, seed=0)
+        validate_time = _time(response_type.model_validate_json, payload, args.repeat)
+        trusted_time = _time(trusted.construct_json, payload, args.repeat)
+        sampled_time = _time(sampled.construct_json, payload, args.repeat)
+        print(
+            f"{label:<10}{validate_time * 1e3:>9.2f} ms{trusted_time * 1e3:>9.2f} ms"
+            f"{sampled_time * 1e3:>9.2f} ms{validate_time / trusted_time:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
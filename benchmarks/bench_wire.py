@@ -0,0 +1,55 @@
+"""
+Time to turn a batch of requests into what is sent: the usual `model_dump`, pop the path parameters, format the path and `json.dumps` the rest, vs. `encode_request`.
+
+Run with:
+
+    python -m benchmarks.bench_wire [--requests N] [--blocks B]
+"""
+
+import json
+import time
+import argparse
+
+from pydantic_api.notion.models import (
+    AppendBlockChildrenRequest,
+    UpdatePagePropertiesRequest,
+    QueryDatabaseRequest,
+    encode_request,
+)
+
+from .bench_limits import _requests
+
+
+def _by_hand(request) -> tuple:
+    data = request.model_dump(mode="json", exclude_none=True)
+    if isinstance(request, AppendBlockChildrenRequest):
+        method, path = "PATCH", f"/v1/blocks/{data.pop('block_id')}/children"
+    elif isinstance(request, UpdatePagePropertiesRequest):
+        method, path = "PATCH", f"/v1/pages/{data.pop('page_id')}"
+    elif isinstance(request, QueryDatabaseRequest):
+        method, path = "POST", f"/v1/databases/{data.pop('database_id')}/query"
+    else:
+        method, path = "POST", f"/v1/{type(request).__name__.removeprefix('Create').lower()}s"  # fmt: skip
+    return method, path, "", json.dumps(data, separators=(",", ":")).encode()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--blocks", type=int, default=20)
+    args = parser.parse_args()
+
+    requests = _requests(args.requests, args.blocks)
+    print(f"{len(requests)} requests")
+    print(f"{'mode':<16}{'time':>12}{'requests/s':>14}{'body':>12}")
+    for label, encode in (("by hand", _by_hand), ("encode_request", encode_request)):  # fmt: skip
+        encode(requests[0])
+        start = time.perf_counter()
+        encoded = [encode(request) for request in requests]
+        elapsed = time.perf_counter() - start
+        size = sum(len(body) for *_, body in encoded)
+        print(f"{label:<16}{elapsed * 1e3:>9.1f} ms{len(requests) / elapsed:>14,.0f}{size / len(requests):>10.0f} B")  # fmt: skip
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,473 @@
+"""
+Synthetic Notion API payloads for the benchmarks, shaped like real responses.
+
+`PayloadGenerator` is seeded, so the same arguments always produce the same payloads and results stay comparable across runs and releases.
+
+Example:
+
+    gen = PayloadGenerator(seed=0)
+    page = gen.page({"title": 1, "rich_text": 10, "relation": 5})
+    children = gen.paginated(gen.block_tree(depth=2, width=5), "block")
+"""
+
+import json
+import uuid
+import random
+from typing import Any, Mapping
+
+
+TIMESTAMP = "2024-11-01T10:00:00.000Z"
+
+ANNOTATIONS = {
+    "bold": False,
+    "italic": False,
+    "strikethrough": False,
+    "underline": False,
+    "code": False,
+    "color": "default",
+}
+
+WORDS = "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor incididunt ut labore et dolore magna aliqua".split()
+
+PAGE_PROPERTY_TYPES = [
+    "button",
+    "checkbox",
+    "created_by",
+    "created_time",
+    "date",
+    "email",
+    "files",
+    "formula",
+    "last_edited_by",
+    "last_edited_time",
+    "multi_select",
+    "number",
+    "people",
+    "phone_number",
+    "relation",
+    "rich_text",
+    "rollup",
+    "select",
+    "status",
+    "title",
+    "url",
+    "unique_id",
+    "verification",
+]
+
+DATABASE_PROPERTY_TYPES = [
+    type_ for type_ in PAGE_PROPERTY_TYPES if type_ != "verification"
+]
+
+BLOCK_TYPES = [
+    "bookmark",
+    "breadcrumb",
+    "bulleted_list_item",
+    "callout",
+    "child_database",
+    "child_page",
+    "code",
+    "column",
+    "column_list",
+    "divider",
+    "embed",
+    "equation",
+    "file",
+    "heading_1",
+    "heading_2",
+    "heading_3",
+    "image",
+    "link_preview",
+    "numbered_list_item",
+    "paragraph",
+    "pdf",
+    "quote",
+    "synced_block",
+    "table",
+    "table_of_contents",
+    "table_row",
+    "template",
+    "to_do",
+    "toggle",
+    "video",
+]
+
+PARENT_BLOCK_TYPES = [
+    "bulleted_list_item",
+    "numbered_list_item",
+    "paragraph",
+    "quote",
+    "to_do",
+    "toggle",
+]
+"""Block types whose data carries nested `children`."""
+
+DEFAULT_PROPERTY_MIX: dict[str, int] = {
+    "title": 1,
+    "rich_text": 3,
+    "number": 2,
+    "select": 2,
+    "multi_select": 2,
+    "status": 1,
+    "date": 2,
+    "people": 1,
+    "relation": 2,
+    "checkbox": 1,
+    "url": 1,
+    "email": 1,
+    "formula": 1,
+    "created_time": 1,
+    "last_edited_by": 1,
+}
+"""A typical database row: 22 properties, mostly text, options and references."""
+
+
+class PayloadGenerator:
+    """Builds JSON-compatible payloads (dicts and lists) of Notion objects.
+
+    Args:
+        seed: Seed of the ids and texts.
+        words: Number of words of each generated text.
+    """
+
+    def __init__(self, seed: int = 0, words: int = 12):
+        self._random = random.Random(seed)
+        self.words = words
+
+    # Primitives
+    def uuid(self) -> str:
+        return str(uuid.UUID(int=self._random.getrandbits(128), version=4))
+
+    def sentence(self, words: int | None = None) -> str:
+        return " ".join(self._random.choices(WORDS, k=words or self.words))
+
+    def text(self, content: str | None = None) -> dict:
+        """A single `text` rich text object."""
+        if content is None:
+            content = self.sentence()
+        return {
+            "type": "text",
+            "text": {"content": content, "link": None},
+            "annotations": dict(ANNOTATIONS),
+            "plain_text": content,
+            "href": None,
+        }
+
+    def rich_text(self, items: int = 1, words: int | None = None) -> list[dict]:
+        return [self.text(self.sentence(words)) for _ in range(items)]
+
+    def partial_user(self) -> dict:
+        return {"object": "user", "id": self.uuid()}
+
+    def person(self) -> dict:
+        name = self.sentence(2).title()
+        return {
+            "object": "user",
+            "id": self.uuid(),
+            "type": "person",
+            "name": name,
+            "avatar_url": "https://example.com/avatar.png",
+            "person": {"email": f"{name.replace(' ', '.').lower()}@example.com"},
+        }
+
+    def option(self) -> dict:
+        return {"id": self.uuid(), "name": self.sentence(2), "color": "blue"}
+
+    def external_file(self, name: str | None = None) -> dict:
+        payload = {"type": "external", "external": {"url": "https://example.com/file.pdf"}}  # fmt: skip
+        if name is not None:
+            payload["name"] = name
+        return payload
+
+    # Pages
+    def page_property(self, type_: str) -> dict:
+        """The value of a page property of type `type_`, see `PAGE_PROPERTY_TYPES`."""
+        value: Any
+        if type_ == "button":
+            value = {}
+        elif type_ == "checkbox":
+            value = self._random.random() < 0.5
+        elif type_ in ("created_by", "last_edited_by"):
+            value = self.partial_user()
+        elif type_ in ("created_time", "last_edited_time"):
+            value = TIMESTAMP
+        elif type_ == "date":
+            value = {"start": "2024-11-01", "end": None, "time_zone": None}
+        elif type_ == "email":
+            value = "someone@example.com"
+        elif type_ == "files":
+            value = [self.external_file(name="file.pdf") for _ in range(2)]
+        elif type_ == "formula":
+            value = {"type": "number", "number": self._random.randint(0, 1000)}
+        elif type_ == "multi_select":
+            value = [self.option() for _ in range(3)]
+        elif type_ == "number":
+            value = self._random.randint(0, 1000)
+        elif type_ == "people":
+            value = [self.person() for _ in range(2)]
+        elif type_ == "phone_number":
+            value = "415-867-5309"
+        elif type_ == "relation":
+            value = [{"id": self.uuid()} for _ in range(5)]
+        elif type_ in ("rich_text", "title"):
+            value = self.rich_text(2)
+        elif type_ == "rollup":
+            value = {"type": "number", "number": 42, "function": "sum"}
+        elif type_ in ("select", "status"):
+            value = self.option()
+        elif type_ == "url":
+            value = "https://example.com/page"
+        elif type_ == "unique_id":
+            value = {"number": self._random.randint(1, 1000), "prefix": "TASK"}
+        elif type_ == "verification":
+            value = {"state": "verified", "verified_by": self.person(), "date": {"start": TIMESTAMP}}  # fmt: skip
+        else:
+            raise ValueError(f"Unknown page property type: {type_}")
+        payload = {"id": self.uuid()[:4], "type": type_, type_: value}
+        if type_ == "relation":
+            payload["has_more"] = False
+        return payload
+
+    def page(self, properties: Mapping[str, int] | None = None) -> dict:
+        """A page, with `properties` mapping each property type to the number of properties of that type (default: `DEFAULT_PROPERTY_MIX`)."""
+        if properties is None:
+            properties = DEFAULT_PROPERTY_MIX
+        user = self.partial_user()
+        return {
+            "object": "page",
+            "id": self.uuid(),
+            "created_time": TIMESTAMP,
+            "created_by": user,
+            "last_edited_time": TIMESTAMP,
+            "last_edited_by": user,
+            "archived": False,
+            "in_trash": False,
+            "icon": {"type": "emoji", "emoji": "😻"},
+            "cover": None,
+            "parent": {"type": "database_id", "database_id": self.uuid()},
+            "url": "https://www.notion.so/page",
+            "public_url": None,
+            "properties": {
+                _property_name(type_, i, count): self.page_property(type_)
+                for type_, count in properties.items()
+                for i in range(count)
+            },
+        }
+
+    # Databases
+    def database_property(self, type_: str) -> dict:
+        """The schema of a database property of type `type_`, see `DATABASE_PROPERTY_TYPES`."""
+        config: dict
+        if type_ == "formula":
+            config = {"expression": 'prop("Price") * 2'}
+        elif type_ in ("multi_select", "select"):
+            config = {"options": [self.option() for _ in range(5)]}
+        elif type_ == "number":
+            config = {"format": "number"}
+        elif type_ == "relation":
+            config = {"type": "dual_property", "database_id": self.uuid(), "dual_property": {}}  # fmt: skip
+        elif type_ == "rollup":
+            config = {
+                "relation_property_name": "Related",
+                "rollup_property_name": "Price",
+                "function": "sum",
+            }
+        elif type_ == "status":
+            config = {"options": [self.option() for _ in range(3)], "groups": []}
+        elif type_ == "unique_id":
+            config = {"prefix": "TASK"}
+        elif type_ in DATABASE_PROPERTY_TYPES:
+            config = {}
+        else:
+            raise ValueError(f"Unknown database property type: {type_}")
+        return {"id": self.uuid()[:4], "type": type_, type_: config}
+
+    def database(self, properties: Mapping[str, int] | None = None) -> dict:
+        """A database, with a schema built like the properties of `page`."""
+        if properties is None:
+            properties = DEFAULT_PROPERTY_MIX
+        user = self.partial_user()
+        schema = {}
+        for type_, count in properties.items():
+            for i in range(count):
+                name = _property_name(type_, i, count)
+                schema[name] = {"name": name, **self.database_property(type_)}
+        return {
+            "object": "database",
+            "id": self.uuid(),
+            "created_time": TIMESTAMP,
+            "created_by": user,
+            "last_edited_time": TIMESTAMP,
+            "last_edited_by": user,
+            "title": self.rich_text(1, words=3),
+            "description": [],
+            "icon": None,
+            "cover": None,
+            "properties": schema,
+            "parent": {"type": "page_id", "page_id": self.uuid()},
+            "archived": False,
+            "url": "https://www.notion.so/database",
+        }
+
+    # Blocks
+    def block(self, type_: str, children: list[dict] | None = None) -> dict:
+        """A block of type `type_`, see `BLOCK_TYPES`. `children` are nested in the block data of `PARENT_BLOCK_TYPES`."""
+        data: dict
+        if type_ in ("bulleted_list_item", "numbered_list_item", "paragraph", "quote", "toggle"):  # fmt: skip
+            data = {"rich_text": self.rich_text(2), "color": "default"}
+        elif type_ == "to_do":
+            data = {"rich_text": self.rich_text(1), "checked": False, "color": "default"}  # fmt: skip
+        elif type_ in ("heading_1", "heading_2", "heading_3"):
+            data = {"rich_text": self.rich_text(1, words=4), "color": "default", "is_toggleable": False}  # fmt: skip
+        elif type_ == "bookmark":
+            data = {"caption": [], "url": "https://example.com"}
+        elif type_ in ("embed", "link_preview"):
+            data = {"url": "https://example.com"}
+        elif type_ == "callout":
+            data = {"rich_text": self.rich_text(1), "icon": {"type": "emoji", "emoji": "💡"}, "color": "default"}  # fmt: skip
+        elif type_ in ("child_database", "child_page"):
+            data = {"title": self.sentence(3)}
+        elif type_ == "code":
+            data = {"caption": [], "rich_text": self.rich_text(1), "language": "python"}
+        elif type_ == "equation":
+            data = {"expression": "e^{i\\pi} + 1 = 0"}
+        elif type_ in ("file", "image", "pdf", "video"):
+            data = {**self.external_file(), "caption": []}
+        elif type_ == "synced_block":
+            data = {"synced_from": None}
+        elif type_ == "table":
+            data = {"table_width": 3, "has_column_header": True, "has_row_header": False}  # fmt: skip
+        elif type_ == "table_row":
+            data = {"cells": self.rich_text(3, words=2)}
+        elif type_ == "table_of_contents":
+            data = {"color": "default"}
+        elif type_ == "template":
+            data = {"rich_text": self.rich_text(1)}
+        elif type_ in ("breadcrumb", "column", "column_list", "divider"):
+            data = {}
+        else:
+            raise ValueError(f"Unknown block type: {type_}")
+        if children:
+            data["children"] = children
+        user = self.partial_user()
+        return {
+            "object": "block",
+            "id": self.uuid(),
+            "parent": {"type": "page_id", "page_id": self.uuid()},
+            "type": type_,
+            "created_time": TIMESTAMP,
+            "created_by": user,
+            "last_edited_time": TIMESTAMP,
+            "last_edited_by": user,
+            "archived": False,
+            "in_trash": False,
+            "has_children": bool(children),
+            type_: data,
+        }
+
+    def block_tree(
+        self, depth: int = 2, width: int = 5, types: list[str] | None = None
+    ) -> list[dict]:
+        """`width` blocks, each with `width` nested children down to `depth` levels. Blocks cycle through `types` (default: `PARENT_BLOCK_TYPES`)."""
+        types = types or PARENT_BLOCK_TYPES
+        blocks = []
+        for i in range(width):
+            children = self.block_tree(depth - 1, width, types) if depth > 1 else None
+            blocks.append(self.block(types[i % len(types)], children))
+        return blocks
+
+    def block_children_pages(
+        self,
+        page_id: str,
+        depth: int = 2,
+        width: int = 5,
+        page_size: int = 100,
+        types: list[str] | None = None,
+    ) -> list[tuple[str, dict]]:
+        """
+        The responses of retrieving every block of a page, as `(parent_id, response)` pairs in retrieval order.
+
+        Like `block_tree`, but flattened the way the API returns it: each parent's children come in pages of at most `page_size` blocks, with `parent` and `has_children` set.
+        """
+        types = types or PARENT_BLOCK_TYPES
+        responses = []
+        parents = [(page_id, "page_id", depth)]
+        while parents:
+            parent_id, parent_type, levels = parents.pop(0)
+            children = []
+            for i in range(width):
+                block = self.block(types[i % len(types)])
+                block["parent"] = {"type": parent_type, parent_type: parent_id}
+                block["has_children"] = levels > 1
+                children.append(block)
+                if levels > 1:
+                    parents.append((block["id"], "block_id", levels - 1))
+            for start in range(0, width, page_size):
+                more = start + page_size < width
+                response = self.paginated(children[start : start + page_size], "block", next_cursor=self.uuid() if more else None)  # fmt: skip
+                responses.append((parent_id, response))
+        return responses
+
+    # Comments
+    def comment(self, discussion_id: str | None = None, page_id: str | None = None) -> dict:  # fmt: skip
+        return {
+            "object": "comment",
+            "id": self.uuid(),
+            "parent": {"type": "page_id", "page_id": page_id or self.uuid()},
+            "discussion_id": discussion_id or self.uuid(),
+            "created_time": TIMESTAMP,
+            "last_edited_time": TIMESTAMP,
+            "created_by": self.partial_user(),
+            "rich_text": self.rich_text(1),
+        }
+
+    def comment_thread(self, comments: int = 10) -> list[dict]:
+        """`comments` comments of one discussion on one page."""
+        discussion_id, page_id = self.uuid(), self.uuid()
+        return [self.comment(discussion_id, page_id) for _ in range(comments)]
+
+    # Envelopes
+    def paginated(
+        self, results: list, type_: str, next_cursor: str | None = None
+    ) -> dict:
+        """A paginated list response, e.g. `paginated(pages, "page_or_database")`."""
+        return {
+            "object": "list",
+            "results": results,
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None,
+            "type": type_,
+            type_: {},
+            "request_id": self.uuid(),
+        }
+
+
+def _property_name(type_: str, i: int, count: int) -> str:
+    name = type_.replace("_", " ").title()
+    return name if count == 1 else f"{name} {i + 1}"
+
+
+def encode(payload: Any) -> bytes:
+    """The payload as the API would send it."""
+    return json.dumps(payload, ensure_ascii=False).encode()
+
+
+def parse_mix(spec: str) -> dict[str, int]:
+    """Parse a property mix such as `"title=1,rich_text=10,number=5"`."""
+    mix = {}
+    for item in spec.split(","):
+        type_, _, count = item.partition("=")
+        mix[type_.strip()] = int(count or 1)
+    return mix
+
+
+__all__ = [
+    "PAGE_PROPERTY_TYPES",
+    "DATABASE_PROPERTY_TYPES",
+    "BLOCK_TYPES",
+    "PARENT_BLOCK_TYPES",
+    "DEFAULT_PROPERTY_MIX",
+    "PayloadGenerator",
+    "encode",
+    "parse_mix",
+]
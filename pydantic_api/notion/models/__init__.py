@@ -1,2 +1,96 @@
-from .objects import *
-from .endpoints import *
+"""
+Module: `pydantic_api.notion.models`
+
+All Notion data models, re-exported from `pydantic_api.notion.models.objects` and `pydantic_api.notion.models.endpoints`, plus `TrustedAdapter` from `pydantic_api.notion.models.trusted` `json_size` from `pydantic_api.notion.models.size` the request linter from `pydantic_api.notion.models.limits` the compiled page decoders from `pydantic_api.notion.models.decoders` the columnar extraction of pages from `pydantic_api.notion.models.columns`, the wire encoding of requests from `pydantic_api.notion.models.wire`, the property diff from `pydantic_api.notion.models.diff`, the content fingerprints from `pydantic_api.notion.models.fingerprints`, the interning of repeated objects from `pydantic_api.notion.models.interning` and the compact timestamps from `pydantic_api.notion.models.compact`. Names are resolved lazily (PEP 562): importing a model only imports the submodules it depends on.
+"""
+
+from typing import TYPE_CHECKING
+
+from ._lazy import attach
+from . import objects, endpoints
+
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        ".objects": objects.__all__,
+        ".endpoints": endpoints.__all__,
+        ".trusted": ["TrustedAdapter"],
+        ".size": ["json_size"],
+        ".limits": [
+            "MAX_ARRAY_LENGTH",
+            "MAX_TEXT_LENGTH",
+            "MAX_URL_LENGTH",
+            "MAX_EQUATION_LENGTH",
+            "MAX_EMAIL_LENGTH",
+            "MAX_PHONE_NUMBER_LENGTH",
+            "MAX_BLOCKS_PER_REQUEST",
+            "LimitViolation",
+            "lint_request",
+            "lint_requests",
+        ],
+        ".decoders": [
+            "DECODER_CACHE_SIZE",
+            "PageDecoder",
+            "compile_page_decoder",
+        ],
+        ".columns": [
+            "NAT",
+            "Column",
+            "NumberColumn",
+            "CheckboxColumn",
+            "DatetimeColumn",
+            "DateColumn",
+            "CategoryColumn",
+            "ListColumn",
+            "TextColumn",
+            "PageColumns",
+            "extract_columns",
+        ],
+        ".wire": [
+            "API_VERSION_PREFIX",
+            "WireRequest",
+            "RequestEncoder",
+            "request_encoder",
+            "encode_request",
+        ],
+        ".diff": [
+            "READ_ONLY_PROPERTY_TYPES",
+            "property_fingerprint",
+            "property_fingerprints",
+            "diff_properties",
+            "diff_page",
+        ],
+        ".fingerprints": [
+            "DIGEST_SIZE",
+            "fingerprint",
+            "merkle_hashes",
+            "merkle_root",
+            "changed_nodes",
+        ],
+        ".interning": [
+            "INTERN_POOL_SIZE",
+            "INTERNED_TYPES",
+            "InternPool",
+        ],
+        ".compact": [
+            "compact_timestamps",
+            "compact_all",
+        ],
+    },
+)
+
+
+if TYPE_CHECKING:
+    from .objects import *
+    from .endpoints import *
+    from .trusted import *
+    from .size import *
+    from .limits import *
+    from .decoders import *
+    from .columns import *
+    from .wire import *
+    from .diff import *
+    from .fingerprints import *
+    from .interning import *
+    from .compact import *
@@ -0,0 +1,56 @@
+"""
+Lazy attribute loading for the `pydantic_api.notion.models` packages (PEP 562).
+
+A package declares which public names live in which submodule, and the submodule is only imported the first time one of its names is accessed.
+"""
+
+import sys
+import importlib
+from typing import Any, Callable
+
+
+def attach(
+    package: str, submodules: dict[str, list[str]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]], list[str]]:
+    """Build the module-level `__getattr__`, `__dir__` and `__all__` of a lazy package.
+
+    Args:
+        package: `__name__` of the package.
+        submodules: Maps a relative submodule name (e.g. `".page"`) to the public names it provides. If a name is listed under several submodules, the last one wins, like consecutive star imports.
+
+    Returns:
+        A `(__getattr__, __dir__, __all__)` tuple to assign in the package namespace.
+    """
+    name_to_module = {
+        name: module
+        for module, module_names in submodules.items()
+        for name in module_names
+    }
+    names = list(name_to_module)
+
+    def __getattr__(name: str) -> Any:
+        module_name = name_to_module.get(name)
+        if module_name is None:
+            # Fall back to submodule access, e.g. `models.objects`.
+            try:
+                return importlib.import_module(f".{name}", package)
+            except ModuleNotFoundError as e:
+                if e.name != f"{package}.{name}":
+                    raise
+                raise AttributeError(
+                    f"module {package!r} has no attribute {name!r}"
+                ) from None
+        value = getattr(importlib.import_module(module_name, package), name)
+        # Cache on the package so that later lookups skip `__getattr__`.
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return list(names)
+
+    return __getattr__, __dir__, names
+
+
+__all__ = [
+    "attach",
+]
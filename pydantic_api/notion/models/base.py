@@ -0,0 +1,45 @@
+"""
+Module: `pydantic_api.notion.models.base`
+
+The BaseModel shared by all Notion data models.
+"""
+
+from typing import Any
+from weakref import WeakValueDictionary
+
+from pydantic import ConfigDict
+
+from pydantic_api.base import BaseModel as _BaseModel
+
+
+_frozen: "WeakValueDictionary[int, BaseModel]" = WeakValueDictionary()
+"""The instances shared by an `InternPool` (`pydantic_api.notion.models.interning`), by id. Models are unhashable, hence a dictionary rather than a `WeakSet`; an entry goes away with its instance, so its id is never matched once reused."""
+
+
+class BaseModel(_BaseModel):
+    """The BaseModel for Notion data models.
+
+    Validators and serializers are built on first use (`defer_build`) rather than at class creation, so importing a module only pays for the models that are actually used.
+
+    Instances can also be created without the validator of their class, by `model_construct`, `TrustedAdapter` or as a nested member validated by another model: their class is built when the first one is, so that serializing them by inference (e.g. `pydantic_core.to_json` or a field typed `Any`) finds a real serializer.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+    def __setattr__(self, name: str, value: Any):
+        if _frozen and _frozen.get(id(self)) is self:
+            raise TypeError(f"{type(self).__name__} instances interned by an InternPool cannot be modified, modify a model_copy() instead")  # fmt: skip
+        # Drop the size cached by `pydantic_api.notion.models.size.json_size`
+        self.__dict__.pop("_json_size", None)
+        super().__setattr__(name, value)
+
+    def model_post_init(self, context: Any):
+        """Build the class of the first instance created without its own validator, see above."""
+        cls = type(self)
+        if not cls.__pydantic_complete__:
+            cls.model_rebuild()
+
+
+__all__ = [
+    "BaseModel",
+]
@@ -0,0 +1,475 @@
+"""
+Columnar extraction of database rows, for analytics.
+
+`extract_columns` turns a stream of pages, as `Page` models or as raw payloads, into one typed column per property. Values are stored in compact `array.array` buffers rather than as one pydantic object each:
+
+- `number` as floats (`NaN` when empty), and `checkbox` as bytes;
+- `date` (start and end) and the `created_time` and `last_edited_time` timestamps as microseconds since the epoch, in UTC, with the smallest int64 for none (NumPy's `NaT`);
+- `select` and `status` as codes into the list of their option names (dictionary encoding), `-1` when empty;
+- `multi_select`, `relation` and `people` as offsets into a flat array of such codes, into option names, page ids or user ids;
+- `title`, `rich_text`, `url`, `email` and `phone_number` as lists of strings.
+
+The other property types (formulas, rollups, files, ...) are skipped. NumPy is not required: with NumPy installed, `to_numpy()` wraps the buffers without copying them.
+"""
+
+from abc import ABC, abstractmethod
+from array import array
+from collections.abc import Mapping
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable, Iterator, Optional
+
+from .objects import LazyPageProperties
+
+NAT = -(2**63)
+"""The timestamp of a missing date, the `NaT` of NumPy."""
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _get(value: Any, name: str) -> Any:
+    """The field `name` of a model or of its payload."""
+    if type(value) is dict:
+        return value.get(name)
+    return getattr(value, name, None)
+
+
+def _micros(value: Any) -> int:
+    """A date or timestamp (object or ISO 8601 string) in microseconds since the epoch, in UTC; naive values are taken as UTC."""
+    if value is None:
+        return NAT
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    elif not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _from_micros(value: int) -> Optional[datetime]:
+    return None if value == NAT else _EPOCH + value * _MICROSECOND
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError as e:  # pragma: no cover - depends on the environment
+        raise ImportError("to_numpy() requires NumPy: pip install numpy") from e
+    return numpy
+
+
+class Column(ABC):
+    """The values of one property, one per row.
+
+    Attributes:
+        type: The type of the property, e.g. `number`.
+    """
+
+    __slots__ = ("type",)
+
+    def __init__(self, type_: str):
+        self.type = type_
+
+    @abstractmethod
+    def __len__(self) -> int: ...
+
+    @abstractmethod
+    def __getitem__(self, row: int) -> Any:
+        """The value of `row`, as a Python object."""
+
+    def __iter__(self) -> Iterator[Any]:
+        for row in range(len(self)):
+            yield self[row]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(type={self.type!r}, rows={len(self)})"
+
+    @abstractmethod
+    def append(self, value: Any):
+        """Add the value of the next row, as returned by the extractor of the property type; `None` when the row has none."""
+
+    @abstractmethod
+    def nbytes(self) -> int:
+        """Size of the buffers of the column, in bytes."""
+
+
+class NumberColumn(Column):
+    """`number` properties, as floats; `NaN` when empty."""
+
+    __slots__ = ("values",)
+
+    def __init__(self, type_: str):
+        super().__init__(type_)
+        self.values = array("d")
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, row: int) -> Optional[float]:
+        value = self.values[row]
+        return None if value != value else value
+
+    def append(self, value: Optional[float]):
+        self.values.append(float("nan") if value is None else value)
+
+    def nbytes(self) -> int:
+        return self.values.itemsize * len(self.values)
+
+    def to_numpy(self):
+        """A float64 array of the values."""
+        return _numpy().frombuffer(self.values, dtype="float64")
+
+
+class CheckboxColumn(Column):
+    """`checkbox` properties, as bytes: 1 when checked, 0 otherwise (or when the row has none)."""
+
+    __slots__ = ("values",)
+
+    def __init__(self, type_: str):
+        super().__init__(type_)
+        self.values = array("B")
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, row: int) -> bool:
+        return bool(self.values[row])
+
+    def append(self, value: Optional[bool]):
+        self.values.append(1 if value else 0)
+
+    def nbytes(self) -> int:
+        return len(self.values)
+
+    def to_numpy(self):
+        """A bool array of the values."""
+        return _numpy().frombuffer(self.values, dtype="bool")
+
+
+class _MicrosColumn(Column):
+    """Timestamps in microseconds since the epoch; `NAT` when empty."""
+
+    __slots__ = ("values",)
+
+    def __init__(self, type_: str):
+        super().__init__(type_)
+        self.values = array("q")
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, row: int) -> Optional[datetime]:
+        return _from_micros(self.values[row])
+
+    def nbytes(self) -> int:
+        return self.values.itemsize * len(self.values)
+
+    def to_numpy(self):
+        """A datetime64[us] array of the values, in UTC."""
+        return _numpy().frombuffer(self.values, dtype="datetime64[us]")
+
+
+class DatetimeColumn(_MicrosColumn):
+    """`created_time` and `last_edited_time` properties, in microseconds since the epoch; `NAT` when empty."""
+
+    __slots__ = ()
+
+    def append(self, value: Optional[int]):
+        self.values.append(NAT if value is None else value)
+
+
+class DateColumn(_MicrosColumn):
+    """`date` properties: `values` are the starts, and `ends` the ends of the ranges (`NAT` if the date is not a range)."""
+
+    __slots__ = ("ends",)
+
+    def __init__(self, type_: str):
+        super().__init__(type_)
+        self.ends = array("q")
+
+    def append(self, value: Optional[tuple[int, int]]):
+        start, end = (NAT, NAT) if value is None else value
+        self.values.append(start)
+        self.ends.append(end)
+
+    def nbytes(self) -> int:
+        return 2 * super().nbytes()
+
+    def end_to_numpy(self):
+        """A datetime64[us] array of the ends, in UTC."""
+        return _numpy().frombuffer(self.ends, dtype="datetime64[us]")
+
+
+class _CodedColumn(Column):
+    """Dictionary encoded strings: `codes` index `categories`."""
+
+    __slots__ = ("codes", "categories", "_index")
+
+    def __init__(self, type_: str):
+        super().__init__(type_)
+        self.codes = array("i")
+        self.categories: list[str] = []
+        self._index: dict[str, int] = {}
+
+    def _code(self, value: str) -> int:
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.categories)
+            self.categories.append(value)
+        return code
+
+    def nbytes(self) -> int:
+        return self.codes.itemsize * len(self.codes)
+
+
+class CategoryColumn(_CodedColumn):
+    """`select` and `status` properties, dictionary encoded: `codes` index `categories`, the option names; `-1` when empty."""
+
+    __slots__ = ()
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, row: int) -> Optional[str]:
+        code = self.codes[row]
+        return None if code < 0 else self.categories[code]
+
+    def append(self, value: Optional[str]):
+        self.codes.append(-1 if value is None else self._code(value))
+
+    def to_numpy(self):
+        """An int32 array of the codes."""
+        return _numpy().frombuffer(self.codes, dtype="int32")
+
+
+class ListColumn(_CodedColumn):
+    """`multi_select`, `relation` and `people` properties: the values of `row` are the `categories` (option names, page or user ids) of `codes[offsets[row]:offsets[row + 1]]`."""
+
+    __slots__ = ("offsets",)
+
+    def __init__(self, type_: str):
+        super().__init__(type_)
+        self.offsets = array("q", [0])
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, row: int) -> list[str]:
+        if row < 0:
+            row += len(self)
+        codes = self.codes[self.offsets[row] : self.offsets[row + 1]]
+        return [self.categories[code] for code in codes]
+
+    def append(self, value: Optional[Iterable[str]]):
+        if value:
+            self.codes.extend(self._code(item) for item in value)
+        self.offsets.append(len(self.codes))
+
+    def nbytes(self) -> int:
+        return super().nbytes() + self.offsets.itemsize * len(self.offsets)
+
+    def to_numpy(self):
+        """The offsets (int64) and codes (int32) arrays."""
+        numpy = _numpy()
+        return numpy.frombuffer(self.offsets, dtype="int64"), numpy.frombuffer(self.codes, dtype="int32")  # fmt: skip
+
+
+class TextColumn(Column):
+    """`title`, `rich_text`, `url`, `email` and `phone_number` properties, as strings; `None` when the row has none."""
+
+    __slots__ = ("values",)
+
+    def __init__(self, type_: str):
+        super().__init__(type_)
+        self.values: list[Optional[str]] = []
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, row: int) -> Optional[str]:
+        return self.values[row]
+
+    def append(self, value: Optional[str]):
+        self.values.append(value)
+
+    def nbytes(self) -> int:
+        # The references to the strings, which are shared with the pages
+        return 8 * len(self.values)
+
+    def to_numpy(self):
+        """An object array of the strings."""
+        return _numpy().array(self.values, dtype=object)
+
+
+def _number(prop: Any) -> Optional[float]:
+    value = _get(prop, "number")
+    return None if value is None else float(value)
+
+
+def _checkbox(prop: Any) -> bool:
+    return bool(_get(prop, "checkbox"))
+
+
+def _option(prop: Any) -> Optional[str]:
+    option = _get(prop, _get(prop, "type"))
+    return None if option is None else _get(option, "name") or _get(option, "id")
+
+
+def _options(prop: Any) -> list[str]:
+    return [_get(option, "name") or _get(option, "id") for option in _get(prop, "multi_select") or ()]  # fmt: skip
+
+
+def _ids(prop: Any) -> list[str]:
+    return [str(_get(item, "id")) for item in _get(prop, _get(prop, "type")) or ()]
+
+
+def _date(prop: Any) -> Optional[tuple[int, int]]:
+    value = _get(prop, "date")
+    if value is None:
+        return None
+    return _micros(_get(value, "start")), _micros(_get(value, "end"))
+
+
+def _timestamp(prop: Any) -> int:
+    return _micros(_get(prop, _get(prop, "type")))
+
+
+def _rich_text(prop: Any) -> str:
+    if type(prop) is not dict:
+        return prop.plain_text
+    return "".join(
+        item.get("plain_text") or (item.get("text") or {}).get("content", "")
+        for item in prop[prop["type"]] or ()
+    )
+
+
+def _text(prop: Any) -> Optional[str]:
+    value = _get(prop, _get(prop, "type"))
+    return None if value is None else str(value)
+
+
+_EXTRACTORS = {
+    "number": (NumberColumn, _number),
+    "checkbox": (CheckboxColumn, _checkbox),
+    "date": (DateColumn, _date),
+    "created_time": (DatetimeColumn, _timestamp),
+    "last_edited_time": (DatetimeColumn, _timestamp),
+    "select": (CategoryColumn, _option),
+    "status": (CategoryColumn, _option),
+    "multi_select": (ListColumn, _options),
+    "relation": (ListColumn, _ids),
+    "people": (ListColumn, _ids),
+    "title": (TextColumn, _rich_text),
+    "rich_text": (TextColumn, _rich_text),
+    "url": (TextColumn, _text),
+    "email": (TextColumn, _text),
+    "phone_number": (TextColumn, _text),
+}
+"""The column class and value extractor of each supported property type."""
+
+
+class PageColumns(Mapping[str, Column]):
+    """The columns extracted from pages, by property name.
+
+    Attributes:
+        ids: The ids of the pages, one per row.
+    """
+
+    __slots__ = ("ids", "_columns")
+
+    def __init__(self):
+        self.ids: list[str] = []
+        self._columns: dict[str, Column] = {}
+
+    def __getitem__(self, name: str) -> Column:
+        return self._columns[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(rows={self.rows}, columns={list(self._columns)!r})"  # fmt: skip
+
+    @property
+    def rows(self) -> int:
+        """The number of rows, i.e. of pages."""
+        return len(self.ids)
+
+    def nbytes(self) -> int:
+        """Size of the buffers of all the columns, in bytes."""
+        return sum(column.nbytes() for column in self._columns.values())
+
+    def append(self, page: Any, names: Optional[frozenset[str]] = None):
+        """Add a row for `page`, a `Page` (or `LazyPage`) or a page payload. Only the properties in `names` are extracted, if given."""
+        properties = _get(page, "properties") or {}
+        if isinstance(properties, LazyPageProperties):
+            # Read the payloads that were not validated yet as they are
+            properties = properties._data
+        row = len(self.ids)
+        columns = self._columns
+        for name, prop in properties.items():
+            if names is not None and name not in names:
+                continue
+            column = columns.get(name)
+            if column is None:
+                type_ = _get(prop, "type")
+                if type_ not in _EXTRACTORS:
+                    continue
+                column = columns[name] = _EXTRACTORS[type_][0](type_)
+                for _ in range(row):
+                    column.append(None)
+            elif column.type != _get(prop, "type"):
+                raise ValueError(f"Property {name!r} is a {_get(prop, 'type')} in page {_get(page, 'id')}, but a {column.type} in previous pages")  # fmt: skip
+            column.append(_EXTRACTORS[column.type][1](prop))
+        self.ids.append(str(_get(page, "id")))
+        for column in columns.values():
+            if len(column) == row:
+                column.append(None)
+
+
+def extract_columns(
+    pages: Iterable[Any], names: Optional[Iterable[str]] = None
+) -> PageColumns:
+    """
+    Extract the properties of `pages` into typed columns, see `pydantic_api.notion.models.columns`.
+
+    Example:
+
+        columns = extract_columns(page for response in responses for page in response.results)
+        prices = columns["Price"].to_numpy()
+
+    Args:
+        pages: `Page` models, `LazyPage` models (whose properties are read without being validated) or raw page payloads, e.g. the `results` of `QueryDatabaseResponse`s. Other objects, such as databases, are skipped.
+        names: The properties to extract; all those of a supported type by default.
+
+    Returns:
+        The columns, by property name. Rows of pages without a property hold an empty value in its column.
+
+    Raises:
+        ValueError: If a property changes type from one page to another.
+    """
+    columns = PageColumns()
+    selected = None if names is None else frozenset(names)
+    for page in pages:
+        if _get(page, "object") == "page":
+            columns.append(page, selected)
+    return columns
+
+
+__all__ = [
+    "NAT",
+    "Column",
+    "NumberColumn",
+    "CheckboxColumn",
+    "DatetimeColumn",
+    "DateColumn",
+    "CategoryColumn",
+    "ListColumn",
+    "TextColumn",
+    "PageColumns",
+    "extract_columns",
+]
@@ -0,0 +1,93 @@
+"""
+Compact storage of the timestamps of decoded objects.
+
+Every `Page`, `Database`, block and `CommentObject` holds its `created_time` and `last_edited_time` as `datetime` instances. `compact_timestamps` replaces them, after decoding, by `EpochMillis` integers, so that an in-process replica sorts and compares its rows with integer operations, and converts a timestamp back to a `datetime` only when it reads `.datetime`: sorting pages by `last_edited_time` is about 15 times faster (`benchmarks/bench_compact.py`). Serializing a compacted object gives the same JSON.
+
+That is the only gain: the memory of decoded pages and blocks stays the same, within a few bytes per object, and compacting adds a walk over each object to its decoding.
+
+Compacting is opt-in. Compacted objects compare unequal to the same objects decoded again, whose timestamps are `datetime`.
+"""
+
+from typing import Any, Iterable, Iterator, TypeVar, get_args
+
+import pydantic
+
+from .size import _LEAF, _MODEL, _SEQUENCE, _kind
+from .objects import EpochMillis, Timestamp, LazyPageProperties
+
+T = TypeVar("T")
+
+_TIMESTAMP_FIELDS: dict[type, tuple[str, ...]] = {}
+"""The fields of each model class declared as a `Timestamp`."""
+
+
+def _timestamp_fields(cls: type[pydantic.BaseModel]) -> tuple[str, ...]:
+    try:
+        return _TIMESTAMP_FIELDS[cls]
+    except KeyError:
+        pass
+    _, marker = get_args(Timestamp)
+    names = _TIMESTAMP_FIELDS[cls] = tuple(
+        name
+        for name, field in cls.model_fields.items()
+        # `Timestamp` itself, or in a union such as `Timestamp | None`
+        if marker in field.metadata or Timestamp in get_args(field.annotation)
+    )
+    return names
+
+
+def _compact(value: Any) -> Any:
+    """`value` as an `EpochMillis` if it is a `datetime` that serializes back to the same text, else unchanged."""
+    if value is None or type(value) is EpochMillis:
+        return value
+    try:
+        return EpochMillis.from_datetime(value)
+    except ValueError:
+        return value
+
+
+def compact_timestamps(value: T) -> T:
+    """
+    Replace, in place, the `created_time` and `last_edited_time` of the objects held by `value` by `EpochMillis`.
+
+    Timestamps that are not in UTC or more precise than a millisecond are left as `datetime`, as are the `created_time` and `last_edited_time` page properties. The properties of a `LazyPage` that were not decoded yet are skipped.
+
+    Args:
+        value: A decoded model (e.g. a `Page` or a `QueryDatabaseResponse`), or a list or dict of them.
+
+    Returns:
+        `value`.
+    """
+    stack: list[Any] = [value]
+    while stack:
+        item = stack.pop()
+        kind = _kind(type(item))
+        if kind is _MODEL:
+            values = item.__dict__
+            for name in _timestamp_fields(type(item)):
+                values[name] = _compact(values[name])
+            stack.extend(
+                field
+                for field in (values[name] for name in type(item).model_fields)
+                if _kind(type(field)) is not _LEAF
+            )
+        elif kind is _SEQUENCE:
+            stack.extend(item)
+        elif kind is not _LEAF:
+            if isinstance(item, LazyPageProperties):
+                stack.extend(v for v in item._data.values() if type(v) is not dict)
+            else:
+                stack.extend(item.values())
+    return value
+
+
+def compact_all(values: Iterable[T]) -> Iterator[T]:
+    """Compact the timestamps of each of `values` as it is consumed, e.g. the pages of a stream."""
+    for value in values:
+        yield compact_timestamps(value)
+
+
+__all__ = [
+    "compact_timestamps",
+    "compact_all",
+]
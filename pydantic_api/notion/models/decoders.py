@@ -0,0 +1,139 @@
+"""
+Decoders of database rows compiled from the database schema.
+
+All the pages of a database have the properties of its schema, yet `Page.properties` resolves each value through the `PageProperty` union, on the `type` of every payload. `compile_page_decoder` builds, for one `Database`, a `Page` subclass whose `properties` map each property name straight to its property class, and a `QueryDatabaseResponse` subclass whose results are such pages. The property names are interned, and shared by all the decoded pages.
+
+Decoders are cached by database id and `last_edited_time`, which changes with the schema, and the least recently used ones are evicted.
+"""
+
+import sys
+from datetime import datetime
+from collections import OrderedDict
+from typing import Annotated, Any, Optional, Union, get_args
+
+from typing_extensions import TypedDict
+from pydantic import ConfigDict, Field, ValidationError, create_model
+
+from .objects import Page, Database, NotionId, PageProperty
+from .endpoints import QueryDatabaseResponse
+
+DECODER_CACHE_SIZE = 64
+"""Number of compiled decoders kept by `compile_page_decoder`."""
+
+_decoders: "OrderedDict[tuple[NotionId, datetime], PageDecoder]" = OrderedDict()
+
+_property_classes: Optional[dict[str, type]] = None
+
+
+def _property_class(type_: str) -> Any:
+    """The `PageProperty` class of the properties of type `type_`, or the whole union for a type this package does not know."""
+    global _property_classes
+    if _property_classes is None:
+        union, *_ = get_args(PageProperty)
+        _property_classes = {cls.model_fields["type"].default: cls for cls in get_args(union)}  # fmt: skip
+    return _property_classes.get(type_, PageProperty)
+
+
+class PageDecoder:
+    """Decodes the pages of one database, and the responses of its queries.
+
+    Pages whose properties do not match the schema any more (a property was added or changed type since the `Database` was retrieved) are decoded like `Page` instead, so a stale decoder is slower, but never wrong.
+
+    Attributes:
+        database_id: The id of the database.
+        last_edited_time: The `last_edited_time` of the database the decoder was compiled from.
+        page_type: The `Page` subclass of the pages of the database, e.g. for `TrustedAdapter`.
+        response_type: The `QueryDatabaseResponse` subclass of the query responses.
+    """
+
+    __slots__ = ("database_id", "last_edited_time", "page_type", "response_type")
+
+    def __init__(self, database: Database):
+        self.database_id = database.id
+        self.last_edited_time = database.last_edited_time
+        fields = {
+            sys.intern(name): _property_class(prop.type)
+            for name, prop in database.properties.items()
+        }
+        properties = TypedDict("PageProperties", fields, total=False)  # type: ignore[misc]
+        properties.__pydantic_config__ = ConfigDict(extra="forbid")  # type: ignore[attr-defined]
+        page_type: type[Page] = create_model(
+            Page.__name__,
+            __base__=Page,
+            __module__=__name__,
+            properties=(properties, Field(default_factory=dict)),
+        )
+        self.page_type = page_type
+        result = Annotated[Union[Database, page_type], Field(discriminator="object")]  # type: ignore[valid-type]  # fmt: skip
+        self.response_type: type[QueryDatabaseResponse] = create_model(
+            QueryDatabaseResponse.__name__,
+            __base__=QueryDatabaseResponse,
+            __module__=__name__,
+            results=(list[result], ...),
+        )
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(database_id={self.database_id!r}, last_edited_time={self.last_edited_time!r})"  # fmt: skip
+
+    def validate_page(self, data: Any) -> Page:
+        """Decode a page of the database from decoded JSON (dicts and lists)."""
+        try:
+            return self.page_type.model_validate(data)
+        except ValidationError:
+            return Page.model_validate(data)
+
+    def validate_page_json(self, data: str | bytes | bytearray) -> Page:
+        """Decode a page of the database from a raw JSON payload."""
+        try:
+            return self.page_type.model_validate_json(data)
+        except ValidationError:
+            return Page.model_validate_json(data)
+
+    def validate_response(self, data: Any) -> QueryDatabaseResponse:
+        """Decode a response of `QueryDatabase` on the database from decoded JSON (dicts and lists)."""
+        try:
+            return self.response_type.model_validate(data)
+        except ValidationError:
+            return QueryDatabaseResponse.model_validate(data)
+
+    def validate_response_json(self, data: str | bytes | bytearray) -> QueryDatabaseResponse:  # fmt: skip
+        """Decode a response of `QueryDatabase` on the database from a raw JSON payload."""
+        try:
+            return self.response_type.model_validate_json(data)
+        except ValidationError:
+            return QueryDatabaseResponse.model_validate_json(data)
+
+
+def compile_page_decoder(database: Database) -> PageDecoder:
+    """
+    The decoder of the pages of `database`, compiled from its schema.
+
+    Decoders are cached by database id and `last_edited_time`: the `DECODER_CACHE_SIZE` most recently used ones are kept.
+
+    Example:
+
+        decoder = compile_page_decoder(RetrieveDatabaseResponse.model_validate_json(raw_database))
+        response = decoder.validate_response_json(raw_query_response)
+
+    Args:
+        database: The database, with its schema in `properties`.
+
+    Returns:
+        The decoder.
+    """
+    key = (database.id, database.last_edited_time)
+    decoder = _decoders.get(key)
+    if decoder is not None:
+        _decoders.move_to_end(key)
+        return decoder
+    decoder = _decoders[key] = PageDecoder(database)
+    while len(_decoders) > DECODER_CACHE_SIZE:
+        _decoders.popitem(last=False)
+    return decoder
+
+
+__all__ = [
+    "DECODER_CACHE_SIZE",
+    "PageDecoder",
+    "compile_page_decoder",
+]
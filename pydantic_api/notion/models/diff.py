@@ -0,0 +1,203 @@
+"""
+Minimal updates of page properties.
+
+Sending every property of a page back with `UpdatePagePropertiesRequest` wastes the request budget, and fails on the properties Notion computes (formulas, rollups, timestamps, ...). `diff_page` compares a page with its desired properties, and builds a request with only the writable properties that changed.
+
+Properties are compared by fingerprint: a short hash of the value as Notion stores it, which ignores what the API fills in on its own (property ids, `plain_text`, option colors, full user objects, signed file URLs). A sync job can keep the fingerprints of what it last wrote, from `property_fingerprints`, and diff against them instead of a fresh snapshot.
+
+Reference: https://developers.notion.com/reference/patch-page
+"""
+
+from hashlib import blake2b
+from collections.abc import Mapping
+from typing import Any, Callable, Optional, Union
+
+from pydantic import TypeAdapter
+
+from .objects import Page, PageProperty
+from .objects.properties.page_property import BasePageProperty
+from .endpoints import UpdatePagePropertiesRequest
+
+READ_ONLY_PROPERTY_TYPES = frozenset(
+    {
+        "button",
+        "created_by",
+        "created_time",
+        "formula",
+        "last_edited_by",
+        "last_edited_time",
+        "rollup",
+        "unique_id",
+        "verification",
+    }
+)
+"""Types of the page properties Notion computes, which cannot be updated."""
+
+_DEFAULT_ANNOTATIONS = (False, False, False, False, False, "default")
+
+_property_adapter: Optional[TypeAdapter] = None
+
+
+def _annotations(item: Any) -> tuple:
+    a = item.annotations
+    if a is None:
+        return _DEFAULT_ANNOTATIONS
+    return (a.bold, a.italic, a.strikethrough, a.underline, a.code, a.color)
+
+
+def _rich_text(items: list) -> tuple:
+    normal: list[tuple] = []
+    for item in items:
+        if item.type == "text":
+            link = item.text.link
+            run = ("text", item.text.content, link and str(link.url), _annotations(item))
+            if normal and normal[-1][0] == "text" and normal[-1][2:] == run[2:]:
+                # Runs of the same style read the same, however the text was split
+                run = ("text", normal.pop()[1] + run[1], *run[2:])
+            normal.append(run)
+        elif item.type == "equation":
+            normal.append(("equation", item.equation.expression, _annotations(item)))
+        else:
+            normal.append(("mention", item.mention.model_dump_json(exclude_none=True), _annotations(item)))  # fmt: skip
+    return tuple(normal)
+
+
+def _option(option: Any) -> Optional[str]:
+    return None if option is None else option.name or option.id
+
+
+def _date(value: Any) -> Optional[tuple]:
+    if value is None:
+        return None
+    return (value.start.isoformat(), value.end and value.end.isoformat(), value.time_zone)  # fmt: skip
+
+
+def _file(file: Any) -> tuple:
+    # Notion signs the URLs of the files it hosts: the query string changes with every read
+    url = str(getattr(file, file.type).url)
+    return (file.type, file.name, url.split("?", 1)[0] if file.type == "file" else url)
+
+
+_NORMALIZERS: dict[str, Callable[[Any], Any]] = {
+    "checkbox": lambda p: p.checkbox,
+    "date": lambda p: _date(p.date),
+    "email": lambda p: p.email,
+    "files": lambda p: tuple(_file(f) for f in p.files),
+    "multi_select": lambda p: tuple(_option(o) for o in p.multi_select),
+    "number": lambda p: None if p.number is None else float(p.number),
+    "people": lambda p: tuple(str(u.id) for u in p.people),
+    "phone_number": lambda p: p.phone_number,
+    "relation": lambda p: tuple(str(r.id) for r in p.relation),
+    "rich_text": lambda p: _rich_text(p.rich_text),
+    "select": lambda p: _option(p.select),
+    "status": lambda p: _option(p.status),
+    "title": lambda p: _rich_text(p.title),
+    "url": lambda p: p.url and str(p.url),
+}
+"""The value of each writable property type, reduced to what Notion stores."""
+
+
+def _validate(value: Union[PageProperty, dict]) -> PageProperty:
+    global _property_adapter
+    if isinstance(value, BasePageProperty):
+        return value
+    if _property_adapter is None:
+        _property_adapter = TypeAdapter(PageProperty)
+    return _property_adapter.validate_python(value)
+
+
+def _properties(value: Union[Page, Mapping[str, Any]]) -> Mapping[str, Any]:
+    return value.properties if isinstance(value, Page) else value
+
+
+def property_fingerprint(prop: Union[PageProperty, dict]) -> Optional[bytes]:
+    """
+    The fingerprint of a page property value: equal for the values Notion stores the same, stable across processes.
+
+    Args:
+        prop: The property, as a `PageProperty` or as its payload.
+
+    Returns:
+        A 16-byte hash, or `None` for the read-only property types, see `READ_ONLY_PROPERTY_TYPES`.
+    """
+    prop = _validate(prop)
+    normalize = _NORMALIZERS.get(prop.type)
+    if normalize is None:
+        return None
+    return blake2b(repr((prop.type, normalize(prop))).encode(), digest_size=16).digest()  # fmt: skip
+
+
+def property_fingerprints(page: Union[Page, Mapping[str, Any]]) -> dict[str, bytes]:
+    """The fingerprints of the writable properties of `page` (a `Page` or its `properties`), by name."""
+    fingerprints = {}
+    for name, prop in _properties(page).items():
+        fingerprint = property_fingerprint(prop)
+        if fingerprint is not None:
+            fingerprints[name] = fingerprint
+    return fingerprints
+
+
+def diff_properties(
+    current: Union[Page, Mapping[str, Any]],
+    desired: Union[Page, Mapping[str, Any]],
+) -> dict[str, PageProperty]:
+    """
+    The desired properties to write to turn `current` into `desired`.
+
+    Read-only properties are never written, and neither are relations that `desired` only holds the first references of (`has_more`). Properties of `current` missing from `desired` are left as they are.
+
+    Args:
+        current: The page as it is: a `Page`, its `properties`, or their fingerprints from `property_fingerprints`.
+        desired: The page as it should be: a `Page` or its `properties`, as `PageProperty` values or payloads.
+
+    Returns:
+        The changed properties of `desired`, by name.
+    """
+    current = _properties(current)
+    changed = {}
+    for name, prop in _properties(desired).items():
+        prop = _validate(prop)
+        if prop.type in READ_ONLY_PROPERTY_TYPES:
+            continue
+        if prop.type == "relation" and prop.has_more:
+            continue
+        before = current.get(name)
+        if before is not None and not isinstance(before, bytes):
+            before = property_fingerprint(before)
+        if before is None or before != property_fingerprint(prop):
+            changed[name] = prop
+    return changed
+
+
+def diff_page(
+    current: Page,
+    desired: Union[Page, Mapping[str, Any]],
+) -> Optional[UpdatePagePropertiesRequest]:
+    """
+    The sparse update of the properties of a page, see `diff_properties`.
+
+    Example:
+
+        if request := diff_page(page, {"Status": StatusProperty.new("Done")}):
+            method, path, _, body = encode_request(request)
+
+    Args:
+        current: The page as it is.
+        desired: The page as it should be: a `Page` or its `properties`.
+
+    Returns:
+        The request updating only the changed properties, or `None` if nothing changed.
+    """
+    changed = diff_properties(current, desired)
+    if not changed:
+        return None
+    return UpdatePagePropertiesRequest.model_validate({"page_id": current.id, "properties": changed})  # fmt: skip
+
+
+__all__ = [
+    "READ_ONLY_PROPERTY_TYPES",
+    "property_fingerprint",
+    "property_fingerprints",
+    "diff_properties",
+    "diff_page",
+]
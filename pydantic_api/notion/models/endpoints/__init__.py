@@ -13,151 +13,110 @@ I.e. all Request and Response data models for the Notion API endpoints.
 - Users: `pydantic_api.notion.models.endpoints.users`
 - Comments: `pydantic_api.notion.models.endpoints.comments`
 - Search: `pydantic_api.notion.models.endpoints.search`
+- Streaming decoding of paginated responses: `pydantic_api.notion.models.endpoints.streaming`
 
+Submodules are imported on first attribute access.
 """
 
-from .base import (
-    PageSize,
-    StartCursor,
-    SortObject,
-    SortObjectFactory,
-    NotionPaginatedData,
-    NotionPaginatedDataTypeLiteral,
-    CheckboxFilterObject,
-    DateFilterObject,
-    FilesFilterObject,
-    FormulaFilterObject,
-    MultiSelectFilterObject,
-    NumberFilterObject,
-    PeopleFilterObject,
-    RelationFilterObject,
-    RichTextFilterObject,
-    RollupFilterObject,
-    SelectFilterObject,
-    StatusFilterObject,
-    TimestampFilterObject,
-    UniqueIDFilterObject,
-    FilterObject,
-)
-from .pages import (
-    CreatePageRequest,
-    CreatePageResponse,
-    RetrievePageRequest,
-    RetrievePageResponse,
-    RetrievePagePropertyItemRequest,
-    RetrievePagePropertyItemResponse,
-    UpdatePagePropertiesRequest,
-    UpdatePagePropertiesResponse,
-)
-from .users import (
-    ListAllUsersRequest,
-    ListAllUsersResponse,
-    RetrieveUserRequest,
-    RetrieveUserResponse,
-    RetrieveBotUserRequest,
-    RetrieveBotUserResponse,
-)
-from .blocks import (
-    AppendBlockChildrenRequest,
-    AppendBlockChildrenResponse,
-    RetrieveBlockRequest,
-    RetrieveBlockResponse,
-    RetrieveBlockChildrenRequest,
-    RetrieveBlockChildrenResponse,
-    # UpdateBlockRequest,
-    UpdateBlockResponse,
-    DeleteBlockRequest,
-    DeleteBlockResponse,
-)
-from .databases import (
-    CreateDatabaseRequest,
-    CreateDatabaseResponse,
-    QueryDatabaseRequest,
-    QueryDatabaseResponse,
-    RetrieveDatabaseRequest,
-    RetrieveDatabaseResponse,
-    UpdateDatabaseRequest,
-    UpdateDatabaseResponse,
-)
-from .comments import (
-    CreateCommentRequest,
-    CreateCommentResponse,
-    RetrieveCommentsRequest,
-    RetrieveCommentsResponse,
-)
-from .search import (
-    SearchByTitleRequest,
-    SearchByTitleResponse,
-    SearchByTitleFilterObject,
+from typing import TYPE_CHECKING
+
+from .._lazy import attach
+
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        ".base": [
+            "NotionPaginatedDataTypeLiteral",
+            "NotionPaginatedData",
+            "StartCursor",
+            "PageSize",
+            "SortObject",
+            "SortObjectFactory",
+            "CheckboxFilterObject",
+            "DateFilterObject",
+            "FilesFilterObject",
+            "FormulaFilterCondition",
+            "FormulaFilterObject",
+            "MultiSelectFilterObject",
+            "NumberFilterObject",
+            "PeopleFilterObject",
+            "RelationFilterObject",
+            "RichTextFilterObject",
+            "RollupFilterObject",
+            "SelectFilterObject",
+            "StatusFilterObject",
+            "TimestampFilterObject",
+            "UniqueIDFilterObject",
+            "FilterObject",
+        ],
+        ".pages": [
+            "CreatePageRequest",
+            "CreatePageResponse",
+            "RetrievePageRequest",
+            "RetrievePageResponse",
+            "RetrievePagePropertyItemRequest",
+            "RetrievePagePropertyItemResponse",
+            "UpdatePagePropertiesRequest",
+            "UpdatePagePropertiesResponse",
+        ],
+        ".users": [
+            "ListAllUsersRequest",
+            "ListAllUsersResponse",
+            "RetrieveUserRequest",
+            "RetrieveUserResponse",
+            "RetrieveBotUserRequest",
+            "RetrieveBotUserResponse",
+        ],
+        ".blocks": [
+            "MAX_APPEND_CHILDREN",
+            "MAX_PAYLOAD_BYTES",
+            "AppendBlockChildrenRequest",
+            "AppendBlockChildrenResponse",
+            "RetrieveBlockRequest",
+            "RetrieveBlockResponse",
+            "RetrieveBlockChildrenRequest",
+            "RetrieveBlockChildrenResponse",
+            # "UpdateBlockRequest",
+            "UpdateBlockResponse",
+            "DeleteBlockRequest",
+            "DeleteBlockResponse",
+        ],
+        ".databases": [
+            "CreateDatabaseRequest",
+            "CreateDatabaseResponse",
+            "QueryDatabaseRequest",
+            "QueryDatabaseResponse",
+            "RetrieveDatabaseRequest",
+            "RetrieveDatabaseResponse",
+            "UpdateDatabaseRequest",
+            "UpdateDatabaseResponse",
+        ],
+        ".comments": [
+            "CreateCommentRequest",
+            "CreateCommentResponse",
+            "RetrieveCommentsRequest",
+            "RetrieveCommentsResponse",
+        ],
+        ".search": [
+            "SearchByTitleFilterObject",
+            "SearchByTitleRequest",
+            "SearchByTitleResponse",
+        ],
+        ".streaming": [
+            "PaginatedSource",
+            "NotionPaginatedStream",
+        ],
+    },
 )
 
 
-__all__ = [
-    # base
-    "PageSize",
-    "StartCursor",
-    "NotionPaginatedDataTypeLiteral",
-    "NotionPaginatedData",
-    "SortObject",
-    "SortObjectFactory",
-    "CheckboxFilterObject",
-    "DateFilterObject",
-    "FilesFilterObject",
-    "FormulaFilterObject",
-    "MultiSelectFilterObject",
-    "NumberFilterObject",
-    "PeopleFilterObject",
-    "RelationFilterObject",
-    "RichTextFilterObject",
-    "RollupFilterObject",
-    "SelectFilterObject",
-    "StatusFilterObject",
-    "TimestampFilterObject",
-    "UniqueIDFilterObject",
-    "FilterObject",
-    # pages
-    "CreatePageRequest",
-    "CreatePageResponse",
-    "RetrievePageRequest",
-    "RetrievePageResponse",
-    "RetrievePagePropertyItemRequest",
-    "RetrievePagePropertyItemResponse",
-    "UpdatePagePropertiesRequest",
-    "UpdatePagePropertiesResponse",
-    # users
-    "ListAllUsersRequest",
-    "ListAllUsersResponse",
-    "RetrieveUserRequest",
-    "RetrieveUserResponse",
-    "RetrieveBotUserRequest",
-    "RetrieveBotUserResponse",
-    # blocks
-    "AppendBlockChildrenRequest",
-    "AppendBlockChildrenResponse",
-    "RetrieveBlockRequest",
-    "RetrieveBlockResponse",
-    "RetrieveBlockChildrenRequest",
-    "RetrieveBlockChildrenResponse",
-    # "UpdateBlockRequest",
-    "UpdateBlockResponse",
-    "DeleteBlockRequest",
-    "DeleteBlockResponse",
-    # databases
-    "CreateDatabaseRequest",
-    "CreateDatabaseResponse",
-    "QueryDatabaseRequest",
-    "QueryDatabaseResponse",
-    "RetrieveDatabaseRequest",
-    "RetrieveDatabaseResponse",
-    "UpdateDatabaseRequest",
-    "UpdateDatabaseResponse",
-    # comments
-    "CreateCommentRequest",
-    "CreateCommentResponse",
-    "RetrieveCommentsRequest",
-    "RetrieveCommentsResponse",
-    # search
-    "SearchByTitleFilterObject",
-    "SearchByTitleRequest",
-    "SearchByTitleResponse",
-]
+if TYPE_CHECKING:
+    from .base import *
+    from .pages import *
+    from .users import *
+    from .blocks import *
+    from .databases import *
+    from .comments import *
+    from .search import *
+    from .streaming import *
@@ -1,10 +1,31 @@
 from __future__ import annotations
-from typing import Generic, TypeVar, Literal, Optional, Annotated, Union, List, Any
-
-from uuid import UUID
-from pydantic import AnyHttpUrl, Field, model_validator
-
-from pydantic_api.base import BaseModel
+from typing import (
+    TYPE_CHECKING,
+    Generic,
+    TypeVar,
+    Literal,
+    Optional,
+    Annotated,
+    Union,
+    List,
+    Any,
+    ClassVar,
+)
+
+from pydantic import (
+    AnyHttpUrl,
+    Field,
+    model_validator,
+    Discriminator,
+    Tag,
+    TypeAdapter,
+)
+
+from pydantic_api.notion.models.base import BaseModel
+from ..objects.ids import NotionId
+
+if TYPE_CHECKING:
+    from .streaming import NotionPaginatedStream, PaginatedSource
 
 TResult = TypeVar("TResult")
 
@@ -34,7 +55,7 @@ class NotionPaginatedData(BaseModel, Generic[TResult]):
     next_cursor: Optional[str] = None
     has_more: bool
     type: NotionPaginatedDataTypeLiteral
-    request_id: UUID
+    request_id: NotionId
     next_url: Optional[AnyHttpUrl] = Field(
         None,
         description="The URL the user can request to get the next page of results.",
@@ -43,6 +64,33 @@ class NotionPaginatedData(BaseModel, Generic[TResult]):
         ],
     )
 
+    @classmethod
+    def results_adapter(cls) -> TypeAdapter:
+        """The TypeAdapter validating a single item of `results`, built once per parametrization."""
+        adapter = cls.__dict__.get("_results_adapter")
+        if adapter is None:
+            args = cls.__pydantic_generic_metadata__["args"]
+            adapter = TypeAdapter(args[0] if args else Any)
+            setattr(cls, "_results_adapter", adapter)
+        return adapter
+
+    @classmethod
+    def stream(
+        cls, source: PaginatedSource, chunk_size: int = 64 * 1024
+    ) -> NotionPaginatedStream[TResult]:
+        """Decode a raw paginated response item by item, without building the `results` list.
+
+        Args:
+            source: The raw JSON response, as bytes/str or a binary/text file-like object.
+            chunk_size: Number of bytes (or characters) read from `source` at a time.
+
+        Returns:
+            An iterator over the validated results, which also exposes `next_cursor` and `has_more`.
+        """
+        from .streaming import NotionPaginatedStream
+
+        return NotionPaginatedStream(source, cls.results_adapter(), chunk_size)
+
 
 StartCursor = Annotated[
     str,
@@ -114,266 +162,224 @@ class SortObjectFactory:
 
 
 # Filter Object
+def _ensure_exact_one_operand(operand: Any):
+    """Shared check for all filter objects: a filter condition must hold exactly one operand."""
+    if isinstance(operand, BaseModel):
+        operand = operand.model_dump(exclude_none=True)
+    if len(operand) != 1:
+        raise ValueError(f"Filter Object can only have exactly 1 operand for a property")
+
+
 class BaseFilterObject(BaseModel):
     property: str = Field(
         ...,
         description="The name of the property as it appears in the database, or the property ID.",
     )
 
+    _operand_key: ClassVar[str]
+    """The key holding the filter condition, e.g. `checkbox` for `CheckboxFilterObject`. It is also the tag used to dispatch `FilterObject`."""
+
+    @model_validator(mode="after")
+    def ensure_exact_one_operand(self):
+        _ensure_exact_one_operand(getattr(self, self._operand_key))
+        return self
+
 
 # Checkbox Filter Object: Refer to https://developers.notion.com/reference/post-database-query-filter#checkbox
+CheckboxFilterCondition = dict[Literal["equals", "does_not_equal"], bool]
+
+
 class CheckboxFilterObject(BaseFilterObject):
-    checkbox: dict[Literal["equals", "does_not_equal"], bool] = Field(
+    _operand_key: ClassVar[str] = "checkbox"
+
+    checkbox: CheckboxFilterCondition = Field(
         ..., description="Filters for checkbox values based on equality."
     )
 
-    @model_validator(mode="after")
-    def ensure_exact_one_operand(self):
-        if not len(self.checkbox) == 1:
-            raise ValueError(
-                f"Filter Object can only have exactly 1 operand for a property"
-            )
-        return self
-
 
 # Date Filter Object: Refer to https://developers.notion.com/reference/post-database-query-filter#date
+# TODO: clarify the `Any` here
+DateFilterCondition = dict[
+    Literal[
+        "after",
+        "before",
+        "equals",
+        "is_empty",
+        "is_not_empty",
+        "next_month",
+        "next_week",
+        "next_year",
+        "on_or_after",
+        "on_or_before",
+        "past_month",
+        "past_week",
+        "past_year",
+        "this_week",
+    ],
+    Union[str, Any],
+]
+
+
 class DateFilterObject(BaseFilterObject):
-    # TODO: clarify the `Any` here
-    date: dict[
-        Literal[
-            "after",
-            "before",
-            "equals",
-            "is_empty",
-            "is_not_empty",
-            "next_month",
-            "next_week",
-            "next_year",
-            "on_or_after",
-            "on_or_before",
-            "past_month",
-            "past_week",
-            "past_year",
-            "this_week",
-        ],
-        Union[str, Any],
-    ]
+    _operand_key: ClassVar[str] = "date"
 
-    @model_validator(mode="after")
-    def ensure_exact_one_operand(self):
-        if not len(self.date) == 1:
-            raise ValueError(
-                f"Filter Object can only have exactly 1 operand for a property"
-            )
-        return self
+    date: DateFilterCondition
 
 
 # Files Filter Object
 class FilesFilterObject(BaseFilterObject):
+    _operand_key: ClassVar[str] = "files"
+
     files: dict[Literal["is_empty", "is_not_empty"], bool]
 
-    @model_validator(mode="after")
-    def ensure_exact_one_operand(self):
-        if not len(self.files) == 1:
-            raise ValueError(
-                f"Filter Object can only have exactly 1 operand for a property"
-            )
-        return self
+
+# Number Filter Object
+# TODO: clarify the `Any` here
+NumberFilterCondition = dict[
+    Literal[
+        "equals",
+        "does_not_equal",
+        "greater_than",
+        "greater_than_or_equal_to",
+        "less_than",
+        "less_than_or_equal_to",
+        "is_empty",
+        "is_not_empty",
+    ],
+    Union[bool, float],
+]
+
+
+class NumberFilterObject(BaseFilterObject):
+    _operand_key: ClassVar[str] = "number"
+
+    number: NumberFilterCondition
+
+
+# Rich Text Filter Object
+RichTextFilterCondition = dict[
+    Literal[
+        "equals",
+        "does_not_equal",
+        "contains",
+        "does_not_contain",
+        "starts_with",
+        "ends_with",
+        "is_empty",
+        "is_not_empty",
+    ],
+    Union[str, bool],
+]
+
+
+class RichTextFilterObject(BaseFilterObject):
+    _operand_key: ClassVar[str] = "rich_text"
+
+    rich_text: RichTextFilterCondition
+
+
+# Formula Filter Object: Refer to https://developers.notion.com/reference/post-database-query-filter#formula
+class FormulaFilterCondition(BaseModel):
+    """The `formula` field of a `FormulaFilterObject`, keyed by the formula's result type. Exactly one key must be set."""
+
+    checkbox: Optional[CheckboxFilterCondition] = None
+    date: Optional[DateFilterCondition] = None
+    number: Optional[NumberFilterCondition] = None
+    string: Optional[RichTextFilterCondition] = None
 
 
-# Formula Filter Object
 class FormulaFilterObject(BaseFilterObject):
-    formula: Union[
-        CheckboxFilterObject, DateFilterObject, NumberFilterObject, RichTextFilterObject
-    ]
+    _operand_key: ClassVar[str] = "formula"
 
-    @model_validator(mode="after")
-    def ensure_exact_one_operand(self):
-        if not len(self.formula) == 1:
-            raise ValueError(
-                f"Filter Object can only have exactly 1 operand for a property"
-            )
-        return self
+    formula: FormulaFilterCondition
 
 
 # Multi-select Filter Object
 class MultiSelectFilterObject(BaseFilterObject):
+    _operand_key: ClassVar[str] = "multi_select"
+
     # TODO: clarify the `Any` here
     multi_select: dict[
         Literal["contains", "does_not_contain", "is_empty", "is_not_empty"],
         Any,
     ]
 
-    @model_validator(mode="after")
-    def ensure_exact_one_operand(self):
-        if not len(self.multi_select) == 1:
-            raise ValueError(
-                f"Filter Object can only have exactly 1 operand for a property"
-            )
-        return self
-
-
-# Number Filter Object
-class NumberFilterObject(BaseFilterObject):
-    # TODO: clarify the `Any` here
-    number: dict[
-        Literal[
-            "equals",
-            "does_not_equal",
-            "greater_than",
-            "greater_than_or_equal_to",
-            "less_than",
-            "less_than_or_equal_to",
-            "is_empty",
-            "is_not_empty",
-        ],
-        Union[bool, float],
-    ]
-
-    @model_validator(mode="after")
-    def ensure_exact_one_operand(self):
-        if not len(self.number) == 1:
-            raise ValueError(
-                f"Filter Object can only have exactly 1 operand for a property"
-            )
-        return self
-
 
 # People Filter Object
 class PeopleFilterObject(BaseFilterObject):
+    _operand_key: ClassVar[str] = "people"
+
     people: dict[
         Literal["contains", "does_not_contain", "is_empty", "is_not_empty"],
         Union[str, bool],
     ]
 
-    @model_validator(mode="after")
-    def ensure_exact_one_operand(self):
-        if not len(self.people) == 1:
-            raise ValueError(
-                f"Filter Object can only have exactly 1 operand for a property"
-            )
-        return self
-
 
 # Relation Filter Object
 class RelationFilterObject(BaseFilterObject):
+    _operand_key: ClassVar[str] = "relation"
+
     relation: dict[
         Literal["contains", "does_not_contain", "is_empty", "is_not_empty"],
         Union[str, bool],
     ]
 
-    @model_validator(mode="after")
-    def ensure_exact_one_operand(self):
-        if not len(self.relation) == 1:
-            raise ValueError(
-                f"Filter Object can only have exactly 1 operand for a property"
-            )
-        return self
-
-
-# Rich Text Filter Object
-class RichTextFilterObject(BaseFilterObject):
-    rich_text: dict[
-        Literal[
-            "equals",
-            "does_not_equal",
-            "contains",
-            "does_not_contain",
-            "starts_with",
-            "ends_with",
-            "is_empty",
-            "is_not_empty",
-        ],
-        Union[str, bool],
-    ]
-
-    @model_validator(mode="after")
-    def ensure_exact_one_operand(self):
-        if not len(self.rich_text) == 1:
-            raise ValueError(
-                f"Filter Object can only have exactly 1 operand for a property"
-            )
-        return self
-
 
 # Rollup Filter Object
 class RollupFilterObject(BaseFilterObject):
+    _operand_key: ClassVar[str] = "rollup"
+
     # TODO: clarify the `Any` here
     rollup: dict[
         Literal["any", "every", "none"],
         Any,
     ]
 
-    @model_validator(mode="after")
-    def ensure_exact_one_operand(self):
-        if not len(self.rollup) == 1:
-            raise ValueError(
-                f"Filter Object can only have exactly 1 operand for a property"
-            )
-        return self
-
 
 # Select Filter Object
 class SelectFilterObject(BaseFilterObject):
+    _operand_key: ClassVar[str] = "select"
+
     select: dict[
         Literal["equals", "does_not_equal", "is_empty", "is_not_empty"],
         Union[str, bool],
     ]
 
-    @model_validator(mode="after")
-    def ensure_exact_one_operand(self):
-        if not len(self.select) == 1:
-            raise ValueError(
-                f"Filter Object can only have exactly 1 operand for a property"
-            )
-        return self
-
 
 # Status Filter Object
 class StatusFilterObject(BaseFilterObject):
+    _operand_key: ClassVar[str] = "status"
+
     status: dict[
         Literal["equals", "does_not_equal", "is_empty", "is_not_empty"],
         Union[str, bool],
     ]
 
-    @model_validator(mode="after")
-    def ensure_exact_one_operand(self):
-        if not len(self.status) == 1:
-            raise ValueError(
-                f"Filter Object can only have exactly 1 operand for a property"
-            )
-        return self
-
 
-# Timestamp Filter Object
+# Timestamp Filter Object: Refer to https://developers.notion.com/reference/post-database-query-filter#timestamp
 class BaseTimestampFilterObject(BaseModel):
     timestamp: Literal["created_time", "last_edited_time"]
 
-
-class CreatedTimeTimestampFilterObject(BaseTimestampFilterObject):
-    timestamp: Literal["created_time"] = "created_time"
-    created_time: DateFilterObject
+    _operand_key: ClassVar[str]
 
     @model_validator(mode="after")
     def ensure_exact_one_operand(self):
-        if not len(self.created_time) == 1:
-            raise ValueError(
-                f"Filter Object can only have exactly 1 operand for a property"
-            )
+        _ensure_exact_one_operand(getattr(self, self._operand_key))
         return self
 
 
+class CreatedTimeTimestampFilterObject(BaseTimestampFilterObject):
+    _operand_key: ClassVar[str] = "created_time"
+
+    timestamp: Literal["created_time"] = "created_time"
+    created_time: DateFilterCondition
+
+
 class LastEditedTimeTimestampFilterObject(BaseTimestampFilterObject):
-    timestamp: Literal["last_edited_time"] = "last_edited_time"
-    last_edited_time: DateFilterObject
+    _operand_key: ClassVar[str] = "last_edited_time"
 
-    @model_validator(mode="after")
-    def ensure_exact_one_operand(self):
-        if not len(self.last_edited_time) == 1:
-            raise ValueError(
-                f"Filter Object can only have exactly 1 operand for a property"
-            )
-        return self
+    timestamp: Literal["last_edited_time"] = "last_edited_time"
+    last_edited_time: DateFilterCondition
 
 
 TimestampFilterObject = Annotated[
@@ -384,6 +390,8 @@ TimestampFilterObject = Annotated[
 
 # Unique ID Filter Object
 class UniqueIDFilterObject(BaseFilterObject):
+    _operand_key: ClassVar[str] = "unique_id"
+
     unique_id: dict[
         Literal[
             "does_not_equal",
@@ -396,31 +404,57 @@ class UniqueIDFilterObject(BaseFilterObject):
         int,
     ]
 
-    @model_validator(mode="after")
-    def ensure_exact_one_operand(self):
-        if not len(self.unique_id) == 1:
-            raise ValueError(
-                f"Filter Object can only have exactly 1 operand for a property"
-            )
-        return self
-
 
-FilterObject = Union[
-    CheckboxFilterObject,
-    DateFilterObject,
-    FilesFilterObject,
-    FormulaFilterObject,
-    MultiSelectFilterObject,
-    NumberFilterObject,
-    PeopleFilterObject,
-    RelationFilterObject,
-    RichTextFilterObject,
-    RollupFilterObject,
-    SelectFilterObject,
-    StatusFilterObject,
-    TimestampFilterObject,
-    UniqueIDFilterObject,
+_FILTER_OPERAND_KEYS = frozenset(
+    [
+        "checkbox",
+        "date",
+        "files",
+        "formula",
+        "multi_select",
+        "number",
+        "people",
+        "relation",
+        "rich_text",
+        "rollup",
+        "select",
+        "status",
+        "timestamp",
+        "unique_id",
+    ]
+)
+
+
+def _filter_operand_discriminator(value: Any) -> str | None:
+    """Pick the filter class from the single operand key present, e.g. `{"property": "Done", "checkbox": {...}}` -> `"checkbox"`."""
+    if isinstance(value, dict):
+        operand_keys = [key for key in value if key in _FILTER_OPERAND_KEYS]
+        return operand_keys[0] if len(operand_keys) == 1 else None
+    if isinstance(value, BaseTimestampFilterObject):
+        return "timestamp"
+    return getattr(value, "_operand_key", None)
+
+
+FilterObject = Annotated[
+    Union[
+        Annotated[CheckboxFilterObject, Tag("checkbox")],
+        Annotated[DateFilterObject, Tag("date")],
+        Annotated[FilesFilterObject, Tag("files")],
+        Annotated[FormulaFilterObject, Tag("formula")],
+        Annotated[MultiSelectFilterObject, Tag("multi_select")],
+        Annotated[NumberFilterObject, Tag("number")],
+        Annotated[PeopleFilterObject, Tag("people")],
+        Annotated[RelationFilterObject, Tag("relation")],
+        Annotated[RichTextFilterObject, Tag("rich_text")],
+        Annotated[RollupFilterObject, Tag("rollup")],
+        Annotated[SelectFilterObject, Tag("select")],
+        Annotated[StatusFilterObject, Tag("status")],
+        Annotated[TimestampFilterObject, Tag("timestamp")],
+        Annotated[UniqueIDFilterObject, Tag("unique_id")],
+    ],
+    Discriminator(_filter_operand_discriminator),
 ]
+"""Union of all Filter objects, dispatched on the operand key. Reference: https://developers.notion.com/reference/post-database-query-filter"""
 
 
 __all__ = [
@@ -436,6 +470,7 @@ __all__ = [
     "CheckboxFilterObject",
     "DateFilterObject",
     "FilesFilterObject",
+    "FormulaFilterCondition",
     "FormulaFilterObject",
     "MultiSelectFilterObject",
     "NumberFilterObject",
@@ -1,26 +1,241 @@
-from typing import List, Optional
+from uuid import UUID
+from typing import Any, Generator, Iterable, Iterator, List, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import Field, TypeAdapter
 
-from ..objects import BlockObject
+from pydantic_api.notion.models.base import BaseModel
+from ..objects import NotionId, BlockId, BlockObject, MAX_NESTING
 from .base import NotionPaginatedData, StartCursor, PageSize
 
 
+MAX_APPEND_CHILDREN = 100
+"""Maximum number of blocks in the `children` of an `AppendBlockChildrenRequest`."""
+
+MAX_PAYLOAD_BYTES = 500_000
+"""Maximum size of a request body accepted by Notion, in bytes. Reference: https://developers.notion.com/reference/request-limits"""
+
+
 class AppendBlockChildrenRequest(BaseModel):
     """Reference: https://developers.notion.com/reference/patch-block-children"""
 
-    block_id: str = Field(
+    block_id: NotionId = Field(
         ..., description="Identifier for a block. Also accepts a page ID."
     )
     children: List[BlockObject] = Field(
         ...,
         description="Child content to append to a container block as an array of block objects",
     )
-    after: Optional[str] = Field(
+    after: Optional[NotionId] = Field(
         None,
         description="The ID of the existing block that the new block should be appended after.",
     )
 
+    @classmethod
+    def plan(
+        cls,
+        block_id: BlockId,
+        blocks: Iterable[BlockObject],
+        after: Optional[BlockId] = None,
+        max_blocks: int = MAX_APPEND_CHILDREN,
+        max_bytes: int = MAX_PAYLOAD_BYTES,
+    ) -> Generator["AppendBlockChildrenRequest", Any, None]:
+        """
+        Split `blocks` into requests that Notion accepts: at most `max_blocks` blocks and `max_bytes` of JSON body each.
+
+        Each block is serialized once, and the size of the batch is tracked as blocks are added. `block_id` is a path parameter and does not count towards the body.
+
+        Nested `children` are split too: a request holds at most `max_blocks` children per block, `MAX_NESTING` levels of them and `MAX_BLOCKS_PER_REQUEST` blocks in all. A block is sent with the first of its children that fit, and the others are appended to it by follow-up requests, once its id is known: send the response of each request to the planner. Copies are sent, `blocks` are left as they are.
+
+        Without `after` and without children to split, the blocks are appended at the end of `block_id`, and the requests can simply be iterated over. With `after`, each request after the first one must be anchored on the last block created by the previous one: send the previous response (or the id of its last block) to the planner to get the next request.
+
+        Example:
+
+            planner = AppendBlockChildrenRequest.plan(page_id, blocks, after=block_id)
+            try:
+                request = next(planner)
+                while True:
+                    response = client.append_block_children(request)
+                    request = planner.send(response)
+            except StopIteration:
+                pass
+
+        Args:
+            block_id: The block or page to append the blocks to.
+            blocks: The blocks to append, in order.
+            after: The id of the existing block to append the blocks after.
+            max_blocks: Maximum number of blocks per request, and of children per block.
+            max_bytes: Maximum size of the JSON body of each request, in bytes.
+
+        Yields:
+            The requests, in order.
+
+        Raises:
+            ValueError: If a single block does not fit in `max_bytes`, or if a response is needed but was not sent.
+        """
+        # Imported here: `limits` imports the endpoints.
+        from ..limits import MAX_BLOCKS_PER_REQUEST
+
+        if not 1 <= max_blocks <= MAX_APPEND_CHILDREN:
+            raise ValueError(f"max_blocks must be between 1 and {MAX_APPEND_CHILDREN}, got {max_blocks}")  # fmt: skip
+        block_id = NotionId(block_id)
+        after = None if after is None else NotionId(after)
+        encode = _block_adapter().dump_json
+        batch: list = []
+        # The children left out of the blocks of `batch`, by index in `batch`
+        deferred: list[tuple[int, list]] = []
+        size = count = 0
+        for block in blocks:
+            block, rest, block_count = _trim(block, max_blocks, MAX_BLOCKS_PER_REQUEST)
+            block_size = len(encode(block))
+            # `{"children":[` ... `]}`, the commas between blocks, and `,"after":"<id>"`
+            overhead = 15 + len(batch) + (_AFTER_SIZE if after else 0)
+            if batch and (
+                len(batch) == max_blocks
+                or count + block_count > MAX_BLOCKS_PER_REQUEST
+                or overhead + size + block_size > max_bytes
+            ):
+                sent = yield cls._request(block_id, batch, after)
+                if after is not None:
+                    after = _last_block_id(sent)
+                yield from cls._append_deferred(sent, deferred, max_blocks, max_bytes)
+                batch, deferred, size, count = [], [], 0, 0
+                overhead = 15 + (_AFTER_SIZE if after else 0)
+            if overhead + block_size > max_bytes:
+                raise ValueError(f"A {block.type} block of {block_size} bytes does not fit in a request of {max_bytes} bytes")  # fmt: skip
+            if rest:
+                deferred.append((len(batch), rest))
+            batch.append(block)
+            size += block_size
+            count += block_count
+        if batch:
+            sent = yield cls._request(block_id, batch, after)
+            yield from cls._append_deferred(sent, deferred, max_blocks, max_bytes)
+
+    @classmethod
+    def _request(cls, block_id: NotionId, children: list, after: Optional[NotionId]) -> "AppendBlockChildrenRequest":  # fmt: skip
+        """A planned request, given `after` only if there is one: a given `None` is sent as `null`, see `encode_request`."""
+        if after is None:
+            return cls.model_construct(block_id=block_id, children=children)
+        return cls.model_construct(block_id=block_id, children=children, after=after)
+
+    @classmethod
+    def _append_deferred(
+        cls, sent: Any, deferred: list[tuple[int, list]], max_blocks: int, max_bytes: int
+    ) -> Generator["AppendBlockChildrenRequest", Any, None]:
+        """Plan the children left out of the blocks of a request, appended to the blocks it created, from its response `sent`."""
+        for index, children in deferred:
+            if sent is None or isinstance(sent, (str, UUID)):
+                raise ValueError(
+                    "Appending children to the blocks of a request needs its response: send it to the planner"
+                )
+            yield from cls.plan(
+                sent.results[index].id,
+                children,
+                max_blocks=max_blocks,
+                max_bytes=max_bytes,
+            )
+
+    @classmethod
+    def from_markdown(
+        cls,
+        block_id: BlockId,
+        markdown: Union[str, Iterable[str]],
+        after: Optional[BlockId] = None,
+        max_blocks: int = MAX_APPEND_CHILDREN,
+        max_bytes: int = MAX_PAYLOAD_BYTES,
+    ) -> Generator["AppendBlockChildrenRequest", Any, None]:
+        """
+        Compile Markdown into requests appending its blocks to `block_id`, in a single pass, see `iter_markdown_blocks` and `plan`.
+
+        Each request is yielded as soon as its blocks are complete, so only one batch is held in memory. Send them in order, and send the response of each one to the planner: tables and lists of more than `max_blocks` items are completed by follow-up requests, see `plan`.
+
+        Args:
+            block_id: The block or page to append the blocks to.
+            markdown: The Markdown, as a string or an iterable of lines such as an open file.
+            after, max_blocks, max_bytes: See `plan`.
+
+        Yields:
+            The requests, in document order.
+        """
+        # Imported here to keep the endpoint modules free of the Markdown compiler until it is used.
+        from ..objects.block.markdown import iter_markdown_blocks
+
+        yield from cls.plan(
+            block_id,
+            iter_markdown_blocks(markdown),
+            after=after,
+            max_blocks=max_blocks,
+            max_bytes=max_bytes,
+        )
+
+
+_block_adapter_instance: Optional[TypeAdapter] = None
+
+
+def _block_adapter() -> TypeAdapter:
+    """The TypeAdapter serializing a single `BlockObject`, built on first use."""
+    global _block_adapter_instance
+    if _block_adapter_instance is None:
+        _block_adapter_instance = TypeAdapter(BlockObject)
+    return _block_adapter_instance
+
+
+_AFTER_SIZE = len(',"after":""') + 36
+"""Size of the `after` field of a request body, with its dashed id."""
+
+
+def _last_block_id(sent: Any) -> NotionId:
+    """The id of the last block created by a request, from its response or the id itself, as sent to `AppendBlockChildrenRequest.plan`."""
+    if sent is None:
+        raise ValueError(
+            "Appending after a block in several requests needs the response of each request: send it to the planner"
+        )
+    if isinstance(sent, (str, UUID, NotionId)):
+        return NotionId(sent)
+    return NotionId(sent.results[-1].id)
+
+
+def _children(block: BlockObject) -> list:
+    """The nested `children` of `block`, if its type has any."""
+    return getattr(getattr(block, block.type, None), "children", None) or []
+
+
+def _count(block: BlockObject, nesting: int, max_children: int) -> Optional[int]:
+    """The number of blocks in `block` and its descendants, if it can be sent as is at `nesting` levels below the top-level blocks of a request, else None."""
+    children = _children(block)
+    if not children:
+        return 1
+    if nesting >= MAX_NESTING or len(children) > max_children:
+        return None
+    total = 1
+    for child in children:
+        count = _count(child, nesting + 1, max_children)
+        if count is None:
+            return None
+        total += count
+    return total
+
+
+def _trim(block: BlockObject, max_children: int, max_total: int) -> tuple[BlockObject, list, int]:  # fmt: skip
+    """
+    `block` as a top-level block of a request.
+
+    Returns:
+        A copy of `block` with the first of its children that can be sent with it, or `block` itself if they all can; the children left out, in order; and the number of blocks sent.
+    """
+    children = _children(block)
+    total = 1
+    for index, child in enumerate(children):
+        count = _count(child, 1, max_children)
+        if index == max_children or count is None or total + count > max_total:
+            break
+        total += count
+    else:
+        return block, [], total
+    data = getattr(block, block.type)
+    update = {block.type: data.model_copy(update={"children": children[:index]})}
+    return block.model_copy(update=update), children[index:], total
+
 
 AppendBlockChildrenResponse = NotionPaginatedData[BlockObject]
 """Returns a paginated list of newly created first level children block objects. Refer to https://developers.notion.com/reference/patch-block-children"""
@@ -29,7 +244,7 @@ AppendBlockChildrenResponse = NotionPaginatedData[BlockObject]
 class RetrieveBlockRequest(BaseModel):
     """Reference: https://developers.notion.com/reference/retrieve-a-block"""
 
-    block_id: str = Field(..., description="Identifier for a Notion block")
+    block_id: NotionId = Field(..., description="Identifier for a Notion block")
 
 
 RetrieveBlockResponse = BlockObject
@@ -39,7 +254,7 @@ RetrieveBlockResponse = BlockObject
 class RetrieveBlockChildrenRequest(BaseModel):
     """Reference: https://developers.notion.com/reference/get-block-children"""
 
-    block_id: str = Field(
+    block_id: NotionId = Field(
         ..., description="Identifier for a Notion block, also accepts a page ID."
     )
     start_cursor: Optional[StartCursor] = None
@@ -58,7 +273,7 @@ UpdateBlockResponse = BlockObject
 class DeleteBlockRequest(BaseModel):
     """Reference: https://developers.notion.com/reference/delete-a-block"""
 
-    block_id: str = Field(..., description="Identifier for a Notion block")
+    block_id: NotionId = Field(..., description="Identifier for a Notion block")
 
 
 DeleteBlockResponse = BlockObject
@@ -66,6 +281,8 @@ DeleteBlockResponse = BlockObject
 
 
 __all__ = [
+    "MAX_APPEND_CHILDREN",
+    "MAX_PAYLOAD_BYTES",
     "AppendBlockChildrenRequest",
     "AppendBlockChildrenResponse",
     "RetrieveBlockRequest",
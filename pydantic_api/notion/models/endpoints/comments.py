@@ -1,9 +1,9 @@
 from typing import List, Optional
 
-from uuid import UUID
-from pydantic import BaseModel, Field, model_validator
+from pydantic import Field, model_validator
 
-from ..objects import CommentObject, RichTextObject, PageParentObject
+from pydantic_api.notion.models.base import BaseModel
+from ..objects import NotionId, CommentObject, RichTextObject, PageParentObject
 from .base import NotionPaginatedData, StartCursor, PageSize
 
 
@@ -14,7 +14,7 @@ class CreateCommentRequest(BaseModel):
         None,
         description="A page parent. Either this or a discussion_id is required (not both)",
     )
-    discussion_id: Optional[UUID] = Field(
+    discussion_id: Optional[NotionId] = Field(
         None,
         description="A UUID identifier for a discussion thread. Either this or a parent object is required (not both)",
     )
@@ -34,7 +34,7 @@ CreateCommentResponse = CommentObject
 class RetrieveCommentsRequest(BaseModel):
     """Reference: https://developers.notion.com/reference/retrieve-a-comment"""
 
-    block_id: UUID = Field(
+    block_id: NotionId = Field(
         ...,
         description="Identifier for a Notion block or page, a uuidv4 string. Reference: https://developers.notion.com/reference/block#keys",
     )
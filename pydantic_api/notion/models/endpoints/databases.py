@@ -1,11 +1,11 @@
-from typing import Union, List, Dict, Optional
+from typing import Union, List, Dict, Optional, Annotated
 
-from uuid import UUID
 from pydantic import Field, model_validator
 
-from pydantic_api.base import BaseModel
+from pydantic_api.notion.models.base import BaseModel
 from .base import NotionPaginatedData, FilterObject, SortObject, StartCursor, PageSize
 from ..objects import (
+    NotionId,
     Page,
     Database,
     RichTextObject,
@@ -80,7 +80,7 @@ CreateDatabaseResponse = Database
 
 
 class QueryDatabaseRequest(BaseModel):
-    database_id: UUID = Field(..., description="Identifier for a Notion database.")
+    database_id: NotionId = Field(..., description="Identifier for a Notion database.")
     filter: Optional[FilterObject] = Field(
         None,
         description="When supplied, limits which pages are returned based on the filter conditions.",
@@ -93,14 +93,16 @@ class QueryDatabaseRequest(BaseModel):
     page_size: Optional[PageSize] = None
 
 
-QueryDatabaseResponse = NotionPaginatedData[Union[Database, Page]]
+QueryDatabaseResponse = NotionPaginatedData[
+    Annotated[Union[Database, Page], Field(discriminator="object")]
+]
 """Reference: https://developers.notion.com/reference/post-database-query"""
 
 
 class RetrieveDatabaseRequest(BaseModel):
     """Reference: https://developers.notion.com/reference/retrieve-a-database"""
 
-    database_id: UUID = Field(..., description="An identifier for the Notion database.")
+    database_id: NotionId = Field(..., description="An identifier for the Notion database.")
 
 
 RetrieveDatabaseResponse = Database
@@ -122,7 +124,7 @@ class UpdateDatabaseRequest(BaseModel):
 
     """
 
-    database_id: UUID = Field(
+    database_id: NotionId = Field(
         ...,
         description="An identifier for the Notion database.",
     )
@@ -1,15 +1,17 @@
-from typing import Union, Dict, List, Any, Optional
+from typing import Union, Dict, List, Optional
 
-from uuid import UUID
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from pydantic_api.notion.models.base import BaseModel
 from .base import NotionPaginatedData, StartCursor, PageSize
 from ..objects import (
+    NotionId,
     PageParentObject,
     DatabaseParentObject,
     IconObject,
     CoverObject,
     Page,
+    BlockObject,
     PageProperty,
     CheckboxProperty,
     CreatedByProperty,
@@ -47,8 +49,7 @@ class CreatePageRequest(BaseModel):
         ...,
         description="The values of the page’s properties. If the parent is a database, then the schema must match the parent database's properties. If the parent is a page, then the only valid object key is title.",
     )
-    # FIXME: implement block types
-    children: List[Any] = Field(
+    children: List[BlockObject] = Field(
         default_factory=list,
         description="The content to be rendered on the new page, represented as an array of block objects.",
     )
@@ -69,7 +70,7 @@ CreatePageResponse = Page
 class RetrievePageRequest(BaseModel):
     """Reference: https://developers.notion.com/reference/retrieve-a-page"""
 
-    page_id: UUID = Field(
+    page_id: NotionId = Field(
         ...,
         description="Identifier for a Notion page, a uuidv4 string. Reference: https://developers.notion.com/reference/page#keys",
     )
@@ -117,7 +118,7 @@ PaginatedPageProperty = Union[
 class RetrievePagePropertyItemRequest(BaseModel):
     """Reference: https://developers.notion.com/reference/retrieve-a-page-property"""
 
-    page_id: UUID = Field(
+    page_id: NotionId = Field(
         ...,
         description="Identifier for a Notion page",
     )
@@ -138,7 +139,7 @@ RetrievePagePropertyItemResponse = Union[
 class UpdatePagePropertiesRequest(BaseModel):
     """Reference: https://developers.notion.com/reference/patch-page"""
 
-    page_id: UUID = Field(
+    page_id: NotionId = Field(
         ...,
         description="The identifier for the Notion page to be updated.",
     )
@@ -1,8 +1,8 @@
-from typing import Union, Optional, Literal
+from typing import Union, Optional, Literal, Annotated
 
 from pydantic import Field
 
-from pydantic_api.base import BaseModel
+from pydantic_api.notion.models.base import BaseModel
 from .base import NotionPaginatedData, StartCursor, PageSize, SortObject
 from ..objects import Page, Database
 
@@ -30,7 +30,9 @@ class SearchByTitleRequest(BaseModel):
 
 
 SearchByTitleResponse = Union[
-    NotionPaginatedData[Union[Page, Database]],
+    NotionPaginatedData[
+        Annotated[Union[Page, Database], Field(discriminator="object")]
+    ],
     NotionPaginatedData[Page],
     NotionPaginatedData[Database],
 ]
@@ -0,0 +1,188 @@
+"""
+Item-by-item decoding of paginated responses.
+
+`NotionPaginatedData.stream` reads a raw JSON response (bytes, str or a file-like object) and yields the validated `results` one at a time, so only the current item is ever held in memory.
+"""
+
+import io
+import re
+import json
+import codecs
+from typing import Any, Generic, Iterator, TypeVar, Union, IO
+
+from pydantic import TypeAdapter
+
+TResult = TypeVar("TResult")
+
+PaginatedSource = Union[bytes, bytearray, memoryview, str, IO[bytes], IO[str]]
+"""Anything `NotionPaginatedStream` can read from: a whole payload, or a binary/text file-like object."""
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class NotionPaginatedStream(Generic[TResult]):
+    """An iterator over the validated `results` of a paginated response.
+
+    The envelope fields (`next_cursor`, `has_more`, ...) are recorded as they are read. Notion usually sends them after `results`, so reading one before the iteration is finished skips the remaining results (without validating them) to reach it.
+
+    Example:
+
+        with open("children.json", "rb") as fp:
+            stream = RetrieveBlockChildrenResponse.stream(fp)
+            for block in stream:
+                ...
+            if stream.has_more:
+                fetch_next(stream.next_cursor)
+    """
+
+    def __init__(
+        self,
+        source: PaginatedSource,
+        adapter: TypeAdapter,
+        chunk_size: int = 64 * 1024,
+    ):
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            source = io.BytesIO(source)
+        elif isinstance(source, str):
+            source = io.StringIO(source)
+        self._source = source
+        self._adapter = adapter
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._text_decoder: codecs.IncrementalDecoder | None = None
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._fields: dict[str, Any] = {}
+        self._raw_results = self._scan()
+
+    def __iter__(self) -> Iterator[TResult]:
+        return self
+
+    def __next__(self) -> TResult:
+        return self._adapter.validate_python(next(self._raw_results))
+
+    # Envelope fields
+    @property
+    def fields(self) -> dict[str, Any]:
+        """All top-level fields of the response except `results`, as decoded JSON. Skips the remaining results if needed."""
+        self._finish()
+        return self._fields
+
+    @property
+    def next_cursor(self) -> str | None:
+        return self._field("next_cursor")
+
+    @property
+    def has_more(self) -> bool:
+        return self._field("has_more")
+
+    @property
+    def type(self) -> str | None:
+        return self._field("type")
+
+    @property
+    def request_id(self) -> str | None:
+        return self._field("request_id")
+
+    def _field(self, key: str) -> Any:
+        if key not in self._fields:
+            self._finish()
+        return self._fields.get(key)
+
+    def _finish(self):
+        for _ in self._raw_results:
+            pass
+
+    # JSON scanning
+    def _scan(self) -> Iterator[Any]:
+        """Walk the top-level object, recording envelope fields and yielding each raw item of `results`."""
+        self._expect("{")
+        while True:
+            char = self._next_char()
+            if char == "}":
+                break
+            if char == ",":
+                continue
+            self._pos -= 1
+            key = self._decode_value()
+            self._expect(":")
+            if key != "results":
+                self._fields[key] = self._decode_value()
+                continue
+            self._expect("[")
+            if self._next_char() == "]":
+                continue
+            self._pos -= 1
+            while True:
+                yield self._decode_value()
+                char = self._next_char()
+                if char == "]":
+                    break
+                if char != ",":
+                    raise ValueError(
+                        f"Expected ',' or ']' in results, got {char!r} at offset {self._pos - 1}"
+                    )
+
+    def _decode_value(self) -> Any:
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+                self._fill()
+                continue
+            # A number that ends at the buffer boundary may continue in the next chunk.
+            if end == len(self._buffer) and not self._eof and isinstance(
+                value, (int, float)
+            ):
+                self._fill()
+                continue
+            self._pos = end
+            return value
+
+    def _expect(self, char: str):
+        actual = self._next_char()
+        if actual != char:
+            raise ValueError(
+                f"Expected {char!r}, got {actual!r} at offset {self._pos - 1}"
+            )
+
+    def _next_char(self) -> str:
+        self._skip_whitespace()
+        if self._pos >= len(self._buffer):
+            raise ValueError("Unexpected end of paginated response")
+        char = self._buffer[self._pos]
+        self._pos += 1
+        return char
+
+    def _skip_whitespace(self):
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer) or self._eof:
+                return
+            self._fill()
+
+    def _fill(self):
+        """Read more input, at least doubling the unconsumed buffer so that large items are not re-scanned too often."""
+        remaining = self._buffer[self._pos :]
+        size = max(self._chunk_size, len(remaining))
+        chunk = self._source.read(size)
+        if isinstance(chunk, (bytes, bytearray)):
+            if self._text_decoder is None:
+                self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+            text = self._text_decoder.decode(chunk, final=not chunk)
+        else:
+            text = chunk
+        if not chunk:
+            self._eof = True
+        self._buffer = remaining + text
+        self._pos = 0
+
+
+__all__ = [
+    "PaginatedSource",
+    "NotionPaginatedStream",
+]
@@ -1,11 +1,10 @@
 from typing import Optional
 
-from uuid import UUID
 from pydantic import Field
 
-from pydantic_api.base import BaseModel
+from pydantic_api.notion.models.base import BaseModel
 from .base import NotionPaginatedData, StartCursor, PageSize
-from ..objects import UserObject, BotUserObject
+from ..objects import NotionId, UserObject, BotUserObject
 
 
 class ListAllUsersRequest(BaseModel):
@@ -20,7 +19,7 @@ ListAllUsersResponse = NotionPaginatedData[UserObject]
 
 
 class RetrieveUserRequest(BaseModel):
-    user_id: UUID = Field(..., description="Identifier for a Notion user")
+    user_id: NotionId = Field(..., description="Identifier for a Notion user")
 
 
 RetrieveUserResponse = UserObject
@@ -0,0 +1,192 @@
+"""
+Content fingerprints of Notion objects, and Merkle hashes of block trees.
+
+`fingerprint` hashes a `Page`, a `Database`, a block, a comment, rich text, or any model, list or dict of them, into 16 bytes that are equal for equal content and stable across processes and versions of Python, so that a mirror can detect changes by comparing hashes rather than re-serialized pages. What changes between two reads of the same content is left out: the `request_id` of responses, and the expiring signature of the files Notion hosts (the query string of their `url`, and their `expiry_time`). Fields set to `None` hash as if they were absent, and dict keys in any order.
+
+`merkle_hashes` hashes a `BlockTree` bottom-up: the hash of a node covers its block and the hashes of its children, so an unchanged subtree is recognized from its hash alone, and `changed_subtrees` only walks down the subtrees that changed.
+"""
+
+from hashlib import blake2b
+from uuid import UUID
+from datetime import date, datetime, time
+from collections.abc import Mapping
+from typing import Any, Iterator, Optional
+
+import pydantic
+
+from .size import _LEAF, _MODEL, _SEQUENCE, _kind
+from .objects import BlockId, BlockNode, BlockTree, EpochMillis, NotionId
+from .objects.file import _FileUploaded
+
+DIGEST_SIZE = 16
+"""Size of the fingerprints and Merkle hashes, in bytes."""
+
+_VOLATILE_FIELDS = frozenset({"request_id"})
+"""Fields of any model that differ between two reads of the same content."""
+
+_FIELDS: dict[type, tuple[tuple[str, str, bool], ...]] = {}
+"""The hashed fields of each model class: name, token, and whether the field is a signed URL."""
+
+
+def _fields(cls: type[pydantic.BaseModel]) -> tuple[tuple[str, str, bool], ...]:
+    fields = _FIELDS.get(cls)
+    if fields is None:
+        volatile, signed = _VOLATILE_FIELDS, False
+        if issubclass(cls, _FileUploaded):
+            # Hosted files are served from signed URLs, signed again on every read
+            volatile, signed = volatile | {"expiry_time"}, True
+        fields = _FIELDS[cls] = tuple(
+            (name, name + "=", signed and name == "url")
+            for name, field in cls.model_fields.items()
+            if not field.exclude and name not in volatile
+        )
+    return fields
+
+
+def _leaf(value: Any) -> str:
+    """The token of a value that is neither a model nor a container; strings are quoted, so they never read like another type."""
+    cls = type(value)
+    if cls is str:
+        return repr(value)
+    if cls is bool:
+        return "T" if value else "F"
+    if cls is int or cls is float or cls is NotionId or cls is UUID:
+        return str(value)
+    if cls is datetime or cls is date or cls is time:
+        return value.isoformat()
+    if cls is EpochMillis:
+        # The token of the `datetime` it stands for
+        return value.datetime.isoformat()
+    if isinstance(value, str):
+        return repr(str(value))
+    return f"{cls.__name__}({value})"
+
+
+def _tokens(value: Any, out: list[str]):
+    """Append the tokens of `value` to `out`."""
+    kind = _kind(type(value))
+    if kind is _LEAF:
+        out.append(_leaf(value))
+    elif kind is _MODEL:
+        out.append("{")
+        values = value.__dict__
+        for name, token, signed in _fields(type(value)):
+            item = values[name]
+            if item is None:
+                continue
+            out.append(token)
+            if signed:
+                out.append(repr(str(item).split("?", 1)[0]))
+            elif _kind(type(item)) is _LEAF:
+                out.append(_leaf(item))
+            else:
+                _tokens(item, out)
+        extra = value.__pydantic_extra__
+        if extra:
+            for name in sorted(extra):
+                if extra[name] is not None and name not in _VOLATILE_FIELDS:
+                    out.append(f"{name}=")
+                    _tokens(extra[name], out)
+        out.append("}")
+    elif kind is _SEQUENCE:
+        out.append("[")
+        for item in value:
+            if _kind(type(item)) is _LEAF:
+                out.append(_leaf(item))
+            else:
+                _tokens(item, out)
+        out.append("]")
+    else:
+        out.append("{")
+        for key in sorted(value, key=str):
+            if value[key] is not None:
+                out.append(f"{str(key)!r}=")
+                _tokens(value[key], out)
+        out.append("}")
+
+
+def _digest(tokens: list[str]) -> bytes:
+    return blake2b("\x1f".join(tokens).encode(), digest_size=DIGEST_SIZE).digest()
+
+
+def fingerprint(value: Any) -> bytes:
+    """
+    The content fingerprint of `value`: equal for equal content, stable across processes.
+
+    Args:
+        value: A `Page`, a `Database`, a block, a comment, rich text, or any model, list or dict of them.
+
+    Returns:
+        A `DIGEST_SIZE`-byte hash.
+    """
+    tokens: list[str] = []
+    _tokens(value, tokens)
+    return _digest(tokens)
+
+
+def merkle_hashes(tree: BlockTree, start: Optional[BlockId] = None) -> dict[NotionId, bytes]:
+    """
+    The Merkle hash of every subtree of `tree` below `start` (the root by default), by block id.
+
+    The hash of a node is the hash of the fingerprint of its block, followed by the hashes of its children in order: it changes when anything in the subtree changes, and only then. Nodes whose block has not been retrieved hash as an empty block.
+
+    Args:
+        tree: The tree.
+        start: The id of the top node, included.
+
+    Returns:
+        The hashes, with the top node's (the Merkle root) first.
+    """
+    top = tree.root if start is None else tree[start]
+    order = [top, *tree.depth_first(top.id)]
+    hashes: dict[NotionId, bytes] = {}
+    # Children come after their parent in document order: hash them first
+    for node in reversed(order):
+        parts = [b"" if node.block is None else fingerprint(node.block)]
+        parts.extend(hashes[child.id] for child in node.children)
+        hashes[node.id] = blake2b(b"".join(parts), digest_size=DIGEST_SIZE).digest()  # fmt: skip
+    return {node.id: hashes[node.id] for node in order}
+
+
+def merkle_root(tree: BlockTree, start: Optional[BlockId] = None) -> bytes:
+    """The Merkle hash of the subtree of `start` (the root by default), see `merkle_hashes`."""
+    return merkle_hashes(tree, start)[tree.root.id if start is None else tree[start].id]
+
+
+def changed_nodes(tree: BlockTree, previous: Mapping[NotionId, bytes]) -> Iterator[BlockNode]:  # fmt: skip
+    """
+    The nodes of `tree` whose subtree changed since it was hashed in `previous`: new and changed blocks, and their ancestors, in document order.
+
+    The walk goes down from the root only into the subtrees whose hash changed, so the unchanged ones are skipped without being visited. Removed blocks are not in `tree`: compare the ids of `previous` with it to find them.
+
+    Example:
+
+        hashes = merkle_hashes(tree)
+        ...  # later, with a new tree of the same page
+        for node in changed_nodes(new_tree, hashes):
+            mirror.save(node.block)
+        hashes = merkle_hashes(new_tree)
+
+    Args:
+        tree: The tree as it is.
+        previous: The `merkle_hashes` of the tree as it was.
+    """
+    hashes = merkle_hashes(tree)
+    if hashes[tree.root.id] == previous.get(tree.root.id):
+        return
+    stack = list(reversed(tree.root.children))
+    while stack:
+        node = stack.pop()
+        if hashes[node.id] == previous.get(node.id):
+            continue
+        yield node
+        stack.extend(reversed(node.children))
+
+
+__all__ = [
+    "DIGEST_SIZE",
+    "fingerprint",
+    "merkle_hashes",
+    "merkle_root",
+    "changed_nodes",
+]
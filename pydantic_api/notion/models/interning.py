@@ -0,0 +1,155 @@
+"""
+Interning of the small objects repeated across decoded rows.
+
+The pages of a large query hold the same few users in `created_by` and `last_edited_by`, the same select and status options, the same text annotations and the same parent, each decoded as its own model instance. An `InternPool` replaces the identical ones by a single shared instance, after decoding, which cuts the memory of an in-process replica of a database.
+
+Shared instances are frozen: assigning one of their fields raises `TypeError`, since the change would show in every row. Interning is opt-in and scoped to a pool, typically one per decoding session, which keeps the most recently used instances (`INTERN_POOL_SIZE` by default).
+"""
+
+from collections import OrderedDict
+from typing import Any, Iterable, Iterator, Optional, TypeVar
+
+from .base import _frozen
+from .size import _LEAF, _MODEL, _SEQUENCE, _kind
+from .objects import (
+    PartialUser,
+    SelectOption,
+    StatusOption,
+    TextAnnotations,
+    DatabaseParentObject,
+    LazyPageProperties,
+)
+
+T = TypeVar("T")
+
+INTERN_POOL_SIZE = 4096
+"""Default number of distinct instances kept by an `InternPool`."""
+
+INTERNED_TYPES: frozenset[type] = frozenset(
+    {
+        PartialUser,
+        SelectOption,
+        StatusOption,
+        TextAnnotations,
+        DatabaseParentObject,
+    }
+)
+"""The classes interned by default. Only instances of these exact classes are, not of their subclasses (e.g. the full `PersonUserObject` of `PartialUser`)."""
+
+
+class InternPool:
+    """A pool of shared instances of small models, bounded by a least recently used policy.
+
+    Example:
+
+        pool = InternPool()
+        for page in pool.intern_all(stream_query_results(...)):
+            replica[page.id] = page
+
+    Args:
+        maxsize: Number of distinct instances kept; the least recently used are dropped, and stay shared by the rows already interned.
+        types: The model classes to intern, `INTERNED_TYPES` by default. Their fields must be hashable.
+
+    Attributes:
+        hits: Number of instances replaced by a shared one.
+        misses: Number of instances added to the pool.
+    """
+
+    __slots__ = ("maxsize", "types", "hits", "misses", "_instances")
+
+    def __init__(self, maxsize: int = INTERN_POOL_SIZE, types: Optional[Iterable[type]] = None):  # fmt: skip
+        self.maxsize = maxsize
+        self.types = INTERNED_TYPES if types is None else frozenset(types)
+        self.hits = 0
+        self.misses = 0
+        self._instances: OrderedDict[tuple, Any] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(size={len(self)}, maxsize={self.maxsize}, hits={self.hits}, misses={self.misses})"  # fmt: skip
+
+    def clear(self):
+        """Drop the pooled instances; they stay shared (and frozen) in the rows already interned."""
+        self._instances.clear()
+
+    def intern(self, value: T) -> T:
+        """
+        Replace, in place, the instances of the interned types held by `value` by shared ones.
+
+        Args:
+            value: A decoded model (e.g. a `Page` or a `QueryDatabaseResponse`), or a list or dict of them.
+
+        Returns:
+            `value`, or its shared instance if it is itself of an interned type.
+        """
+        if type(value) in self.types:
+            return self._shared(value)
+        self._walk(value)
+        return value
+
+    def intern_all(self, values: Iterable[T]) -> Iterator[T]:
+        """Intern each of `values` as it is consumed, e.g. the pages of a stream."""
+        for value in values:
+            yield self.intern(value)
+
+    def _shared(self, instance: Any) -> Any:
+        values = instance.__dict__
+        try:
+            key = (type(instance), frozenset(instance.model_fields_set), *(values[name] for name in type(instance).model_fields))  # fmt: skip
+            if instance.__pydantic_extra__:
+                key += tuple(sorted(instance.__pydantic_extra__.items()))
+            shared = self._instances.get(key)
+        except TypeError:  # an unhashable field
+            return instance
+        if shared is not None:
+            self._instances.move_to_end(key)
+            self.hits += 1
+            return shared
+        _frozen[id(instance)] = instance
+        self._instances[key] = instance
+        self.misses += 1
+        if len(self._instances) > self.maxsize:
+            self._instances.popitem(last=False)
+        return instance
+
+    def _walk(self, value: Any):
+        types = self.types
+        stack = [value]
+        while stack:
+            value = stack.pop()
+            kind = _kind(type(value))
+            if kind is _MODEL:
+                values = value.__dict__
+                for name in type(value).model_fields:
+                    item = values[name]
+                    if type(item) in types:
+                        values[name] = self._shared(item)
+                    elif _kind(type(item)) is not _LEAF:
+                        stack.append(item)
+            elif kind is _SEQUENCE:
+                if type(value) is not list:
+                    stack.extend(value)
+                    continue
+                for i, item in enumerate(value):
+                    if type(item) in types:
+                        value[i] = self._shared(item)
+                    elif _kind(type(item)) is not _LEAF:
+                        stack.append(item)
+            elif kind is not _LEAF:
+                # Only walk the properties of a `LazyPage` that were decoded
+                lazy = isinstance(value, LazyPageProperties)
+                items = value._data if lazy else value
+                for key, item in items.items():
+                    if type(item) in types:
+                        items[key] = self._shared(item)
+                    elif _kind(type(item)) is not _LEAF and not (lazy and type(item) is dict):  # fmt: skip
+                        stack.append(item)
+
+
+__all__ = [
+    "INTERN_POOL_SIZE",
+    "INTERNED_TYPES",
+    "InternPool",
+]
@@ -0,0 +1,240 @@
+"""
+Notion's request limits, checked before a request is sent.
+
+`lint_request` walks a request once, reporting every value over one of the documented limits with its path in the request body and measuring the body on the way (as `json_size` does), so that a batch can be fixed or split instead of being rejected one round trip at a time. `lint_requests` does the same over a batch.
+
+Reference: https://developers.notion.com/reference/request-limits
+"""
+
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Optional, Union
+
+import pydantic
+
+from .size import (
+    _LEAF,
+    _MODEL,
+    _SEQUENCE,
+    _kind,
+    _fields,
+    _str_size,
+    _leaf_size,
+    json_size,
+)
+from .objects import (
+    TextObject,
+    EquationObject,
+    EmailProperty,
+    PhoneNumberProperty,
+    MAX_NESTING,
+    utf16_len,
+)
+from .endpoints import MAX_PAYLOAD_BYTES
+from .wire import request_encoder
+
+MAX_ARRAY_LENGTH = 100
+"""Maximum number of elements of any array: blocks, rich text objects, multi-select options, relations, people, ..."""
+
+MAX_TEXT_LENGTH = 2000
+"""Maximum length of the `text.content` of a rich text object, in UTF-16 code units."""
+
+MAX_URL_LENGTH = 2000
+"""Maximum length of any URL, e.g. a link, a bookmark or a `url` property."""
+
+MAX_EQUATION_LENGTH = 1000
+"""Maximum length of the `equation.expression` of a rich text object."""
+
+MAX_EMAIL_LENGTH = 200
+"""Maximum length of an `email` property."""
+
+MAX_PHONE_NUMBER_LENGTH = 200
+"""Maximum length of a `phone_number` property."""
+
+MAX_BLOCKS_PER_REQUEST = 1000
+"""Maximum number of blocks in a request, nested children included."""
+
+
+def _url_fields(cls: type) -> Optional[set[str]]:
+    """Fields of the request models sent in the URL rather than in the body."""
+    try:
+        encoder = request_encoder(cls)
+    except TypeError:
+        return None
+    return {*encoder.path_fields, *encoder.query_fields}
+
+
+class LimitViolation(NamedTuple):
+    """A value of a request over one of Notion's limits."""
+
+    path: str
+    """Where the value is in the request body, e.g. `children[3].paragraph.rich_text[0].text.content`; empty for the whole body."""
+    limit: str
+    """What is limited, e.g. `text length`."""
+    size: int
+    """The size of the value."""
+    maximum: int
+    """The largest size accepted by Notion."""
+
+    def __str__(self) -> str:
+        return f"{self.path or 'request body'}: {self.limit} is {self.size}, the maximum is {self.maximum}"  # fmt: skip
+
+
+_Rule = tuple[str, int, Callable[[Any], int]]
+"""What is limited, the maximum, and how to measure a value."""
+
+_Path = Optional[tuple["_Path", Union[str, int, tuple[str]]]]
+"""A path as a linked list of segments, from the last one: field names, list indexes and `(key,)` for mapping keys. Only formatted when a violation is found."""
+
+_URL: _Rule = ("URL length", MAX_URL_LENGTH, lambda value: len(str(value)))
+
+_FIELD_RULES: dict[type, dict[str, _Rule]] = {
+    TextObject: {"content": ("text length", MAX_TEXT_LENGTH, utf16_len)},
+    EquationObject: {"expression": ("equation length", MAX_EQUATION_LENGTH, len)},
+    EmailProperty: {"email": ("email length", MAX_EMAIL_LENGTH, len)},
+    PhoneNumberProperty: {"phone_number": ("phone number length", MAX_PHONE_NUMBER_LENGTH, len)},  # fmt: skip
+}
+
+_PLANS: dict[type, tuple[tuple[str, int, Optional[_Rule]], ...]] = {}
+"""The serialized fields of each model class, with the size of their `"name":` key and the rule that applies to their value."""
+
+
+def _plan(cls: type) -> tuple[tuple[str, int, Optional[_Rule]], ...]:
+    plan = _PLANS.get(cls)
+    if plan is None:
+        rules: dict[str, _Rule] = {}
+        for base in reversed(cls.__mro__):
+            rules.update(_FIELD_RULES.get(base, ()))
+        plan = _PLANS[cls] = tuple(
+            (name, key_size, rules.get(name, _URL if name == "url" else None))
+            for name, key_size in _fields(cls)
+        )
+    return plan
+
+
+def _format(path: _Path) -> str:
+    segments = []
+    while path is not None:
+        path, segment = path
+        segments.append(segment)
+    text = ""
+    for segment in reversed(segments):
+        if isinstance(segment, int):
+            text += f"[{segment}]"
+        elif isinstance(segment, tuple):
+            text += f"[{segment[0]!r}]"
+        else:
+            text += f".{segment}" if text else segment
+    return text
+
+
+class _Linter:
+    """Collects the violations of a request, counts its blocks and measures its body (as `json_size(exclude_none=True)`), in one walk."""
+
+    __slots__ = ("violations", "blocks")
+
+    def __init__(self):
+        self.violations: list[LimitViolation] = []
+        self.blocks = 0
+
+    def report(self, path: _Path, limit: str, size: int, maximum: int):
+        self.violations.append(LimitViolation(_format(path), limit, size, maximum))
+
+    def model(self, model: pydantic.BaseModel, path: _Path, depth: int, exclude: Optional[set[str]] = None) -> int:  # fmt: skip
+        """The serialized size of `model`."""
+        values = model.__dict__
+        size, count = 2, 0
+        for name, key_size, rule in _plan(type(model)):
+            value = values.get(name)
+            if value is not None and not (exclude and name in exclude):
+                count += 1
+                size += key_size + self.value(value, (path, name), rule, depth, name)
+        extra = model.__pydantic_extra__
+        if extra:
+            for name, value in extra.items():
+                if value is not None:
+                    count += 1
+                    size += _str_size(name) + 1 + self.value(value, (path, name), _URL if name == "url" else None, depth, name)  # fmt: skip
+        return size + max(count - 1, 0)
+
+    def value(self, value: Any, path: _Path, rule: Optional[_Rule], depth: int, name: Optional[str]) -> int:  # fmt: skip
+        """The serialized size of `value`."""
+        kind = _kind(type(value))
+        if kind is _LEAF:
+            if rule is not None:
+                limit, maximum, measure = rule
+                length = measure(value)
+                if length > maximum:
+                    self.report(path, limit, length, maximum)
+            return _leaf_size(value)
+        if kind is _MODEL:
+            return self.model(value, path, depth)
+        if kind is _SEQUENCE:
+            if len(value) > MAX_ARRAY_LENGTH:
+                self.report(path, "array length", len(value), MAX_ARRAY_LENGTH)
+            if name == "children":
+                # `depth` counts the lists of children entered: top-level blocks are at nesting 0.
+                # An empty list, such as the default `children` of a list item, nests no block.
+                self.blocks += len(value)
+                depth += 1
+                if value and depth - 1 > MAX_NESTING:
+                    self.report(path, "nesting depth", depth - 1, MAX_NESTING)
+                    return json_size(value, exclude_none=True)
+            size = 1 + len(value) if value else 2
+            for index, item in enumerate(value):
+                size += self.value(item, (path, index), None, depth, None)
+            return size
+        size = 1 + len(value) if value else 2
+        for key, item in value.items():
+            size += _str_size(str(key)) + 1 + self.value(item, (path, (key,)), rule, depth, None)  # fmt: skip
+        return size
+
+
+def lint_request(request: pydantic.BaseModel) -> list[LimitViolation]:
+    """
+    Check a request against Notion's request limits.
+
+    Made for `CreatePageRequest`, `UpdatePagePropertiesRequest`, `AppendBlockChildrenRequest` and `CreateCommentRequest`, and works with any request model. Every limit is checked: the length of arrays, texts, equations, URLs, emails and phone numbers, the number of blocks and their nesting, and the size of the body, measured like `json_size`. Nesting deeper than `MAX_NESTING` is reported once, and not looked into.
+
+    Args:
+        request: The request to check.
+
+    Returns:
+        The violations, in the order of the request body; empty if the request can be sent.
+    """
+    linter = _Linter()
+    size = linter.model(request, None, 0, _url_fields(type(request)))
+    if linter.blocks > MAX_BLOCKS_PER_REQUEST:
+        linter.report((None, "children"), "block count", linter.blocks, MAX_BLOCKS_PER_REQUEST)  # fmt: skip
+    if size > MAX_PAYLOAD_BYTES:
+        linter.report(None, "body size", size, MAX_PAYLOAD_BYTES)
+    return linter.violations
+
+
+def lint_requests(
+    requests: Iterable[pydantic.BaseModel],
+) -> Iterator[tuple[int, LimitViolation]]:
+    """
+    Check a batch of requests against Notion's request limits, see `lint_request`.
+
+    Args:
+        requests: The requests to check.
+
+    Yields:
+        The index of the request in `requests` and a violation, for every violation.
+    """
+    for index, request in enumerate(requests):
+        for violation in lint_request(request):
+            yield index, violation
+
+
+__all__ = [
+    "MAX_ARRAY_LENGTH",
+    "MAX_TEXT_LENGTH",
+    "MAX_URL_LENGTH",
+    "MAX_EQUATION_LENGTH",
+    "MAX_EMAIL_LENGTH",
+    "MAX_PHONE_NUMBER_LENGTH",
+    "MAX_BLOCKS_PER_REQUEST",
+    "LimitViolation",
+    "lint_request",
+    "lint_requests",
+]
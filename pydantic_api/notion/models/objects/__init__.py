@@ -12,17 +12,91 @@ Contains all data models defined in the Notion API documentation, the *OBJECTS*
 - Unfurl attribute(Link Previews): `pydantic_api.notion.models.objects.link_preview`
 - File: `pydantic_api.notion.models.objects.file`
 - Emoji: `pydantic_api.notion.models.objects.emoji`
+- Ids: `pydantic_api.notion.models.objects.ids`
+- Timestamps: `pydantic_api.notion.models.objects.timestamps`
 
+Submodules are imported on first attribute access.
 """
 
-from .common import *
-from .user import *
-from .file import *
-from .page import *
-from .emoji import *
-from .block import *
-from .parent import *
-from .comment import *
-from .database import *
-from .properties import *
-from .link_preview import *
+from typing import TYPE_CHECKING
+
+from .._lazy import attach
+from . import block, properties
+
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        ".ids": ["NotionId"],
+        ".timestamps": ["EpochMillis", "Timestamp"],
+        ".common": [
+            "IconObject",
+            "IconObjectFactory",
+            "CoverObject",
+            "CoverObjectFactory",
+            "ColorLiteral",
+            "CodeLanguageLiteral",
+        ],
+        ".user": [
+            "UserObjectTypeLiteral",
+            "PersonUserObject",
+            "BotUserObject",
+            "UserObject",
+            "PartialUser",
+            "UserObjectFactory",
+        ],
+        ".file": [
+            "FileObjectTypeLiteral",
+            "ExternalFileObject",
+            "UploadedFileObject",
+            "FileObject",
+            "FileObjectFactory",
+            "_BaseFileObject",
+            "_FileExternal",
+            "_FileUploaded",
+        ],
+        ".page": [
+            "ParentOfPage",
+            "Page",
+            "LazyPageProperties",
+            "LazyPage",
+        ],
+        ".emoji": [
+            "EmojiObject",
+        ],
+        ".parent": [
+            "ParentObjectTypeLiteral",
+            "DatabaseParentObject",
+            "PageParentObject",
+            "WorkspaceParentObject",
+            "BlockParentObject",
+            "ParentObject",
+            "ParentObjectFactory",
+        ],
+        ".comment": [
+            "ParentOfComment",
+            "CommentObject",
+        ],
+        ".database": [
+            "ParentOfDatabase",
+            "Database",
+        ],
+        ".block": block.__all__,
+        ".properties": properties.__all__,
+    },
+)
+
+
+if TYPE_CHECKING:
+    from .ids import *
+    from .timestamps import *
+    from .common import *
+    from .user import *
+    from .file import *
+    from .page import *
+    from .emoji import *
+    from .block import *
+    from .parent import *
+    from .comment import *
+    from .database import *
+    from .properties import *
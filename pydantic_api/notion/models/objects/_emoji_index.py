@@ -0,0 +1,5052 @@
+"""
+Valid emoji sequences, generated by `scripts/generate_emoji_index.py` from emoji==2.14.0. Do not edit.
+
+Stored as one newline-separated string constant, so loading the module only unmarshals a single object.
+"""
+
+EMOJI_PACKAGE_VERSION = "2.14.0"
+
+EMOJI_SEQUENCES = (
+    '#⃣\n'
+    '#️⃣\n'
+    '*⃣\n'
+    '*️⃣\n'
+    '0⃣\n'
+    '0️⃣\n'
+    '1⃣\n'
+    '1️⃣\n'
+    '2⃣\n'
+    '2️⃣\n'
+    '3⃣\n'
+    '3️⃣\n'
+    '4⃣\n'
+    '4️⃣\n'
+    '5⃣\n'
+    '5️⃣\n'
+    '6⃣\n'
+    '6️⃣\n'
+    '7⃣\n'
+    '7️⃣\n'
+    '8⃣\n'
+    '8️⃣\n'
+    '9⃣\n'
+    '9️⃣\n'
+    '©\n'
+    '©️\n'
+    '®\n'
+    '®️\n'
+    '‼\n'
+    '‼️\n'
+    '⁉\n'
+    '⁉️\n'
+    '™\n'
+    '™️\n'
+    'ℹ\n'
+    'ℹ️\n'
+    '↔\n'
+    '↔️\n'
+    '↕\n'
+    '↕️\n'
+    '↖\n'
+    '↖️\n'
+    '↗\n'
+    '↗️\n'
+    '↘\n'
+    '↘️\n'
+    '↙\n'
+    '↙️\n'
+    '↩\n'
+    '↩️\n'
+    '↪\n'
+    '↪️\n'
+    '⌚\n'
+    '⌛\n'
+    '⌨\n'
+    '⌨️\n'
+    '⏏\n'
+    '⏏️\n'
+    '⏩\n'
+    '⏪\n'
+    '⏫\n'
+    '⏬\n'
+    '⏭\n'
+    '⏭️\n'
+    '⏮\n'
+    '⏮️\n'
+    '⏯\n'
+    '⏯️\n'
+    '⏰\n'
+    '⏱\n'
+    '⏱️\n'
+    '⏲\n'
+    '⏲️\n'
+    '⏳\n'
+    '⏸\n'
+    '⏸️\n'
+    '⏹\n'
+    '⏹️\n'
+    '⏺\n'
+    '⏺️\n'
+    'Ⓜ\n'
+    'Ⓜ️\n'
+    '▪\n'
+    '▪️\n'
+    '▫\n'
+    '▫️\n'
+    '▶\n'
+    '▶️\n'
+    '◀\n'
+    '◀️\n'
+    '◻\n'
+    '◻️\n'
+    '◼\n'
+    '◼️\n'
+    '◽\n'
+    '◾\n'
+    '☀\n'
+    '☀️\n'
+    '☁\n'
+    '☁️\n'
+    '☂\n'
+    '☂️\n'
+    '☃\n'
+    '☃️\n'
+    '☄\n'
+    '☄️\n'
+    '☎\n'
+    '☎️\n'
+    '☑\n'
+    '☑️\n'
+    '☔\n'
+    '☕\n'
+    '☘\n'
+    '☘️\n'
+    '☝\n'
+    '☝️\n'
+    '☝🏻\n'
+    '☝🏼\n'
+    '☝🏽\n'
+    '☝🏾\n'
+    '☝🏿\n'
+    '☠\n'
+    '☠️\n'
+    '☢\n'
+    '☢️\n'
+    '☣\n'
+    '☣️\n'
+    '☦\n'
+    '☦️\n'
+    '☪\n'
+    '☪️\n'
+    '☮\n'
+    '☮️\n'
+    '☯\n'
+    '☯️\n'
+    '☸\n'
+    '☸️\n'
+    '☹\n'
+    '☹️\n'
+    '☺\n'
+    '☺️\n'
+    '♀\n'
+    '♀️\n'
+    '♂\n'
+    '♂️\n'
+    '♈\n'
+    '♉\n'
+    '♊\n'
+    '♋\n'
+    '♌\n'
+    '♍\n'
+    '♎\n'
+    '♏\n'
+    '♐\n'
+    '♑\n'
+    '♒\n'
+    '♓\n'
+    '♟\n'
+    '♟️\n'
+    '♠\n'
+    '♠️\n'
+    '♣\n'
+    '♣️\n'
+    '♥\n'
+    '♥️\n'
+    '♦\n'
+    '♦️\n'
+    '♨\n'
+    '♨️\n'
+    '♻\n'
+    '♻️\n'
+    '♾\n'
+    '♾️\n'
+    '♿\n'
+    '⚒\n'
+    '⚒️\n'
+    '⚓\n'
+    '⚔\n'
+    '⚔️\n'
+    '⚕\n'
+    '⚕️\n'
+    '⚖\n'
+    '⚖️\n'
+    '⚗\n'
+    '⚗️\n'
+    '⚙\n'
+    '⚙️\n'
+    '⚛\n'
+    '⚛️\n'
+    '⚜\n'
+    '⚜️\n'
+    '⚠\n'
+    '⚠️\n'
+    '⚡\n'
+    '⚧\n'
+    '⚧️\n'
+    '⚪\n'
+    '⚫\n'
+    '⚰\n'
+    '⚰️\n'
+    '⚱\n'
+    '⚱️\n'
+    '⚽\n'
+    '⚾\n'
+    '⛄\n'
+    '⛅\n'
+    '⛈\n'
+    '⛈️\n'
+    '⛎\n'
+    '⛏\n'
+    '⛏️\n'
+    '⛑\n'
+    '⛑️\n'
+    '⛓\n'
+    '⛓\u200d💥\n'
+    '⛓️\n'
+    '⛓️\u200d💥\n'
+    '⛔\n'
+    '⛩\n'
+    '⛩️\n'
+    '⛪\n'
+    '⛰\n'
+    '⛰️\n'
+    '⛱\n'
+    '⛱️\n'
+    '⛲\n'
+    '⛳\n'
+    '⛴\n'
+    '⛴️\n'
+    '⛵\n'
+    '⛷\n'
+    '⛷️\n'
+    '⛸\n'
+    '⛸️\n'
+    '⛹\n'
+    '⛹\u200d♀\n'
+    '⛹\u200d♀️\n'
+    '⛹\u200d♂\n'
+    '⛹\u200d♂️\n'
+    '⛹️\n'
+    '⛹️\u200d♀\n'
+    '⛹️\u200d♀️\n'
+    '⛹️\u200d♂\n'
+    '⛹️\u200d♂️\n'
+    '⛹🏻\n'
+    '⛹🏻\u200d♀\n'
+    '⛹🏻\u200d♀️\n'
+    '⛹🏻\u200d♂\n'
+    '⛹🏻\u200d♂️\n'
+    '⛹🏼\n'
+    '⛹🏼\u200d♀\n'
+    '⛹🏼\u200d♀️\n'
+    '⛹🏼\u200d♂\n'
+    '⛹🏼\u200d♂️\n'
+    '⛹🏽\n'
+    '⛹🏽\u200d♀\n'
+    '⛹🏽\u200d♀️\n'
+    '⛹🏽\u200d♂\n'
+    '⛹🏽\u200d♂️\n'
+    '⛹🏾\n'
+    '⛹🏾\u200d♀\n'
+    '⛹🏾\u200d♀️\n'
+    '⛹🏾\u200d♂\n'
+    '⛹🏾\u200d♂️\n'
+    '⛹🏿\n'
+    '⛹🏿\u200d♀\n'
+    '⛹🏿\u200d♀️\n'
+    '⛹🏿\u200d♂\n'
+    '⛹🏿\u200d♂️\n'
+    '⛺\n'
+    '⛽\n'
+    '✂\n'
+    '✂️\n'
+    '✅\n'
+    '✈\n'
+    '✈️\n'
+    '✉\n'
+    '✉️\n'
+    '✊\n'
+    '✊🏻\n'
+    '✊🏼\n'
+    '✊🏽\n'
+    '✊🏾\n'
+    '✊🏿\n'
+    '✋\n'
+    '✋🏻\n'
+    '✋🏼\n'
+    '✋🏽\n'
+    '✋🏾\n'
+    '✋🏿\n'
+    '✌\n'
+    '✌️\n'
+    '✌🏻\n'
+    '✌🏼\n'
+    '✌🏽\n'
+    '✌🏾\n'
+    '✌🏿\n'
+    '✍\n'
+    '✍️\n'
+    '✍🏻\n'
+    '✍🏼\n'
+    '✍🏽\n'
+    '✍🏾\n'
+    '✍🏿\n'
+    '✏\n'
+    '✏️\n'
+    '✒\n'
+    '✒️\n'
+    '✔\n'
+    '✔️\n'
+    '✖\n'
+    '✖️\n'
+    '✝\n'
+    '✝️\n'
+    '✡\n'
+    '✡️\n'
+    '✨\n'
+    '✳\n'
+    '✳️\n'
+    '✴\n'
+    '✴️\n'
+    '❄\n'
+    '❄️\n'
+    '❇\n'
+    '❇️\n'
+    '❌\n'
+    '❎\n'
+    '❓\n'
+    '❔\n'
+    '❕\n'
+    '❗\n'
+    '❣\n'
+    '❣️\n'
+    '❤\n'
+    '❤\u200d🔥\n'
+    '❤\u200d🩹\n'
+    '❤️\n'
+    '❤️\u200d🔥\n'
+    '❤️\u200d🩹\n'
+    '➕\n'
+    '➖\n'
+    '➗\n'
+    '➡\n'
+    '➡️\n'
+    '➰\n'
+    '➿\n'
+    '⤴\n'
+    '⤴️\n'
+    '⤵\n'
+    '⤵️\n'
+    '⬅\n'
+    '⬅️\n'
+    '⬆\n'
+    '⬆️\n'
+    '⬇\n'
+    '⬇️\n'
+    '⬛\n'
+    '⬜\n'
+    '⭐\n'
+    '⭕\n'
+    '〰\n'
+    '〰️\n'
+    '〽\n'
+    '〽️\n'
+    '㊗\n'
+    '㊗️\n'
+    '㊙\n'
+    '㊙️\n'
+    '🀄\n'
+    '🃏\n'
+    '🅰\n'
+    '🅰️\n'
+    '🅱\n'
+    '🅱️\n'
+    '🅾\n'
+    '🅾️\n'
+    '🅿\n'
+    '🅿️\n'
+    '🆎\n'
+    '🆑\n'
+    '🆒\n'
+    '🆓\n'
+    '🆔\n'
+    '🆕\n'
+    '🆖\n'
+    '🆗\n'
+    '🆘\n'
+    '🆙\n'
+    '🆚\n'
+    '🇦🇨\n'
+    '🇦🇩\n'
+    '🇦🇪\n'
+    '🇦🇫\n'
+    '🇦🇬\n'
+    '🇦🇮\n'
+    '🇦🇱\n'
+    '🇦🇲\n'
+    '🇦🇴\n'
+    '🇦🇶\n'
+    '🇦🇷\n'
+    '🇦🇸\n'
+    '🇦🇹\n'
+    '🇦🇺\n'
+    '🇦🇼\n'
+    '🇦🇽\n'
+    '🇦🇿\n'
+    '🇧🇦\n'
+    '🇧🇧\n'
+    '🇧🇩\n'
+    '🇧🇪\n'
+    '🇧🇫\n'
+    '🇧🇬\n'
+    '🇧🇭\n'
+    '🇧🇮\n'
+    '🇧🇯\n'
+    '🇧🇱\n'
+    '🇧🇲\n'
+    '🇧🇳\n'
+    '🇧🇴\n'
+    '🇧🇶\n'
+    '🇧🇷\n'
+    '🇧🇸\n'
+    '🇧🇹\n'
+    '🇧🇻\n'
+    '🇧🇼\n'
+    '🇧🇾\n'
+    '🇧🇿\n'
+    '🇨🇦\n'
+    '🇨🇨\n'
+    '🇨🇩\n'
+    '🇨🇫\n'
+    '🇨🇬\n'
+    '🇨🇭\n'
+    '🇨🇮\n'
+    '🇨🇰\n'
+    '🇨🇱\n'
+    '🇨🇲\n'
+    '🇨🇳\n'
+    '🇨🇴\n'
+    '🇨🇵\n'
+    '🇨🇶\n'
+    '🇨🇷\n'
+    '🇨🇺\n'
+    '🇨🇻\n'
+    '🇨🇼\n'
+    '🇨🇽\n'
+    '🇨🇾\n'
+    '🇨🇿\n'
+    '🇩🇪\n'
+    '🇩🇬\n'
+    '🇩🇯\n'
+    '🇩🇰\n'
+    '🇩🇲\n'
+    '🇩🇴\n'
+    '🇩🇿\n'
+    '🇪🇦\n'
+    '🇪🇨\n'
+    '🇪🇪\n'
+    '🇪🇬\n'
+    '🇪🇭\n'
+    '🇪🇷\n'
+    '🇪🇸\n'
+    '🇪🇹\n'
+    '🇪🇺\n'
+    '🇫🇮\n'
+    '🇫🇯\n'
+    '🇫🇰\n'
+    '🇫🇲\n'
+    '🇫🇴\n'
+    '🇫🇷\n'
+    '🇬🇦\n'
+    '🇬🇧\n'
+    '🇬🇩\n'
+    '🇬🇪\n'
+    '🇬🇫\n'
+    '🇬🇬\n'
+    '🇬🇭\n'
+    '🇬🇮\n'
+    '🇬🇱\n'
+    '🇬🇲\n'
+    '🇬🇳\n'
+    '🇬🇵\n'
+    '🇬🇶\n'
+    '🇬🇷\n'
+    '🇬🇸\n'
+    '🇬🇹\n'
+    '🇬🇺\n'
+    '🇬🇼\n'
+    '🇬🇾\n'
+    '🇭🇰\n'
+    '🇭🇲\n'
+    '🇭🇳\n'
+    '🇭🇷\n'
+    '🇭🇹\n'
+    '🇭🇺\n'
+    '🇮🇨\n'
+    '🇮🇩\n'
+    '🇮🇪\n'
+    '🇮🇱\n'
+    '🇮🇲\n'
+    '🇮🇳\n'
+    '🇮🇴\n'
+    '🇮🇶\n'
+    '🇮🇷\n'
+    '🇮🇸\n'
+    '🇮🇹\n'
+    '🇯🇪\n'
+    '🇯🇲\n'
+    '🇯🇴\n'
+    '🇯🇵\n'
+    '🇰🇪\n'
+    '🇰🇬\n'
+    '🇰🇭\n'
+    '🇰🇮\n'
+    '🇰🇲\n'
+    '🇰🇳\n'
+    '🇰🇵\n'
+    '🇰🇷\n'
+    '🇰🇼\n'
+    '🇰🇾\n'
+    '🇰🇿\n'
+    '🇱🇦\n'
+    '🇱🇧\n'
+    '🇱🇨\n'
+    '🇱🇮\n'
+    '🇱🇰\n'
+    '🇱🇷\n'
+    '🇱🇸\n'
+    '🇱🇹\n'
+    '🇱🇺\n'
+    '🇱🇻\n'
+    '🇱🇾\n'
+    '🇲🇦\n'
+    '🇲🇨\n'
+    '🇲🇩\n'
+    '🇲🇪\n'
+    '🇲🇫\n'
+    '🇲🇬\n'
+    '🇲🇭\n'
+    '🇲🇰\n'
+    '🇲🇱\n'
+    '🇲🇲\n'
+    '🇲🇳\n'
+    '🇲🇴\n'
+    '🇲🇵\n'
+    '🇲🇶\n'
+    '🇲🇷\n'
+    '🇲🇸\n'
+    '🇲🇹\n'
+    '🇲🇺\n'
+    '🇲🇻\n'
+    '🇲🇼\n'
+    '🇲🇽\n'
+    '🇲🇾\n'
+    '🇲🇿\n'
+    '🇳🇦\n'
+    '🇳🇨\n'
+    '🇳🇪\n'
+    '🇳🇫\n'
+    '🇳🇬\n'
+    '🇳🇮\n'
+    '🇳🇱\n'
+    '🇳🇴\n'
+    '🇳🇵\n'
+    '🇳🇷\n'
+    '🇳🇺\n'
+    '🇳🇿\n'
+    '🇴🇲\n'
+    '🇵🇦\n'
+    '🇵🇪\n'
+    '🇵🇫\n'
+    '🇵🇬\n'
+    '🇵🇭\n'
+    '🇵🇰\n'
+    '🇵🇱\n'
+    '🇵🇲\n'
+    '🇵🇳\n'
+    '🇵🇷\n'
+    '🇵🇸\n'
+    '🇵🇹\n'
+    '🇵🇼\n'
+    '🇵🇾\n'
+    '🇶🇦\n'
+    '🇷🇪\n'
+    '🇷🇴\n'
+    '🇷🇸\n'
+    '🇷🇺\n'
+    '🇷🇼\n'
+    '🇸🇦\n'
+    '🇸🇧\n'
+    '🇸🇨\n'
+    '🇸🇩\n'
+    '🇸🇪\n'
+    '🇸🇬\n'
+    '🇸🇭\n'
+    '🇸🇮\n'
+    '🇸🇯\n'
+    '🇸🇰\n'
+    '🇸🇱\n'
+    '🇸🇲\n'
+    '🇸🇳\n'
+    '🇸🇴\n'
+    '🇸🇷\n'
+    '🇸🇸\n'
+    '🇸🇹\n'
+    '🇸🇻\n'
+    '🇸🇽\n'
+    '🇸🇾\n'
+    '🇸🇿\n'
+    '🇹🇦\n'
+    '🇹🇨\n'
+    '🇹🇩\n'
+    '🇹🇫\n'
+    '🇹🇬\n'
+    '🇹🇭\n'
+    '🇹🇯\n'
+    '🇹🇰\n'
+    '🇹🇱\n'
+    '🇹🇲\n'
+    '🇹🇳\n'
+    '🇹🇴\n'
+    '🇹🇷\n'
+    '🇹🇹\n'
+    '🇹🇻\n'
+    '🇹🇼\n'
+    '🇹🇿\n'
+    '🇺🇦\n'
+    '🇺🇬\n'
+    '🇺🇲\n'
+    '🇺🇳\n'
+    '🇺🇸\n'
+    '🇺🇾\n'
+    '🇺🇿\n'
+    '🇻🇦\n'
+    '🇻🇨\n'
+    '🇻🇪\n'
+    '🇻🇬\n'
+    '🇻🇮\n'
+    '🇻🇳\n'
+    '🇻🇺\n'
+    '🇼🇫\n'
+    '🇼🇸\n'
+    '🇽🇰\n'
+    '🇾🇪\n'
+    '🇾🇹\n'
+    '🇿🇦\n'
+    '🇿🇲\n'
+    '🇿🇼\n'
+    '🈁\n'
+    '🈂\n'
+    '🈂️\n'
+    '🈚\n'
+    '🈯\n'
+    '🈲\n'
+    '🈳\n'
+    '🈴\n'
+    '🈵\n'
+    '🈶\n'
+    '🈷\n'
+    '🈷️\n'
+    '🈸\n'
+    '🈹\n'
+    '🈺\n'
+    '🉐\n'
+    '🉑\n'
+    '🌀\n'
+    '🌁\n'
+    '🌂\n'
+    '🌃\n'
+    '🌄\n'
+    '🌅\n'
+    '🌆\n'
+    '🌇\n'
+    '🌈\n'
+    '🌉\n'
+    '🌊\n'
+    '🌋\n'
+    '🌌\n'
+    '🌍\n'
+    '🌎\n'
+    '🌏\n'
+    '🌐\n'
+    '🌑\n'
+    '🌒\n'
+    '🌓\n'
+    '🌔\n'
+    '🌕\n'
+    '🌖\n'
+    '🌗\n'
+    '🌘\n'
+    '🌙\n'
+    '🌚\n'
+    '🌛\n'
+    '🌜\n'
+    '🌝\n'
+    '🌞\n'
+    '🌟\n'
+    '🌠\n'
+    '🌡\n'
+    '🌡️\n'
+    '🌤\n'
+    '🌤️\n'
+    '🌥\n'
+    '🌥️\n'
+    '🌦\n'
+    '🌦️\n'
+    '🌧\n'
+    '🌧️\n'
+    '🌨\n'
+    '🌨️\n'
+    '🌩\n'
+    '🌩️\n'
+    '🌪\n'
+    '🌪️\n'
+    '🌫\n'
+    '🌫️\n'
+    '🌬\n'
+    '🌬️\n'
+    '🌭\n'
+    '🌮\n'
+    '🌯\n'
+    '🌰\n'
+    '🌱\n'
+    '🌲\n'
+    '🌳\n'
+    '🌴\n'
+    '🌵\n'
+    '🌶\n'
+    '🌶️\n'
+    '🌷\n'
+    '🌸\n'
+    '🌹\n'
+    '🌺\n'
+    '🌻\n'
+    '🌼\n'
+    '🌽\n'
+    '🌾\n'
+    '🌿\n'
+    '🍀\n'
+    '🍁\n'
+    '🍂\n'
+    '🍃\n'
+    '🍄\n'
+    '🍄\u200d🟫\n'
+    '🍅\n'
+    '🍆\n'
+    '🍇\n'
+    '🍈\n'
+    '🍉\n'
+    '🍊\n'
+    '🍋\n'
+    '🍋\u200d🟩\n'
+    '🍌\n'
+    '🍍\n'
+    '🍎\n'
+    '🍏\n'
+    '🍐\n'
+    '🍑\n'
+    '🍒\n'
+    '🍓\n'
+    '🍔\n'
+    '🍕\n'
+    '🍖\n'
+    '🍗\n'
+    '🍘\n'
+    '🍙\n'
+    '🍚\n'
+    '🍛\n'
+    '🍜\n'
+    '🍝\n'
+    '🍞\n'
+    '🍟\n'
+    '🍠\n'
+    '🍡\n'
+    '🍢\n'
+    '🍣\n'
+    '🍤\n'
+    '🍥\n'
+    '🍦\n'
+    '🍧\n'
+    '🍨\n'
+    '🍩\n'
+    '🍪\n'
+    '🍫\n'
+    '🍬\n'
+    '🍭\n'
+    '🍮\n'
+    '🍯\n'
+    '🍰\n'
+    '🍱\n'
+    '🍲\n'
+    '🍳\n'
+    '🍴\n'
+    '🍵\n'
+    '🍶\n'
+    '🍷\n'
+    '🍸\n'
+    '🍹\n'
+    '🍺\n'
+    '🍻\n'
+    '🍼\n'
+    '🍽\n'
+    '🍽️\n'
+    '🍾\n'
+    '🍿\n'
+    '🎀\n'
+    '🎁\n'
+    '🎂\n'
+    '🎃\n'
+    '🎄\n'
+    '🎅\n'
+    '🎅🏻\n'
+    '🎅🏼\n'
+    '🎅🏽\n'
+    '🎅🏾\n'
+    '🎅🏿\n'
+    '🎆\n'
+    '🎇\n'
+    '🎈\n'
+    '🎉\n'
+    '🎊\n'
+    '🎋\n'
+    '🎌\n'
+    '🎍\n'
+    '🎎\n'
+    '🎏\n'
+    '🎐\n'
+    '🎑\n'
+    '🎒\n'
+    '🎓\n'
+    '🎖\n'
+    '🎖️\n'
+    '🎗\n'
+    '🎗️\n'
+    '🎙\n'
+    '🎙️\n'
+    '🎚\n'
+    '🎚️\n'
+    '🎛\n'
+    '🎛️\n'
+    '🎞\n'
+    '🎞️\n'
+    '🎟\n'
+    '🎟️\n'
+    '🎠\n'
+    '🎡\n'
+    '🎢\n'
+    '🎣\n'
+    '🎤\n'
+    '🎥\n'
+    '🎦\n'
+    '🎧\n'
+    '🎨\n'
+    '🎩\n'
+    '🎪\n'
+    '🎫\n'
+    '🎬\n'
+    '🎭\n'
+    '🎮\n'
+    '🎯\n'
+    '🎰\n'
+    '🎱\n'
+    '🎲\n'
+    '🎳\n'
+    '🎴\n'
+    '🎵\n'
+    '🎶\n'
+    '🎷\n'
+    '🎸\n'
+    '🎹\n'
+    '🎺\n'
+    '🎻\n'
+    '🎼\n'
+    '🎽\n'
+    '🎾\n'
+    '🎿\n'
+    '🏀\n'
+    '🏁\n'
+    '🏂\n'
+    '🏂🏻\n'
+    '🏂🏼\n'
+    '🏂🏽\n'
+    '🏂🏾\n'
+    '🏂🏿\n'
+    '🏃\n'
+    '🏃\u200d♀\n'
+    '🏃\u200d♀\u200d➡\n'
+    '🏃\u200d♀\u200d➡️\n'
+    '🏃\u200d♀️\n'
+    '🏃\u200d♀️\u200d➡\n'
+    '🏃\u200d♀️\u200d➡️\n'
+    '🏃\u200d♂\n'
+    '🏃\u200d♂\u200d➡\n'
+    '🏃\u200d♂\u200d➡️\n'
+    '🏃\u200d♂️\n'
+    '🏃\u200d♂️\u200d➡\n'
+    '🏃\u200d♂️\u200d➡️\n'
+    '🏃\u200d➡\n'
+    '🏃\u200d➡️\n'
+    '🏃🏻\n'
+    '🏃🏻\u200d♀\n'
+    '🏃🏻\u200d♀\u200d➡\n'
+    '🏃🏻\u200d♀\u200d➡️\n'
+    '🏃🏻\u200d♀️\n'
+    '🏃🏻\u200d♀️\u200d➡\n'
+    '🏃🏻\u200d♀️\u200d➡️\n'
+    '🏃🏻\u200d♂\n'
+    '🏃🏻\u200d♂\u200d➡\n'
+    '🏃🏻\u200d♂\u200d➡️\n'
+    '🏃🏻\u200d♂️\n'
+    '🏃🏻\u200d♂️\u200d➡\n'
+    '🏃🏻\u200d♂️\u200d➡️\n'
+    '🏃🏻\u200d➡\n'
+    '🏃🏻\u200d➡️\n'
+    '🏃🏼\n'
+    '🏃🏼\u200d♀\n'
+    '🏃🏼\u200d♀\u200d➡\n'
+    '🏃🏼\u200d♀\u200d➡️\n'
+    '🏃🏼\u200d♀️\n'
+    '🏃🏼\u200d♀️\u200d➡\n'
+    '🏃🏼\u200d♀️\u200d➡️\n'
+    '🏃🏼\u200d♂\n'
+    '🏃🏼\u200d♂\u200d➡\n'
+    '🏃🏼\u200d♂\u200d➡️\n'
+    '🏃🏼\u200d♂️\n'
+    '🏃🏼\u200d♂️\u200d➡\n'
+    '🏃🏼\u200d♂️\u200d➡️\n'
+    '🏃🏼\u200d➡\n'
+    '🏃🏼\u200d➡️\n'
+    '🏃🏽\n'
+    '🏃🏽\u200d♀\n'
+    '🏃🏽\u200d♀\u200d➡\n'
+    '🏃🏽\u200d♀\u200d➡️\n'
+    '🏃🏽\u200d♀️\n'
+    '🏃🏽\u200d♀️\u200d➡\n'
+    '🏃🏽\u200d♀️\u200d➡️\n'
+    '🏃🏽\u200d♂\n'
+    '🏃🏽\u200d♂\u200d➡\n'
+    '🏃🏽\u200d♂\u200d➡️\n'
+    '🏃🏽\u200d♂️\n'
+    '🏃🏽\u200d♂️\u200d➡\n'
+    '🏃🏽\u200d♂️\u200d➡️\n'
+    '🏃🏽\u200d➡\n'
+    '🏃🏽\u200d➡️\n'
+    '🏃🏾\n'
+    '🏃🏾\u200d♀\n'
+    '🏃🏾\u200d♀\u200d➡\n'
+    '🏃🏾\u200d♀\u200d➡️\n'
+    '🏃🏾\u200d♀️\n'
+    '🏃🏾\u200d♀️\u200d➡\n'
+    '🏃🏾\u200d♀️\u200d➡️\n'
+    '🏃🏾\u200d♂\n'
+    '🏃🏾\u200d♂\u200d➡\n'
+    '🏃🏾\u200d♂\u200d➡️\n'
+    '🏃🏾\u200d♂️\n'
+    '🏃🏾\u200d♂️\u200d➡\n'
+    '🏃🏾\u200d♂️\u200d➡️\n'
+    '🏃🏾\u200d➡\n'
+    '🏃🏾\u200d➡️\n'
+    '🏃🏿\n'
+    '🏃🏿\u200d♀\n'
+    '🏃🏿\u200d♀\u200d➡\n'
+    '🏃🏿\u200d♀\u200d➡️\n'
+    '🏃🏿\u200d♀️\n'
+    '🏃🏿\u200d♀️\u200d➡\n'
+    '🏃🏿\u200d♀️\u200d➡️\n'
+    '🏃🏿\u200d♂\n'
+    '🏃🏿\u200d♂\u200d➡\n'
+    '🏃🏿\u200d♂\u200d➡️\n'
+    '🏃🏿\u200d♂️\n'
+    '🏃🏿\u200d♂️\u200d➡\n'
+    '🏃🏿\u200d♂️\u200d➡️\n'
+    '🏃🏿\u200d➡\n'
+    '🏃🏿\u200d➡️\n'
+    '🏄\n'
+    '🏄\u200d♀\n'
+    '🏄\u200d♀️\n'
+    '🏄\u200d♂\n'
+    '🏄\u200d♂️\n'
+    '🏄🏻\n'
+    '🏄🏻\u200d♀\n'
+    '🏄🏻\u200d♀️\n'
+    '🏄🏻\u200d♂\n'
+    '🏄🏻\u200d♂️\n'
+    '🏄🏼\n'
+    '🏄🏼\u200d♀\n'
+    '🏄🏼\u200d♀️\n'
+    '🏄🏼\u200d♂\n'
+    '🏄🏼\u200d♂️\n'
+    '🏄🏽\n'
+    '🏄🏽\u200d♀\n'
+    '🏄🏽\u200d♀️\n'
+    '🏄🏽\u200d♂\n'
+    '🏄🏽\u200d♂️\n'
+    '🏄🏾\n'
+    '🏄🏾\u200d♀\n'
+    '🏄🏾\u200d♀️\n'
+    '🏄🏾\u200d♂\n'
+    '🏄🏾\u200d♂️\n'
+    '🏄🏿\n'
+    '🏄🏿\u200d♀\n'
+    '🏄🏿\u200d♀️\n'
+    '🏄🏿\u200d♂\n'
+    '🏄🏿\u200d♂️\n'
+    '🏅\n'
+    '🏆\n'
+    '🏇\n'
+    '🏇🏻\n'
+    '🏇🏼\n'
+    '🏇🏽\n'
+    '🏇🏾\n'
+    '🏇🏿\n'
+    '🏈\n'
+    '🏉\n'
+    '🏊\n'
+    '🏊\u200d♀\n'
+    '🏊\u200d♀️\n'
+    '🏊\u200d♂\n'
+    '🏊\u200d♂️\n'
+    '🏊🏻\n'
+    '🏊🏻\u200d♀\n'
+    '🏊🏻\u200d♀️\n'
+    '🏊🏻\u200d♂\n'
+    '🏊🏻\u200d♂️\n'
+    '🏊🏼\n'
+    '🏊🏼\u200d♀\n'
+    '🏊🏼\u200d♀️\n'
+    '🏊🏼\u200d♂\n'
+    '🏊🏼\u200d♂️\n'
+    '🏊🏽\n'
+    '🏊🏽\u200d♀\n'
+    '🏊🏽\u200d♀️\n'
+    '🏊🏽\u200d♂\n'
+    '🏊🏽\u200d♂️\n'
+    '🏊🏾\n'
+    '🏊🏾\u200d♀\n'
+    '🏊🏾\u200d♀️\n'
+    '🏊🏾\u200d♂\n'
+    '🏊🏾\u200d♂️\n'
+    '🏊🏿\n'
+    '🏊🏿\u200d♀\n'
+    '🏊🏿\u200d♀️\n'
+    '🏊🏿\u200d♂\n'
+    '🏊🏿\u200d♂️\n'
+    '🏋\n'
+    '🏋\u200d♀\n'
+    '🏋\u200d♀️\n'
+    '🏋\u200d♂\n'
+    '🏋\u200d♂️\n'
+    '🏋️\n'
+    '🏋️\u200d♀\n'
+    '🏋️\u200d♀️\n'
+    '🏋️\u200d♂\n'
+    '🏋️\u200d♂️\n'
+    '🏋🏻\n'
+    '🏋🏻\u200d♀\n'
+    '🏋🏻\u200d♀️\n'
+    '🏋🏻\u200d♂\n'
+    '🏋🏻\u200d♂️\n'
+    '🏋🏼\n'
+    '🏋🏼\u200d♀\n'
+    '🏋🏼\u200d♀️\n'
+    '🏋🏼\u200d♂\n'
+    '🏋🏼\u200d♂️\n'
+    '🏋🏽\n'
+    '🏋🏽\u200d♀\n'
+    '🏋🏽\u200d♀️\n'
+    '🏋🏽\u200d♂\n'
+    '🏋🏽\u200d♂️\n'
+    '🏋🏾\n'
+    '🏋🏾\u200d♀\n'
+    '🏋🏾\u200d♀️\n'
+    '🏋🏾\u200d♂\n'
+    '🏋🏾\u200d♂️\n'
+    '🏋🏿\n'
+    '🏋🏿\u200d♀\n'
+    '🏋🏿\u200d♀️\n'
+    '🏋🏿\u200d♂\n'
+    '🏋🏿\u200d♂️\n'
+    '🏌\n'
+    '🏌\u200d♀\n'
+    '🏌\u200d♀️\n'
+    '🏌\u200d♂\n'
+    '🏌\u200d♂️\n'
+    '🏌️\n'
+    '🏌️\u200d♀\n'
+    '🏌️\u200d♀️\n'
+    '🏌️\u200d♂\n'
+    '🏌️\u200d♂️\n'
+    '🏌🏻\n'
+    '🏌🏻\u200d♀\n'
+    '🏌🏻\u200d♀️\n'
+    '🏌🏻\u200d♂\n'
+    '🏌🏻\u200d♂️\n'
+    '🏌🏼\n'
+    '🏌🏼\u200d♀\n'
+    '🏌🏼\u200d♀️\n'
+    '🏌🏼\u200d♂\n'
+    '🏌🏼\u200d♂️\n'
+    '🏌🏽\n'
+    '🏌🏽\u200d♀\n'
+    '🏌🏽\u200d♀️\n'
+    '🏌🏽\u200d♂\n'
+    '🏌🏽\u200d♂️\n'
+    '🏌🏾\n'
+    '🏌🏾\u200d♀\n'
+    '🏌🏾\u200d♀️\n'
+    '🏌🏾\u200d♂\n'
+    '🏌🏾\u200d♂️\n'
+    '🏌🏿\n'
+    '🏌🏿\u200d♀\n'
+    '🏌🏿\u200d♀️\n'
+    '🏌🏿\u200d♂\n'
+    '🏌🏿\u200d♂️\n'
+    '🏍\n'
+    '🏍️\n'
+    '🏎\n'
+    '🏎️\n'
+    '🏏\n'
+    '🏐\n'
+    '🏑\n'
+    '🏒\n'
+    '🏓\n'
+    '🏔\n'
+    '🏔️\n'
+    '🏕\n'
+    '🏕️\n'
+    '🏖\n'
+    '🏖️\n'
+    '🏗\n'
+    '🏗️\n'
+    '🏘\n'
+    '🏘️\n'
+    '🏙\n'
+    '🏙️\n'
+    '🏚\n'
+    '🏚️\n'
+    '🏛\n'
+    '🏛️\n'
+    '🏜\n'
+    '🏜️\n'
+    '🏝\n'
+    '🏝️\n'
+    '🏞\n'
+    '🏞️\n'
+    '🏟\n'
+    '🏟️\n'
+    '🏠\n'
+    '🏡\n'
+    '🏢\n'
+    '🏣\n'
+    '🏤\n'
+    '🏥\n'
+    '🏦\n'
+    '🏧\n'
+    '🏨\n'
+    '🏩\n'
+    '🏪\n'
+    '🏫\n'
+    '🏬\n'
+    '🏭\n'
+    '🏮\n'
+    '🏯\n'
+    '🏰\n'
+    '🏳\n'
+    '🏳\u200d⚧\n'
+    '🏳\u200d⚧️\n'
+    '🏳\u200d🌈\n'
+    '🏳️\n'
+    '🏳️\u200d⚧\n'
+    '🏳️\u200d⚧️\n'
+    '🏳️\u200d🌈\n'
+    '🏴\n'
+    '🏴\u200d☠\n'
+    '🏴\u200d☠️\n'
+    '🏴\U000e0067\U000e0062\U000e0065\U000e006e\U000e0067\U000e007f\n'
+    '🏴\U000e0067\U000e0062\U000e0073\U000e0063\U000e0074\U000e007f\n'
+    '🏴\U000e0067\U000e0062\U000e0077\U000e006c\U000e0073\U000e007f\n'
+    '🏵\n'
+    '🏵️\n'
+    '🏷\n'
+    '🏷️\n'
+    '🏸\n'
+    '🏹\n'
+    '🏺\n'
+    '🏻\n'
+    '🏼\n'
+    '🏽\n'
+    '🏾\n'
+    '🏿\n'
+    '🐀\n'
+    '🐁\n'
+    '🐂\n'
+    '🐃\n'
+    '🐄\n'
+    '🐅\n'
+    '🐆\n'
+    '🐇\n'
+    '🐈\n'
+    '🐈\u200d⬛\n'
+    '🐉\n'
+    '🐊\n'
+    '🐋\n'
+    '🐌\n'
+    '🐍\n'
+    '🐎\n'
+    '🐏\n'
+    '🐐\n'
+    '🐑\n'
+    '🐒\n'
+    '🐓\n'
+    '🐔\n'
+    '🐕\n'
+    '🐕\u200d🦺\n'
+    '🐖\n'
+    '🐗\n'
+    '🐘\n'
+    '🐙\n'
+    '🐚\n'
+    '🐛\n'
+    '🐜\n'
+    '🐝\n'
+    '🐞\n'
+    '🐟\n'
+    '🐠\n'
+    '🐡\n'
+    '🐢\n'
+    '🐣\n'
+    '🐤\n'
+    '🐥\n'
+    '🐦\n'
+    '🐦\u200d⬛\n'
+    '🐦\u200d🔥\n'
+    '🐧\n'
+    '🐨\n'
+    '🐩\n'
+    '🐪\n'
+    '🐫\n'
+    '🐬\n'
+    '🐭\n'
+    '🐮\n'
+    '🐯\n'
+    '🐰\n'
+    '🐱\n'
+    '🐲\n'
+    '🐳\n'
+    '🐴\n'
+    '🐵\n'
+    '🐶\n'
+    '🐷\n'
+    '🐸\n'
+    '🐹\n'
+    '🐺\n'
+    '🐻\n'
+    '🐻\u200d❄\n'
+    '🐻\u200d❄️\n'
+    '🐼\n'
+    '🐽\n'
+    '🐾\n'
+    '🐿\n'
+    '🐿️\n'
+    '👀\n'
+    '👁\n'
+    '👁\u200d🗨\n'
+    '👁\u200d🗨️\n'
+    '👁️\n'
+    '👁️\u200d🗨\n'
+    '👁️\u200d🗨️\n'
+    '👂\n'
+    '👂🏻\n'
+    '👂🏼\n'
+    '👂🏽\n'
+    '👂🏾\n'
+    '👂🏿\n'
+    '👃\n'
+    '👃🏻\n'
+    '👃🏼\n'
+    '👃🏽\n'
+    '👃🏾\n'
+    '👃🏿\n'
+    '👄\n'
+    '👅\n'
+    '👆\n'
+    '👆🏻\n'
+    '👆🏼\n'
+    '👆🏽\n'
+    '👆🏾\n'
+    '👆🏿\n'
+    '👇\n'
+    '👇🏻\n'
+    '👇🏼\n'
+    '👇🏽\n'
+    '👇🏾\n'
+    '👇🏿\n'
+    '👈\n'
+    '👈🏻\n'
+    '👈🏼\n'
+    '👈🏽\n'
+    '👈🏾\n'
+    '👈🏿\n'
+    '👉\n'
+    '👉🏻\n'
+    '👉🏼\n'
+    '👉🏽\n'
+    '👉🏾\n'
+    '👉🏿\n'
+    '👊\n'
+    '👊🏻\n'
+    '👊🏼\n'
+    '👊🏽\n'
+    '👊🏾\n'
+    '👊🏿\n'
+    '👋\n'
+    '👋🏻\n'
+    '👋🏼\n'
+    '👋🏽\n'
+    '👋🏾\n'
+    '👋🏿\n'
+    '👌\n'
+    '👌🏻\n'
+    '👌🏼\n'
+    '👌🏽\n'
+    '👌🏾\n'
+    '👌🏿\n'
+    '👍\n'
+    '👍🏻\n'
+    '👍🏼\n'
+    '👍🏽\n'
+    '👍🏾\n'
+    '👍🏿\n'
+    '👎\n'
+    '👎🏻\n'
+    '👎🏼\n'
+    '👎🏽\n'
+    '👎🏾\n'
+    '👎🏿\n'
+    '👏\n'
+    '👏🏻\n'
+    '👏🏼\n'
+    '👏🏽\n'
+    '👏🏾\n'
+    '👏🏿\n'
+    '👐\n'
+    '👐🏻\n'
+    '👐🏼\n'
+    '👐🏽\n'
+    '👐🏾\n'
+    '👐🏿\n'
+    '👑\n'
+    '👒\n'
+    '👓\n'
+    '👔\n'
+    '👕\n'
+    '👖\n'
+    '👗\n'
+    '👘\n'
+    '👙\n'
+    '👚\n'
+    '👛\n'
+    '👜\n'
+    '👝\n'
+    '👞\n'
+    '👟\n'
+    '👠\n'
+    '👡\n'
+    '👢\n'
+    '👣\n'
+    '👤\n'
+    '👥\n'
+    '👦\n'
+    '👦🏻\n'
+    '👦🏼\n'
+    '👦🏽\n'
+    '👦🏾\n'
+    '👦🏿\n'
+    '👧\n'
+    '👧🏻\n'
+    '👧🏼\n'
+    '👧🏽\n'
+    '👧🏾\n'
+    '👧🏿\n'
+    '👨\n'
+    '👨\u200d⚕\n'
+    '👨\u200d⚕️\n'
+    '👨\u200d⚖\n'
+    '👨\u200d⚖️\n'
+    '👨\u200d✈\n'
+    '👨\u200d✈️\n'
+    '👨\u200d❤\u200d👨\n'
+    '👨\u200d❤\u200d💋\u200d👨\n'
+    '👨\u200d❤️\u200d👨\n'
+    '👨\u200d❤️\u200d💋\u200d👨\n'
+    '👨\u200d🌾\n'
+    '👨\u200d🍳\n'
+    '👨\u200d🍼\n'
+    '👨\u200d🎓\n'
+    '👨\u200d🎤\n'
+    '👨\u200d🎨\n'
+    '👨\u200d🏫\n'
+    '👨\u200d🏭\n'
+    '👨\u200d👦\n'
+    '👨\u200d👦\u200d👦\n'
+    '👨\u200d👧\n'
+    '👨\u200d👧\u200d👦\n'
+    '👨\u200d👧\u200d👧\n'
+    '👨\u200d👨\u200d👦\n'
+    '👨\u200d👨\u200d👦\u200d👦\n'
+    '👨\u200d👨\u200d👧\n'
+    '👨\u200d👨\u200d👧\u200d👦\n'
+    '👨\u200d👨\u200d👧\u200d👧\n'
+    '👨\u200d👩\u200d👦\n'
+    '👨\u200d👩\u200d👦\u200d👦\n'
+    '👨\u200d👩\u200d👧\n'
+    '👨\u200d👩\u200d👧\u200d👦\n'
+    '👨\u200d👩\u200d👧\u200d👧\n'
+    '👨\u200d💻\n'
+    '👨\u200d💼\n'
+    '👨\u200d🔧\n'
+    '👨\u200d🔬\n'
+    '👨\u200d🚀\n'
+    '👨\u200d🚒\n'
+    '👨\u200d🦯\n'
+    '👨\u200d🦯\u200d➡\n'
+    '👨\u200d🦯\u200d➡️\n'
+    '👨\u200d🦰\n'
+    '👨\u200d🦱\n'
+    '👨\u200d🦲\n'
+    '👨\u200d🦳\n'
+    '👨\u200d🦼\n'
+    '👨\u200d🦼\u200d➡\n'
+    '👨\u200d🦼\u200d➡️\n'
+    '👨\u200d🦽\n'
+    '👨\u200d🦽\u200d➡\n'
+    '👨\u200d🦽\u200d➡️\n'
+    '👨🏻\n'
+    '👨🏻\u200d⚕\n'
+    '👨🏻\u200d⚕️\n'
+    '👨🏻\u200d⚖\n'
+    '👨🏻\u200d⚖️\n'
+    '👨🏻\u200d✈\n'
+    '👨🏻\u200d✈️\n'
+    '👨🏻\u200d❤\u200d👨🏻\n'
+    '👨🏻\u200d❤\u200d👨🏼\n'
+    '👨🏻\u200d❤\u200d👨🏽\n'
+    '👨🏻\u200d❤\u200d👨🏾\n'
+    '👨🏻\u200d❤\u200d👨🏿\n'
+    '👨🏻\u200d❤\u200d💋\u200d👨🏻\n'
+    '👨🏻\u200d❤\u200d💋\u200d👨🏼\n'
+    '👨🏻\u200d❤\u200d💋\u200d👨🏽\n'
+    '👨🏻\u200d❤\u200d💋\u200d👨🏾\n'
+    '👨🏻\u200d❤\u200d💋\u200d👨🏿\n'
+    '👨🏻\u200d❤️\u200d👨🏻\n'
+    '👨🏻\u200d❤️\u200d👨🏼\n'
+    '👨🏻\u200d❤️\u200d👨🏽\n'
+    '👨🏻\u200d❤️\u200d👨🏾\n'
+    '👨🏻\u200d❤️\u200d👨🏿\n'
+    '👨🏻\u200d❤️\u200d💋\u200d👨🏻\n'
+    '👨🏻\u200d❤️\u200d💋\u200d👨🏼\n'
+    '👨🏻\u200d❤️\u200d💋\u200d👨🏽\n'
+    '👨🏻\u200d❤️\u200d💋\u200d👨🏾\n'
+    '👨🏻\u200d❤️\u200d💋\u200d👨🏿\n'
+    '👨🏻\u200d🌾\n'
+    '👨🏻\u200d🍳\n'
+    '👨🏻\u200d🍼\n'
+    '👨🏻\u200d🎓\n'
+    '👨🏻\u200d🎤\n'
+    '👨🏻\u200d🎨\n'
+    '👨🏻\u200d🏫\n'
+    '👨🏻\u200d🏭\n'
+    '👨🏻\u200d💻\n'
+    '👨🏻\u200d💼\n'
+    '👨🏻\u200d🔧\n'
+    '👨🏻\u200d🔬\n'
+    '👨🏻\u200d🚀\n'
+    '👨🏻\u200d🚒\n'
+    '👨🏻\u200d🤝\u200d👨🏼\n'
+    '👨🏻\u200d🤝\u200d👨🏽\n'
+    '👨🏻\u200d🤝\u200d👨🏾\n'
+    '👨🏻\u200d🤝\u200d👨🏿\n'
+    '👨🏻\u200d🦯\n'
+    '👨🏻\u200d🦯\u200d➡\n'
+    '👨🏻\u200d🦯\u200d➡️\n'
+    '👨🏻\u200d🦰\n'
+    '👨🏻\u200d🦱\n'
+    '👨🏻\u200d🦲\n'
+    '👨🏻\u200d🦳\n'
+    '👨🏻\u200d🦼\n'
+    '👨🏻\u200d🦼\u200d➡\n'
+    '👨🏻\u200d🦼\u200d➡️\n'
+    '👨🏻\u200d🦽\n'
+    '👨🏻\u200d🦽\u200d➡\n'
+    '👨🏻\u200d🦽\u200d➡️\n'
+    '👨🏼\n'
+    '👨🏼\u200d⚕\n'
+    '👨🏼\u200d⚕️\n'
+    '👨🏼\u200d⚖\n'
+    '👨🏼\u200d⚖️\n'
+    '👨🏼\u200d✈\n'
+    '👨🏼\u200d✈️\n'
+    '👨🏼\u200d❤\u200d👨🏻\n'
+    '👨🏼\u200d❤\u200d👨🏼\n'
+    '👨🏼\u200d❤\u200d👨🏽\n'
+    '👨🏼\u200d❤\u200d👨🏾\n'
+    '👨🏼\u200d❤\u200d👨🏿\n'
+    '👨🏼\u200d❤\u200d💋\u200d👨🏻\n'
+    '👨🏼\u200d❤\u200d💋\u200d👨🏼\n'
+    '👨🏼\u200d❤\u200d💋\u200d👨🏽\n'
+    '👨🏼\u200d❤\u200d💋\u200d👨🏾\n'
+    '👨🏼\u200d❤\u200d💋\u200d👨🏿\n'
+    '👨🏼\u200d❤️\u200d👨🏻\n'
+    '👨🏼\u200d❤️\u200d👨🏼\n'
+    '👨🏼\u200d❤️\u200d👨🏽\n'
+    '👨🏼\u200d❤️\u200d👨🏾\n'
+    '👨🏼\u200d❤️\u200d👨🏿\n'
+    '👨🏼\u200d❤️\u200d💋\u200d👨🏻\n'
+    '👨🏼\u200d❤️\u200d💋\u200d👨🏼\n'
+    '👨🏼\u200d❤️\u200d💋\u200d👨🏽\n'
+    '👨🏼\u200d❤️\u200d💋\u200d👨🏾\n'
+    '👨🏼\u200d❤️\u200d💋\u200d👨🏿\n'
+    '👨🏼\u200d🌾\n'
+    '👨🏼\u200d🍳\n'
+    '👨🏼\u200d🍼\n'
+    '👨🏼\u200d🎓\n'
+    '👨🏼\u200d🎤\n'
+    '👨🏼\u200d🎨\n'
+    '👨🏼\u200d🏫\n'
+    '👨🏼\u200d🏭\n'
+    '👨🏼\u200d💻\n'
+    '👨🏼\u200d💼\n'
+    '👨🏼\u200d🔧\n'
+    '👨🏼\u200d🔬\n'
+    '👨🏼\u200d🚀\n'
+    '👨🏼\u200d🚒\n'
+    '👨🏼\u200d🤝\u200d👨🏻\n'
+    '👨🏼\u200d🤝\u200d👨🏽\n'
+    '👨🏼\u200d🤝\u200d👨🏾\n'
+    '👨🏼\u200d🤝\u200d👨🏿\n'
+    '👨🏼\u200d🦯\n'
+    '👨🏼\u200d🦯\u200d➡\n'
+    '👨🏼\u200d🦯\u200d➡️\n'
+    '👨🏼\u200d🦰\n'
+    '👨🏼\u200d🦱\n'
+    '👨🏼\u200d🦲\n'
+    '👨🏼\u200d🦳\n'
+    '👨🏼\u200d🦼\n'
+    '👨🏼\u200d🦼\u200d➡\n'
+    '👨🏼\u200d🦼\u200d➡️\n'
+    '👨🏼\u200d🦽\n'
+    '👨🏼\u200d🦽\u200d➡\n'
+    '👨🏼\u200d🦽\u200d➡️\n'
+    '👨🏽\n'
+    '👨🏽\u200d⚕\n'
+    '👨🏽\u200d⚕️\n'
+    '👨🏽\u200d⚖\n'
+    '👨🏽\u200d⚖️\n'
+    '👨🏽\u200d✈\n'
+    '👨🏽\u200d✈️\n'
+    '👨🏽\u200d❤\u200d👨🏻\n'
+    '👨🏽\u200d❤\u200d👨🏼\n'
+    '👨🏽\u200d❤\u200d👨🏽\n'
+    '👨🏽\u200d❤\u200d👨🏾\n'
+    '👨🏽\u200d❤\u200d👨🏿\n'
+    '👨🏽\u200d❤\u200d💋\u200d👨🏻\n'
+    '👨🏽\u200d❤\u200d💋\u200d👨🏼\n'
+    '👨🏽\u200d❤\u200d💋\u200d👨🏽\n'
+    '👨🏽\u200d❤\u200d💋\u200d👨🏾\n'
+    '👨🏽\u200d❤\u200d💋\u200d👨🏿\n'
+    '👨🏽\u200d❤️\u200d👨🏻\n'
+    '👨🏽\u200d❤️\u200d👨🏼\n'
+    '👨🏽\u200d❤️\u200d👨🏽\n'
+    '👨🏽\u200d❤️\u200d👨🏾\n'
+    '👨🏽\u200d❤️\u200d👨🏿\n'
+    '👨🏽\u200d❤️\u200d💋\u200d👨🏻\n'
+    '👨🏽\u200d❤️\u200d💋\u200d👨🏼\n'
+    '👨🏽\u200d❤️\u200d💋\u200d👨🏽\n'
+    '👨🏽\u200d❤️\u200d💋\u200d👨🏾\n'
+    '👨🏽\u200d❤️\u200d💋\u200d👨🏿\n'
+    '👨🏽\u200d🌾\n'
+    '👨🏽\u200d🍳\n'
+    '👨🏽\u200d🍼\n'
+    '👨🏽\u200d🎓\n'
+    '👨🏽\u200d🎤\n'
+    '👨🏽\u200d🎨\n'
+    '👨🏽\u200d🏫\n'
+    '👨🏽\u200d🏭\n'
+    '👨🏽\u200d💻\n'
+    '👨🏽\u200d💼\n'
+    '👨🏽\u200d🔧\n'
+    '👨🏽\u200d🔬\n'
+    '👨🏽\u200d🚀\n'
+    '👨🏽\u200d🚒\n'
+    '👨🏽\u200d🤝\u200d👨🏻\n'
+    '👨🏽\u200d🤝\u200d👨🏼\n'
+    '👨🏽\u200d🤝\u200d👨🏾\n'
+    '👨🏽\u200d🤝\u200d👨🏿\n'
+    '👨🏽\u200d🦯\n'
+    '👨🏽\u200d🦯\u200d➡\n'
+    '👨🏽\u200d🦯\u200d➡️\n'
+    '👨🏽\u200d🦰\n'
+    '👨🏽\u200d🦱\n'
+    '👨🏽\u200d🦲\n'
+    '👨🏽\u200d🦳\n'
+    '👨🏽\u200d🦼\n'
+    '👨🏽\u200d🦼\u200d➡\n'
+    '👨🏽\u200d🦼\u200d➡️\n'
+    '👨🏽\u200d🦽\n'
+    '👨🏽\u200d🦽\u200d➡\n'
+    '👨🏽\u200d🦽\u200d➡️\n'
+    '👨🏾\n'
+    '👨🏾\u200d⚕\n'
+    '👨🏾\u200d⚕️\n'
+    '👨🏾\u200d⚖\n'
+    '👨🏾\u200d⚖️\n'
+    '👨🏾\u200d✈\n'
+    '👨🏾\u200d✈️\n'
+    '👨🏾\u200d❤\u200d👨🏻\n'
+    '👨🏾\u200d❤\u200d👨🏼\n'
+    '👨🏾\u200d❤\u200d👨🏽\n'
+    '👨🏾\u200d❤\u200d👨🏾\n'
+    '👨🏾\u200d❤\u200d👨🏿\n'
+    '👨🏾\u200d❤\u200d💋\u200d👨🏻\n'
+    '👨🏾\u200d❤\u200d💋\u200d👨🏼\n'
+    '👨🏾\u200d❤\u200d💋\u200d👨🏽\n'
+    '👨🏾\u200d❤\u200d💋\u200d👨🏾\n'
+    '👨🏾\u200d❤\u200d💋\u200d👨🏿\n'
+    '👨🏾\u200d❤️\u200d👨🏻\n'
+    '👨🏾\u200d❤️\u200d👨🏼\n'
+    '👨🏾\u200d❤️\u200d👨🏽\n'
+    '👨🏾\u200d❤️\u200d👨🏾\n'
+    '👨🏾\u200d❤️\u200d👨🏿\n'
+    '👨🏾\u200d❤️\u200d💋\u200d👨🏻\n'
+    '👨🏾\u200d❤️\u200d💋\u200d👨🏼\n'
+    '👨🏾\u200d❤️\u200d💋\u200d👨🏽\n'
+    '👨🏾\u200d❤️\u200d💋\u200d👨🏾\n'
+    '👨🏾\u200d❤️\u200d💋\u200d👨🏿\n'
+    '👨🏾\u200d🌾\n'
+    '👨🏾\u200d🍳\n'
+    '👨🏾\u200d🍼\n'
+    '👨🏾\u200d🎓\n'
+    '👨🏾\u200d🎤\n'
+    '👨🏾\u200d🎨\n'
+    '👨🏾\u200d🏫\n'
+    '👨🏾\u200d🏭\n'
+    '👨🏾\u200d💻\n'
+    '👨🏾\u200d💼\n'
+    '👨🏾\u200d🔧\n'
+    '👨🏾\u200d🔬\n'
+    '👨🏾\u200d🚀\n'
+    '👨🏾\u200d🚒\n'
+    '👨🏾\u200d🤝\u200d👨🏻\n'
+    '👨🏾\u200d🤝\u200d👨🏼\n'
+    '👨🏾\u200d🤝\u200d👨🏽\n'
+    '👨🏾\u200d🤝\u200d👨🏿\n'
+    '👨🏾\u200d🦯\n'
+    '👨🏾\u200d🦯\u200d➡\n'
+    '👨🏾\u200d🦯\u200d➡️\n'
+    '👨🏾\u200d🦰\n'
+    '👨🏾\u200d🦱\n'
+    '👨🏾\u200d🦲\n'
+    '👨🏾\u200d🦳\n'
+    '👨🏾\u200d🦼\n'
+    '👨🏾\u200d🦼\u200d➡\n'
+    '👨🏾\u200d🦼\u200d➡️\n'
+    '👨🏾\u200d🦽\n'
+    '👨🏾\u200d🦽\u200d➡\n'
+    '👨🏾\u200d🦽\u200d➡️\n'
+    '👨🏿\n'
+    '👨🏿\u200d⚕\n'
+    '👨🏿\u200d⚕️\n'
+    '👨🏿\u200d⚖\n'
+    '👨🏿\u200d⚖️\n'
+    '👨🏿\u200d✈\n'
+    '👨🏿\u200d✈️\n'
+    '👨🏿\u200d❤\u200d👨🏻\n'
+    '👨🏿\u200d❤\u200d👨🏼\n'
+    '👨🏿\u200d❤\u200d👨🏽\n'
+    '👨🏿\u200d❤\u200d👨🏾\n'
+    '👨🏿\u200d❤\u200d👨🏿\n'
+    '👨🏿\u200d❤\u200d💋\u200d👨🏻\n'
+    '👨🏿\u200d❤\u200d💋\u200d👨🏼\n'
+    '👨🏿\u200d❤\u200d💋\u200d👨🏽\n'
+    '👨🏿\u200d❤\u200d💋\u200d👨🏾\n'
+    '👨🏿\u200d❤\u200d💋\u200d👨🏿\n'
+    '👨🏿\u200d❤️\u200d👨🏻\n'
+    '👨🏿\u200d❤️\u200d👨🏼\n'
+    '👨🏿\u200d❤️\u200d👨🏽\n'
+    '👨🏿\u200d❤️\u200d👨🏾\n'
+    '👨🏿\u200d❤️\u200d👨🏿\n'
+    '👨🏿\u200d❤️\u200d💋\u200d👨🏻\n'
+    '👨🏿\u200d❤️\u200d💋\u200d👨🏼\n'
+    '👨🏿\u200d❤️\u200d💋\u200d👨🏽\n'
+    '👨🏿\u200d❤️\u200d💋\u200d👨🏾\n'
+    '👨🏿\u200d❤️\u200d💋\u200d👨🏿\n'
+    '👨🏿\u200d🌾\n'
+    '👨🏿\u200d🍳\n'
+    '👨🏿\u200d🍼\n'
+    '👨🏿\u200d🎓\n'
+    '👨🏿\u200d🎤\n'
+    '👨🏿\u200d🎨\n'
+    '👨🏿\u200d🏫\n'
+    '👨🏿\u200d🏭\n'
+    '👨🏿\u200d💻\n'
+    '👨🏿\u200d💼\n'
+    '👨🏿\u200d🔧\n'
+    '👨🏿\u200d🔬\n'
+    '👨🏿\u200d🚀\n'
+    '👨🏿\u200d🚒\n'
+    '👨🏿\u200d🤝\u200d👨🏻\n'
+    '👨🏿\u200d🤝\u200d👨🏼\n'
+    '👨🏿\u200d🤝\u200d👨🏽\n'
+    '👨🏿\u200d🤝\u200d👨🏾\n'
+    '👨🏿\u200d🦯\n'
+    '👨🏿\u200d🦯\u200d➡\n'
+    '👨🏿\u200d🦯\u200d➡️\n'
+    '👨🏿\u200d🦰\n'
+    '👨🏿\u200d🦱\n'
+    '👨🏿\u200d🦲\n'
+    '👨🏿\u200d🦳\n'
+    '👨🏿\u200d🦼\n'
+    '👨🏿\u200d🦼\u200d➡\n'
+    '👨🏿\u200d🦼\u200d➡️\n'
+    '👨🏿\u200d🦽\n'
+    '👨🏿\u200d🦽\u200d➡\n'
+    '👨🏿\u200d🦽\u200d➡️\n'
+    '👩\n'
+    '👩\u200d⚕\n'
+    '👩\u200d⚕️\n'
+    '👩\u200d⚖\n'
+    '👩\u200d⚖️\n'
+    '👩\u200d✈\n'
+    '👩\u200d✈️\n'
+    '👩\u200d❤\u200d👨\n'
+    '👩\u200d❤\u200d👩\n'
+    '👩\u200d❤\u200d💋\u200d👨\n'
+    '👩\u200d❤\u200d💋\u200d👩\n'
+    '👩\u200d❤️\u200d👨\n'
+    '👩\u200d❤️\u200d👩\n'
+    '👩\u200d❤️\u200d💋\u200d👨\n'
+    '👩\u200d❤️\u200d💋\u200d👩\n'
+    '👩\u200d🌾\n'
+    '👩\u200d🍳\n'
+    '👩\u200d🍼\n'
+    '👩\u200d🎓\n'
+    '👩\u200d🎤\n'
+    '👩\u200d🎨\n'
+    '👩\u200d🏫\n'
+    '👩\u200d🏭\n'
+    '👩\u200d👦\n'
+    '👩\u200d👦\u200d👦\n'
+    '👩\u200d👧\n'
+    '👩\u200d👧\u200d👦\n'
+    '👩\u200d👧\u200d👧\n'
+    '👩\u200d👩\u200d👦\n'
+    '👩\u200d👩\u200d👦\u200d👦\n'
+    '👩\u200d👩\u200d👧\n'
+    '👩\u200d👩\u200d👧\u200d👦\n'
+    '👩\u200d👩\u200d👧\u200d👧\n'
+    '👩\u200d💻\n'
+    '👩\u200d💼\n'
+    '👩\u200d🔧\n'
+    '👩\u200d🔬\n'
+    '👩\u200d🚀\n'
+    '👩\u200d🚒\n'
+    '👩\u200d🦯\n'
+    '👩\u200d🦯\u200d➡\n'
+    '👩\u200d🦯\u200d➡️\n'
+    '👩\u200d🦰\n'
+    '👩\u200d🦱\n'
+    '👩\u200d🦲\n'
+    '👩\u200d🦳\n'
+    '👩\u200d🦼\n'
+    '👩\u200d🦼\u200d➡\n'
+    '👩\u200d🦼\u200d➡️\n'
+    '👩\u200d🦽\n'
+    '👩\u200d🦽\u200d➡\n'
+    '👩\u200d🦽\u200d➡️\n'
+    '👩🏻\n'
+    '👩🏻\u200d⚕\n'
+    '👩🏻\u200d⚕️\n'
+    '👩🏻\u200d⚖\n'
+    '👩🏻\u200d⚖️\n'
+    '👩🏻\u200d✈\n'
+    '👩🏻\u200d✈️\n'
+    '👩🏻\u200d❤\u200d👨🏻\n'
+    '👩🏻\u200d❤\u200d👨🏼\n'
+    '👩🏻\u200d❤\u200d👨🏽\n'
+    '👩🏻\u200d❤\u200d👨🏾\n'
+    '👩🏻\u200d❤\u200d👨🏿\n'
+    '👩🏻\u200d❤\u200d👩🏻\n'
+    '👩🏻\u200d❤\u200d👩🏼\n'
+    '👩🏻\u200d❤\u200d👩🏽\n'
+    '👩🏻\u200d❤\u200d👩🏾\n'
+    '👩🏻\u200d❤\u200d👩🏿\n'
+    '👩🏻\u200d❤\u200d💋\u200d👨🏻\n'
+    '👩🏻\u200d❤\u200d💋\u200d👨🏼\n'
+    '👩🏻\u200d❤\u200d💋\u200d👨🏽\n'
+    '👩🏻\u200d❤\u200d💋\u200d👨🏾\n'
+    '👩🏻\u200d❤\u200d💋\u200d👨🏿\n'
+    '👩🏻\u200d❤\u200d💋\u200d👩🏻\n'
+    '👩🏻\u200d❤\u200d💋\u200d👩🏼\n'
+    '👩🏻\u200d❤\u200d💋\u200d👩🏽\n'
+    '👩🏻\u200d❤\u200d💋\u200d👩🏾\n'
+    '👩🏻\u200d❤\u200d💋\u200d👩🏿\n'
+    '👩🏻\u200d❤️\u200d👨🏻\n'
+    '👩🏻\u200d❤️\u200d👨🏼\n'
+    '👩🏻\u200d❤️\u200d👨🏽\n'
+    '👩🏻\u200d❤️\u200d👨🏾\n'
+    '👩🏻\u200d❤️\u200d👨🏿\n'
+    '👩🏻\u200d❤️\u200d👩🏻\n'
+    '👩🏻\u200d❤️\u200d👩🏼\n'
+    '👩🏻\u200d❤️\u200d👩🏽\n'
+    '👩🏻\u200d❤️\u200d👩🏾\n'
+    '👩🏻\u200d❤️\u200d👩🏿\n'
+    '👩🏻\u200d❤️\u200d💋\u200d👨🏻\n'
+    '👩🏻\u200d❤️\u200d💋\u200d👨🏼\n'
+    '👩🏻\u200d❤️\u200d💋\u200d👨🏽\n'
+    '👩🏻\u200d❤️\u200d💋\u200d👨🏾\n'
+    '👩🏻\u200d❤️\u200d💋\u200d👨🏿\n'
+    '👩🏻\u200d❤️\u200d💋\u200d👩🏻\n'
+    '👩🏻\u200d❤️\u200d💋\u200d👩🏼\n'
+    '👩🏻\u200d❤️\u200d💋\u200d👩🏽\n'
+    '👩🏻\u200d❤️\u200d💋\u200d👩🏾\n'
+    '👩🏻\u200d❤️\u200d💋\u200d👩🏿\n'
+    '👩🏻\u200d🌾\n'
+    '👩🏻\u200d🍳\n'
+    '👩🏻\u200d🍼\n'
+    '👩🏻\u200d🎓\n'
+    '👩🏻\u200d🎤\n'
+    '👩🏻\u200d🎨\n'
+    '👩🏻\u200d🏫\n'
+    '👩🏻\u200d🏭\n'
+    '👩🏻\u200d💻\n'
+    '👩🏻\u200d💼\n'
+    '👩🏻\u200d🔧\n'
+    '👩🏻\u200d🔬\n'
+    '👩🏻\u200d🚀\n'
+    '👩🏻\u200d🚒\n'
+    '👩🏻\u200d🤝\u200d👨🏼\n'
+    '👩🏻\u200d🤝\u200d👨🏽\n'
+    '👩🏻\u200d🤝\u200d👨🏾\n'
+    '👩🏻\u200d🤝\u200d👨🏿\n'
+    '👩🏻\u200d🤝\u200d👩🏼\n'
+    '👩🏻\u200d🤝\u200d👩🏽\n'
+    '👩🏻\u200d🤝\u200d👩🏾\n'
+    '👩🏻\u200d🤝\u200d👩🏿\n'
+    '👩🏻\u200d🦯\n'
+    '👩🏻\u200d🦯\u200d➡\n'
+    '👩🏻\u200d🦯\u200d➡️\n'
+    '👩🏻\u200d🦰\n'
+    '👩🏻\u200d🦱\n'
+    '👩🏻\u200d🦲\n'
+    '👩🏻\u200d🦳\n'
+    '👩🏻\u200d🦼\n'
+    '👩🏻\u200d🦼\u200d➡\n'
+    '👩🏻\u200d🦼\u200d➡️\n'
+    '👩🏻\u200d🦽\n'
+    '👩🏻\u200d🦽\u200d➡\n'
+    '👩🏻\u200d🦽\u200d➡️\n'
+    '👩🏼\n'
+    '👩🏼\u200d⚕\n'
+    '👩🏼\u200d⚕️\n'
+    '👩🏼\u200d⚖\n'
+    '👩🏼\u200d⚖️\n'
+    '👩🏼\u200d✈\n'
+    '👩🏼\u200d✈️\n'
+    '👩🏼\u200d❤\u200d👨🏻\n'
+    '👩🏼\u200d❤\u200d👨🏼\n'
+    '👩🏼\u200d❤\u200d👨🏽\n'
+    '👩🏼\u200d❤\u200d👨🏾\n'
+    '👩🏼\u200d❤\u200d👨🏿\n'
+    '👩🏼\u200d❤\u200d👩🏻\n'
+    '👩🏼\u200d❤\u200d👩🏼\n'
+    '👩🏼\u200d❤\u200d👩🏽\n'
+    '👩🏼\u200d❤\u200d👩🏾\n'
+    '👩🏼\u200d❤\u200d👩🏿\n'
+    '👩🏼\u200d❤\u200d💋\u200d👨🏻\n'
+    '👩🏼\u200d❤\u200d💋\u200d👨🏼\n'
+    '👩🏼\u200d❤\u200d💋\u200d👨🏽\n'
+    '👩🏼\u200d❤\u200d💋\u200d👨🏾\n'
+    '👩🏼\u200d❤\u200d💋\u200d👨🏿\n'
+    '👩🏼\u200d❤\u200d💋\u200d👩🏻\n'
+    '👩🏼\u200d❤\u200d💋\u200d👩🏼\n'
+    '👩🏼\u200d❤\u200d💋\u200d👩🏽\n'
+    '👩🏼\u200d❤\u200d💋\u200d👩🏾\n'
+    '👩🏼\u200d❤\u200d💋\u200d👩🏿\n'
+    '👩🏼\u200d❤️\u200d👨🏻\n'
+    '👩🏼\u200d❤️\u200d👨🏼\n'
+    '👩🏼\u200d❤️\u200d👨🏽\n'
+    '👩🏼\u200d❤️\u200d👨🏾\n'
+    '👩🏼\u200d❤️\u200d👨🏿\n'
+    '👩🏼\u200d❤️\u200d👩🏻\n'
+    '👩🏼\u200d❤️\u200d👩🏼\n'
+    '👩🏼\u200d❤️\u200d👩🏽\n'
+    '👩🏼\u200d❤️\u200d👩🏾\n'
+    '👩🏼\u200d❤️\u200d👩🏿\n'
+    '👩🏼\u200d❤️\u200d💋\u200d👨🏻\n'
+    '👩🏼\u200d❤️\u200d💋\u200d👨🏼\n'
+    '👩🏼\u200d❤️\u200d💋\u200d👨🏽\n'
+    '👩🏼\u200d❤️\u200d💋\u200d👨🏾\n'
+    '👩🏼\u200d❤️\u200d💋\u200d👨🏿\n'
+    '👩🏼\u200d❤️\u200d💋\u200d👩🏻\n'
+    '👩🏼\u200d❤️\u200d💋\u200d👩🏼\n'
+    '👩🏼\u200d❤️\u200d💋\u200d👩🏽\n'
+    '👩🏼\u200d❤️\u200d💋\u200d👩🏾\n'
+    '👩🏼\u200d❤️\u200d💋\u200d👩🏿\n'
+    '👩🏼\u200d🌾\n'
+    '👩🏼\u200d🍳\n'
+    '👩🏼\u200d🍼\n'
+    '👩🏼\u200d🎓\n'
+    '👩🏼\u200d🎤\n'
+    '👩🏼\u200d🎨\n'
+    '👩🏼\u200d🏫\n'
+    '👩🏼\u200d🏭\n'
+    '👩🏼\u200d💻\n'
+    '👩🏼\u200d💼\n'
+    '👩🏼\u200d🔧\n'
+    '👩🏼\u200d🔬\n'
+    '👩🏼\u200d🚀\n'
+    '👩🏼\u200d🚒\n'
+    '👩🏼\u200d🤝\u200d👨🏻\n'
+    '👩🏼\u200d🤝\u200d👨🏽\n'
+    '👩🏼\u200d🤝\u200d👨🏾\n'
+    '👩🏼\u200d🤝\u200d👨🏿\n'
+    '👩🏼\u200d🤝\u200d👩🏻\n'
+    '👩🏼\u200d🤝\u200d👩🏽\n'
+    '👩🏼\u200d🤝\u200d👩🏾\n'
+    '👩🏼\u200d🤝\u200d👩🏿\n'
+    '👩🏼\u200d🦯\n'
+    '👩🏼\u200d🦯\u200d➡\n'
+    '👩🏼\u200d🦯\u200d➡️\n'
+    '👩🏼\u200d🦰\n'
+    '👩🏼\u200d🦱\n'
+    '👩🏼\u200d🦲\n'
+    '👩🏼\u200d🦳\n'
+    '👩🏼\u200d🦼\n'
+    '👩🏼\u200d🦼\u200d➡\n'
+    '👩🏼\u200d🦼\u200d➡️\n'
+    '👩🏼\u200d🦽\n'
+    '👩🏼\u200d🦽\u200d➡\n'
+    '👩🏼\u200d🦽\u200d➡️\n'
+    '👩🏽\n'
+    '👩🏽\u200d⚕\n'
+    '👩🏽\u200d⚕️\n'
+    '👩🏽\u200d⚖\n'
+    '👩🏽\u200d⚖️\n'
+    '👩🏽\u200d✈\n'
+    '👩🏽\u200d✈️\n'
+    '👩🏽\u200d❤\u200d👨🏻\n'
+    '👩🏽\u200d❤\u200d👨🏼\n'
+    '👩🏽\u200d❤\u200d👨🏽\n'
+    '👩🏽\u200d❤\u200d👨🏾\n'
+    '👩🏽\u200d❤\u200d👨🏿\n'
+    '👩🏽\u200d❤\u200d👩🏻\n'
+    '👩🏽\u200d❤\u200d👩🏼\n'
+    '👩🏽\u200d❤\u200d👩🏽\n'
+    '👩🏽\u200d❤\u200d👩🏾\n'
+    '👩🏽\u200d❤\u200d👩🏿\n'
+    '👩🏽\u200d❤\u200d💋\u200d👨🏻\n'
+    '👩🏽\u200d❤\u200d💋\u200d👨🏼\n'
+    '👩🏽\u200d❤\u200d💋\u200d👨🏽\n'
+    '👩🏽\u200d❤\u200d💋\u200d👨🏾\n'
+    '👩🏽\u200d❤\u200d💋\u200d👨🏿\n'
+    '👩🏽\u200d❤\u200d💋\u200d👩🏻\n'
+    '👩🏽\u200d❤\u200d💋\u200d👩🏼\n'
+    '👩🏽\u200d❤\u200d💋\u200d👩🏽\n'
+    '👩🏽\u200d❤\u200d💋\u200d👩🏾\n'
+    '👩🏽\u200d❤\u200d💋\u200d👩🏿\n'
+    '👩🏽\u200d❤️\u200d👨🏻\n'
+    '👩🏽\u200d❤️\u200d👨🏼\n'
+    '👩🏽\u200d❤️\u200d👨🏽\n'
+    '👩🏽\u200d❤️\u200d👨🏾\n'
+    '👩🏽\u200d❤️\u200d👨🏿\n'
+    '👩🏽\u200d❤️\u200d👩🏻\n'
+    '👩🏽\u200d❤️\u200d👩🏼\n'
+    '👩🏽\u200d❤️\u200d👩🏽\n'
+    '👩🏽\u200d❤️\u200d👩🏾\n'
+    '👩🏽\u200d❤️\u200d👩🏿\n'
+    '👩🏽\u200d❤️\u200d💋\u200d👨🏻\n'
+    '👩🏽\u200d❤️\u200d💋\u200d👨🏼\n'
+    '👩🏽\u200d❤️\u200d💋\u200d👨🏽\n'
+    '👩🏽\u200d❤️\u200d💋\u200d👨🏾\n'
+    '👩🏽\u200d❤️\u200d💋\u200d👨🏿\n'
+    '👩🏽\u200d❤️\u200d💋\u200d👩🏻\n'
+    '👩🏽\u200d❤️\u200d💋\u200d👩🏼\n'
+    '👩🏽\u200d❤️\u200d💋\u200d👩🏽\n'
+    '👩🏽\u200d❤️\u200d💋\u200d👩🏾\n'
+    '👩🏽\u200d❤️\u200d💋\u200d👩🏿\n'
+    '👩🏽\u200d🌾\n'
+    '👩🏽\u200d🍳\n'
+    '👩🏽\u200d🍼\n'
+    '👩🏽\u200d🎓\n'
+    '👩🏽\u200d🎤\n'
+    '👩🏽\u200d🎨\n'
+    '👩🏽\u200d🏫\n'
+    '👩🏽\u200d🏭\n'
+    '👩🏽\u200d💻\n'
+    '👩🏽\u200d💼\n'
+    '👩🏽\u200d🔧\n'
+    '👩🏽\u200d🔬\n'
+    '👩🏽\u200d🚀\n'
+    '👩🏽\u200d🚒\n'
+    '👩🏽\u200d🤝\u200d👨🏻\n'
+    '👩🏽\u200d🤝\u200d👨🏼\n'
+    '👩🏽\u200d🤝\u200d👨🏾\n'
+    '👩🏽\u200d🤝\u200d👨🏿\n'
+    '👩🏽\u200d🤝\u200d👩🏻\n'
+    '👩🏽\u200d🤝\u200d👩🏼\n'
+    '👩🏽\u200d🤝\u200d👩🏾\n'
+    '👩🏽\u200d🤝\u200d👩🏿\n'
+    '👩🏽\u200d🦯\n'
+    '👩🏽\u200d🦯\u200d➡\n'
+    '👩🏽\u200d🦯\u200d➡️\n'
+    '👩🏽\u200d🦰\n'
+    '👩🏽\u200d🦱\n'
+    '👩🏽\u200d🦲\n'
+    '👩🏽\u200d🦳\n'
+    '👩🏽\u200d🦼\n'
+    '👩🏽\u200d🦼\u200d➡\n'
+    '👩🏽\u200d🦼\u200d➡️\n'
+    '👩🏽\u200d🦽\n'
+    '👩🏽\u200d🦽\u200d➡\n'
+    '👩🏽\u200d🦽\u200d➡️\n'
+    '👩🏾\n'
+    '👩🏾\u200d⚕\n'
+    '👩🏾\u200d⚕️\n'
+    '👩🏾\u200d⚖\n'
+    '👩🏾\u200d⚖️\n'
+    '👩🏾\u200d✈\n'
+    '👩🏾\u200d✈️\n'
+    '👩🏾\u200d❤\u200d👨🏻\n'
+    '👩🏾\u200d❤\u200d👨🏼\n'
+    '👩🏾\u200d❤\u200d👨🏽\n'
+    '👩🏾\u200d❤\u200d👨🏾\n'
+    '👩🏾\u200d❤\u200d👨🏿\n'
+    '👩🏾\u200d❤\u200d👩🏻\n'
+    '👩🏾\u200d❤\u200d👩🏼\n'
+    '👩🏾\u200d❤\u200d👩🏽\n'
+    '👩🏾\u200d❤\u200d👩🏾\n'
+    '👩🏾\u200d❤\u200d👩🏿\n'
+    '👩🏾\u200d❤\u200d💋\u200d👨🏻\n'
+    '👩🏾\u200d❤\u200d💋\u200d👨🏼\n'
+    '👩🏾\u200d❤\u200d💋\u200d👨🏽\n'
+    '👩🏾\u200d❤\u200d💋\u200d👨🏾\n'
+    '👩🏾\u200d❤\u200d💋\u200d👨🏿\n'
+    '👩🏾\u200d❤\u200d💋\u200d👩🏻\n'
+    '👩🏾\u200d❤\u200d💋\u200d👩🏼\n'
+    '👩🏾\u200d❤\u200d💋\u200d👩🏽\n'
+    '👩🏾\u200d❤\u200d💋\u200d👩🏾\n'
+    '👩🏾\u200d❤\u200d💋\u200d👩🏿\n'
+    '👩🏾\u200d❤️\u200d👨🏻\n'
+    '👩🏾\u200d❤️\u200d👨🏼\n'
+    '👩🏾\u200d❤️\u200d👨🏽\n'
+    '👩🏾\u200d❤️\u200d👨🏾\n'
+    '👩🏾\u200d❤️\u200d👨🏿\n'
+    '👩🏾\u200d❤️\u200d👩🏻\n'
+    '👩🏾\u200d❤️\u200d👩🏼\n'
+    '👩🏾\u200d❤️\u200d👩🏽\n'
+    '👩🏾\u200d❤️\u200d👩🏾\n'
+    '👩🏾\u200d❤️\u200d👩🏿\n'
+    '👩🏾\u200d❤️\u200d💋\u200d👨🏻\n'
+    '👩🏾\u200d❤️\u200d💋\u200d👨🏼\n'
+    '👩🏾\u200d❤️\u200d💋\u200d👨🏽\n'
+    '👩🏾\u200d❤️\u200d💋\u200d👨🏾\n'
+    '👩🏾\u200d❤️\u200d💋\u200d👨🏿\n'
+    '👩🏾\u200d❤️\u200d💋\u200d👩🏻\n'
+    '👩🏾\u200d❤️\u200d💋\u200d👩🏼\n'
+    '👩🏾\u200d❤️\u200d💋\u200d👩🏽\n'
+    '👩🏾\u200d❤️\u200d💋\u200d👩🏾\n'
+    '👩🏾\u200d❤️\u200d💋\u200d👩🏿\n'
+    '👩🏾\u200d🌾\n'
+    '👩🏾\u200d🍳\n'
+    '👩🏾\u200d🍼\n'
+    '👩🏾\u200d🎓\n'
+    '👩🏾\u200d🎤\n'
+    '👩🏾\u200d🎨\n'
+    '👩🏾\u200d🏫\n'
+    '👩🏾\u200d🏭\n'
+    '👩🏾\u200d💻\n'
+    '👩🏾\u200d💼\n'
+    '👩🏾\u200d🔧\n'
+    '👩🏾\u200d🔬\n'
+    '👩🏾\u200d🚀\n'
+    '👩🏾\u200d🚒\n'
+    '👩🏾\u200d🤝\u200d👨🏻\n'
+    '👩🏾\u200d🤝\u200d👨🏼\n'
+    '👩🏾\u200d🤝\u200d👨🏽\n'
+    '👩🏾\u200d🤝\u200d👨🏿\n'
+    '👩🏾\u200d🤝\u200d👩🏻\n'
+    '👩🏾\u200d🤝\u200d👩🏼\n'
+    '👩🏾\u200d🤝\u200d👩🏽\n'
+    '👩🏾\u200d🤝\u200d👩🏿\n'
+    '👩🏾\u200d🦯\n'
+    '👩🏾\u200d🦯\u200d➡\n'
+    '👩🏾\u200d🦯\u200d➡️\n'
+    '👩🏾\u200d🦰\n'
+    '👩🏾\u200d🦱\n'
+    '👩🏾\u200d🦲\n'
+    '👩🏾\u200d🦳\n'
+    '👩🏾\u200d🦼\n'
+    '👩🏾\u200d🦼\u200d➡\n'
+    '👩🏾\u200d🦼\u200d➡️\n'
+    '👩🏾\u200d🦽\n'
+    '👩🏾\u200d🦽\u200d➡\n'
+    '👩🏾\u200d🦽\u200d➡️\n'
+    '👩🏿\n'
+    '👩🏿\u200d⚕\n'
+    '👩🏿\u200d⚕️\n'
+    '👩🏿\u200d⚖\n'
+    '👩🏿\u200d⚖️\n'
+    '👩🏿\u200d✈\n'
+    '👩🏿\u200d✈️\n'
+    '👩🏿\u200d❤\u200d👨🏻\n'
+    '👩🏿\u200d❤\u200d👨🏼\n'
+    '👩🏿\u200d❤\u200d👨🏽\n'
+    '👩🏿\u200d❤\u200d👨🏾\n'
+    '👩🏿\u200d❤\u200d👨🏿\n'
+    '👩🏿\u200d❤\u200d👩🏻\n'
+    '👩🏿\u200d❤\u200d👩🏼\n'
+    '👩🏿\u200d❤\u200d👩🏽\n'
+    '👩🏿\u200d❤\u200d👩🏾\n'
+    '👩🏿\u200d❤\u200d👩🏿\n'
+    '👩🏿\u200d❤\u200d💋\u200d👨🏻\n'
+    '👩🏿\u200d❤\u200d💋\u200d👨🏼\n'
+    '👩🏿\u200d❤\u200d💋\u200d👨🏽\n'
+    '👩🏿\u200d❤\u200d💋\u200d👨🏾\n'
+    '👩🏿\u200d❤\u200d💋\u200d👨🏿\n'
+    '👩🏿\u200d❤\u200d💋\u200d👩🏻\n'
+    '👩🏿\u200d❤\u200d💋\u200d👩🏼\n'
+    '👩🏿\u200d❤\u200d💋\u200d👩🏽\n'
+    '👩🏿\u200d❤\u200d💋\u200d👩🏾\n'
+    '👩🏿\u200d❤\u200d💋\u200d👩🏿\n'
+    '👩🏿\u200d❤️\u200d👨🏻\n'
+    '👩🏿\u200d❤️\u200d👨🏼\n'
+    '👩🏿\u200d❤️\u200d👨🏽\n'
+    '👩🏿\u200d❤️\u200d👨🏾\n'
+    '👩🏿\u200d❤️\u200d👨🏿\n'
+    '👩🏿\u200d❤️\u200d👩🏻\n'
+    '👩🏿\u200d❤️\u200d👩🏼\n'
+    '👩🏿\u200d❤️\u200d👩🏽\n'
+    '👩🏿\u200d❤️\u200d👩🏾\n'
+    '👩🏿\u200d❤️\u200d👩🏿\n'
+    '👩🏿\u200d❤️\u200d💋\u200d👨🏻\n'
+    '👩🏿\u200d❤️\u200d💋\u200d👨🏼\n'
+    '👩🏿\u200d❤️\u200d💋\u200d👨🏽\n'
+    '👩🏿\u200d❤️\u200d💋\u200d👨🏾\n'
+    '👩🏿\u200d❤️\u200d💋\u200d👨🏿\n'
+    '👩🏿\u200d❤️\u200d💋\u200d👩🏻\n'
+    '👩🏿\u200d❤️\u200d💋\u200d👩🏼\n'
+    '👩🏿\u200d❤️\u200d💋\u200d👩🏽\n'
+    '👩🏿\u200d❤️\u200d💋\u200d👩🏾\n'
+    '👩🏿\u200d❤️\u200d💋\u200d👩🏿\n'
+    '👩🏿\u200d🌾\n'
+    '👩🏿\u200d🍳\n'
+    '👩🏿\u200d🍼\n'
+    '👩🏿\u200d🎓\n'
+    '👩🏿\u200d🎤\n'
+    '👩🏿\u200d🎨\n'
+    '👩🏿\u200d🏫\n'
+    '👩🏿\u200d🏭\n'
+    '👩🏿\u200d💻\n'
+    '👩🏿\u200d💼\n'
+    '👩🏿\u200d🔧\n'
+    '👩🏿\u200d🔬\n'
+    '👩🏿\u200d🚀\n'
+    '👩🏿\u200d🚒\n'
+    '👩🏿\u200d🤝\u200d👨🏻\n'
+    '👩🏿\u200d🤝\u200d👨🏼\n'
+    '👩🏿\u200d🤝\u200d👨🏽\n'
+    '👩🏿\u200d🤝\u200d👨🏾\n'
+    '👩🏿\u200d🤝\u200d👩🏻\n'
+    '👩🏿\u200d🤝\u200d👩🏼\n'
+    '👩🏿\u200d🤝\u200d👩🏽\n'
+    '👩🏿\u200d🤝\u200d👩🏾\n'
+    '👩🏿\u200d🦯\n'
+    '👩🏿\u200d🦯\u200d➡\n'
+    '👩🏿\u200d🦯\u200d➡️\n'
+    '👩🏿\u200d🦰\n'
+    '👩🏿\u200d🦱\n'
+    '👩🏿\u200d🦲\n'
+    '👩🏿\u200d🦳\n'
+    '👩🏿\u200d🦼\n'
+    '👩🏿\u200d🦼\u200d➡\n'
+    '👩🏿\u200d🦼\u200d➡️\n'
+    '👩🏿\u200d🦽\n'
+    '👩🏿\u200d🦽\u200d➡\n'
+    '👩🏿\u200d🦽\u200d➡️\n'
+    '👪\n'
+    '👫\n'
+    '👫🏻\n'
+    '👫🏼\n'
+    '👫🏽\n'
+    '👫🏾\n'
+    '👫🏿\n'
+    '👬\n'
+    '👬🏻\n'
+    '👬🏼\n'
+    '👬🏽\n'
+    '👬🏾\n'
+    '👬🏿\n'
+    '👭\n'
+    '👭🏻\n'
+    '👭🏼\n'
+    '👭🏽\n'
+    '👭🏾\n'
+    '👭🏿\n'
+    '👮\n'
+    '👮\u200d♀\n'
+    '👮\u200d♀️\n'
+    '👮\u200d♂\n'
+    '👮\u200d♂️\n'
+    '👮🏻\n'
+    '👮🏻\u200d♀\n'
+    '👮🏻\u200d♀️\n'
+    '👮🏻\u200d♂\n'
+    '👮🏻\u200d♂️\n'
+    '👮🏼\n'
+    '👮🏼\u200d♀\n'
+    '👮🏼\u200d♀️\n'
+    '👮🏼\u200d♂\n'
+    '👮🏼\u200d♂️\n'
+    '👮🏽\n'
+    '👮🏽\u200d♀\n'
+    '👮🏽\u200d♀️\n'
+    '👮🏽\u200d♂\n'
+    '👮🏽\u200d♂️\n'
+    '👮🏾\n'
+    '👮🏾\u200d♀\n'
+    '👮🏾\u200d♀️\n'
+    '👮🏾\u200d♂\n'
+    '👮🏾\u200d♂️\n'
+    '👮🏿\n'
+    '👮🏿\u200d♀\n'
+    '👮🏿\u200d♀️\n'
+    '👮🏿\u200d♂\n'
+    '👮🏿\u200d♂️\n'
+    '👯\n'
+    '👯\u200d♀\n'
+    '👯\u200d♀️\n'
+    '👯\u200d♂\n'
+    '👯\u200d♂️\n'
+    '👰\n'
+    '👰\u200d♀\n'
+    '👰\u200d♀️\n'
+    '👰\u200d♂\n'
+    '👰\u200d♂️\n'
+    '👰🏻\n'
+    '👰🏻\u200d♀\n'
+    '👰🏻\u200d♀️\n'
+    '👰🏻\u200d♂\n'
+    '👰🏻\u200d♂️\n'
+    '👰🏼\n'
+    '👰🏼\u200d♀\n'
+    '👰🏼\u200d♀️\n'
+    '👰🏼\u200d♂\n'
+    '👰🏼\u200d♂️\n'
+    '👰🏽\n'
+    '👰🏽\u200d♀\n'
+    '👰🏽\u200d♀️\n'
+    '👰🏽\u200d♂\n'
+    '👰🏽\u200d♂️\n'
+    '👰🏾\n'
+    '👰🏾\u200d♀\n'
+    '👰🏾\u200d♀️\n'
+    '👰🏾\u200d♂\n'
+    '👰🏾\u200d♂️\n'
+    '👰🏿\n'
+    '👰🏿\u200d♀\n'
+    '👰🏿\u200d♀️\n'
+    '👰🏿\u200d♂\n'
+    '👰🏿\u200d♂️\n'
+    '👱\n'
+    '👱\u200d♀\n'
+    '👱\u200d♀️\n'
+    '👱\u200d♂\n'
+    '👱\u200d♂️\n'
+    '👱🏻\n'
+    '👱🏻\u200d♀\n'
+    '👱🏻\u200d♀️\n'
+    '👱🏻\u200d♂\n'
+    '👱🏻\u200d♂️\n'
+    '👱🏼\n'
+    '👱🏼\u200d♀\n'
+    '👱🏼\u200d♀️\n'
+    '👱🏼\u200d♂\n'
+    '👱🏼\u200d♂️\n'
+    '👱🏽\n'
+    '👱🏽\u200d♀\n'
+    '👱🏽\u200d♀️\n'
+    '👱🏽\u200d♂\n'
+    '👱🏽\u200d♂️\n'
+    '👱🏾\n'
+    '👱🏾\u200d♀\n'
+    '👱🏾\u200d♀️\n'
+    '👱🏾\u200d♂\n'
+    '👱🏾\u200d♂️\n'
+    '👱🏿\n'
+    '👱🏿\u200d♀\n'
+    '👱🏿\u200d♀️\n'
+    '👱🏿\u200d♂\n'
+    '👱🏿\u200d♂️\n'
+    '👲\n'
+    '👲🏻\n'
+    '👲🏼\n'
+    '👲🏽\n'
+    '👲🏾\n'
+    '👲🏿\n'
+    '👳\n'
+    '👳\u200d♀\n'
+    '👳\u200d♀️\n'
+    '👳\u200d♂\n'
+    '👳\u200d♂️\n'
+    '👳🏻\n'
+    '👳🏻\u200d♀\n'
+    '👳🏻\u200d♀️\n'
+    '👳🏻\u200d♂\n'
+    '👳🏻\u200d♂️\n'
+    '👳🏼\n'
+    '👳🏼\u200d♀\n'
+    '👳🏼\u200d♀️\n'
+    '👳🏼\u200d♂\n'
+    '👳🏼\u200d♂️\n'
+    '👳🏽\n'
+    '👳🏽\u200d♀\n'
+    '👳🏽\u200d♀️\n'
+    '👳🏽\u200d♂\n'
+    '👳🏽\u200d♂️\n'
+    '👳🏾\n'
+    '👳🏾\u200d♀\n'
+    '👳🏾\u200d♀️\n'
+    '👳🏾\u200d♂\n'
+    '👳🏾\u200d♂️\n'
+    '👳🏿\n'
+    '👳🏿\u200d♀\n'
+    '👳🏿\u200d♀️\n'
+    '👳🏿\u200d♂\n'
+    '👳🏿\u200d♂️\n'
+    '👴\n'
+    '👴🏻\n'
+    '👴🏼\n'
+    '👴🏽\n'
+    '👴🏾\n'
+    '👴🏿\n'
+    '👵\n'
+    '👵🏻\n'
+    '👵🏼\n'
+    '👵🏽\n'
+    '👵🏾\n'
+    '👵🏿\n'
+    '👶\n'
+    '👶🏻\n'
+    '👶🏼\n'
+    '👶🏽\n'
+    '👶🏾\n'
+    '👶🏿\n'
+    '👷\n'
+    '👷\u200d♀\n'
+    '👷\u200d♀️\n'
+    '👷\u200d♂\n'
+    '👷\u200d♂️\n'
+    '👷🏻\n'
+    '👷🏻\u200d♀\n'
+    '👷🏻\u200d♀️\n'
+    '👷🏻\u200d♂\n'
+    '👷🏻\u200d♂️\n'
+    '👷🏼\n'
+    '👷🏼\u200d♀\n'
+    '👷🏼\u200d♀️\n'
+    '👷🏼\u200d♂\n'
+    '👷🏼\u200d♂️\n'
+    '👷🏽\n'
+    '👷🏽\u200d♀\n'
+    '👷🏽\u200d♀️\n'
+    '👷🏽\u200d♂\n'
+    '👷🏽\u200d♂️\n'
+    '👷🏾\n'
+    '👷🏾\u200d♀\n'
+    '👷🏾\u200d♀️\n'
+    '👷🏾\u200d♂\n'
+    '👷🏾\u200d♂️\n'
+    '👷🏿\n'
+    '👷🏿\u200d♀\n'
+    '👷🏿\u200d♀️\n'
+    '👷🏿\u200d♂\n'
+    '👷🏿\u200d♂️\n'
+    '👸\n'
+    '👸🏻\n'
+    '👸🏼\n'
+    '👸🏽\n'
+    '👸🏾\n'
+    '👸🏿\n'
+    '👹\n'
+    '👺\n'
+    '👻\n'
+    '👼\n'
+    '👼🏻\n'
+    '👼🏼\n'
+    '👼🏽\n'
+    '👼🏾\n'
+    '👼🏿\n'
+    '👽\n'
+    '👾\n'
+    '👿\n'
+    '💀\n'
+    '💁\n'
+    '💁\u200d♀\n'
+    '💁\u200d♀️\n'
+    '💁\u200d♂\n'
+    '💁\u200d♂️\n'
+    '💁🏻\n'
+    '💁🏻\u200d♀\n'
+    '💁🏻\u200d♀️\n'
+    '💁🏻\u200d♂\n'
+    '💁🏻\u200d♂️\n'
+    '💁🏼\n'
+    '💁🏼\u200d♀\n'
+    '💁🏼\u200d♀️\n'
+    '💁🏼\u200d♂\n'
+    '💁🏼\u200d♂️\n'
+    '💁🏽\n'
+    '💁🏽\u200d♀\n'
+    '💁🏽\u200d♀️\n'
+    '💁🏽\u200d♂\n'
+    '💁🏽\u200d♂️\n'
+    '💁🏾\n'
+    '💁🏾\u200d♀\n'
+    '💁🏾\u200d♀️\n'
+    '💁🏾\u200d♂\n'
+    '💁🏾\u200d♂️\n'
+    '💁🏿\n'
+    '💁🏿\u200d♀\n'
+    '💁🏿\u200d♀️\n'
+    '💁🏿\u200d♂\n'
+    '💁🏿\u200d♂️\n'
+    '💂\n'
+    '💂\u200d♀\n'
+    '💂\u200d♀️\n'
+    '💂\u200d♂\n'
+    '💂\u200d♂️\n'
+    '💂🏻\n'
+    '💂🏻\u200d♀\n'
+    '💂🏻\u200d♀️\n'
+    '💂🏻\u200d♂\n'
+    '💂🏻\u200d♂️\n'
+    '💂🏼\n'
+    '💂🏼\u200d♀\n'
+    '💂🏼\u200d♀️\n'
+    '💂🏼\u200d♂\n'
+    '💂🏼\u200d♂️\n'
+    '💂🏽\n'
+    '💂🏽\u200d♀\n'
+    '💂🏽\u200d♀️\n'
+    '💂🏽\u200d♂\n'
+    '💂🏽\u200d♂️\n'
+    '💂🏾\n'
+    '💂🏾\u200d♀\n'
+    '💂🏾\u200d♀️\n'
+    '💂🏾\u200d♂\n'
+    '💂🏾\u200d♂️\n'
+    '💂🏿\n'
+    '💂🏿\u200d♀\n'
+    '💂🏿\u200d♀️\n'
+    '💂🏿\u200d♂\n'
+    '💂🏿\u200d♂️\n'
+    '💃\n'
+    '💃🏻\n'
+    '💃🏼\n'
+    '💃🏽\n'
+    '💃🏾\n'
+    '💃🏿\n'
+    '💄\n'
+    '💅\n'
+    '💅🏻\n'
+    '💅🏼\n'
+    '💅🏽\n'
+    '💅🏾\n'
+    '💅🏿\n'
+    '💆\n'
+    '💆\u200d♀\n'
+    '💆\u200d♀️\n'
+    '💆\u200d♂\n'
+    '💆\u200d♂️\n'
+    '💆🏻\n'
+    '💆🏻\u200d♀\n'
+    '💆🏻\u200d♀️\n'
+    '💆🏻\u200d♂\n'
+    '💆🏻\u200d♂️\n'
+    '💆🏼\n'
+    '💆🏼\u200d♀\n'
+    '💆🏼\u200d♀️\n'
+    '💆🏼\u200d♂\n'
+    '💆🏼\u200d♂️\n'
+    '💆🏽\n'
+    '💆🏽\u200d♀\n'
+    '💆🏽\u200d♀️\n'
+    '💆🏽\u200d♂\n'
+    '💆🏽\u200d♂️\n'
+    '💆🏾\n'
+    '💆🏾\u200d♀\n'
+    '💆🏾\u200d♀️\n'
+    '💆🏾\u200d♂\n'
+    '💆🏾\u200d♂️\n'
+    '💆🏿\n'
+    '💆🏿\u200d♀\n'
+    '💆🏿\u200d♀️\n'
+    '💆🏿\u200d♂\n'
+    '💆🏿\u200d♂️\n'
+    '💇\n'
+    '💇\u200d♀\n'
+    '💇\u200d♀️\n'
+    '💇\u200d♂\n'
+    '💇\u200d♂️\n'
+    '💇🏻\n'
+    '💇🏻\u200d♀\n'
+    '💇🏻\u200d♀️\n'
+    '💇🏻\u200d♂\n'
+    '💇🏻\u200d♂️\n'
+    '💇🏼\n'
+    '💇🏼\u200d♀\n'
+    '💇🏼\u200d♀️\n'
+    '💇🏼\u200d♂\n'
+    '💇🏼\u200d♂️\n'
+    '💇🏽\n'
+    '💇🏽\u200d♀\n'
+    '💇🏽\u200d♀️\n'
+    '💇🏽\u200d♂\n'
+    '💇🏽\u200d♂️\n'
+    '💇🏾\n'
+    '💇🏾\u200d♀\n'
+    '💇🏾\u200d♀️\n'
+    '💇🏾\u200d♂\n'
+    '💇🏾\u200d♂️\n'
+    '💇🏿\n'
+    '💇🏿\u200d♀\n'
+    '💇🏿\u200d♀️\n'
+    '💇🏿\u200d♂\n'
+    '💇🏿\u200d♂️\n'
+    '💈\n'
+    '💉\n'
+    '💊\n'
+    '💋\n'
+    '💌\n'
+    '💍\n'
+    '💎\n'
+    '💏\n'
+    '💏🏻\n'
+    '💏🏼\n'
+    '💏🏽\n'
+    '💏🏾\n'
+    '💏🏿\n'
+    '💐\n'
+    '💑\n'
+    '💑🏻\n'
+    '💑🏼\n'
+    '💑🏽\n'
+    '💑🏾\n'
+    '💑🏿\n'
+    '💒\n'
+    '💓\n'
+    '💔\n'
+    '💕\n'
+    '💖\n'
+    '💗\n'
+    '💘\n'
+    '💙\n'
+    '💚\n'
+    '💛\n'
+    '💜\n'
+    '💝\n'
+    '💞\n'
+    '💟\n'
+    '💠\n'
+    '💡\n'
+    '💢\n'
+    '💣\n'
+    '💤\n'
+    '💥\n'
+    '💦\n'
+    '💧\n'
+    '💨\n'
+    '💩\n'
+    '💪\n'
+    '💪🏻\n'
+    '💪🏼\n'
+    '💪🏽\n'
+    '💪🏾\n'
+    '💪🏿\n'
+    '💫\n'
+    '💬\n'
+    '💭\n'
+    '💮\n'
+    '💯\n'
+    '💰\n'
+    '💱\n'
+    '💲\n'
+    '💳\n'
+    '💴\n'
+    '💵\n'
+    '💶\n'
+    '💷\n'
+    '💸\n'
+    '💹\n'
+    '💺\n'
+    '💻\n'
+    '💼\n'
+    '💽\n'
+    '💾\n'
+    '💿\n'
+    '📀\n'
+    '📁\n'
+    '📂\n'
+    '📃\n'
+    '📄\n'
+    '📅\n'
+    '📆\n'
+    '📇\n'
+    '📈\n'
+    '📉\n'
+    '📊\n'
+    '📋\n'
+    '📌\n'
+    '📍\n'
+    '📎\n'
+    '📏\n'
+    '📐\n'
+    '📑\n'
+    '📒\n'
+    '📓\n'
+    '📔\n'
+    '📕\n'
+    '📖\n'
+    '📗\n'
+    '📘\n'
+    '📙\n'
+    '📚\n'
+    '📛\n'
+    '📜\n'
+    '📝\n'
+    '📞\n'
+    '📟\n'
+    '📠\n'
+    '📡\n'
+    '📢\n'
+    '📣\n'
+    '📤\n'
+    '📥\n'
+    '📦\n'
+    '📧\n'
+    '📨\n'
+    '📩\n'
+    '📪\n'
+    '📫\n'
+    '📬\n'
+    '📭\n'
+    '📮\n'
+    '📯\n'
+    '📰\n'
+    '📱\n'
+    '📲\n'
+    '📳\n'
+    '📴\n'
+    '📵\n'
+    '📶\n'
+    '📷\n'
+    '📸\n'
+    '📹\n'
+    '📺\n'
+    '📻\n'
+    '📼\n'
+    '📽\n'
+    '📽️\n'
+    '📿\n'
+    '🔀\n'
+    '🔁\n'
+    '🔂\n'
+    '🔃\n'
+    '🔄\n'
+    '🔅\n'
+    '🔆\n'
+    '🔇\n'
+    '🔈\n'
+    '🔉\n'
+    '🔊\n'
+    '🔋\n'
+    '🔌\n'
+    '🔍\n'
+    '🔎\n'
+    '🔏\n'
+    '🔐\n'
+    '🔑\n'
+    '🔒\n'
+    '🔓\n'
+    '🔔\n'
+    '🔕\n'
+    '🔖\n'
+    '🔗\n'
+    '🔘\n'
+    '🔙\n'
+    '🔚\n'
+    '🔛\n'
+    '🔜\n'
+    '🔝\n'
+    '🔞\n'
+    '🔟\n'
+    '🔠\n'
+    '🔡\n'
+    '🔢\n'
+    '🔣\n'
+    '🔤\n'
+    '🔥\n'
+    '🔦\n'
+    '🔧\n'
+    '🔨\n'
+    '🔩\n'
+    '🔪\n'
+    '🔫\n'
+    '🔬\n'
+    '🔭\n'
+    '🔮\n'
+    '🔯\n'
+    '🔰\n'
+    '🔱\n'
+    '🔲\n'
+    '🔳\n'
+    '🔴\n'
+    '🔵\n'
+    '🔶\n'
+    '🔷\n'
+    '🔸\n'
+    '🔹\n'
+    '🔺\n'
+    '🔻\n'
+    '🔼\n'
+    '🔽\n'
+    '🕉\n'
+    '🕉️\n'
+    '🕊\n'
+    '🕊️\n'
+    '🕋\n'
+    '🕌\n'
+    '🕍\n'
+    '🕎\n'
+    '🕐\n'
+    '🕑\n'
+    '🕒\n'
+    '🕓\n'
+    '🕔\n'
+    '🕕\n'
+    '🕖\n'
+    '🕗\n'
+    '🕘\n'
+    '🕙\n'
+    '🕚\n'
+    '🕛\n'
+    '🕜\n'
+    '🕝\n'
+    '🕞\n'
+    '🕟\n'
+    '🕠\n'
+    '🕡\n'
+    '🕢\n'
+    '🕣\n'
+    '🕤\n'
+    '🕥\n'
+    '🕦\n'
+    '🕧\n'
+    '🕯\n'
+    '🕯️\n'
+    '🕰\n'
+    '🕰️\n'
+    '🕳\n'
+    '🕳️\n'
+    '🕴\n'
+    '🕴️\n'
+    '🕴🏻\n'
+    '🕴🏼\n'
+    '🕴🏽\n'
+    '🕴🏾\n'
+    '🕴🏿\n'
+    '🕵\n'
+    '🕵\u200d♀\n'
+    '🕵\u200d♀️\n'
+    '🕵\u200d♂\n'
+    '🕵\u200d♂️\n'
+    '🕵️\n'
+    '🕵️\u200d♀\n'
+    '🕵️\u200d♀️\n'
+    '🕵️\u200d♂\n'
+    '🕵️\u200d♂️\n'
+    '🕵🏻\n'
+    '🕵🏻\u200d♀\n'
+    '🕵🏻\u200d♀️\n'
+    '🕵🏻\u200d♂\n'
+    '🕵🏻\u200d♂️\n'
+    '🕵🏼\n'
+    '🕵🏼\u200d♀\n'
+    '🕵🏼\u200d♀️\n'
+    '🕵🏼\u200d♂\n'
+    '🕵🏼\u200d♂️\n'
+    '🕵🏽\n'
+    '🕵🏽\u200d♀\n'
+    '🕵🏽\u200d♀️\n'
+    '🕵🏽\u200d♂\n'
+    '🕵🏽\u200d♂️\n'
+    '🕵🏾\n'
+    '🕵🏾\u200d♀\n'
+    '🕵🏾\u200d♀️\n'
+    '🕵🏾\u200d♂\n'
+    '🕵🏾\u200d♂️\n'
+    '🕵🏿\n'
+    '🕵🏿\u200d♀\n'
+    '🕵🏿\u200d♀️\n'
+    '🕵🏿\u200d♂\n'
+    '🕵🏿\u200d♂️\n'
+    '🕶\n'
+    '🕶️\n'
+    '🕷\n'
+    '🕷️\n'
+    '🕸\n'
+    '🕸️\n'
+    '🕹\n'
+    '🕹️\n'
+    '🕺\n'
+    '🕺🏻\n'
+    '🕺🏼\n'
+    '🕺🏽\n'
+    '🕺🏾\n'
+    '🕺🏿\n'
+    '🖇\n'
+    '🖇️\n'
+    '🖊\n'
+    '🖊️\n'
+    '🖋\n'
+    '🖋️\n'
+    '🖌\n'
+    '🖌️\n'
+    '🖍\n'
+    '🖍️\n'
+    '🖐\n'
+    '🖐️\n'
+    '🖐🏻\n'
+    '🖐🏼\n'
+    '🖐🏽\n'
+    '🖐🏾\n'
+    '🖐🏿\n'
+    '🖕\n'
+    '🖕🏻\n'
+    '🖕🏼\n'
+    '🖕🏽\n'
+    '🖕🏾\n'
+    '🖕🏿\n'
+    '🖖\n'
+    '🖖🏻\n'
+    '🖖🏼\n'
+    '🖖🏽\n'
+    '🖖🏾\n'
+    '🖖🏿\n'
+    '🖤\n'
+    '🖥\n'
+    '🖥️\n'
+    '🖨\n'
+    '🖨️\n'
+    '🖱\n'
+    '🖱️\n'
+    '🖲\n'
+    '🖲️\n'
+    '🖼\n'
+    '🖼️\n'
+    '🗂\n'
+    '🗂️\n'
+    '🗃\n'
+    '🗃️\n'
+    '🗄\n'
+    '🗄️\n'
+    '🗑\n'
+    '🗑️\n'
+    '🗒\n'
+    '🗒️\n'
+    '🗓\n'
+    '🗓️\n'
+    '🗜\n'
+    '🗜️\n'
+    '🗝\n'
+    '🗝️\n'
+    '🗞\n'
+    '🗞️\n'
+    '🗡\n'
+    '🗡️\n'
+    '🗣\n'
+    '🗣️\n'
+    '🗨\n'
+    '🗨️\n'
+    '🗯\n'
+    '🗯️\n'
+    '🗳\n'
+    '🗳️\n'
+    '🗺\n'
+    '🗺️\n'
+    '🗻\n'
+    '🗼\n'
+    '🗽\n'
+    '🗾\n'
+    '🗿\n'
+    '😀\n'
+    '😁\n'
+    '😂\n'
+    '😃\n'
+    '😄\n'
+    '😅\n'
+    '😆\n'
+    '😇\n'
+    '😈\n'
+    '😉\n'
+    '😊\n'
+    '😋\n'
+    '😌\n'
+    '😍\n'
+    '😎\n'
+    '😏\n'
+    '😐\n'
+    '😑\n'
+    '😒\n'
+    '😓\n'
+    '😔\n'
+    '😕\n'
+    '😖\n'
+    '😗\n'
+    '😘\n'
+    '😙\n'
+    '😚\n'
+    '😛\n'
+    '😜\n'
+    '😝\n'
+    '😞\n'
+    '😟\n'
+    '😠\n'
+    '😡\n'
+    '😢\n'
+    '😣\n'
+    '😤\n'
+    '😥\n'
+    '😦\n'
+    '😧\n'
+    '😨\n'
+    '😩\n'
+    '😪\n'
+    '😫\n'
+    '😬\n'
+    '😭\n'
+    '😮\n'
+    '😮\u200d💨\n'
+    '😯\n'
+    '😰\n'
+    '😱\n'
+    '😲\n'
+    '😳\n'
+    '😴\n'
+    '😵\n'
+    '😵\u200d💫\n'
+    '😶\n'
+    '😶\u200d🌫\n'
+    '😶\u200d🌫️\n'
+    '😷\n'
+    '😸\n'
+    '😹\n'
+    '😺\n'
+    '😻\n'
+    '😼\n'
+    '😽\n'
+    '😾\n'
+    '😿\n'
+    '🙀\n'
+    '🙁\n'
+    '🙂\n'
+    '🙂\u200d↔\n'
+    '🙂\u200d↔️\n'
+    '🙂\u200d↕\n'
+    '🙂\u200d↕️\n'
+    '🙃\n'
+    '🙄\n'
+    '🙅\n'
+    '🙅\u200d♀\n'
+    '🙅\u200d♀️\n'
+    '🙅\u200d♂\n'
+    '🙅\u200d♂️\n'
+    '🙅🏻\n'
+    '🙅🏻\u200d♀\n'
+    '🙅🏻\u200d♀️\n'
+    '🙅🏻\u200d♂\n'
+    '🙅🏻\u200d♂️\n'
+    '🙅🏼\n'
+    '🙅🏼\u200d♀\n'
+    '🙅🏼\u200d♀️\n'
+    '🙅🏼\u200d♂\n'
+    '🙅🏼\u200d♂️\n'
+    '🙅🏽\n'
+    '🙅🏽\u200d♀\n'
+    '🙅🏽\u200d♀️\n'
+    '🙅🏽\u200d♂\n'
+    '🙅🏽\u200d♂️\n'
+    '🙅🏾\n'
+    '🙅🏾\u200d♀\n'
+    '🙅🏾\u200d♀️\n'
+    '🙅🏾\u200d♂\n'
+    '🙅🏾\u200d♂️\n'
+    '🙅🏿\n'
+    '🙅🏿\u200d♀\n'
+    '🙅🏿\u200d♀️\n'
+    '🙅🏿\u200d♂\n'
+    '🙅🏿\u200d♂️\n'
+    '🙆\n'
+    '🙆\u200d♀\n'
+    '🙆\u200d♀️\n'
+    '🙆\u200d♂\n'
+    '🙆\u200d♂️\n'
+    '🙆🏻\n'
+    '🙆🏻\u200d♀\n'
+    '🙆🏻\u200d♀️\n'
+    '🙆🏻\u200d♂\n'
+    '🙆🏻\u200d♂️\n'
+    '🙆🏼\n'
+    '🙆🏼\u200d♀\n'
+    '🙆🏼\u200d♀️\n'
+    '🙆🏼\u200d♂\n'
+    '🙆🏼\u200d♂️\n'
+    '🙆🏽\n'
+    '🙆🏽\u200d♀\n'
+    '🙆🏽\u200d♀️\n'
+    '🙆🏽\u200d♂\n'
+    '🙆🏽\u200d♂️\n'
+    '🙆🏾\n'
+    '🙆🏾\u200d♀\n'
+    '🙆🏾\u200d♀️\n'
+    '🙆🏾\u200d♂\n'
+    '🙆🏾\u200d♂️\n'
+    '🙆🏿\n'
+    '🙆🏿\u200d♀\n'
+    '🙆🏿\u200d♀️\n'
+    '🙆🏿\u200d♂\n'
+    '🙆🏿\u200d♂️\n'
+    '🙇\n'
+    '🙇\u200d♀\n'
+    '🙇\u200d♀️\n'
+    '🙇\u200d♂\n'
+    '🙇\u200d♂️\n'
+    '🙇🏻\n'
+    '🙇🏻\u200d♀\n'
+    '🙇🏻\u200d♀️\n'
+    '🙇🏻\u200d♂\n'
+    '🙇🏻\u200d♂️\n'
+    '🙇🏼\n'
+    '🙇🏼\u200d♀\n'
+    '🙇🏼\u200d♀️\n'
+    '🙇🏼\u200d♂\n'
+    '🙇🏼\u200d♂️\n'
+    '🙇🏽\n'
+    '🙇🏽\u200d♀\n'
+    '🙇🏽\u200d♀️\n'
+    '🙇🏽\u200d♂\n'
+    '🙇🏽\u200d♂️\n'
+    '🙇🏾\n'
+    '🙇🏾\u200d♀\n'
+    '🙇🏾\u200d♀️\n'
+    '🙇🏾\u200d♂\n'
+    '🙇🏾\u200d♂️\n'
+    '🙇🏿\n'
+    '🙇🏿\u200d♀\n'
+    '🙇🏿\u200d♀️\n'
+    '🙇🏿\u200d♂\n'
+    '🙇🏿\u200d♂️\n'
+    '🙈\n'
+    '🙉\n'
+    '🙊\n'
+    '🙋\n'
+    '🙋\u200d♀\n'
+    '🙋\u200d♀️\n'
+    '🙋\u200d♂\n'
+    '🙋\u200d♂️\n'
+    '🙋🏻\n'
+    '🙋🏻\u200d♀\n'
+    '🙋🏻\u200d♀️\n'
+    '🙋🏻\u200d♂\n'
+    '🙋🏻\u200d♂️\n'
+    '🙋🏼\n'
+    '🙋🏼\u200d♀\n'
+    '🙋🏼\u200d♀️\n'
+    '🙋🏼\u200d♂\n'
+    '🙋🏼\u200d♂️\n'
+    '🙋🏽\n'
+    '🙋🏽\u200d♀\n'
+    '🙋🏽\u200d♀️\n'
+    '🙋🏽\u200d♂\n'
+    '🙋🏽\u200d♂️\n'
+    '🙋🏾\n'
+    '🙋🏾\u200d♀\n'
+    '🙋🏾\u200d♀️\n'
+    '🙋🏾\u200d♂\n'
+    '🙋🏾\u200d♂️\n'
+    '🙋🏿\n'
+    '🙋🏿\u200d♀\n'
+    '🙋🏿\u200d♀️\n'
+    '🙋🏿\u200d♂\n'
+    '🙋🏿\u200d♂️\n'
+    '🙌\n'
+    '🙌🏻\n'
+    '🙌🏼\n'
+    '🙌🏽\n'
+    '🙌🏾\n'
+    '🙌🏿\n'
+    '🙍\n'
+    '🙍\u200d♀\n'
+    '🙍\u200d♀️\n'
+    '🙍\u200d♂\n'
+    '🙍\u200d♂️\n'
+    '🙍🏻\n'
+    '🙍🏻\u200d♀\n'
+    '🙍🏻\u200d♀️\n'
+    '🙍🏻\u200d♂\n'
+    '🙍🏻\u200d♂️\n'
+    '🙍🏼\n'
+    '🙍🏼\u200d♀\n'
+    '🙍🏼\u200d♀️\n'
+    '🙍🏼\u200d♂\n'
+    '🙍🏼\u200d♂️\n'
+    '🙍🏽\n'
+    '🙍🏽\u200d♀\n'
+    '🙍🏽\u200d♀️\n'
+    '🙍🏽\u200d♂\n'
+    '🙍🏽\u200d♂️\n'
+    '🙍🏾\n'
+    '🙍🏾\u200d♀\n'
+    '🙍🏾\u200d♀️\n'
+    '🙍🏾\u200d♂\n'
+    '🙍🏾\u200d♂️\n'
+    '🙍🏿\n'
+    '🙍🏿\u200d♀\n'
+    '🙍🏿\u200d♀️\n'
+    '🙍🏿\u200d♂\n'
+    '🙍🏿\u200d♂️\n'
+    '🙎\n'
+    '🙎\u200d♀\n'
+    '🙎\u200d♀️\n'
+    '🙎\u200d♂\n'
+    '🙎\u200d♂️\n'
+    '🙎🏻\n'
+    '🙎🏻\u200d♀\n'
+    '🙎🏻\u200d♀️\n'
+    '🙎🏻\u200d♂\n'
+    '🙎🏻\u200d♂️\n'
+    '🙎🏼\n'
+    '🙎🏼\u200d♀\n'
+    '🙎🏼\u200d♀️\n'
+    '🙎🏼\u200d♂\n'
+    '🙎🏼\u200d♂️\n'
+    '🙎🏽\n'
+    '🙎🏽\u200d♀\n'
+    '🙎🏽\u200d♀️\n'
+    '🙎🏽\u200d♂\n'
+    '🙎🏽\u200d♂️\n'
+    '🙎🏾\n'
+    '🙎🏾\u200d♀\n'
+    '🙎🏾\u200d♀️\n'
+    '🙎🏾\u200d♂\n'
+    '🙎🏾\u200d♂️\n'
+    '🙎🏿\n'
+    '🙎🏿\u200d♀\n'
+    '🙎🏿\u200d♀️\n'
+    '🙎🏿\u200d♂\n'
+    '🙎🏿\u200d♂️\n'
+    '🙏\n'
+    '🙏🏻\n'
+    '🙏🏼\n'
+    '🙏🏽\n'
+    '🙏🏾\n'
+    '🙏🏿\n'
+    '🚀\n'
+    '🚁\n'
+    '🚂\n'
+    '🚃\n'
+    '🚄\n'
+    '🚅\n'
+    '🚆\n'
+    '🚇\n'
+    '🚈\n'
+    '🚉\n'
+    '🚊\n'
+    '🚋\n'
+    '🚌\n'
+    '🚍\n'
+    '🚎\n'
+    '🚏\n'
+    '🚐\n'
+    '🚑\n'
+    '🚒\n'
+    '🚓\n'
+    '🚔\n'
+    '🚕\n'
+    '🚖\n'
+    '🚗\n'
+    '🚘\n'
+    '🚙\n'
+    '🚚\n'
+    '🚛\n'
+    '🚜\n'
+    '🚝\n'
+    '🚞\n'
+    '🚟\n'
+    '🚠\n'
+    '🚡\n'
+    '🚢\n'
+    '🚣\n'
+    '🚣\u200d♀\n'
+    '🚣\u200d♀️\n'
+    '🚣\u200d♂\n'
+    '🚣\u200d♂️\n'
+    '🚣🏻\n'
+    '🚣🏻\u200d♀\n'
+    '🚣🏻\u200d♀️\n'
+    '🚣🏻\u200d♂\n'
+    '🚣🏻\u200d♂️\n'
+    '🚣🏼\n'
+    '🚣🏼\u200d♀\n'
+    '🚣🏼\u200d♀️\n'
+    '🚣🏼\u200d♂\n'
+    '🚣🏼\u200d♂️\n'
+    '🚣🏽\n'
+    '🚣🏽\u200d♀\n'
+    '🚣🏽\u200d♀️\n'
+    '🚣🏽\u200d♂\n'
+    '🚣🏽\u200d♂️\n'
+    '🚣🏾\n'
+    '🚣🏾\u200d♀\n'
+    '🚣🏾\u200d♀️\n'
+    '🚣🏾\u200d♂\n'
+    '🚣🏾\u200d♂️\n'
+    '🚣🏿\n'
+    '🚣🏿\u200d♀\n'
+    '🚣🏿\u200d♀️\n'
+    '🚣🏿\u200d♂\n'
+    '🚣🏿\u200d♂️\n'
+    '🚤\n'
+    '🚥\n'
+    '🚦\n'
+    '🚧\n'
+    '🚨\n'
+    '🚩\n'
+    '🚪\n'
+    '🚫\n'
+    '🚬\n'
+    '🚭\n'
+    '🚮\n'
+    '🚯\n'
+    '🚰\n'
+    '🚱\n'
+    '🚲\n'
+    '🚳\n'
+    '🚴\n'
+    '🚴\u200d♀\n'
+    '🚴\u200d♀️\n'
+    '🚴\u200d♂\n'
+    '🚴\u200d♂️\n'
+    '🚴🏻\n'
+    '🚴🏻\u200d♀\n'
+    '🚴🏻\u200d♀️\n'
+    '🚴🏻\u200d♂\n'
+    '🚴🏻\u200d♂️\n'
+    '🚴🏼\n'
+    '🚴🏼\u200d♀\n'
+    '🚴🏼\u200d♀️\n'
+    '🚴🏼\u200d♂\n'
+    '🚴🏼\u200d♂️\n'
+    '🚴🏽\n'
+    '🚴🏽\u200d♀\n'
+    '🚴🏽\u200d♀️\n'
+    '🚴🏽\u200d♂\n'
+    '🚴🏽\u200d♂️\n'
+    '🚴🏾\n'
+    '🚴🏾\u200d♀\n'
+    '🚴🏾\u200d♀️\n'
+    '🚴🏾\u200d♂\n'
+    '🚴🏾\u200d♂️\n'
+    '🚴🏿\n'
+    '🚴🏿\u200d♀\n'
+    '🚴🏿\u200d♀️\n'
+    '🚴🏿\u200d♂\n'
+    '🚴🏿\u200d♂️\n'
+    '🚵\n'
+    '🚵\u200d♀\n'
+    '🚵\u200d♀️\n'
+    '🚵\u200d♂\n'
+    '🚵\u200d♂️\n'
+    '🚵🏻\n'
+    '🚵🏻\u200d♀\n'
+    '🚵🏻\u200d♀️\n'
+    '🚵🏻\u200d♂\n'
+    '🚵🏻\u200d♂️\n'
+    '🚵🏼\n'
+    '🚵🏼\u200d♀\n'
+    '🚵🏼\u200d♀️\n'
+    '🚵🏼\u200d♂\n'
+    '🚵🏼\u200d♂️\n'
+    '🚵🏽\n'
+    '🚵🏽\u200d♀\n'
+    '🚵🏽\u200d♀️\n'
+    '🚵🏽\u200d♂\n'
+    '🚵🏽\u200d♂️\n'
+    '🚵🏾\n'
+    '🚵🏾\u200d♀\n'
+    '🚵🏾\u200d♀️\n'
+    '🚵🏾\u200d♂\n'
+    '🚵🏾\u200d♂️\n'
+    '🚵🏿\n'
+    '🚵🏿\u200d♀\n'
+    '🚵🏿\u200d♀️\n'
+    '🚵🏿\u200d♂\n'
+    '🚵🏿\u200d♂️\n'
+    '🚶\n'
+    '🚶\u200d♀\n'
+    '🚶\u200d♀\u200d➡\n'
+    '🚶\u200d♀\u200d➡️\n'
+    '🚶\u200d♀️\n'
+    '🚶\u200d♀️\u200d➡\n'
+    '🚶\u200d♀️\u200d➡️\n'
+    '🚶\u200d♂\n'
+    '🚶\u200d♂\u200d➡\n'
+    '🚶\u200d♂\u200d➡️\n'
+    '🚶\u200d♂️\n'
+    '🚶\u200d♂️\u200d➡\n'
+    '🚶\u200d♂️\u200d➡️\n'
+    '🚶\u200d➡\n'
+    '🚶\u200d➡️\n'
+    '🚶🏻\n'
+    '🚶🏻\u200d♀\n'
+    '🚶🏻\u200d♀\u200d➡\n'
+    '🚶🏻\u200d♀\u200d➡️\n'
+    '🚶🏻\u200d♀️\n'
+    '🚶🏻\u200d♀️\u200d➡\n'
+    '🚶🏻\u200d♀️\u200d➡️\n'
+    '🚶🏻\u200d♂\n'
+    '🚶🏻\u200d♂\u200d➡\n'
+    '🚶🏻\u200d♂\u200d➡️\n'
+    '🚶🏻\u200d♂️\n'
+    '🚶🏻\u200d♂️\u200d➡\n'
+    '🚶🏻\u200d♂️\u200d➡️\n'
+    '🚶🏻\u200d➡\n'
+    '🚶🏻\u200d➡️\n'
+    '🚶🏼\n'
+    '🚶🏼\u200d♀\n'
+    '🚶🏼\u200d♀\u200d➡\n'
+    '🚶🏼\u200d♀\u200d➡️\n'
+    '🚶🏼\u200d♀️\n'
+    '🚶🏼\u200d♀️\u200d➡\n'
+    '🚶🏼\u200d♀️\u200d➡️\n'
+    '🚶🏼\u200d♂\n'
+    '🚶🏼\u200d♂\u200d➡\n'
+    '🚶🏼\u200d♂\u200d➡️\n'
+    '🚶🏼\u200d♂️\n'
+    '🚶🏼\u200d♂️\u200d➡\n'
+    '🚶🏼\u200d♂️\u200d➡️\n'
+    '🚶🏼\u200d➡\n'
+    '🚶🏼\u200d➡️\n'
+    '🚶🏽\n'
+    '🚶🏽\u200d♀\n'
+    '🚶🏽\u200d♀\u200d➡\n'
+    '🚶🏽\u200d♀\u200d➡️\n'
+    '🚶🏽\u200d♀️\n'
+    '🚶🏽\u200d♀️\u200d➡\n'
+    '🚶🏽\u200d♀️\u200d➡️\n'
+    '🚶🏽\u200d♂\n'
+    '🚶🏽\u200d♂\u200d➡\n'
+    '🚶🏽\u200d♂\u200d➡️\n'
+    '🚶🏽\u200d♂️\n'
+    '🚶🏽\u200d♂️\u200d➡\n'
+    '🚶🏽\u200d♂️\u200d➡️\n'
+    '🚶🏽\u200d➡\n'
+    '🚶🏽\u200d➡️\n'
+    '🚶🏾\n'
+    '🚶🏾\u200d♀\n'
+    '🚶🏾\u200d♀\u200d➡\n'
+    '🚶🏾\u200d♀\u200d➡️\n'
+    '🚶🏾\u200d♀️\n'
+    '🚶🏾\u200d♀️\u200d➡\n'
+    '🚶🏾\u200d♀️\u200d➡️\n'
+    '🚶🏾\u200d♂\n'
+    '🚶🏾\u200d♂\u200d➡\n'
+    '🚶🏾\u200d♂\u200d➡️\n'
+    '🚶🏾\u200d♂️\n'
+    '🚶🏾\u200d♂️\u200d➡\n'
+    '🚶🏾\u200d♂️\u200d➡️\n'
+    '🚶🏾\u200d➡\n'
+    '🚶🏾\u200d➡️\n'
+    '🚶🏿\n'
+    '🚶🏿\u200d♀\n'
+    '🚶🏿\u200d♀\u200d➡\n'
+    '🚶🏿\u200d♀\u200d➡️\n'
+    '🚶🏿\u200d♀️\n'
+    '🚶🏿\u200d♀️\u200d➡\n'
+    '🚶🏿\u200d♀️\u200d➡️\n'
+    '🚶🏿\u200d♂\n'
+    '🚶🏿\u200d♂\u200d➡\n'
+    '🚶🏿\u200d♂\u200d➡️\n'
+    '🚶🏿\u200d♂️\n'
+    '🚶🏿\u200d♂️\u200d➡\n'
+    '🚶🏿\u200d♂️\u200d➡️\n'
+    '🚶🏿\u200d➡\n'
+    '🚶🏿\u200d➡️\n'
+    '🚷\n'
+    '🚸\n'
+    '🚹\n'
+    '🚺\n'
+    '🚻\n'
+    '🚼\n'
+    '🚽\n'
+    '🚾\n'
+    '🚿\n'
+    '🛀\n'
+    '🛀🏻\n'
+    '🛀🏼\n'
+    '🛀🏽\n'
+    '🛀🏾\n'
+    '🛀🏿\n'
+    '🛁\n'
+    '🛂\n'
+    '🛃\n'
+    '🛄\n'
+    '🛅\n'
+    '🛋\n'
+    '🛋️\n'
+    '🛌\n'
+    '🛌🏻\n'
+    '🛌🏼\n'
+    '🛌🏽\n'
+    '🛌🏾\n'
+    '🛌🏿\n'
+    '🛍\n'
+    '🛍️\n'
+    '🛎\n'
+    '🛎️\n'
+    '🛏\n'
+    '🛏️\n'
+    '🛐\n'
+    '🛑\n'
+    '🛒\n'
+    '🛕\n'
+    '🛖\n'
+    '🛗\n'
+    '🛜\n'
+    '🛝\n'
+    '🛞\n'
+    '🛟\n'
+    '🛠\n'
+    '🛠️\n'
+    '🛡\n'
+    '🛡️\n'
+    '🛢\n'
+    '🛢️\n'
+    '🛣\n'
+    '🛣️\n'
+    '🛤\n'
+    '🛤️\n'
+    '🛥\n'
+    '🛥️\n'
+    '🛩\n'
+    '🛩️\n'
+    '🛫\n'
+    '🛬\n'
+    '🛰\n'
+    '🛰️\n'
+    '🛳\n'
+    '🛳️\n'
+    '🛴\n'
+    '🛵\n'
+    '🛶\n'
+    '🛷\n'
+    '🛸\n'
+    '🛹\n'
+    '🛺\n'
+    '🛻\n'
+    '🛼\n'
+    '🟠\n'
+    '🟡\n'
+    '🟢\n'
+    '🟣\n'
+    '🟤\n'
+    '🟥\n'
+    '🟦\n'
+    '🟧\n'
+    '🟨\n'
+    '🟩\n'
+    '🟪\n'
+    '🟫\n'
+    '🟰\n'
+    '🤌\n'
+    '🤌🏻\n'
+    '🤌🏼\n'
+    '🤌🏽\n'
+    '🤌🏾\n'
+    '🤌🏿\n'
+    '🤍\n'
+    '🤎\n'
+    '🤏\n'
+    '🤏🏻\n'
+    '🤏🏼\n'
+    '🤏🏽\n'
+    '🤏🏾\n'
+    '🤏🏿\n'
+    '🤐\n'
+    '🤑\n'
+    '🤒\n'
+    '🤓\n'
+    '🤔\n'
+    '🤕\n'
+    '🤖\n'
+    '🤗\n'
+    '🤘\n'
+    '🤘🏻\n'
+    '🤘🏼\n'
+    '🤘🏽\n'
+    '🤘🏾\n'
+    '🤘🏿\n'
+    '🤙\n'
+    '🤙🏻\n'
+    '🤙🏼\n'
+    '🤙🏽\n'
+    '🤙🏾\n'
+    '🤙🏿\n'
+    '🤚\n'
+    '🤚🏻\n'
+    '🤚🏼\n'
+    '🤚🏽\n'
+    '🤚🏾\n'
+    '🤚🏿\n'
+    '🤛\n'
+    '🤛🏻\n'
+    '🤛🏼\n'
+    '🤛🏽\n'
+    '🤛🏾\n'
+    '🤛🏿\n'
+    '🤜\n'
+    '🤜🏻\n'
+    '🤜🏼\n'
+    '🤜🏽\n'
+    '🤜🏾\n'
+    '🤜🏿\n'
+    '🤝\n'
+    '🤝🏻\n'
+    '🤝🏼\n'
+    '🤝🏽\n'
+    '🤝🏾\n'
+    '🤝🏿\n'
+    '🤞\n'
+    '🤞🏻\n'
+    '🤞🏼\n'
+    '🤞🏽\n'
+    '🤞🏾\n'
+    '🤞🏿\n'
+    '🤟\n'
+    '🤟🏻\n'
+    '🤟🏼\n'
+    '🤟🏽\n'
+    '🤟🏾\n'
+    '🤟🏿\n'
+    '🤠\n'
+    '🤡\n'
+    '🤢\n'
+    '🤣\n'
+    '🤤\n'
+    '🤥\n'
+    '🤦\n'
+    '🤦\u200d♀\n'
+    '🤦\u200d♀️\n'
+    '🤦\u200d♂\n'
+    '🤦\u200d♂️\n'
+    '🤦🏻\n'
+    '🤦🏻\u200d♀\n'
+    '🤦🏻\u200d♀️\n'
+    '🤦🏻\u200d♂\n'
+    '🤦🏻\u200d♂️\n'
+    '🤦🏼\n'
+    '🤦🏼\u200d♀\n'
+    '🤦🏼\u200d♀️\n'
+    '🤦🏼\u200d♂\n'
+    '🤦🏼\u200d♂️\n'
+    '🤦🏽\n'
+    '🤦🏽\u200d♀\n'
+    '🤦🏽\u200d♀️\n'
+    '🤦🏽\u200d♂\n'
+    '🤦🏽\u200d♂️\n'
+    '🤦🏾\n'
+    '🤦🏾\u200d♀\n'
+    '🤦🏾\u200d♀️\n'
+    '🤦🏾\u200d♂\n'
+    '🤦🏾\u200d♂️\n'
+    '🤦🏿\n'
+    '🤦🏿\u200d♀\n'
+    '🤦🏿\u200d♀️\n'
+    '🤦🏿\u200d♂\n'
+    '🤦🏿\u200d♂️\n'
+    '🤧\n'
+    '🤨\n'
+    '🤩\n'
+    '🤪\n'
+    '🤫\n'
+    '🤬\n'
+    '🤭\n'
+    '🤮\n'
+    '🤯\n'
+    '🤰\n'
+    '🤰🏻\n'
+    '🤰🏼\n'
+    '🤰🏽\n'
+    '🤰🏾\n'
+    '🤰🏿\n'
+    '🤱\n'
+    '🤱🏻\n'
+    '🤱🏼\n'
+    '🤱🏽\n'
+    '🤱🏾\n'
+    '🤱🏿\n'
+    '🤲\n'
+    '🤲🏻\n'
+    '🤲🏼\n'
+    '🤲🏽\n'
+    '🤲🏾\n'
+    '🤲🏿\n'
+    '🤳\n'
+    '🤳🏻\n'
+    '🤳🏼\n'
+    '🤳🏽\n'
+    '🤳🏾\n'
+    '🤳🏿\n'
+    '🤴\n'
+    '🤴🏻\n'
+    '🤴🏼\n'
+    '🤴🏽\n'
+    '🤴🏾\n'
+    '🤴🏿\n'
+    '🤵\n'
+    '🤵\u200d♀\n'
+    '🤵\u200d♀️\n'
+    '🤵\u200d♂\n'
+    '🤵\u200d♂️\n'
+    '🤵🏻\n'
+    '🤵🏻\u200d♀\n'
+    '🤵🏻\u200d♀️\n'
+    '🤵🏻\u200d♂\n'
+    '🤵🏻\u200d♂️\n'
+    '🤵🏼\n'
+    '🤵🏼\u200d♀\n'
+    '🤵🏼\u200d♀️\n'
+    '🤵🏼\u200d♂\n'
+    '🤵🏼\u200d♂️\n'
+    '🤵🏽\n'
+    '🤵🏽\u200d♀\n'
+    '🤵🏽\u200d♀️\n'
+    '🤵🏽\u200d♂\n'
+    '🤵🏽\u200d♂️\n'
+    '🤵🏾\n'
+    '🤵🏾\u200d♀\n'
+    '🤵🏾\u200d♀️\n'
+    '🤵🏾\u200d♂\n'
+    '🤵🏾\u200d♂️\n'
+    '🤵🏿\n'
+    '🤵🏿\u200d♀\n'
+    '🤵🏿\u200d♀️\n'
+    '🤵🏿\u200d♂\n'
+    '🤵🏿\u200d♂️\n'
+    '🤶\n'
+    '🤶🏻\n'
+    '🤶🏼\n'
+    '🤶🏽\n'
+    '🤶🏾\n'
+    '🤶🏿\n'
+    '🤷\n'
+    '🤷\u200d♀\n'
+    '🤷\u200d♀️\n'
+    '🤷\u200d♂\n'
+    '🤷\u200d♂️\n'
+    '🤷🏻\n'
+    '🤷🏻\u200d♀\n'
+    '🤷🏻\u200d♀️\n'
+    '🤷🏻\u200d♂\n'
+    '🤷🏻\u200d♂️\n'
+    '🤷🏼\n'
+    '🤷🏼\u200d♀\n'
+    '🤷🏼\u200d♀️\n'
+    '🤷🏼\u200d♂\n'
+    '🤷🏼\u200d♂️\n'
+    '🤷🏽\n'
+    '🤷🏽\u200d♀\n'
+    '🤷🏽\u200d♀️\n'
+    '🤷🏽\u200d♂\n'
+    '🤷🏽\u200d♂️\n'
+    '🤷🏾\n'
+    '🤷🏾\u200d♀\n'
+    '🤷🏾\u200d♀️\n'
+    '🤷🏾\u200d♂\n'
+    '🤷🏾\u200d♂️\n'
+    '🤷🏿\n'
+    '🤷🏿\u200d♀\n'
+    '🤷🏿\u200d♀️\n'
+    '🤷🏿\u200d♂\n'
+    '🤷🏿\u200d♂️\n'
+    '🤸\n'
+    '🤸\u200d♀\n'
+    '🤸\u200d♀️\n'
+    '🤸\u200d♂\n'
+    '🤸\u200d♂️\n'
+    '🤸🏻\n'
+    '🤸🏻\u200d♀\n'
+    '🤸🏻\u200d♀️\n'
+    '🤸🏻\u200d♂\n'
+    '🤸🏻\u200d♂️\n'
+    '🤸🏼\n'
+    '🤸🏼\u200d♀\n'
+    '🤸🏼\u200d♀️\n'
+    '🤸🏼\u200d♂\n'
+    '🤸🏼\u200d♂️\n'
+    '🤸🏽\n'
+    '🤸🏽\u200d♀\n'
+    '🤸🏽\u200d♀️\n'
+    '🤸🏽\u200d♂\n'
+    '🤸🏽\u200d♂️\n'
+    '🤸🏾\n'
+    '🤸🏾\u200d♀\n'
+    '🤸🏾\u200d♀️\n'
+    '🤸🏾\u200d♂\n'
+    '🤸🏾\u200d♂️\n'
+    '🤸🏿\n'
+    '🤸🏿\u200d♀\n'
+    '🤸🏿\u200d♀️\n'
+    '🤸🏿\u200d♂\n'
+    '🤸🏿\u200d♂️\n'
+    '🤹\n'
+    '🤹\u200d♀\n'
+    '🤹\u200d♀️\n'
+    '🤹\u200d♂\n'
+    '🤹\u200d♂️\n'
+    '🤹🏻\n'
+    '🤹🏻\u200d♀\n'
+    '🤹🏻\u200d♀️\n'
+    '🤹🏻\u200d♂\n'
+    '🤹🏻\u200d♂️\n'
+    '🤹🏼\n'
+    '🤹🏼\u200d♀\n'
+    '🤹🏼\u200d♀️\n'
+    '🤹🏼\u200d♂\n'
+    '🤹🏼\u200d♂️\n'
+    '🤹🏽\n'
+    '🤹🏽\u200d♀\n'
+    '🤹🏽\u200d♀️\n'
+    '🤹🏽\u200d♂\n'
+    '🤹🏽\u200d♂️\n'
+    '🤹🏾\n'
+    '🤹🏾\u200d♀\n'
+    '🤹🏾\u200d♀️\n'
+    '🤹🏾\u200d♂\n'
+    '🤹🏾\u200d♂️\n'
+    '🤹🏿\n'
+    '🤹🏿\u200d♀\n'
+    '🤹🏿\u200d♀️\n'
+    '🤹🏿\u200d♂\n'
+    '🤹🏿\u200d♂️\n'
+    '🤺\n'
+    '🤼\n'
+    '🤼\u200d♀\n'
+    '🤼\u200d♀️\n'
+    '🤼\u200d♂\n'
+    '🤼\u200d♂️\n'
+    '🤽\n'
+    '🤽\u200d♀\n'
+    '🤽\u200d♀️\n'
+    '🤽\u200d♂\n'
+    '🤽\u200d♂️\n'
+    '🤽🏻\n'
+    '🤽🏻\u200d♀\n'
+    '🤽🏻\u200d♀️\n'
+    '🤽🏻\u200d♂\n'
+    '🤽🏻\u200d♂️\n'
+    '🤽🏼\n'
+    '🤽🏼\u200d♀\n'
+    '🤽🏼\u200d♀️\n'
+    '🤽🏼\u200d♂\n'
+    '🤽🏼\u200d♂️\n'
+    '🤽🏽\n'
+    '🤽🏽\u200d♀\n'
+    '🤽🏽\u200d♀️\n'
+    '🤽🏽\u200d♂\n'
+    '🤽🏽\u200d♂️\n'
+    '🤽🏾\n'
+    '🤽🏾\u200d♀\n'
+    '🤽🏾\u200d♀️\n'
+    '🤽🏾\u200d♂\n'
+    '🤽🏾\u200d♂️\n'
+    '🤽🏿\n'
+    '🤽🏿\u200d♀\n'
+    '🤽🏿\u200d♀️\n'
+    '🤽🏿\u200d♂\n'
+    '🤽🏿\u200d♂️\n'
+    '🤾\n'
+    '🤾\u200d♀\n'
+    '🤾\u200d♀️\n'
+    '🤾\u200d♂\n'
+    '🤾\u200d♂️\n'
+    '🤾🏻\n'
+    '🤾🏻\u200d♀\n'
+    '🤾🏻\u200d♀️\n'
+    '🤾🏻\u200d♂\n'
+    '🤾🏻\u200d♂️\n'
+    '🤾🏼\n'
+    '🤾🏼\u200d♀\n'
+    '🤾🏼\u200d♀️\n'
+    '🤾🏼\u200d♂\n'
+    '🤾🏼\u200d♂️\n'
+    '🤾🏽\n'
+    '🤾🏽\u200d♀\n'
+    '🤾🏽\u200d♀️\n'
+    '🤾🏽\u200d♂\n'
+    '🤾🏽\u200d♂️\n'
+    '🤾🏾\n'
+    '🤾🏾\u200d♀\n'
+    '🤾🏾\u200d♀️\n'
+    '🤾🏾\u200d♂\n'
+    '🤾🏾\u200d♂️\n'
+    '🤾🏿\n'
+    '🤾🏿\u200d♀\n'
+    '🤾🏿\u200d♀️\n'
+    '🤾🏿\u200d♂\n'
+    '🤾🏿\u200d♂️\n'
+    '🤿\n'
+    '🥀\n'
+    '🥁\n'
+    '🥂\n'
+    '🥃\n'
+    '🥄\n'
+    '🥅\n'
+    '🥇\n'
+    '🥈\n'
+    '🥉\n'
+    '🥊\n'
+    '🥋\n'
+    '🥌\n'
+    '🥍\n'
+    '🥎\n'
+    '🥏\n'
+    '🥐\n'
+    '🥑\n'
+    '🥒\n'
+    '🥓\n'
+    '🥔\n'
+    '🥕\n'
+    '🥖\n'
+    '🥗\n'
+    '🥘\n'
+    '🥙\n'
+    '🥚\n'
+    '🥛\n'
+    '🥜\n'
+    '🥝\n'
+    '🥞\n'
+    '🥟\n'
+    '🥠\n'
+    '🥡\n'
+    '🥢\n'
+    '🥣\n'
+    '🥤\n'
+    '🥥\n'
+    '🥦\n'
+    '🥧\n'
+    '🥨\n'
+    '🥩\n'
+    '🥪\n'
+    '🥫\n'
+    '🥬\n'
+    '🥭\n'
+    '🥮\n'
+    '🥯\n'
+    '🥰\n'
+    '🥱\n'
+    '🥲\n'
+    '🥳\n'
+    '🥴\n'
+    '🥵\n'
+    '🥶\n'
+    '🥷\n'
+    '🥷🏻\n'
+    '🥷🏼\n'
+    '🥷🏽\n'
+    '🥷🏾\n'
+    '🥷🏿\n'
+    '🥸\n'
+    '🥹\n'
+    '🥺\n'
+    '🥻\n'
+    '🥼\n'
+    '🥽\n'
+    '🥾\n'
+    '🥿\n'
+    '🦀\n'
+    '🦁\n'
+    '🦂\n'
+    '🦃\n'
+    '🦄\n'
+    '🦅\n'
+    '🦆\n'
+    '🦇\n'
+    '🦈\n'
+    '🦉\n'
+    '🦊\n'
+    '🦋\n'
+    '🦌\n'
+    '🦍\n'
+    '🦎\n'
+    '🦏\n'
+    '🦐\n'
+    '🦑\n'
+    '🦒\n'
+    '🦓\n'
+    '🦔\n'
+    '🦕\n'
+    '🦖\n'
+    '🦗\n'
+    '🦘\n'
+    '🦙\n'
+    '🦚\n'
+    '🦛\n'
+    '🦜\n'
+    '🦝\n'
+    '🦞\n'
+    '🦟\n'
+    '🦠\n'
+    '🦡\n'
+    '🦢\n'
+    '🦣\n'
+    '🦤\n'
+    '🦥\n'
+    '🦦\n'
+    '🦧\n'
+    '🦨\n'
+    '🦩\n'
+    '🦪\n'
+    '🦫\n'
+    '🦬\n'
+    '🦭\n'
+    '🦮\n'
+    '🦯\n'
+    '🦰\n'
+    '🦱\n'
+    '🦲\n'
+    '🦳\n'
+    '🦴\n'
+    '🦵\n'
+    '🦵🏻\n'
+    '🦵🏼\n'
+    '🦵🏽\n'
+    '🦵🏾\n'
+    '🦵🏿\n'
+    '🦶\n'
+    '🦶🏻\n'
+    '🦶🏼\n'
+    '🦶🏽\n'
+    '🦶🏾\n'
+    '🦶🏿\n'
+    '🦷\n'
+    '🦸\n'
+    '🦸\u200d♀\n'
+    '🦸\u200d♀️\n'
+    '🦸\u200d♂\n'
+    '🦸\u200d♂️\n'
+    '🦸🏻\n'
+    '🦸🏻\u200d♀\n'
+    '🦸🏻\u200d♀️\n'
+    '🦸🏻\u200d♂\n'
+    '🦸🏻\u200d♂️\n'
+    '🦸🏼\n'
+    '🦸🏼\u200d♀\n'
+    '🦸🏼\u200d♀️\n'
+    '🦸🏼\u200d♂\n'
+    '🦸🏼\u200d♂️\n'
+    '🦸🏽\n'
+    '🦸🏽\u200d♀\n'
+    '🦸🏽\u200d♀️\n'
+    '🦸🏽\u200d♂\n'
+    '🦸🏽\u200d♂️\n'
+    '🦸🏾\n'
+    '🦸🏾\u200d♀\n'
+    '🦸🏾\u200d♀️\n'
+    '🦸🏾\u200d♂\n'
+    '🦸🏾\u200d♂️\n'
+    '🦸🏿\n'
+    '🦸🏿\u200d♀\n'
+    '🦸🏿\u200d♀️\n'
+    '🦸🏿\u200d♂\n'
+    '🦸🏿\u200d♂️\n'
+    '🦹\n'
+    '🦹\u200d♀\n'
+    '🦹\u200d♀️\n'
+    '🦹\u200d♂\n'
+    '🦹\u200d♂️\n'
+    '🦹🏻\n'
+    '🦹🏻\u200d♀\n'
+    '🦹🏻\u200d♀️\n'
+    '🦹🏻\u200d♂\n'
+    '🦹🏻\u200d♂️\n'
+    '🦹🏼\n'
+    '🦹🏼\u200d♀\n'
+    '🦹🏼\u200d♀️\n'
+    '🦹🏼\u200d♂\n'
+    '🦹🏼\u200d♂️\n'
+    '🦹🏽\n'
+    '🦹🏽\u200d♀\n'
+    '🦹🏽\u200d♀️\n'
+    '🦹🏽\u200d♂\n'
+    '🦹🏽\u200d♂️\n'
+    '🦹🏾\n'
+    '🦹🏾\u200d♀\n'
+    '🦹🏾\u200d♀️\n'
+    '🦹🏾\u200d♂\n'
+    '🦹🏾\u200d♂️\n'
+    '🦹🏿\n'
+    '🦹🏿\u200d♀\n'
+    '🦹🏿\u200d♀️\n'
+    '🦹🏿\u200d♂\n'
+    '🦹🏿\u200d♂️\n'
+    '🦺\n'
+    '🦻\n'
+    '🦻🏻\n'
+    '🦻🏼\n'
+    '🦻🏽\n'
+    '🦻🏾\n'
+    '🦻🏿\n'
+    '🦼\n'
+    '🦽\n'
+    '🦾\n'
+    '🦿\n'
+    '🧀\n'
+    '🧁\n'
+    '🧂\n'
+    '🧃\n'
+    '🧄\n'
+    '🧅\n'
+    '🧆\n'
+    '🧇\n'
+    '🧈\n'
+    '🧉\n'
+    '🧊\n'
+    '🧋\n'
+    '🧌\n'
+    '🧍\n'
+    '🧍\u200d♀\n'
+    '🧍\u200d♀️\n'
+    '🧍\u200d♂\n'
+    '🧍\u200d♂️\n'
+    '🧍🏻\n'
+    '🧍🏻\u200d♀\n'
+    '🧍🏻\u200d♀️\n'
+    '🧍🏻\u200d♂\n'
+    '🧍🏻\u200d♂️\n'
+    '🧍🏼\n'
+    '🧍🏼\u200d♀\n'
+    '🧍🏼\u200d♀️\n'
+    '🧍🏼\u200d♂\n'
+    '🧍🏼\u200d♂️\n'
+    '🧍🏽\n'
+    '🧍🏽\u200d♀\n'
+    '🧍🏽\u200d♀️\n'
+    '🧍🏽\u200d♂\n'
+    '🧍🏽\u200d♂️\n'
+    '🧍🏾\n'
+    '🧍🏾\u200d♀\n'
+    '🧍🏾\u200d♀️\n'
+    '🧍🏾\u200d♂\n'
+    '🧍🏾\u200d♂️\n'
+    '🧍🏿\n'
+    '🧍🏿\u200d♀\n'
+    '🧍🏿\u200d♀️\n'
+    '🧍🏿\u200d♂\n'
+    '🧍🏿\u200d♂️\n'
+    '🧎\n'
+    '🧎\u200d♀\n'
+    '🧎\u200d♀\u200d➡\n'
+    '🧎\u200d♀\u200d➡️\n'
+    '🧎\u200d♀️\n'
+    '🧎\u200d♀️\u200d➡\n'
+    '🧎\u200d♀️\u200d➡️\n'
+    '🧎\u200d♂\n'
+    '🧎\u200d♂\u200d➡\n'
+    '🧎\u200d♂\u200d➡️\n'
+    '🧎\u200d♂️\n'
+    '🧎\u200d♂️\u200d➡\n'
+    '🧎\u200d♂️\u200d➡️\n'
+    '🧎\u200d➡\n'
+    '🧎\u200d➡️\n'
+    '🧎🏻\n'
+    '🧎🏻\u200d♀\n'
+    '🧎🏻\u200d♀\u200d➡\n'
+    '🧎🏻\u200d♀\u200d➡️\n'
+    '🧎🏻\u200d♀️\n'
+    '🧎🏻\u200d♀️\u200d➡\n'
+    '🧎🏻\u200d♀️\u200d➡️\n'
+    '🧎🏻\u200d♂\n'
+    '🧎🏻\u200d♂\u200d➡\n'
+    '🧎🏻\u200d♂\u200d➡️\n'
+    '🧎🏻\u200d♂️\n'
+    '🧎🏻\u200d♂️\u200d➡\n'
+    '🧎🏻\u200d♂️\u200d➡️\n'
+    '🧎🏻\u200d➡\n'
+    '🧎🏻\u200d➡️\n'
+    '🧎🏼\n'
+    '🧎🏼\u200d♀\n'
+    '🧎🏼\u200d♀\u200d➡\n'
+    '🧎🏼\u200d♀\u200d➡️\n'
+    '🧎🏼\u200d♀️\n'
+    '🧎🏼\u200d♀️\u200d➡\n'
+    '🧎🏼\u200d♀️\u200d➡️\n'
+    '🧎🏼\u200d♂\n'
+    '🧎🏼\u200d♂\u200d➡\n'
+    '🧎🏼\u200d♂\u200d➡️\n'
+    '🧎🏼\u200d♂️\n'
+    '🧎🏼\u200d♂️\u200d➡\n'
+    '🧎🏼\u200d♂️\u200d➡️\n'
+    '🧎🏼\u200d➡\n'
+    '🧎🏼\u200d➡️\n'
+    '🧎🏽\n'
+    '🧎🏽\u200d♀\n'
+    '🧎🏽\u200d♀\u200d➡\n'
+    '🧎🏽\u200d♀\u200d➡️\n'
+    '🧎🏽\u200d♀️\n'
+    '🧎🏽\u200d♀️\u200d➡\n'
+    '🧎🏽\u200d♀️\u200d➡️\n'
+    '🧎🏽\u200d♂\n'
+    '🧎🏽\u200d♂\u200d➡\n'
+    '🧎🏽\u200d♂\u200d➡️\n'
+    '🧎🏽\u200d♂️\n'
+    '🧎🏽\u200d♂️\u200d➡\n'
+    '🧎🏽\u200d♂️\u200d➡️\n'
+    '🧎🏽\u200d➡\n'
+    '🧎🏽\u200d➡️\n'
+    '🧎🏾\n'
+    '🧎🏾\u200d♀\n'
+    '🧎🏾\u200d♀\u200d➡\n'
+    '🧎🏾\u200d♀\u200d➡️\n'
+    '🧎🏾\u200d♀️\n'
+    '🧎🏾\u200d♀️\u200d➡\n'
+    '🧎🏾\u200d♀️\u200d➡️\n'
+    '🧎🏾\u200d♂\n'
+    '🧎🏾\u200d♂\u200d➡\n'
+    '🧎🏾\u200d♂\u200d➡️\n'
+    '🧎🏾\u200d♂️\n'
+    '🧎🏾\u200d♂️\u200d➡\n'
+    '🧎🏾\u200d♂️\u200d➡️\n'
+    '🧎🏾\u200d➡\n'
+    '🧎🏾\u200d➡️\n'
+    '🧎🏿\n'
+    '🧎🏿\u200d♀\n'
+    '🧎🏿\u200d♀\u200d➡\n'
+    '🧎🏿\u200d♀\u200d➡️\n'
+    '🧎🏿\u200d♀️\n'
+    '🧎🏿\u200d♀️\u200d➡\n'
+    '🧎🏿\u200d♀️\u200d➡️\n'
+    '🧎🏿\u200d♂\n'
+    '🧎🏿\u200d♂\u200d➡\n'
+    '🧎🏿\u200d♂\u200d➡️\n'
+    '🧎🏿\u200d♂️\n'
+    '🧎🏿\u200d♂️\u200d➡\n'
+    '🧎🏿\u200d♂️\u200d➡️\n'
+    '🧎🏿\u200d➡\n'
+    '🧎🏿\u200d➡️\n'
+    '🧏\n'
+    '🧏\u200d♀\n'
+    '🧏\u200d♀️\n'
+    '🧏\u200d♂\n'
+    '🧏\u200d♂️\n'
+    '🧏🏻\n'
+    '🧏🏻\u200d♀\n'
+    '🧏🏻\u200d♀️\n'
+    '🧏🏻\u200d♂\n'
+    '🧏🏻\u200d♂️\n'
+    '🧏🏼\n'
+    '🧏🏼\u200d♀\n'
+    '🧏🏼\u200d♀️\n'
+    '🧏🏼\u200d♂\n'
+    '🧏🏼\u200d♂️\n'
+    '🧏🏽\n'
+    '🧏🏽\u200d♀\n'
+    '🧏🏽\u200d♀️\n'
+    '🧏🏽\u200d♂\n'
+    '🧏🏽\u200d♂️\n'
+    '🧏🏾\n'
+    '🧏🏾\u200d♀\n'
+    '🧏🏾\u200d♀️\n'
+    '🧏🏾\u200d♂\n'
+    '🧏🏾\u200d♂️\n'
+    '🧏🏿\n'
+    '🧏🏿\u200d♀\n'
+    '🧏🏿\u200d♀️\n'
+    '🧏🏿\u200d♂\n'
+    '🧏🏿\u200d♂️\n'
+    '🧐\n'
+    '🧑\n'
+    '🧑\u200d⚕\n'
+    '🧑\u200d⚕️\n'
+    '🧑\u200d⚖\n'
+    '🧑\u200d⚖️\n'
+    '🧑\u200d✈\n'
+    '🧑\u200d✈️\n'
+    '🧑\u200d🌾\n'
+    '🧑\u200d🍳\n'
+    '🧑\u200d🍼\n'
+    '🧑\u200d🎄\n'
+    '🧑\u200d🎓\n'
+    '🧑\u200d🎤\n'
+    '🧑\u200d🎨\n'
+    '🧑\u200d🏫\n'
+    '🧑\u200d🏭\n'
+    '🧑\u200d💻\n'
+    '🧑\u200d💼\n'
+    '🧑\u200d🔧\n'
+    '🧑\u200d🔬\n'
+    '🧑\u200d🚀\n'
+    '🧑\u200d🚒\n'
+    '🧑\u200d🤝\u200d🧑\n'
+    '🧑\u200d🦯\n'
+    '🧑\u200d🦯\u200d➡\n'
+    '🧑\u200d🦯\u200d➡️\n'
+    '🧑\u200d🦰\n'
+    '🧑\u200d🦱\n'
+    '🧑\u200d🦲\n'
+    '🧑\u200d🦳\n'
+    '🧑\u200d🦼\n'
+    '🧑\u200d🦼\u200d➡\n'
+    '🧑\u200d🦼\u200d➡️\n'
+    '🧑\u200d🦽\n'
+    '🧑\u200d🦽\u200d➡\n'
+    '🧑\u200d🦽\u200d➡️\n'
+    '🧑\u200d🧑\u200d🧒\n'
+    '🧑\u200d🧑\u200d🧒\u200d🧒\n'
+    '🧑\u200d🧒\n'
+    '🧑\u200d🧒\u200d🧒\n'
+    '🧑🏻\n'
+    '🧑🏻\u200d⚕\n'
+    '🧑🏻\u200d⚕️\n'
+    '🧑🏻\u200d⚖\n'
+    '🧑🏻\u200d⚖️\n'
+    '🧑🏻\u200d✈\n'
+    '🧑🏻\u200d✈️\n'
+    '🧑🏻\u200d❤\u200d💋\u200d🧑🏼\n'
+    '🧑🏻\u200d❤\u200d💋\u200d🧑🏽\n'
+    '🧑🏻\u200d❤\u200d💋\u200d🧑🏾\n'
+    '🧑🏻\u200d❤\u200d💋\u200d🧑🏿\n'
+    '🧑🏻\u200d❤\u200d🧑🏼\n'
+    '🧑🏻\u200d❤\u200d🧑🏽\n'
+    '🧑🏻\u200d❤\u200d🧑🏾\n'
+    '🧑🏻\u200d❤\u200d🧑🏿\n'
+    '🧑🏻\u200d❤️\u200d💋\u200d🧑🏼\n'
+    '🧑🏻\u200d❤️\u200d💋\u200d🧑🏽\n'
+    '🧑🏻\u200d❤️\u200d💋\u200d🧑🏾\n'
+    '🧑🏻\u200d❤️\u200d💋\u200d🧑🏿\n'
+    '🧑🏻\u200d❤️\u200d🧑🏼\n'
+    '🧑🏻\u200d❤️\u200d🧑🏽\n'
+    '🧑🏻\u200d❤️\u200d🧑🏾\n'
+    '🧑🏻\u200d❤️\u200d🧑🏿\n'
+    '🧑🏻\u200d🌾\n'
+    '🧑🏻\u200d🍳\n'
+    '🧑🏻\u200d🍼\n'
+    '🧑🏻\u200d🎄\n'
+    '🧑🏻\u200d🎓\n'
+    '🧑🏻\u200d🎤\n'
+    '🧑🏻\u200d🎨\n'
+    '🧑🏻\u200d🏫\n'
+    '🧑🏻\u200d🏭\n'
+    '🧑🏻\u200d💻\n'
+    '🧑🏻\u200d💼\n'
+    '🧑🏻\u200d🔧\n'
+    '🧑🏻\u200d🔬\n'
+    '🧑🏻\u200d🚀\n'
+    '🧑🏻\u200d🚒\n'
+    '🧑🏻\u200d🤝\u200d🧑🏻\n'
+    '🧑🏻\u200d🤝\u200d🧑🏼\n'
+    '🧑🏻\u200d🤝\u200d🧑🏽\n'
+    '🧑🏻\u200d🤝\u200d🧑🏾\n'
+    '🧑🏻\u200d🤝\u200d🧑🏿\n'
+    '🧑🏻\u200d🦯\n'
+    '🧑🏻\u200d🦯\u200d➡\n'
+    '🧑🏻\u200d🦯\u200d➡️\n'
+    '🧑🏻\u200d🦰\n'
+    '🧑🏻\u200d🦱\n'
+    '🧑🏻\u200d🦲\n'
+    '🧑🏻\u200d🦳\n'
+    '🧑🏻\u200d🦼\n'
+    '🧑🏻\u200d🦼\u200d➡\n'
+    '🧑🏻\u200d🦼\u200d➡️\n'
+    '🧑🏻\u200d🦽\n'
+    '🧑🏻\u200d🦽\u200d➡\n'
+    '🧑🏻\u200d🦽\u200d➡️\n'
+    '🧑🏼\n'
+    '🧑🏼\u200d⚕\n'
+    '🧑🏼\u200d⚕️\n'
+    '🧑🏼\u200d⚖\n'
+    '🧑🏼\u200d⚖️\n'
+    '🧑🏼\u200d✈\n'
+    '🧑🏼\u200d✈️\n'
+    '🧑🏼\u200d❤\u200d💋\u200d🧑🏻\n'
+    '🧑🏼\u200d❤\u200d💋\u200d🧑🏽\n'
+    '🧑🏼\u200d❤\u200d💋\u200d🧑🏾\n'
+    '🧑🏼\u200d❤\u200d💋\u200d🧑🏿\n'
+    '🧑🏼\u200d❤\u200d🧑🏻\n'
+    '🧑🏼\u200d❤\u200d🧑🏽\n'
+    '🧑🏼\u200d❤\u200d🧑🏾\n'
+    '🧑🏼\u200d❤\u200d🧑🏿\n'
+    '🧑🏼\u200d❤️\u200d💋\u200d🧑🏻\n'
+    '🧑🏼\u200d❤️\u200d💋\u200d🧑🏽\n'
+    '🧑🏼\u200d❤️\u200d💋\u200d🧑🏾\n'
+    '🧑🏼\u200d❤️\u200d💋\u200d🧑🏿\n'
+    '🧑🏼\u200d❤️\u200d🧑🏻\n'
+    '🧑🏼\u200d❤️\u200d🧑🏽\n'
+    '🧑🏼\u200d❤️\u200d🧑🏾\n'
+    '🧑🏼\u200d❤️\u200d🧑🏿\n'
+    '🧑🏼\u200d🌾\n'
+    '🧑🏼\u200d🍳\n'
+    '🧑🏼\u200d🍼\n'
+    '🧑🏼\u200d🎄\n'
+    '🧑🏼\u200d🎓\n'
+    '🧑🏼\u200d🎤\n'
+    '🧑🏼\u200d🎨\n'
+    '🧑🏼\u200d🏫\n'
+    '🧑🏼\u200d🏭\n'
+    '🧑🏼\u200d💻\n'
+    '🧑🏼\u200d💼\n'
+    '🧑🏼\u200d🔧\n'
+    '🧑🏼\u200d🔬\n'
+    '🧑🏼\u200d🚀\n'
+    '🧑🏼\u200d🚒\n'
+    '🧑🏼\u200d🤝\u200d🧑🏻\n'
+    '🧑🏼\u200d🤝\u200d🧑🏼\n'
+    '🧑🏼\u200d🤝\u200d🧑🏽\n'
+    '🧑🏼\u200d🤝\u200d🧑🏾\n'
+    '🧑🏼\u200d🤝\u200d🧑🏿\n'
+    '🧑🏼\u200d🦯\n'
+    '🧑🏼\u200d🦯\u200d➡\n'
+    '🧑🏼\u200d🦯\u200d➡️\n'
+    '🧑🏼\u200d🦰\n'
+    '🧑🏼\u200d🦱\n'
+    '🧑🏼\u200d🦲\n'
+    '🧑🏼\u200d🦳\n'
+    '🧑🏼\u200d🦼\n'
+    '🧑🏼\u200d🦼\u200d➡\n'
+    '🧑🏼\u200d🦼\u200d➡️\n'
+    '🧑🏼\u200d🦽\n'
+    '🧑🏼\u200d🦽\u200d➡\n'
+    '🧑🏼\u200d🦽\u200d➡️\n'
+    '🧑🏽\n'
+    '🧑🏽\u200d⚕\n'
+    '🧑🏽\u200d⚕️\n'
+    '🧑🏽\u200d⚖\n'
+    '🧑🏽\u200d⚖️\n'
+    '🧑🏽\u200d✈\n'
+    '🧑🏽\u200d✈️\n'
+    '🧑🏽\u200d❤\u200d💋\u200d🧑🏻\n'
+    '🧑🏽\u200d❤\u200d💋\u200d🧑🏼\n'
+    '🧑🏽\u200d❤\u200d💋\u200d🧑🏾\n'
+    '🧑🏽\u200d❤\u200d💋\u200d🧑🏿\n'
+    '🧑🏽\u200d❤\u200d🧑🏻\n'
+    '🧑🏽\u200d❤\u200d🧑🏼\n'
+    '🧑🏽\u200d❤\u200d🧑🏾\n'
+    '🧑🏽\u200d❤\u200d🧑🏿\n'
+    '🧑🏽\u200d❤️\u200d💋\u200d🧑🏻\n'
+    '🧑🏽\u200d❤️\u200d💋\u200d🧑🏼\n'
+    '🧑🏽\u200d❤️\u200d💋\u200d🧑🏾\n'
+    '🧑🏽\u200d❤️\u200d💋\u200d🧑🏿\n'
+    '🧑🏽\u200d❤️\u200d🧑🏻\n'
+    '🧑🏽\u200d❤️\u200d🧑🏼\n'
+    '🧑🏽\u200d❤️\u200d🧑🏾\n'
+    '🧑🏽\u200d❤️\u200d🧑🏿\n'
+    '🧑🏽\u200d🌾\n'
+    '🧑🏽\u200d🍳\n'
+    '🧑🏽\u200d🍼\n'
+    '🧑🏽\u200d🎄\n'
+    '🧑🏽\u200d🎓\n'
+    '🧑🏽\u200d🎤\n'
+    '🧑🏽\u200d🎨\n'
+    '🧑🏽\u200d🏫\n'
+    '🧑🏽\u200d🏭\n'
+    '🧑🏽\u200d💻\n'
+    '🧑🏽\u200d💼\n'
+    '🧑🏽\u200d🔧\n'
+    '🧑🏽\u200d🔬\n'
+    '🧑🏽\u200d🚀\n'
+    '🧑🏽\u200d🚒\n'
+    '🧑🏽\u200d🤝\u200d🧑🏻\n'
+    '🧑🏽\u200d🤝\u200d🧑🏼\n'
+    '🧑🏽\u200d🤝\u200d🧑🏽\n'
+    '🧑🏽\u200d🤝\u200d🧑🏾\n'
+    '🧑🏽\u200d🤝\u200d🧑🏿\n'
+    '🧑🏽\u200d🦯\n'
+    '🧑🏽\u200d🦯\u200d➡\n'
+    '🧑🏽\u200d🦯\u200d➡️\n'
+    '🧑🏽\u200d🦰\n'
+    '🧑🏽\u200d🦱\n'
+    '🧑🏽\u200d🦲\n'
+    '🧑🏽\u200d🦳\n'
+    '🧑🏽\u200d🦼\n'
+    '🧑🏽\u200d🦼\u200d➡\n'
+    '🧑🏽\u200d🦼\u200d➡️\n'
+    '🧑🏽\u200d🦽\n'
+    '🧑🏽\u200d🦽\u200d➡\n'
+    '🧑🏽\u200d🦽\u200d➡️\n'
+    '🧑🏾\n'
+    '🧑🏾\u200d⚕\n'
+    '🧑🏾\u200d⚕️\n'
+    '🧑🏾\u200d⚖\n'
+    '🧑🏾\u200d⚖️\n'
+    '🧑🏾\u200d✈\n'
+    '🧑🏾\u200d✈️\n'
+    '🧑🏾\u200d❤\u200d💋\u200d🧑🏻\n'
+    '🧑🏾\u200d❤\u200d💋\u200d🧑🏼\n'
+    '🧑🏾\u200d❤\u200d💋\u200d🧑🏽\n'
+    '🧑🏾\u200d❤\u200d💋\u200d🧑🏿\n'
+    '🧑🏾\u200d❤\u200d🧑🏻\n'
+    '🧑🏾\u200d❤\u200d🧑🏼\n'
+    '🧑🏾\u200d❤\u200d🧑🏽\n'
+    '🧑🏾\u200d❤\u200d🧑🏿\n'
+    '🧑🏾\u200d❤️\u200d💋\u200d🧑🏻\n'
+    '🧑🏾\u200d❤️\u200d💋\u200d🧑🏼\n'
+    '🧑🏾\u200d❤️\u200d💋\u200d🧑🏽\n'
+    '🧑🏾\u200d❤️\u200d💋\u200d🧑🏿\n'
+    '🧑🏾\u200d❤️\u200d🧑🏻\n'
+    '🧑🏾\u200d❤️\u200d🧑🏼\n'
+    '🧑🏾\u200d❤️\u200d🧑🏽\n'
+    '🧑🏾\u200d❤️\u200d🧑🏿\n'
+    '🧑🏾\u200d🌾\n'
+    '🧑🏾\u200d🍳\n'
+    '🧑🏾\u200d🍼\n'
+    '🧑🏾\u200d🎄\n'
+    '🧑🏾\u200d🎓\n'
+    '🧑🏾\u200d🎤\n'
+    '🧑🏾\u200d🎨\n'
+    '🧑🏾\u200d🏫\n'
+    '🧑🏾\u200d🏭\n'
+    '🧑🏾\u200d💻\n'
+    '🧑🏾\u200d💼\n'
+    '🧑🏾\u200d🔧\n'
+    '🧑🏾\u200d🔬\n'
+    '🧑🏾\u200d🚀\n'
+    '🧑🏾\u200d🚒\n'
+    '🧑🏾\u200d🤝\u200d🧑🏻\n'
+    '🧑🏾\u200d🤝\u200d🧑🏼\n'
+    '🧑🏾\u200d🤝\u200d🧑🏽\n'
+    '🧑🏾\u200d🤝\u200d🧑🏾\n'
+    '🧑🏾\u200d🤝\u200d🧑🏿\n'
+    '🧑🏾\u200d🦯\n'
+    '🧑🏾\u200d🦯\u200d➡\n'
+    '🧑🏾\u200d🦯\u200d➡️\n'
+    '🧑🏾\u200d🦰\n'
+    '🧑🏾\u200d🦱\n'
+    '🧑🏾\u200d🦲\n'
+    '🧑🏾\u200d🦳\n'
+    '🧑🏾\u200d🦼\n'
+    '🧑🏾\u200d🦼\u200d➡\n'
+    '🧑🏾\u200d🦼\u200d➡️\n'
+    '🧑🏾\u200d🦽\n'
+    '🧑🏾\u200d🦽\u200d➡\n'
+    '🧑🏾\u200d🦽\u200d➡️\n'
+    '🧑🏿\n'
+    '🧑🏿\u200d⚕\n'
+    '🧑🏿\u200d⚕️\n'
+    '🧑🏿\u200d⚖\n'
+    '🧑🏿\u200d⚖️\n'
+    '🧑🏿\u200d✈\n'
+    '🧑🏿\u200d✈️\n'
+    '🧑🏿\u200d❤\u200d💋\u200d🧑🏻\n'
+    '🧑🏿\u200d❤\u200d💋\u200d🧑🏼\n'
+    '🧑🏿\u200d❤\u200d💋\u200d🧑🏽\n'
+    '🧑🏿\u200d❤\u200d💋\u200d🧑🏾\n'
+    '🧑🏿\u200d❤\u200d🧑🏻\n'
+    '🧑🏿\u200d❤\u200d🧑🏼\n'
+    '🧑🏿\u200d❤\u200d🧑🏽\n'
+    '🧑🏿\u200d❤\u200d🧑🏾\n'
+    '🧑🏿\u200d❤️\u200d💋\u200d🧑🏻\n'
+    '🧑🏿\u200d❤️\u200d💋\u200d🧑🏼\n'
+    '🧑🏿\u200d❤️\u200d💋\u200d🧑🏽\n'
+    '🧑🏿\u200d❤️\u200d💋\u200d🧑🏾\n'
+    '🧑🏿\u200d❤️\u200d🧑🏻\n'
+    '🧑🏿\u200d❤️\u200d🧑🏼\n'
+    '🧑🏿\u200d❤️\u200d🧑🏽\n'
+    '🧑🏿\u200d❤️\u200d🧑🏾\n'
+    '🧑🏿\u200d🌾\n'
+    '🧑🏿\u200d🍳\n'
+    '🧑🏿\u200d🍼\n'
+    '🧑🏿\u200d🎄\n'
+    '🧑🏿\u200d🎓\n'
+    '🧑🏿\u200d🎤\n'
+    '🧑🏿\u200d🎨\n'
+    '🧑🏿\u200d🏫\n'
+    '🧑🏿\u200d🏭\n'
+    '🧑🏿\u200d💻\n'
+    '🧑🏿\u200d💼\n'
+    '🧑🏿\u200d🔧\n'
+    '🧑🏿\u200d🔬\n'
+    '🧑🏿\u200d🚀\n'
+    '🧑🏿\u200d🚒\n'
+    '🧑🏿\u200d🤝\u200d🧑🏻\n'
+    '🧑🏿\u200d🤝\u200d🧑🏼\n'
+    '🧑🏿\u200d🤝\u200d🧑🏽\n'
+    '🧑🏿\u200d🤝\u200d🧑🏾\n'
+    '🧑🏿\u200d🤝\u200d🧑🏿\n'
+    '🧑🏿\u200d🦯\n'
+    '🧑🏿\u200d🦯\u200d➡\n'
+    '🧑🏿\u200d🦯\u200d➡️\n'
+    '🧑🏿\u200d🦰\n'
+    '🧑🏿\u200d🦱\n'
+    '🧑🏿\u200d🦲\n'
+    '🧑🏿\u200d🦳\n'
+    '🧑🏿\u200d🦼\n'
+    '🧑🏿\u200d🦼\u200d➡\n'
+    '🧑🏿\u200d🦼\u200d➡️\n'
+    '🧑🏿\u200d🦽\n'
+    '🧑🏿\u200d🦽\u200d➡\n'
+    '🧑🏿\u200d🦽\u200d➡️\n'
+    '🧒\n'
+    '🧒🏻\n'
+    '🧒🏼\n'
+    '🧒🏽\n'
+    '🧒🏾\n'
+    '🧒🏿\n'
+    '🧓\n'
+    '🧓🏻\n'
+    '🧓🏼\n'
+    '🧓🏽\n'
+    '🧓🏾\n'
+    '🧓🏿\n'
+    '🧔\n'
+    '🧔\u200d♀\n'
+    '🧔\u200d♀️\n'
+    '🧔\u200d♂\n'
+    '🧔\u200d♂️\n'
+    '🧔🏻\n'
+    '🧔🏻\u200d♀\n'
+    '🧔🏻\u200d♀️\n'
+    '🧔🏻\u200d♂\n'
+    '🧔🏻\u200d♂️\n'
+    '🧔🏼\n'
+    '🧔🏼\u200d♀\n'
+    '🧔🏼\u200d♀️\n'
+    '🧔🏼\u200d♂\n'
+    '🧔🏼\u200d♂️\n'
+    '🧔🏽\n'
+    '🧔🏽\u200d♀\n'
+    '🧔🏽\u200d♀️\n'
+    '🧔🏽\u200d♂\n'
+    '🧔🏽\u200d♂️\n'
+    '🧔🏾\n'
+    '🧔🏾\u200d♀\n'
+    '🧔🏾\u200d♀️\n'
+    '🧔🏾\u200d♂\n'
+    '🧔🏾\u200d♂️\n'
+    '🧔🏿\n'
+    '🧔🏿\u200d♀\n'
+    '🧔🏿\u200d♀️\n'
+    '🧔🏿\u200d♂\n'
+    '🧔🏿\u200d♂️\n'
+    '🧕\n'
+    '🧕🏻\n'
+    '🧕🏼\n'
+    '🧕🏽\n'
+    '🧕🏾\n'
+    '🧕🏿\n'
+    '🧖\n'
+    '🧖\u200d♀\n'
+    '🧖\u200d♀️\n'
+    '🧖\u200d♂\n'
+    '🧖\u200d♂️\n'
+    '🧖🏻\n'
+    '🧖🏻\u200d♀\n'
+    '🧖🏻\u200d♀️\n'
+    '🧖🏻\u200d♂\n'
+    '🧖🏻\u200d♂️\n'
+    '🧖🏼\n'
+    '🧖🏼\u200d♀\n'
+    '🧖🏼\u200d♀️\n'
+    '🧖🏼\u200d♂\n'
+    '🧖🏼\u200d♂️\n'
+    '🧖🏽\n'
+    '🧖🏽\u200d♀\n'
+    '🧖🏽\u200d♀️\n'
+    '🧖🏽\u200d♂\n'
+    '🧖🏽\u200d♂️\n'
+    '🧖🏾\n'
+    '🧖🏾\u200d♀\n'
+    '🧖🏾\u200d♀️\n'
+    '🧖🏾\u200d♂\n'
+    '🧖🏾\u200d♂️\n'
+    '🧖🏿\n'
+    '🧖🏿\u200d♀\n'
+    '🧖🏿\u200d♀️\n'
+    '🧖🏿\u200d♂\n'
+    '🧖🏿\u200d♂️\n'
+    '🧗\n'
+    '🧗\u200d♀\n'
+    '🧗\u200d♀️\n'
+    '🧗\u200d♂\n'
+    '🧗\u200d♂️\n'
+    '🧗🏻\n'
+    '🧗🏻\u200d♀\n'
+    '🧗🏻\u200d♀️\n'
+    '🧗🏻\u200d♂\n'
+    '🧗🏻\u200d♂️\n'
+    '🧗🏼\n'
+    '🧗🏼\u200d♀\n'
+    '🧗🏼\u200d♀️\n'
+    '🧗🏼\u200d♂\n'
+    '🧗🏼\u200d♂️\n'
+    '🧗🏽\n'
+    '🧗🏽\u200d♀\n'
+    '🧗🏽\u200d♀️\n'
+    '🧗🏽\u200d♂\n'
+    '🧗🏽\u200d♂️\n'
+    '🧗🏾\n'
+    '🧗🏾\u200d♀\n'
+    '🧗🏾\u200d♀️\n'
+    '🧗🏾\u200d♂\n'
+    '🧗🏾\u200d♂️\n'
+    '🧗🏿\n'
+    '🧗🏿\u200d♀\n'
+    '🧗🏿\u200d♀️\n'
+    '🧗🏿\u200d♂\n'
+    '🧗🏿\u200d♂️\n'
+    '🧘\n'
+    '🧘\u200d♀\n'
+    '🧘\u200d♀️\n'
+    '🧘\u200d♂\n'
+    '🧘\u200d♂️\n'
+    '🧘🏻\n'
+    '🧘🏻\u200d♀\n'
+    '🧘🏻\u200d♀️\n'
+    '🧘🏻\u200d♂\n'
+    '🧘🏻\u200d♂️\n'
+    '🧘🏼\n'
+    '🧘🏼\u200d♀\n'
+    '🧘🏼\u200d♀️\n'
+    '🧘🏼\u200d♂\n'
+    '🧘🏼\u200d♂️\n'
+    '🧘🏽\n'
+    '🧘🏽\u200d♀\n'
+    '🧘🏽\u200d♀️\n'
+    '🧘🏽\u200d♂\n'
+    '🧘🏽\u200d♂️\n'
+    '🧘🏾\n'
+    '🧘🏾\u200d♀\n'
+    '🧘🏾\u200d♀️\n'
+    '🧘🏾\u200d♂\n'
+    '🧘🏾\u200d♂️\n'
+    '🧘🏿\n'
+    '🧘🏿\u200d♀\n'
+    '🧘🏿\u200d♀️\n'
+    '🧘🏿\u200d♂\n'
+    '🧘🏿\u200d♂️\n'
+    '🧙\n'
+    '🧙\u200d♀\n'
+    '🧙\u200d♀️\n'
+    '🧙\u200d♂\n'
+    '🧙\u200d♂️\n'
+    '🧙🏻\n'
+    '🧙🏻\u200d♀\n'
+    '🧙🏻\u200d♀️\n'
+    '🧙🏻\u200d♂\n'
+    '🧙🏻\u200d♂️\n'
+    '🧙🏼\n'
+    '🧙🏼\u200d♀\n'
+    '🧙🏼\u200d♀️\n'
+    '🧙🏼\u200d♂\n'
+    '🧙🏼\u200d♂️\n'
+    '🧙🏽\n'
+    '🧙🏽\u200d♀\n'
+    '🧙🏽\u200d♀️\n'
+    '🧙🏽\u200d♂\n'
+    '🧙🏽\u200d♂️\n'
+    '🧙🏾\n'
+    '🧙🏾\u200d♀\n'
+    '🧙🏾\u200d♀️\n'
+    '🧙🏾\u200d♂\n'
+    '🧙🏾\u200d♂️\n'
+    '🧙🏿\n'
+    '🧙🏿\u200d♀\n'
+    '🧙🏿\u200d♀️\n'
+    '🧙🏿\u200d♂\n'
+    '🧙🏿\u200d♂️\n'
+    '🧚\n'
+    '🧚\u200d♀\n'
+    '🧚\u200d♀️\n'
+    '🧚\u200d♂\n'
+    '🧚\u200d♂️\n'
+    '🧚🏻\n'
+    '🧚🏻\u200d♀\n'
+    '🧚🏻\u200d♀️\n'
+    '🧚🏻\u200d♂\n'
+    '🧚🏻\u200d♂️\n'
+    '🧚🏼\n'
+    '🧚🏼\u200d♀\n'
+    '🧚🏼\u200d♀️\n'
+    '🧚🏼\u200d♂\n'
+    '🧚🏼\u200d♂️\n'
+    '🧚🏽\n'
+    '🧚🏽\u200d♀\n'
+    '🧚🏽\u200d♀️\n'
+    '🧚🏽\u200d♂\n'
+    '🧚🏽\u200d♂️\n'
+    '🧚🏾\n'
+    '🧚🏾\u200d♀\n'
+    '🧚🏾\u200d♀️\n'
+    '🧚🏾\u200d♂\n'
+    '🧚🏾\u200d♂️\n'
+    '🧚🏿\n'
+    '🧚🏿\u200d♀\n'
+    '🧚🏿\u200d♀️\n'
+    '🧚🏿\u200d♂\n'
+    '🧚🏿\u200d♂️\n'
+    '🧛\n'
+    '🧛\u200d♀\n'
+    '🧛\u200d♀️\n'
+    '🧛\u200d♂\n'
+    '🧛\u200d♂️\n'
+    '🧛🏻\n'
+    '🧛🏻\u200d♀\n'
+    '🧛🏻\u200d♀️\n'
+    '🧛🏻\u200d♂\n'
+    '🧛🏻\u200d♂️\n'
+    '🧛🏼\n'
+    '🧛🏼\u200d♀\n'
+    '🧛🏼\u200d♀️\n'
+    '🧛🏼\u200d♂\n'
+    '🧛🏼\u200d♂️\n'
+    '🧛🏽\n'
+    '🧛🏽\u200d♀\n'
+    '🧛🏽\u200d♀️\n'
+    '🧛🏽\u200d♂\n'
+    '🧛🏽\u200d♂️\n'
+    '🧛🏾\n'
+    '🧛🏾\u200d♀\n'
+    '🧛🏾\u200d♀️\n'
+    '🧛🏾\u200d♂\n'
+    '🧛🏾\u200d♂️\n'
+    '🧛🏿\n'
+    '🧛🏿\u200d♀\n'
+    '🧛🏿\u200d♀️\n'
+    '🧛🏿\u200d♂\n'
+    '🧛🏿\u200d♂️\n'
+    '🧜\n'
+    '🧜\u200d♀\n'
+    '🧜\u200d♀️\n'
+    '🧜\u200d♂\n'
+    '🧜\u200d♂️\n'
+    '🧜🏻\n'
+    '🧜🏻\u200d♀\n'
+    '🧜🏻\u200d♀️\n'
+    '🧜🏻\u200d♂\n'
+    '🧜🏻\u200d♂️\n'
+    '🧜🏼\n'
+    '🧜🏼\u200d♀\n'
+    '🧜🏼\u200d♀️\n'
+    '🧜🏼\u200d♂\n'
+    '🧜🏼\u200d♂️\n'
+    '🧜🏽\n'
+    '🧜🏽\u200d♀\n'
+    '🧜🏽\u200d♀️\n'
+    '🧜🏽\u200d♂\n'
+    '🧜🏽\u200d♂️\n'
+    '🧜🏾\n'
+    '🧜🏾\u200d♀\n'
+    '🧜🏾\u200d♀️\n'
+    '🧜🏾\u200d♂\n'
+    '🧜🏾\u200d♂️\n'
+    '🧜🏿\n'
+    '🧜🏿\u200d♀\n'
+    '🧜🏿\u200d♀️\n'
+    '🧜🏿\u200d♂\n'
+    '🧜🏿\u200d♂️\n'
+    '🧝\n'
+    '🧝\u200d♀\n'
+    '🧝\u200d♀️\n'
+    '🧝\u200d♂\n'
+    '🧝\u200d♂️\n'
+    '🧝🏻\n'
+    '🧝🏻\u200d♀\n'
+    '🧝🏻\u200d♀️\n'
+    '🧝🏻\u200d♂\n'
+    '🧝🏻\u200d♂️\n'
+    '🧝🏼\n'
+    '🧝🏼\u200d♀\n'
+    '🧝🏼\u200d♀️\n'
+    '🧝🏼\u200d♂\n'
+    '🧝🏼\u200d♂️\n'
+    '🧝🏽\n'
+    '🧝🏽\u200d♀\n'
+    '🧝🏽\u200d♀️\n'
+    '🧝🏽\u200d♂\n'
+    '🧝🏽\u200d♂️\n'
+    '🧝🏾\n'
+    '🧝🏾\u200d♀\n'
+    '🧝🏾\u200d♀️\n'
+    '🧝🏾\u200d♂\n'
+    '🧝🏾\u200d♂️\n'
+    '🧝🏿\n'
+    '🧝🏿\u200d♀\n'
+    '🧝🏿\u200d♀️\n'
+    '🧝🏿\u200d♂\n'
+    '🧝🏿\u200d♂️\n'
+    '🧞\n'
+    '🧞\u200d♀\n'
+    '🧞\u200d♀️\n'
+    '🧞\u200d♂\n'
+    '🧞\u200d♂️\n'
+    '🧟\n'
+    '🧟\u200d♀\n'
+    '🧟\u200d♀️\n'
+    '🧟\u200d♂\n'
+    '🧟\u200d♂️\n'
+    '🧠\n'
+    '🧡\n'
+    '🧢\n'
+    '🧣\n'
+    '🧤\n'
+    '🧥\n'
+    '🧦\n'
+    '🧧\n'
+    '🧨\n'
+    '🧩\n'
+    '🧪\n'
+    '🧫\n'
+    '🧬\n'
+    '🧭\n'
+    '🧮\n'
+    '🧯\n'
+    '🧰\n'
+    '🧱\n'
+    '🧲\n'
+    '🧳\n'
+    '🧴\n'
+    '🧵\n'
+    '🧶\n'
+    '🧷\n'
+    '🧸\n'
+    '🧹\n'
+    '🧺\n'
+    '🧻\n'
+    '🧼\n'
+    '🧽\n'
+    '🧾\n'
+    '🧿\n'
+    '🩰\n'
+    '🩱\n'
+    '🩲\n'
+    '🩳\n'
+    '🩴\n'
+    '🩵\n'
+    '🩶\n'
+    '🩷\n'
+    '🩸\n'
+    '🩹\n'
+    '🩺\n'
+    '🩻\n'
+    '🩼\n'
+    '🪀\n'
+    '🪁\n'
+    '🪂\n'
+    '🪃\n'
+    '🪄\n'
+    '🪅\n'
+    '🪆\n'
+    '🪇\n'
+    '🪈\n'
+    '\U0001fa89\n'
+    '\U0001fa8f\n'
+    '🪐\n'
+    '🪑\n'
+    '🪒\n'
+    '🪓\n'
+    '🪔\n'
+    '🪕\n'
+    '🪖\n'
+    '🪗\n'
+    '🪘\n'
+    '🪙\n'
+    '🪚\n'
+    '🪛\n'
+    '🪜\n'
+    '🪝\n'
+    '🪞\n'
+    '🪟\n'
+    '🪠\n'
+    '🪡\n'
+    '🪢\n'
+    '🪣\n'
+    '🪤\n'
+    '🪥\n'
+    '🪦\n'
+    '🪧\n'
+    '🪨\n'
+    '🪩\n'
+    '🪪\n'
+    '🪫\n'
+    '🪬\n'
+    '🪭\n'
+    '🪮\n'
+    '🪯\n'
+    '🪰\n'
+    '🪱\n'
+    '🪲\n'
+    '🪳\n'
+    '🪴\n'
+    '🪵\n'
+    '🪶\n'
+    '🪷\n'
+    '🪸\n'
+    '🪹\n'
+    '🪺\n'
+    '🪻\n'
+    '🪼\n'
+    '🪽\n'
+    '\U0001fabe\n'
+    '🪿\n'
+    '🫀\n'
+    '🫁\n'
+    '🫂\n'
+    '🫃\n'
+    '🫃🏻\n'
+    '🫃🏼\n'
+    '🫃🏽\n'
+    '🫃🏾\n'
+    '🫃🏿\n'
+    '🫄\n'
+    '🫄🏻\n'
+    '🫄🏼\n'
+    '🫄🏽\n'
+    '🫄🏾\n'
+    '🫄🏿\n'
+    '🫅\n'
+    '🫅🏻\n'
+    '🫅🏼\n'
+    '🫅🏽\n'
+    '🫅🏾\n'
+    '🫅🏿\n'
+    '\U0001fac6\n'
+    '🫎\n'
+    '🫏\n'
+    '🫐\n'
+    '🫑\n'
+    '🫒\n'
+    '🫓\n'
+    '🫔\n'
+    '🫕\n'
+    '🫖\n'
+    '🫗\n'
+    '🫘\n'
+    '🫙\n'
+    '🫚\n'
+    '🫛\n'
+    '\U0001fadc\n'
+    '\U0001fadf\n'
+    '🫠\n'
+    '🫡\n'
+    '🫢\n'
+    '🫣\n'
+    '🫤\n'
+    '🫥\n'
+    '🫦\n'
+    '🫧\n'
+    '🫨\n'
+    '\U0001fae9\n'
+    '🫰\n'
+    '🫰🏻\n'
+    '🫰🏼\n'
+    '🫰🏽\n'
+    '🫰🏾\n'
+    '🫰🏿\n'
+    '🫱\n'
+    '🫱🏻\n'
+    '🫱🏻\u200d🫲🏼\n'
+    '🫱🏻\u200d🫲🏽\n'
+    '🫱🏻\u200d🫲🏾\n'
+    '🫱🏻\u200d🫲🏿\n'
+    '🫱🏼\n'
+    '🫱🏼\u200d🫲🏻\n'
+    '🫱🏼\u200d🫲🏽\n'
+    '🫱🏼\u200d🫲🏾\n'
+    '🫱🏼\u200d🫲🏿\n'
+    '🫱🏽\n'
+    '🫱🏽\u200d🫲🏻\n'
+    '🫱🏽\u200d🫲🏼\n'
+    '🫱🏽\u200d🫲🏾\n'
+    '🫱🏽\u200d🫲🏿\n'
+    '🫱🏾\n'
+    '🫱🏾\u200d🫲🏻\n'
+    '🫱🏾\u200d🫲🏼\n'
+    '🫱🏾\u200d🫲🏽\n'
+    '🫱🏾\u200d🫲🏿\n'
+    '🫱🏿\n'
+    '🫱🏿\u200d🫲🏻\n'
+    '🫱🏿\u200d🫲🏼\n'
+    '🫱🏿\u200d🫲🏽\n'
+    '🫱🏿\u200d🫲🏾\n'
+    '🫲\n'
+    '🫲🏻\n'
+    '🫲🏼\n'
+    '🫲🏽\n'
+    '🫲🏾\n'
+    '🫲🏿\n'
+    '🫳\n'
+    '🫳🏻\n'
+    '🫳🏼\n'
+    '🫳🏽\n'
+    '🫳🏾\n'
+    '🫳🏿\n'
+    '🫴\n'
+    '🫴🏻\n'
+    '🫴🏼\n'
+    '🫴🏽\n'
+    '🫴🏾\n'
+    '🫴🏿\n'
+    '🫵\n'
+    '🫵🏻\n'
+    '🫵🏼\n'
+    '🫵🏽\n'
+    '🫵🏾\n'
+    '🫵🏿\n'
+    '🫶\n'
+    '🫶🏻\n'
+    '🫶🏼\n'
+    '🫶🏽\n'
+    '🫶🏾\n'
+    '🫶🏿\n'
+    '🫷\n'
+    '🫷🏻\n'
+    '🫷🏼\n'
+    '🫷🏽\n'
+    '🫷🏾\n'
+    '🫷🏿\n'
+    '🫸\n'
+    '🫸🏻\n'
+    '🫸🏼\n'
+    '🫸🏽\n'
+    '🫸🏾\n'
+    '🫸🏿'
+)
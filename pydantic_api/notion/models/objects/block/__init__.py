@@ -5,5 +5,98 @@ Reference:
 - https://developers.notion.com/reference/rich-text
 """
 
-from .rich_text import *
-from .block import *
+from typing import TYPE_CHECKING
+
+from ..._lazy import attach
+
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        ".rich_text": [
+            "TextAnnotations",
+            "RichTextTypeLiteral",
+            "TextObject",
+            "TextRichTextObject",
+            "EquationObject",
+            "EquationRichTextObject",
+            "MentionTypeLiteral",
+            "DatabaseMentionBody",
+            "DatabaseMentionObject",
+            "DateMentionBody",
+            "DateMentionObject",
+            "LinkPreviewMentionBody",
+            "LinkPreviewMentionObject",
+            "PageMentionBody",
+            "PageMentionObject",
+            "TemplateMentionBody",
+            "TemplateMentionObject",
+            "TemplateMentionTypeLiteral",
+            "TemplateMentionDateValueLiteral",
+            "TemplateMentionUserValueLiteral",
+            "UserMentionBody",
+            "UserMentionObject",
+            "MentionObject",
+            "MentionRichTextObject",
+            "RichTextObject",
+            "RichTextObjectFactory",
+            "utf16_len",
+            "iter_text_chunks",
+            "join_plain_text",
+        ],
+        ".block": [
+            "BlockObject",
+            "BookmarkBlock",
+            "BreadcrumbBlock",
+            "BulletedListItemBlock",
+            "CalloutBlock",
+            "ChildDatabaseBlock",
+            "ChildPageBlock",
+            "CodeBlock",
+            "ColumnBlock",
+            "ColumnListBlock",
+            "DividerBlock",
+            "EmbedBlock",
+            "EquationBlock",
+            "FileBlock",
+            "Heading1Block",
+            "Heading2Block",
+            "Heading3Block",
+            "ImageBlock",
+            "LinkPreviewBlock",
+            "NumberedListItemBlock",
+            "ParagraphBlock",
+            "PdfBlock",
+            "QuoteBlock",
+            "SyncedBlock",
+            "TableBlock",
+            "TableRowBlock",
+            "TableOfContentsBlock",
+            "TemplateBlock",
+            "TodoBlock",
+            "ToggleBlock",
+            "VideoBlock",
+            "BlockTypeLiteral",
+            "ParentOfBlock",
+        ],
+        ".tree": [
+            "BlockId",
+            "BlockNode",
+            "BlockTree",
+        ],
+        ".markdown": [
+            "rich_text_to_markdown",
+            "iter_markdown",
+            "render_markdown",
+            "MAX_NESTING",
+            "iter_markdown_blocks",
+        ],
+    },
+)
+
+
+if TYPE_CHECKING:
+    from .rich_text import *
+    from .block import *
+    from .tree import *
+    from .markdown import *
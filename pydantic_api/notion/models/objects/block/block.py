@@ -3,15 +3,15 @@ Reference: https://developers.notion.com/reference/block
 """
 
 from __future__ import annotations
-from uuid import UUID
-from datetime import datetime
-from typing import Union, Literal, List, Annotated
+from ..ids import NotionId
+from ..timestamps import Timestamp
+from typing import Union, Literal, List, Annotated, Any, Optional
 
-from pydantic_api.base import BaseModel
-from pydantic import AnyUrl, Field, PositiveInt
+from pydantic_api.notion.models.base import BaseModel
+from pydantic import AnyUrl, Field, PositiveInt, Discriminator, Tag
 
 from ..user import PartialUser
-from .rich_text import RichTextObject, RichTextObjectFactory
+from .rich_text import RichTextObject, RichTextObjectFactory, join_plain_text
 from ..parent import PageParentObject, BlockParentObject, DatabaseParentObject
 from ..common import (
     IconObject,
@@ -28,6 +28,7 @@ BlockTypeLiteral = Literal[
     "callout",
     "child_database",
     "child_page",
+    "code",
     "column",
     "column_list",
     "divider",
@@ -68,17 +69,26 @@ class BaseBlock(BaseModel):
     """Reference: https://developers.notion.com/reference/block#keys"""
 
     object: Literal["block"] = "block"
-    id: UUID | None = None
+    id: NotionId | None = None
     parent: ParentOfBlock | None = None
     type: BlockTypeLiteral
-    created_time: datetime | None = None
+    created_time: Timestamp | None = None
     created_by: PartialUser | None = None
-    last_edited_time: datetime | None = None
+    last_edited_time: Timestamp | None = None
     last_edited_by: PartialUser | None = None
     archived: bool | None = None
     in_trash: bool | None = None
     has_children: bool | None = None
 
+    @property
+    def plain_text(self) -> str:
+        """The text of the block's `rich_text` (paragraphs, headings, list items, code, ...), or `""` for blocks without one."""
+        data = getattr(self, self.type, None)
+        rich_text = getattr(data, "rich_text", None)
+        if rich_text is None:
+            return ""
+        return join_plain_text(rich_text)
+
 
 class EmptyBlockData(BaseModel):
     pass
@@ -126,7 +136,7 @@ class BulletedListItemBlockData(BaseModel):
         default_factory=list, description="The content of the bulleted list item."
     )
     color: ColorLiteral | None = None
-    children: list = Field(
+    children: List[BlockObject] = Field(
         default_factory=list,
         description="The nested child blocks (if any) of the bulleted_list_item block.",
     )
@@ -691,7 +701,7 @@ class OriginalSyncedBlock(BaseSyncedBlock):
 
 
 class BlockReference(BaseModel):
-    block_id: str
+    block_id: NotionId
 
 
 class DuplicateSyncedBlockData(BaseModel):
@@ -702,7 +712,32 @@ class DupliateSyncedBlock(BaseSyncedBlock):
     synced_block: DuplicateSyncedBlockData
 
 
-SyncedBlock = Union[OriginalSyncedBlock, DupliateSyncedBlock]
+def _synced_block_discriminator(value: Any) -> str | None:
+    """Tell an original synced block from a duplicate by its `synced_from` field.
+
+    Both variants share `type: "synced_block"`, so the `type` tag alone cannot pick one. An original synced block has `synced_from: null`, a duplicate points at the original block.
+    """
+    if isinstance(value, dict):
+        synced_block = value.get("synced_block")
+    else:
+        synced_block = getattr(value, "synced_block", None)
+    if synced_block is None:
+        return None
+    if isinstance(synced_block, dict):
+        synced_from = synced_block.get("synced_from")
+    else:
+        synced_from = getattr(synced_block, "synced_from", None)
+    return "original" if synced_from is None else "duplicate"
+
+
+SyncedBlock = Annotated[
+    Union[
+        Annotated[OriginalSyncedBlock, Tag("original")],
+        Annotated[DupliateSyncedBlock, Tag("duplicate")],
+    ],
+    Discriminator(_synced_block_discriminator),
+]
+"""Reference: https://developers.notion.com/reference/block#synced-block"""
 
 
 # table: Refer to https://developers.notion.com/reference/block#table
@@ -719,6 +754,10 @@ class TableBlockData(BaseModel):
         ...,
         description="Whether the table has a header row. If true, then the first column in the table appears visually distinct from the other columns.",
     )
+    children: Optional[List[BlockObject]] = Field(
+        default=None,
+        description="The table_row blocks of the table, required when the table is created.",
+    )
 
 
 class TableBlock(BaseBlock):
@@ -823,8 +862,8 @@ class TodoBlockData(BaseModel):
     )
 
 
-class TodoBlock(BaseModel):
-    type: Literal["to_do"] = "to-do"
+class TodoBlock(BaseBlock):
+    type: Literal["to_do"] = "to_do"
     to_do: TodoBlockData
 
     @classmethod
@@ -838,7 +877,7 @@ class TodoBlock(BaseModel):
             rich_text = RichTextObjectFactory.new_text(content=rich_text)
         todo_block_data = TodoBlockData(
             rich_text=rich_text or [],
-            checked=checked,
+            checked=checked or False,
             color=color,
         )
         return cls(to_do=todo_block_data)
@@ -898,38 +937,42 @@ class VideoBlock(BaseBlock):
 
 
 # Union Type
-BlockObject = Union[
-    BookmarkBlock,
-    BreadcrumbBlock,
-    BulletedListItemBlock,
-    CalloutBlock,
-    ChildDatabaseBlock,
-    ChildPageBlock,
-    CodeBlock,
-    ColumnBlock,
-    ColumnListBlock,
-    DividerBlock,
-    EmbedBlock,
-    EquationBlock,
-    FileBlock,
-    Heading1Block,
-    Heading2Block,
-    Heading3Block,
-    ImageBlock,
-    LinkPreviewBlock,
-    NumberedListItemBlock,
-    ParagraphBlock,
-    PdfBlock,
-    QuoteBlock,
-    SyncedBlock,
-    TableBlock,
-    TableRowBlock,
-    TableOfContentsBlock,
-    TemplateBlock,
-    TodoBlock,
-    ToggleBlock,
-    VideoBlock,
+BlockObject = Annotated[
+    Union[
+        BookmarkBlock,
+        BreadcrumbBlock,
+        BulletedListItemBlock,
+        CalloutBlock,
+        ChildDatabaseBlock,
+        ChildPageBlock,
+        CodeBlock,
+        ColumnBlock,
+        ColumnListBlock,
+        DividerBlock,
+        EmbedBlock,
+        EquationBlock,
+        FileBlock,
+        Heading1Block,
+        Heading2Block,
+        Heading3Block,
+        ImageBlock,
+        LinkPreviewBlock,
+        NumberedListItemBlock,
+        ParagraphBlock,
+        PdfBlock,
+        QuoteBlock,
+        SyncedBlock,
+        TableBlock,
+        TableRowBlock,
+        TableOfContentsBlock,
+        TemplateBlock,
+        TodoBlock,
+        ToggleBlock,
+        VideoBlock,
+    ],
+    Field(discriminator="type"),
 ]
+"""Union of all Block objects, dispatched on the `type` key. Reference: https://developers.notion.com/reference/block"""
 
 __all__ = [
     "BlockObject",
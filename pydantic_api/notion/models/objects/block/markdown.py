@@ -0,0 +1,692 @@
+"""
+Streaming conversion between blocks and Markdown.
+
+Blocks are rendered one at a time, as they come: only the state of the enclosing blocks (prefixes, list numbering, the current table) is kept, so memory is bounded by the nesting depth and not by the number of blocks. The other way round, Markdown is compiled line by line into top-level blocks, each one yielded as soon as it is complete.
+
+Reference: https://developers.notion.com/reference/block
+"""
+
+import re
+import unicodedata
+from typing import Any, Iterable, Iterator, Optional, TextIO, Union, get_args
+
+from pydantic_api.notion.models.trusted import TrustedAdapter
+
+from .block import BlockObject
+from .tree import BlockNode
+from .rich_text import RichTextObject, iter_text_chunks, join_plain_text
+from ..common import CodeLanguageLiteral
+
+
+_ESCAPE = str.maketrans({c: "\\" + c for c in "\\`*_[]<>~"})
+_ESCAPE_CELL = str.maketrans({c: "\\" + c for c in "\\`*_[]<>~|"})
+_LINE_START = re.compile(r"^([#>+=-]|\d+[.)])", re.MULTILINE)
+"""Text at the start of a line that Markdown would read as a heading, quote, list item or rule."""
+
+_HEADINGS = {"heading_1": "# ", "heading_2": "## ", "heading_3": "### "}
+_TIGHT = {"bulleted_list_item", "numbered_list_item", "to_do", "toggle"}
+"""Block types rendered as list items, which follow each other without a blank line."""
+_MEDIA = {"image", "video", "file", "pdf"}
+_LINKS = {"bookmark", "embed", "link_preview"}
+_PARENTS = {"bulleted_list_item", "numbered_list_item", "paragraph", "quote", "synced_block", "table", "template", "to_do", "toggle"}  # fmt: skip
+"""Block types whose data can carry nested `children`."""
+
+
+def rich_text_to_markdown(rich_text: Iterable[RichTextObject], cell: bool = False) -> str:  # fmt: skip
+    """
+    Render rich text as inline Markdown: bold, italic, strikethrough and code annotations, links, and inline equations.
+
+    Adjacent segments with the same annotations and link are rendered as one. Underline and colors have no Markdown equivalent and are dropped.
+
+    Args:
+        rich_text: The rich text objects.
+        cell: Whether the text goes in a table cell, where `|` is escaped as well.
+    """
+    escape = _ESCAPE_CELL if cell else _ESCAPE
+    parts: list[str] = []
+    run: list[str] = []
+    run_key: Optional[tuple] = None
+    for t in rich_text:
+        if t.type == "equation":
+            key = None
+            content = f"${t.equation.expression}$"
+        else:
+            plain_text = t.plain_text
+            url = t.href
+            if t.type == "text":
+                if plain_text is None:
+                    plain_text = t.text.content
+                if t.text.link is not None:
+                    url = t.text.link.url
+            elif plain_text is None:
+                plain_text = ""
+            content = plain_text
+            a = t.annotations
+            if a is None:
+                key = (False, False, False, False, url)
+            else:
+                key = (a.bold, a.italic, a.strikethrough, a.code, url)
+            if not a or not a.code:
+                content = content.translate(escape)
+        if key is None or key != run_key:
+            if run:
+                parts.append(_wrap("".join(run), run_key))
+            run, run_key = [content], key
+        else:
+            run.append(content)
+    if run:
+        parts.append(_wrap("".join(run), run_key))
+    return "".join(parts)
+
+
+def _wrap(content: str, key: Optional[tuple]) -> str:
+    """Apply the annotations and link of `key` to `content`, keeping surrounding whitespace outside of the markers."""
+    if key is None or not content:
+        return content
+    bold, italic, strikethrough, code, url = key
+    if not (bold or italic or strikethrough or code or url):
+        return content
+    stripped = content.strip()
+    if not stripped:
+        return content
+    start = content.index(stripped[0])
+    leading, trailing = content[:start], content[start + len(stripped) :]
+    if code:
+        ticks = "``" if "`" in stripped else "`"
+        stripped = f"{ticks} {stripped} {ticks}" if ticks == "``" else f"`{stripped}`"
+    if strikethrough:
+        stripped = f"~~{stripped}~~"
+    if italic:
+        stripped = f"*{stripped}*"
+    if bold:
+        stripped = f"**{stripped}**"
+    if url:
+        stripped = f"[{stripped}]({url})"
+    return f"{leading}{stripped}{trailing}"
+
+
+class _Level:
+    """Rendering state of one nesting level: the prefix of its lines and what came before at this level."""
+
+    __slots__ = ("prefix", "table", "rows", "previous", "number", "child_prefix", "child_table")  # fmt: skip
+
+    def __init__(self, prefix: str, table: Any = None):
+        self.prefix = prefix
+        self.table = table
+        """The `TableBlockData` of the table whose rows are at this level, if any."""
+        self.rows = 0
+        self.previous: Optional[str] = None
+        self.number = 0
+        self.child_prefix = prefix
+        self.child_table = None
+
+
+class _MarkdownWriter:
+    def __init__(self):
+        self.levels: list[_Level] = [_Level("")]
+        self.last: Optional[str] = None
+
+    def write(self, block: Any, depth: int) -> Optional[str]:
+        """The Markdown of `block` at `depth`, preceded by its separator from the previous block; None if it renders to nothing."""
+        levels = self.levels
+        if depth < len(levels) - 1:
+            del levels[depth + 1 :]
+        while len(levels) <= depth:
+            parent = levels[-1]
+            levels.append(_Level(parent.child_prefix, parent.child_table))
+        level = levels[depth]
+        type_ = block.type
+        previous = level.previous
+        level.previous = type_
+        level.child_prefix = level.prefix
+        level.child_table = None
+        text = self._render(block, type_, level, previous)
+        if text is None:
+            return None
+        last, self.last = self.last, type_
+        if last is None:
+            return text
+        if (last in _TIGHT and type_ in _TIGHT) or (type_ == "table_row" and level.rows > 1):  # fmt: skip
+            return "\n" + text
+        return "\n" + level.prefix.rstrip() + "\n" + text
+
+    def _render(self, block: Any, type_: str, level: _Level, previous: Optional[str]) -> Optional[str]:  # fmt: skip
+        prefix = level.prefix
+        data = getattr(block, type_, None)
+        if data is None:
+            # Blocks without their data, e.g. built with `model_construct`
+            return None
+        if type_ == "paragraph":
+            return _lines(prefix, "", prefix, _escape_lines(rich_text_to_markdown(data.rich_text)))  # fmt: skip
+        if type_ in _HEADINGS:
+            return _lines(prefix, _HEADINGS[type_], prefix, rich_text_to_markdown(data.rich_text))  # fmt: skip
+        if type_ in _TIGHT:
+            if type_ == "numbered_list_item":
+                level.number = level.number + 1 if previous == type_ else 1
+                marker = f"{level.number}. "
+            elif type_ == "to_do":
+                marker = "- [x] " if data.checked else "- [ ] "
+            else:
+                marker = "- "
+            level.child_prefix = prefix + "    "
+            return _lines(prefix, marker, level.child_prefix, _escape_lines(rich_text_to_markdown(data.rich_text)))  # fmt: skip
+        if type_ in ("quote", "callout"):
+            text = rich_text_to_markdown(data.rich_text)
+            if type_ == "callout" and data.icon is not None and data.icon.type == "emoji":  # fmt: skip
+                text = f"{data.icon.emoji} {text}"
+            level.child_prefix = prefix + "> "
+            return _lines(prefix, "> ", level.child_prefix, _escape_lines(text))
+        if type_ == "code":
+            language = "" if data.language == "plaintext" else data.language
+            code = join_plain_text(data.rich_text)
+            fence = "````" if "```" in code else "```"
+            return _lines(prefix, "", prefix, f"{fence}{language}\n{code}\n{fence}")
+        if type_ == "equation":
+            return _lines(prefix, "", prefix, f"$$\n{data.expression}\n$$")
+        if type_ == "divider":
+            return prefix + "---"
+        if type_ == "table":
+            level.child_table = data
+            return None
+        if type_ == "table_row":
+            return self._row(data, level)
+        if type_ in _MEDIA:
+            url = getattr(data, data.type).url
+            caption = rich_text_to_markdown(getattr(data, "caption", None) or []) or (data.name or "").translate(_ESCAPE)  # fmt: skip
+            if type_ == "image":
+                return f"{prefix}![{caption}]({url})"
+            return f"{prefix}[{caption or url}]({url})"
+        if type_ in _LINKS:
+            caption = rich_text_to_markdown(getattr(data, "caption", None) or [])
+            return f"{prefix}[{caption or data.url}]({data.url})"
+        if type_ in ("child_page", "child_database"):
+            return _lines(prefix, "", prefix, _escape_lines(data.title.translate(_ESCAPE)))  # fmt: skip
+        if type_ == "template":
+            return _lines(prefix, "", prefix, _escape_lines(rich_text_to_markdown(data.rich_text))) if data.rich_text else None  # fmt: skip
+        # Containers (column_list, column, synced_block) and blocks without content (breadcrumb, table_of_contents)
+        return None
+
+    def _row(self, data: Any, level: _Level) -> str:
+        table = level.table
+        level.rows += 1
+        width = table.table_width if table is not None else len(data.cells)
+        cells = [rich_text_to_markdown([cell], cell=True) for cell in data.cells]
+        cells += [""] * (width - len(cells))
+        row = level.prefix + "| " + " | ".join(cells) + " |"
+        if level.rows > 1:
+            return row
+        rule = level.prefix + "|" + " --- |" * width
+        if table is not None and table.has_column_header:
+            return f"{row}\n{rule}"
+        # Markdown tables need a header row
+        return level.prefix + "|" + "   |" * width + f"\n{rule}\n{row}"
+
+
+def _lines(prefix: str, marker: str, indent: str, text: str) -> str:
+    """`text` with `prefix + marker` before its first line and `indent` before the others."""
+    if "\n" not in text:
+        return prefix + marker + text
+    return prefix + marker + text.replace("\n", "\n" + indent)
+
+
+def _escape_lines(text: str) -> str:
+    return _LINE_START.sub(r"\\\1", text) if text else text
+
+
+def iter_markdown(blocks: Iterable[Union[BlockObject, BlockNode]]) -> Iterator[str]:
+    """
+    Render blocks as Markdown, one chunk per block.
+
+    `blocks` are the blocks in document order, e.g. `RetrieveBlockChildrenResponse.stream(...)` or `BlockTree.depth_first()`. Blocks are top-level, and nodes are nested according to their depth in their tree. The nested `children` of blocks (as built locally, before they are appended) are rendered after each block.
+
+    Args:
+        blocks: The blocks or `BlockTree` nodes to render.
+
+    Yields:
+        The Markdown of each block that renders to something, preceded by its separator from the previous one. The last chunk does not end with a newline.
+    """
+    writer = _MarkdownWriter()
+    stack: list[tuple[Iterator[Any], int]] = []
+    items, base = iter(blocks), 0
+    while True:
+        for item in items:
+            if isinstance(item, BlockNode):
+                block, depth = item.block, item.depth - 1
+                if block is None:
+                    continue
+            else:
+                block, depth = item, base
+            text = writer.write(block, depth)
+            if text is not None:
+                yield text
+            if block.type not in _PARENTS:
+                continue
+            children = getattr(getattr(block, block.type), "children", None)
+            if children:
+                stack.append((items, base))
+                items, base = iter(children), depth + 1
+                break
+        else:
+            if not stack:
+                return
+            items, base = stack.pop()
+
+
+def render_markdown(
+    blocks: Iterable[Union[BlockObject, BlockNode]], stream: Optional[TextIO] = None
+) -> Optional[str]:
+    """
+    Render blocks as Markdown, see `iter_markdown`.
+
+    Args:
+        blocks: The blocks or `BlockTree` nodes to render.
+        stream: A text stream to write the Markdown to, block by block. By default, the Markdown is returned.
+
+    Returns:
+        The Markdown, ending with a newline if not empty; None if written to `stream`.
+    """
+    if stream is None:
+        text = "".join(iter_markdown(blocks))
+        return text + "\n" if text else text
+    wrote = False
+    for chunk in iter_markdown(blocks):
+        stream.write(chunk)
+        wrote = True
+    if wrote:
+        stream.write("\n")
+    return None
+
+
+# Markdown to blocks
+
+MAX_NESTING = 2
+"""Levels of nested children that Notion accepts in a single request. Deeper list items are attached at this level."""
+
+_FENCE = re.compile(r"(`{3,}|~{3,})\s*([^`\s]*)")
+_HEADING = re.compile(r"(#{1,6})\s+(.*?)(?:\s+#+)?\s*$")
+_RULE = re.compile(r"([-*_])(?:\s*\1){2,}\s*$")
+_LIST_ITEM = re.compile(r"([-*+]|\d{1,9}[.)])(?:\s+(.*)|$)")
+_TODO = re.compile(r"\[([ xX])\](?:\s+(.*)|$)")
+_TABLE_RULE = re.compile(r"\|?\s*:?-+:?\s*(?:\|\s*:?-+:?\s*)*\|?\s*$")
+_CELL_SEPARATOR = re.compile(r"(?<!\\)\|")
+_INLINE = re.compile(
+    r"\\(?P<escaped>[!-/:-@\[-`{-~])"
+    r"|(?P<ticks>`+)(?P<code>.+?)(?P=ticks)"
+    r"|\$(?P<equation>[^$\s](?:[^$]*[^$\s])?)\$"
+    r"|\[(?P<label>[^\]]*)\]\((?P<url>[^)\s]+)(?:\s+\"[^\"]*\")?\)"
+    r"|(?P<delimiter>\*+|_+|~+)"
+)
+_SCHEME = re.compile(r"[a-zA-Z][a-zA-Z0-9+.-]*:")
+_BOLD, _ITALIC, _STRIKETHROUGH = 1, 2, 3
+"""Index of the annotations toggled by delimiters in a segment."""
+
+_LANGUAGES = frozenset(get_args(CodeLanguageLiteral))
+_LANGUAGE_ALIASES = {
+    "": "plaintext",
+    "text": "plaintext",
+    "txt": "plaintext",
+    "cpp": "c++",
+    "cs": "c#",
+    "csharp": "c#",
+    "dockerfile": "docker",
+    "js": "javascript",
+    "md": "markdown",
+    "py": "python",
+    "rb": "ruby",
+    "rs": "rust",
+    "sh": "shell",
+    "ts": "typescript",
+    "yml": "yaml",
+    "zsh": "shell",
+}
+
+_block_adapter: Optional[TrustedAdapter] = None
+
+
+def _punctuation(char: str) -> bool:
+    return unicodedata.category(char)[0] in "PS"
+
+
+class _Run:
+    """A run of `*`, `_` or `~~` delimiters, with the annotations it opens and closes once matched."""
+
+    __slots__ = ("char", "length", "count", "can_open", "can_close", "opens", "closes")  # fmt: skip
+
+    def __init__(self, text: str, start: int, end: int) -> None:
+        self.char = text[start]
+        self.length = self.count = end - start
+        before = text[start - 1] if start > 0 else " "
+        after = text[end] if end < len(text) else " "
+        # CommonMark left- and right-flanking delimiter runs
+        left = not after.isspace() and (not _punctuation(after) or before.isspace() or _punctuation(before))  # fmt: skip
+        right = not before.isspace() and (not _punctuation(before) or after.isspace() or _punctuation(after))  # fmt: skip
+        if self.char == "_":
+            # Intraword underscores, as in snake_case, are plain text
+            self.can_open = left and (not right or _punctuation(before))
+            self.can_close = right and (not left or _punctuation(after))
+        else:
+            self.can_open, self.can_close = left, right
+        if self.char == "~" and self.length != 2:
+            self.can_open = self.can_close = False
+        self.opens: list[int] = []
+        self.closes: list[int] = []
+
+    def matches(self, closer: "_Run") -> bool:
+        """Whether this run can open the emphasis that `closer` closes."""
+        if not (self.can_open and self.count and self.char == closer.char):
+            return False
+        # A run that can both open and close only pairs with another if their lengths do not add up to a multiple of 3, as in `*a**b*`
+        both = self.can_close or closer.can_open
+        return not both or (self.length + closer.length) % 3 != 0 or (self.length % 3 == 0 and closer.length % 3 == 0)  # fmt: skip
+
+
+def _match_runs(runs: list[_Run]) -> None:
+    """Pair the delimiter runs, from the first closer on, as CommonMark does: `**` before `*`, so `***` is read as bold and italic."""
+    for at, closer in enumerate(runs):
+        while closer.can_close and closer.count:
+            for before in range(at - 1, -1, -1):
+                opener = runs[before]
+                if opener.matches(closer):
+                    break
+            else:
+                break
+            if closer.char == "~":
+                used, index = 2, _STRIKETHROUGH
+            elif opener.count >= 2 and closer.count >= 2:
+                used, index = 2, _BOLD
+            else:
+                used, index = 1, _ITALIC
+            opener.count -= used
+            closer.count -= used
+            opener.opens.append(index)
+            closer.closes.append(index)
+            # Runs left open between the two are plain text
+            for run in runs[before + 1 : at]:
+                run.can_open = run.can_close = False
+
+
+def _segments(text: str, url: Optional[str] = None) -> list[list]:
+    """Split inline Markdown into `[content, bold, italic, strikethrough, code, url]` segments, or `[expression]` for inline equations."""
+    items: list[Union[str, list, tuple, _Run]] = []
+    runs: list[_Run] = []
+    position = 0
+    for match in _INLINE.finditer(text):
+        items.append(text[position : match.start()])
+        position = match.end()
+        kind = match.lastgroup
+        if kind == "escaped":
+            items.append(match.group("escaped"))
+        elif kind == "code":
+            code = match.group("code")
+            if code.startswith(" ") and code.endswith(" ") and code.strip():
+                code = code[1:-1]
+            items.append([code, False, False, False, True, url])
+        elif kind == "equation":
+            items.append([match.group("equation")])
+        elif kind == "url":
+            link = match.group("url")
+            if url is None and _SCHEME.match(link):
+                items.append(tuple(_segments(match.group("label"), link)))
+            else:
+                items.append(match.group(0))
+        else:
+            run = _Run(text, match.start(), match.end())
+            items.append(run)
+            runs.append(run)
+    items.append(text[position:])
+    _match_runs(runs)
+
+    segments: list[list] = []
+    depth = [0, 0, 0, 0]
+    style = [None, False, False, False, False, url]
+
+    def add(content: str) -> None:
+        if not content:
+            return
+        last = segments[-1] if segments else None
+        if last is not None and len(last) > 1 and last[1:] == style[1:]:
+            last[0] += content
+        else:
+            segments.append([content, *style[1:]])
+
+    def toggle(indexes: list[int], step: int) -> None:
+        for index in indexes:
+            depth[index] += step
+            style[index] = depth[index] > 0
+
+    for item in items:
+        if isinstance(item, str):
+            add(item)
+        elif isinstance(item, _Run):
+            # A run closes with its first delimiters and opens with its last ones: what is left in between is plain text
+            toggle(item.closes, -1)
+            add(item.char * item.count)
+            toggle(item.opens, 1)
+        else:
+            # A code span or an equation, or the segments of a link label
+            for segment in item if isinstance(item, tuple) else (item,):
+                if len(segment) > 1:
+                    segment[1] |= style[1]
+                    segment[2] |= style[2]
+                    segment[3] |= style[3]
+                segments.append(segment)
+    return segments
+
+
+def _rich_text(text: str) -> list[dict[str, Any]]:
+    """The rich text payloads of inline Markdown, split into text objects of at most 2000 UTF-16 code units."""
+    rich_text: list[dict[str, Any]] = []
+    previous = None
+    for segment in _segments(text):
+        if len(segment) == 1:
+            rich_text.append({"type": "equation", "equation": {"expression": segment[0]}})  # fmt: skip
+            previous = None
+            continue
+        content, bold, italic, strikethrough, code, url = segment
+        if previous is not None and previous[1:] == segment[1:]:
+            # Adjacent segments with the same style, such as two code spans
+            content = rich_text.pop()["text"]["content"] + content
+        previous = segment
+        annotations: Optional[dict[str, Any]] = None
+        if bold or italic or strikethrough or code:
+            annotations = {"bold": bold, "italic": italic, "strikethrough": strikethrough, "underline": False, "code": code, "color": "default"}  # fmt: skip
+        link = {"url": url} if url else None
+        for chunk in iter_text_chunks(content):
+            rich_text.append({"type": "text", "text": {"content": chunk, "link": link}, "annotations": annotations})  # fmt: skip
+    return rich_text
+
+
+def _block(type_: str, **data: Any) -> dict:
+    return {"type": type_, type_: data}
+
+
+def _code(lines: list[str], language: str) -> dict:
+    chunks = iter_text_chunks("\n".join(lines), separater="\n")
+    return _block("code", rich_text=[{"type": "text", "text": {"content": chunk, "link": None}} for chunk in chunks], language=language)  # fmt: skip
+
+
+def _cells(line: str) -> list[str]:
+    line = line.strip()
+    if line.startswith("|"):
+        line = line[1:]
+    if line.endswith("|") and not line.endswith("\\|"):
+        line = line[:-1]
+    return [cell.strip() for cell in _CELL_SEPARATOR.split(line)]
+
+
+def _cell(text: str) -> dict:
+    """A table cell, which holds a single rich text object: styles are only kept if the whole cell has the same."""
+    rich_text = _rich_text(text)
+    if len(rich_text) == 1:
+        return rich_text[0]
+    content = "".join([t["text"]["content"] if t["type"] == "text" else t["equation"]["expression"] for t in rich_text])  # fmt: skip
+    return {"type": "text", "text": {"content": content, "link": None}, "annotations": None}  # fmt: skip
+
+
+def _iter_block_payloads(markdown: Union[str, Iterable[str]]) -> Iterator[dict]:
+    """Compile Markdown into the payloads of its top-level blocks, each yielded once complete, see `iter_markdown_blocks`."""
+    lines = markdown.splitlines() if isinstance(markdown, str) else markdown
+    done: list[dict] = []
+    paragraph: list[str] = []
+    quote: list[str] = []
+    items: list[list] = []
+    """Open list items, outermost first, as `[indent, payload, lines]`."""
+    table: Optional[dict] = None
+    header: Optional[str] = None
+    """A line that starts a table if the next one is a table rule."""
+    fence: Optional[tuple[str, str, list[str]]] = None
+    equation: Optional[list[str]] = None
+    blank = False
+
+    def close_item() -> None:
+        _, payload, text = items.pop()
+        payload[payload["type"]]["rich_text"] = _rich_text("\n".join(text))
+        if not items:
+            done.append(payload)
+
+    def close() -> None:
+        nonlocal table
+        if paragraph:
+            done.append(_block("paragraph", rich_text=_rich_text("\n".join(paragraph))))  # fmt: skip
+            paragraph.clear()
+        if quote:
+            done.append(_block("quote", rich_text=_rich_text("\n".join(quote))))
+            quote.clear()
+        while items:
+            close_item()
+        if table is not None:
+            done.append(table)
+            table = None
+
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if fence is not None:
+            marker, language, code = fence
+            if line.strip().startswith(marker) and not line.strip().strip(marker[0]):
+                done.append(_code(code, language))
+                fence = None
+            else:
+                code.append(line)
+        elif equation is not None:
+            if line.strip() == "$$":
+                done.append(_block("equation", expression="\n".join(equation)))
+                equation = None
+            else:
+                equation.append(line)
+        else:
+            if header is not None:
+                pending, header = header, None
+                if _TABLE_RULE.match(line.strip()) and "-" in line:
+                    close()
+                    cells = _cells(pending)
+                    table = _block("table", table_width=len(cells), has_column_header=True, has_row_header=False, children=[_block("table_row", cells=[_cell(c) for c in cells])])  # fmt: skip
+                    continue
+                paragraph.append(pending.strip())
+            expanded = line.expandtabs(4)
+            stripped = expanded.lstrip()
+            indent = len(expanded) - len(stripped)
+            if not stripped:
+                if paragraph or quote or table is not None:
+                    close()
+                blank = True
+            elif table is not None and "|" in stripped:
+                cells = _cells(stripped)
+                width = table["table"]["table_width"]
+                cells = cells[:width] + [""] * (width - len(cells))
+                table["table"]["children"].append(_block("table_row", cells=[_cell(c) for c in cells]))  # fmt: skip
+            elif match := _FENCE.match(stripped):
+                close()
+                language = match.group(2).lower()
+                language = _LANGUAGE_ALIASES.get(language, language)
+                fence = (match.group(1), language if language in _LANGUAGES else "plaintext", [])  # fmt: skip
+            elif stripped.startswith("$$"):
+                close()
+                expression = stripped[2:].rstrip()
+                if expression.endswith("$$"):
+                    done.append(_block("equation", expression=expression[:-2].strip()))  # fmt: skip
+                else:
+                    equation = [expression] if expression else []
+            elif match := _HEADING.match(stripped):
+                close()
+                level = min(len(match.group(1)), 3)
+                done.append(_block(f"heading_{level}", rich_text=_rich_text(match.group(2)), is_toggleable=False))  # fmt: skip
+            elif _RULE.match(stripped):
+                close()
+                done.append(_block("divider"))
+            elif match := _LIST_ITEM.match(stripped):
+                if paragraph or quote or table is not None:
+                    close()
+                marker, text = match.group(1), match.group(2) or ""
+                if marker[0].isdigit():
+                    payload = _block("numbered_list_item")
+                elif todo := _TODO.match(text):
+                    payload = _block("to_do", checked=todo.group(1) != " ")
+                    text = todo.group(2) or ""
+                else:
+                    payload = _block("bulleted_list_item")
+                while items and items[-1][0] >= indent:
+                    close_item()
+                if items:
+                    owner = items[min(len(items), MAX_NESTING) - 1][1]
+                    owner[owner["type"]].setdefault("children", []).append(payload)  # fmt: skip
+                else:
+                    close()
+                items.append([indent, payload, [text]])
+            elif stripped.startswith(">"):
+                if not quote:
+                    close()
+                quote.append(stripped[2:] if stripped.startswith("> ") else stripped[1:])  # fmt: skip
+            elif items and (not blank or indent > items[0][0]):
+                # Continuation of the last list item
+                items[-1][2].append(stripped)
+            elif "|" in stripped and not paragraph:
+                close()
+                header = stripped
+            else:
+                if not paragraph:
+                    close()
+                paragraph.append(stripped)
+            blank = not stripped
+        if done:
+            yield from done
+            done.clear()
+    if fence is not None:
+        # An unclosed fence runs to the end of the document
+        done.append(_code(fence[2], fence[1]))
+    if equation is not None:
+        done.append(_block("equation", expression="\n".join(equation)))
+    if header is not None:
+        paragraph.append(header)
+    close()
+    yield from done
+
+
+def iter_markdown_blocks(markdown: Union[str, Iterable[str]]) -> Iterator[BlockObject]:
+    """
+    Compile Markdown into blocks, in a single pass.
+
+    Supports ATX headings (levels 4 to 6 become `heading_3`), paragraphs, bulleted, numbered and task lists, fenced code, block quotes, pipe tables, `$$` equations and thematic breaks, with bold, italic, strikethrough, code, links and `$inline$` equations in the text. List items nested deeper than `MAX_NESTING` levels are attached at that level, so that every block can be sent in one request. Tables and lists may hold more than 100 rows or items: `AppendBlockChildrenRequest.plan` sends the others in follow-up requests. Text is split into rich text objects of at most 2000 UTF-16 code units.
+
+    The blocks are built from their payloads directly, without the validators of the `.new()` factories.
+
+    Args:
+        markdown: The Markdown, as a string or an iterable of lines such as an open file.
+
+    Yields:
+        The top-level blocks, each one as soon as it is complete.
+    """
+    global _block_adapter
+    adapter = _block_adapter
+    if adapter is None:
+        adapter = _block_adapter = TrustedAdapter(BlockObject)
+    for payload in _iter_block_payloads(markdown):
+        yield adapter.construct_python(payload)
+
+
+__all__ = [
+    "rich_text_to_markdown",
+    "iter_markdown",
+    "render_markdown",
+    "MAX_NESTING",
+    "iter_markdown_blocks",
+]
@@ -25,7 +25,13 @@ from .mention import (
     MentionObject,
     MentionRichTextObject,
 )
-from .rich_text import RichTextObject, RichTextObjectFactory
+from .rich_text import (
+    RichTextObject,
+    RichTextObjectFactory,
+    utf16_len,
+    iter_text_chunks,
+    join_plain_text,
+)
 
 
 __all__ = [
@@ -60,4 +66,7 @@ __all__ = [
     # Rich Text
     "RichTextObject",
     "RichTextObjectFactory",
+    "utf16_len",
+    "iter_text_chunks",
+    "join_plain_text",
 ]
@@ -2,7 +2,7 @@ from typing import Literal, Optional
 
 from pydantic import AnyHttpUrl, Field
 
-from pydantic_api.base import BaseModel
+from pydantic_api.notion.models.base import BaseModel
 
 from pydantic_api.notion.models.objects.common import ColorLiteral
 
@@ -26,10 +26,12 @@ class BaseRichTextObject(BaseModel):
 
     type: RichTextTypeLiteral
     annotations: Optional[TextAnnotations] = Field(
-        None, description="Formatting style for the text"
+        default=None, description="Formatting style for the text"
+    )
+    plain_text: Optional[str] = Field(default=None)
+    href: Optional[AnyHttpUrl] = Field(
+        default=None, description="Hyperlink for the text"
     )
-    plain_text: Optional[str] = Field(None)
-    href: Optional[AnyHttpUrl] = Field(None, description="Hyperlink for the text")
 
 
 __all__ = [
@@ -1,6 +1,6 @@
 from typing import Literal
 
-from pydantic_api.base import BaseModel
+from pydantic_api.notion.models.base import BaseModel
 from .base import BaseRichTextObject
 
 
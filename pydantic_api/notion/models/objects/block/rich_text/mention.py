@@ -1,10 +1,10 @@
 from datetime import datetime
 from typing import Literal, Union, Annotated, Optional
 
-from uuid import UUID
+from ...ids import NotionId
 from pydantic import AnyUrl, Field
 
-from pydantic_api.base import BaseModel
+from pydantic_api.notion.models.base import BaseModel
 from .base import BaseRichTextObject
 
 MentionTypeLiteral = Literal[
@@ -25,7 +25,7 @@ class _BaseMentionObject(BaseModel):
 
 # 1. Database mention
 class DatabaseMentionBody(BaseModel):
-    id: UUID = Field(..., description=f"The id of the mentioned database")
+    id: NotionId = Field(..., description=f"The id of the mentioned database")
 
 
 class DatabaseMentionObject(_BaseMentionObject):
@@ -66,7 +66,7 @@ class LinkPreviewMentionObject(_BaseMentionObject):
 
 # 4. Page mention
 class PageMentionBody(BaseModel):
-    id: UUID = Field(..., description=f"The id of the mentioned page")
+    id: NotionId = Field(..., description=f"The id of the mentioned page")
 
 
 class PageMentionObject(_BaseMentionObject):
@@ -117,7 +117,7 @@ class TemplateMentionObject(_BaseMentionObject):
 # 6. User mention
 class UserMentionBody(BaseModel):
     object: Literal["user"] = "user"
-    id: UUID = Field(..., description="The id of the mentioned user")
+    id: NotionId = Field(..., description="The id of the mentioned user")
 
 
 class UserMentionObject(_BaseMentionObject):
@@ -1,9 +1,9 @@
-from typing import Annotated, Union
+from typing import Annotated, Callable, Iterable, Iterator, Union
 
 from pydantic import AnyUrl, Field
 
 from .base import TextAnnotations
-from .text import TextRichTextObject
+from .text import TextObject, TextRichTextObject
 from .mention import MentionRichTextObject
 from .equation import EquationRichTextObject
 from pydantic_api.notion.models.objects.common import ColorLiteral
@@ -14,8 +14,101 @@ RichTextObject = Annotated[
 ]
 
 
+def utf16_len(text: str) -> int:
+    """Length of `text` in UTF-16 code units, which is how Notion counts its text limits."""
+    return len(text) if text.isascii() else len(text.encode("utf-16-le")) // 2
+
+
+def _utf16_prefix(text: str, limit: int) -> int:
+    """Number of code points of the longest prefix of `text` that fits in `limit` UTF-16 code units."""
+    excess = utf16_len(text) - limit
+    if excess <= 0:
+        return len(text)
+    # Every code point takes one or two units: dropping `excess` of them is enough, then grow back into the slack.
+    end = len(text) - excess
+    slack = limit - utf16_len(text[:end])
+    while slack > 0:
+        step = max(slack // 2, 1)
+        units = utf16_len(text[end : end + step])
+        if units > slack:
+            break
+        end, slack = end + step, slack - units
+    return end
+
+
+def iter_text_chunks(
+    content: str, max_segment_len: int = 2000, separater: str = " "
+) -> Iterator[str]:
+    """
+    Split `content` into chunks of at most `max_segment_len` UTF-16 code units, in a single pass.
+
+    Chunks end after the last `separater` that fits, and long runs without one are split at the limit. Separators are kept at the end of the chunks, so `"".join(chunks) == content`.
+
+    Args:
+        content: The text to split.
+        max_segment_len: Maximum length of each chunk, in UTF-16 code units.
+        separater: Preferred place to split; `""` splits at the limit only.
+
+    Yields:
+        The chunks, in order.
+    """
+    if max_segment_len < 2:
+        raise ValueError("max_segment_len must be at least 2 UTF-16 code units.")
+
+    start, length = 0, len(content)
+    while start < length:
+        end = start + _utf16_prefix(content[start : start + max_segment_len], max_segment_len)  # fmt: skip
+        if end < length and separater:
+            split = content.rfind(separater, start, end)
+            if split > start:
+                end = split + len(separater)
+        yield content[start:end]
+        start = end
+
+
+def join_plain_text(rich_text: Iterable[RichTextObject]) -> str:
+    """Concatenate the `plain_text` of `rich_text`, using the content of text objects that have none, such as those created by `RichTextObjectFactory`."""
+    return "".join(
+        [
+            t.plain_text or (t.text.content if t.type == "text" else "")
+            for t in rich_text
+        ]
+    )
+
+
 # Factory class for Devlopers
 class RichTextObjectFactory:
+    @classmethod
+    def iter_text(
+        cls,
+        content: str,
+        link_url: str | None = None,
+        bold: bool | None = None,
+        italic: bool | None = None,
+        strikethrough: bool | None = None,
+        underline: bool | None = None,
+        code: bool | None = None,
+        color: ColorLiteral | None = None,
+        max_segment_len: int = 2000,
+        separater: str = " ",
+    ) -> Iterator[TextRichTextObject]:
+        """
+        Lazily create TextRichTextObject instances for `content`, split as by `iter_text_chunks`.
+
+        Every chunk carries the same link and annotations. Arguments are the same as for `new_text`.
+        """
+        build = cls._text_builder(
+            link_url=link_url,
+            bold=bold,
+            italic=italic,
+            strikethrough=strikethrough,
+            underline=underline,
+            code=code,
+            color=color,
+        )
+        for chunk in iter_text_chunks(content, max_segment_len, separater):
+            yield build(chunk)
+
     @classmethod
     def new_text(
         cls,
@@ -35,54 +128,17 @@ class RichTextObjectFactory:
 
         Args:
             content: The text content to convert.
-            link_url: Hyperlink associated with the text.
-            bold, italic, strikethrough, underline, code, color: Styling options.
-            max_segment_len: Maximum length for each rich text object.
+            link_url: Hyperlink associated with the text, set on every segment.
+            bold, italic, strikethrough, underline, code, color: Styling options, set on every segment.
+            max_segment_len: Maximum length for each rich text object, in UTF-16 code units as counted by Notion.
             separater: Word separator for splitting long text.
 
         Returns:
             A list of RichTextObject instances.
         """
-        if link_url is not None and len(content) > max_segment_len:
-            raise ValueError(
-                f"Text length exceeds the maximum segment length of {max_segment_len} when a link is provided."
-            )
-
-        if not content:
-            return []
-
-        words = content.split(separater)
-        segments = []
-        current_segment = []
-        current_length = 0
-
-        for word in words:
-            word_length = len(word)
-            # If adding this word exceeds the max length, flush the current segment
-            if current_length + word_length + len(separater) > max_segment_len:
-                if current_segment:
-                    segments.append(separater.join(current_segment))
-                    current_segment = []
-                    current_length = 0
-
-            # If the word itself is too long, split it into smaller segments
-            while word_length > max_segment_len:
-                segments.append(word[:max_segment_len])
-                word = word[max_segment_len:]
-                word_length = len(word)
-
-            # Add the remaining word to the current segment
-            current_segment.append(word)
-            current_length += word_length + len(separater)
-
-        # Flush the last segment
-        if current_segment:
-            segments.append(separater.join(current_segment))
-
-        # Convert segments to RichTextObject instances
-        rich_text_objects = [
-            TextRichTextObject.new(
-                content=segment,
+        return list(
+            cls.iter_text(
+                content,
                 link_url=link_url,
                 bold=bold,
                 italic=italic,
@@ -90,10 +146,78 @@ class RichTextObjectFactory:
                 underline=underline,
                 code=code,
                 color=color,
+                max_segment_len=max_segment_len,
+                separater=separater,
             )
-            for segment in segments
+        )
+
+    @classmethod
+    def new_texts(
+        cls,
+        contents: Iterable[str],
+        link_url: str | None = None,
+        bold: bool | None = None,
+        italic: bool | None = None,
+        strikethrough: bool | None = None,
+        underline: bool | None = None,
+        code: bool | None = None,
+        color: ColorLiteral | None = None,
+        max_segment_len: int = 2000,
+        separater: str = " ",
+    ) -> list[list[RichTextObject]]:
+        """
+        Batch version of `new_text`: convert each string of `contents` with the same options.
+
+        The link and annotations are validated once for the whole batch.
+
+        Returns:
+            One list of RichTextObject instances per string, in order.
+        """
+        build = cls._text_builder(
+            link_url=link_url,
+            bold=bold,
+            italic=italic,
+            strikethrough=strikethrough,
+            underline=underline,
+            code=code,
+            color=color,
+        )
+        return [
+            [build(chunk) for chunk in iter_text_chunks(content, max_segment_len, separater)]  # fmt: skip
+            for content in contents
         ]
-        return rich_text_objects
+
+    @classmethod
+    def _text_builder(
+        cls,
+        link_url: str | None = None,
+        bold: bool | None = None,
+        italic: bool | None = None,
+        strikethrough: bool | None = None,
+        underline: bool | None = None,
+        code: bool | None = None,
+        color: ColorLiteral | None = None,
+    ) -> Callable[[str], TextRichTextObject]:
+        """A function creating a TextRichTextObject from a chunk of text, with the link and annotations built once."""
+        template = TextRichTextObject.new(
+            content="",
+            link_url=link_url,
+            bold=bold,
+            italic=italic,
+            strikethrough=strikethrough,
+            underline=underline,
+            code=code,
+            color=color,
+        )
+        link, annotations = template.text.link, template.annotations
+
+        def build(chunk: str) -> TextRichTextObject:
+            return TextRichTextObject(
+                text=TextObject(content=chunk, link=link and link.model_copy()),
+                annotations=annotations and annotations.model_copy(),
+            )
+
+        return build
 
     @classmethod
     def new_equation(cls, expression: str):
@@ -109,4 +233,7 @@ class RichTextObjectFactory:
 __all__ = [
     "RichTextObject",
     "RichTextObjectFactory",
+    "utf16_len",
+    "iter_text_chunks",
+    "join_plain_text",
 ]
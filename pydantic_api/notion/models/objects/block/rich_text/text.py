@@ -1,7 +1,7 @@
 from typing import Literal, Optional
 
 from pydantic import AnyUrl, Field
-from pydantic_api.base import BaseModel
+from pydantic_api.notion.models.base import BaseModel
 
 from .base import BaseRichTextObject, TextAnnotations
 from pydantic_api.notion.models.objects.common import ColorLiteral
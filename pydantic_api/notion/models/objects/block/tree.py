@@ -0,0 +1,202 @@
+"""
+An addressable tree of blocks, assembled from successive pages of block children.
+
+Reference: https://developers.notion.com/reference/get-block-children
+"""
+
+import weakref
+from uuid import UUID
+from collections import deque
+from typing import Any, Iterable, Iterator, Optional, Union
+
+from .block import BlockObject
+from ..ids import NotionId
+
+
+BlockId = Union[NotionId, UUID, str]
+"""A block id, as a `NotionId`, a `UUID` or its string form (with or without dashes)."""
+
+
+class BlockNode:
+    """A block of a `BlockTree`, with its ordered children and a weak reference to its parent.
+
+    The root node stands for the page (or block) the tree was retrieved from, and has no `block`. So does a node whose children arrived before the block itself, until it arrives.
+
+    `fetched` is set once a page of its children was appended with its id as `parent_id`, even an empty one.
+    """
+
+    __slots__ = ("id", "block", "children", "fetched", "_parent", "__weakref__")
+
+    def __init__(self, id: NotionId, block: Optional[BlockObject] = None):
+        self.id = id
+        self.block = block
+        self.children: list[BlockNode] = []
+        self.fetched = False
+        self._parent: Optional[weakref.ref] = None
+
+    @property
+    def parent(self) -> Optional["BlockNode"]:
+        """The parent node; None for the root, a detached node, or once the tree is gone."""
+        return self._parent() if self._parent is not None else None
+
+    @property
+    def depth(self) -> int:
+        """Number of ancestors of this node: 0 for the root, 1 for top-level blocks."""
+        depth, parent = 0, self.parent
+        while parent is not None:
+            depth, parent = depth + 1, parent.parent
+        return depth
+
+    def __repr__(self) -> str:
+        type_ = self.block.type if self.block is not None else None
+        return f"{type(self).__name__}(id={self.id}, type={type_}, children={len(self.children)})"  # fmt: skip
+
+
+class BlockTree:
+    """Blocks indexed by id and linked to their parent and children, built incrementally from pages of block children.
+
+    Each appended block is attached to the parent given to `append`, or else to the parent recorded in the block itself. Lookups by id are O(1), and traversals are iterative, so deep trees do not hit the recursion limit.
+
+    Example:
+
+        tree = BlockTree(page_id)
+        tree.append(client.retrieve_block_children(page_id))
+        while pending := tree.pending():
+            for block_id in pending:
+                tree.append(client.retrieve_block_children(block_id), parent_id=block_id)
+        for node in tree.depth_first():
+            ...
+    """
+
+    def __init__(self, root_id: BlockId):
+        self.root = BlockNode(_block_id(root_id))
+        self._nodes: dict[NotionId, BlockNode] = {self.root.id: self.root}
+
+    @classmethod
+    def new(cls, root_id: BlockId, pages: Iterable[Any] = ()) -> "BlockTree":
+        """Create a tree and append `pages` to it, see `append`."""
+        tree = cls(root_id)
+        for page in pages:
+            tree.append(page)
+        return tree
+
+    def append(
+        self,
+        page: Union[Any, Iterable[BlockObject]],
+        parent_id: Optional[BlockId] = None,
+    ) -> list[BlockNode]:
+        """
+        Append a page of children: a `NotionPaginatedData[BlockObject]` (such as `RetrieveBlockChildrenResponse`) or any iterable of blocks.
+
+        Args:
+            page: The blocks to append, in order.
+            parent_id: The block (or page) they are the children of. By default, the `parent` of each block, or the root for blocks without one.
+
+        Returns:
+            The nodes of the appended blocks.
+        """
+        blocks = getattr(page, "results", page)
+        parent = None
+        if parent_id is not None:
+            parent = self._node(_block_id(parent_id))
+            parent.fetched = True
+        appended = []
+        for block in blocks:
+            if block.id is None:
+                raise ValueError(f"Cannot add a block without an id to a BlockTree: {block!r}")  # fmt: skip
+            node = self._nodes.get(block.id)
+            if node is None:
+                node = self._nodes[block.id] = BlockNode(block.id, block)
+            else:
+                node.block = block
+                if node.parent is not None or node is self.root:
+                    # Already attached, e.g. a page that was retrieved twice
+                    appended.append(node)
+                    continue
+            owner = parent
+            if owner is None:
+                recorded = _parent_id(block)
+                owner = self._node(recorded) if recorded is not None else self.root
+            node._parent = weakref.ref(owner)
+            owner.children.append(node)
+            appended.append(node)
+        return appended
+
+    def pending(self) -> list[NotionId]:
+        """Ids of the blocks that have children (`has_children`) but none appended yet, i.e. what to retrieve next.
+
+        A block whose children were retrieved with its id as `parent_id` is not pending anymore, even if none came back (e.g. they were all deleted since).
+        """
+        return [
+            node.id
+            for node in self._nodes.values()
+            if not node.children
+            and not node.fetched
+            and node.block is not None
+            and node.block.has_children
+        ]
+
+    def depth_first(self, start: Optional[BlockId] = None) -> Iterator[BlockNode]:
+        """The descendants of `start` (the root by default) in document order, i.e. pre-order depth-first."""
+        stack = list(reversed(self._start(start).children))
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    def breadth_first(self, start: Optional[BlockId] = None) -> Iterator[BlockNode]:
+        """The descendants of `start` (the root by default), level by level."""
+        queue = deque(self._start(start).children)
+        while queue:
+            node = queue.popleft()
+            yield node
+            queue.extend(node.children)
+
+    def get(self, block_id: BlockId) -> Optional[BlockNode]:
+        return self._nodes.get(_block_id(block_id))
+
+    def __getitem__(self, block_id: BlockId) -> BlockNode:
+        return self._nodes[_block_id(block_id)]
+
+    def __contains__(self, block_id: object) -> bool:
+        if not isinstance(block_id, (NotionId, UUID, str)):
+            return False
+        try:
+            return _block_id(block_id) in self._nodes
+        except ValueError:
+            return False
+
+    def __len__(self) -> int:
+        """Number of nodes, without the root."""
+        return len(self._nodes) - 1
+
+    def __iter__(self) -> Iterator[BlockNode]:
+        return self.depth_first()
+
+    def _node(self, block_id: NotionId) -> BlockNode:
+        """The node of `block_id`, created (detached) if its block has not arrived yet."""
+        node = self._nodes.get(block_id)
+        if node is None:
+            node = self._nodes[block_id] = BlockNode(block_id)
+        return node
+
+    def _start(self, start: Optional[BlockId]) -> BlockNode:
+        return self.root if start is None else self[start]
+
+
+def _block_id(block_id: BlockId) -> NotionId:
+    return NotionId(block_id)
+
+
+def _parent_id(block: BlockObject) -> Optional[NotionId]:
+    parent = block.parent
+    if parent is None:
+        return None
+    return getattr(parent, parent.type)
+
+
+__all__ = [
+    "BlockId",
+    "BlockNode",
+    "BlockTree",
+]
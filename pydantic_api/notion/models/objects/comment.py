@@ -3,13 +3,13 @@ Reference: https://developers.notion.com/reference/comment-object
 """
 
 from typing import Literal, List, Union
-from datetime import datetime
 
-from uuid import UUID
+from .ids import NotionId
+from .timestamps import Timestamp
 
-from pydantic_api.base import BaseModel
+from pydantic_api.notion.models.base import BaseModel
 from .user import PartialUser
-from .block import RichTextObject
+from .block import RichTextObject, join_plain_text
 from .parent import BlockParentObject, PageParentObject
 
 
@@ -24,14 +24,19 @@ class CommentObject(BaseModel):
     """
 
     object: Literal["comment"] = "comment"
-    id: UUID
+    id: NotionId
     parent: ParentOfComment
-    discussion_id: UUID
-    created_time: datetime
-    last_edited_time: datetime
+    discussion_id: NotionId
+    created_time: Timestamp
+    last_edited_time: Timestamp
     created_by: PartialUser
     rich_text: List[RichTextObject]
 
+    @property
+    def plain_text(self) -> str:
+        """The comment's text."""
+        return join_plain_text(self.rich_text)
+
 
 __all__ = [
     "ParentOfComment",
@@ -1,12 +1,15 @@
-from pydantic import AnyUrl
+from pydantic import AnyUrl, Field
 from datetime import datetime
-from typing import Union, Literal, Optional
+from typing import Union, Literal, Optional, Annotated
 
 from .emoji import EmojiObject
 from .file import ExternalFileObject, UploadedFileObject
 
 
-IconObject = Union[UploadedFileObject, ExternalFileObject, EmojiObject]
+IconObject = Annotated[
+    Union[UploadedFileObject, ExternalFileObject, EmojiObject],
+    Field(discriminator="type"),
+]
 
 
 class IconObjectFactory:
@@ -40,7 +43,9 @@ class IconObjectFactory:
         return EmojiObject(emoji=emoji)
 
 
-CoverObject = Union[ExternalFileObject, UploadedFileObject]
+CoverObject = Annotated[
+    Union[ExternalFileObject, UploadedFileObject], Field(discriminator="type")
+]
 
 
 class CoverObjectFactory:
@@ -2,15 +2,15 @@
 Reference: https://developers.notion.com/reference/property-object
 """
 
-from datetime import datetime
 from typing import List, Optional, Literal, Dict, Any
 
-from uuid import UUID
+from .ids import NotionId
+from .timestamps import Timestamp
 from pydantic import AnyHttpUrl, Field
 
-from pydantic_api.base import BaseModel
+from pydantic_api.notion.models.base import BaseModel
 from .user import PartialUser
-from .block import RichTextObject
+from .block import RichTextObject, join_plain_text
 from .parent import PageParentObject, BlockParentObject
 from .properties import DatabaseProperty
 from .common import IconObject, CoverObject
@@ -29,10 +29,10 @@ class Database(BaseModel):
     """Reference: https://developers.notion.com/reference/database"""
 
     object: Literal["database"] = "database"
-    id: UUID
-    created_time: datetime
+    id: NotionId
+    created_time: Timestamp
     created_by: PartialUser
-    last_edited_time: datetime
+    last_edited_time: Timestamp
     last_edited_by: PartialUser
     title: List[RichTextObject] = Field(default_factory=list)
     description: List[Dict[str, Any]] = Field(default_factory=list)
@@ -45,7 +45,8 @@ class Database(BaseModel):
 
     @property
     def plain_text_title(self) -> str:
-        return "".join([t.plain_text for t in self.title if t.plain_text])
+        """The database's title as plain text."""
+        return join_plain_text(self.title)
 
 
 __all__ = [
@@ -4,10 +4,33 @@ Reference: https://developers.notion.com/reference/emoji-object
 
 from typing import Literal
 
-import emoji
 from pydantic import field_validator, Field
 
-from pydantic_api.base import BaseModel
+from pydantic_api.notion.models.base import BaseModel
+
+
+_emoji_index: frozenset[str] | None = None
+
+
+def load_emoji_index() -> frozenset[str]:
+    """Load the precomputed set of valid emoji sequences.
+
+    The index is generated from the `emoji` package by `scripts/generate_emoji_index.py` and loaded on first use. Call this before forking worker processes to share one copy between them.
+    """
+    global _emoji_index
+    if _emoji_index is None:
+        from ._emoji_index import EMOJI_SEQUENCES
+
+        _emoji_index = frozenset(EMOJI_SEQUENCES.split("\n"))
+    return _emoji_index
+
+
+def is_emoji(v: str) -> bool:
+    """Whether `v` is a single emoji, with the same semantics as `emoji.is_emoji`."""
+    index = _emoji_index
+    if index is None:
+        index = load_emoji_index()
+    return v in index
 
 
 class EmojiObject(BaseModel):
@@ -21,8 +44,8 @@ class EmojiObject(BaseModel):
     def ensure_valid_emoji_character(cls, v: str):
         # if len(v) > 1:
         # raise ValueError("Emoji must be a single character.")
-        if not emoji.is_emoji(v):
-            raise ValueError("Invalid emoji character: {v}")
+        if not is_emoji(v):
+            raise ValueError(f"Invalid emoji character: {v}")
         return v
 
 
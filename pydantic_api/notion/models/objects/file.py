@@ -9,7 +9,7 @@ from datetime import datetime
 from typing import Literal, Optional, Annotated, Union
 
 from pydantic import AnyUrl, Field
-from pydantic_api.base import BaseModel
+from pydantic_api.notion.models.base import BaseModel
 
 
 FileObjectTypeLiteral = Literal["file", "external"]
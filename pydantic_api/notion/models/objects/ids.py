@@ -0,0 +1,134 @@
+"""
+Identifiers of Notion objects.
+
+Reference: https://developers.notion.com/reference/intro#conventions
+"""
+
+from uuid import UUID
+from typing import Any, Optional
+
+from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import core_schema
+
+_new = bytes.__new__
+_fromhex = bytes.fromhex
+
+
+def _from_hex(value: str) -> Optional[bytes]:
+    """The 16 bytes of an id written as 32 hexadecimal digits, with or without its 4 dashes, else None."""
+    digits = value.replace("-", "")
+    if len(digits) != 32 or len(value) != 32 and len(value) != 36:
+        return None
+    try:
+        raw = _fromhex(digits)
+    except ValueError:
+        return None
+    # `fromhex` skips whitespace
+    return raw if len(raw) == 16 else None
+
+
+def _serialize(value: "NotionId", info: core_schema.SerializationInfo) -> Any:
+    """The dashed string of an id in JSON, and its `UUID` in Python mode, the type of ids before `NotionId`."""
+    return str(value) if info.mode_is_json() else value.uuid
+
+
+def _validate(value: Any) -> "NotionId":
+    """`NotionId(value)` as the validator of pydantic: a plain function on the path of the strings of payloads, which is cheaper to call than the class."""
+    if type(value) is str:
+        raw = _from_hex(value)
+        if raw is not None:
+            return _new(NotionId, raw)
+    return NotionId(value)
+
+
+class NotionId(bytes):
+    """The id of a Notion object (page, database, block, user, comment, ...), stored as its 16 bytes.
+
+    Notion writes ids as dashed UUIDs (`"59833787-2cf9-4fdf-8782-e53db20768a5"`) in its payloads, and without dashes in URLs (`"598337872cf94fdf8782e53db20768a5"`): both are accepted, as are `UUID` instances, and ids are written back in the dashed form. Like `UUID`, the positions of the dashes are not checked. The 32 hexadecimal digits are `id.hex()`. A `NotionId` is equal to the `UUID` of the same value, and hashes like it, so either can look the other up in a dict or a set.
+
+    Models serialize ids to their dashed string in JSON, and to a `UUID` in Python mode (`model_dump()`), as when ids were typed `UUID`. Being `bytes`, an id held outside of a model, in a plain dict or a field typed `Any`, is serialized by inference as bytes, which fails: pass `bytes_mode="hex"` to `pydantic_core.to_json`, for the undashed form, or `str()` it first.
+
+    Compared to a `UUID`, which holds a separate `int`, an id takes 40% less memory (65 bytes instead of 108). Validating ids from JSON costs about as much as the `UUID` parser of pydantic, see `benchmarks/bench_notion_id.py`.
+
+    Example:
+
+        NotionId("598337872cf94fdf8782e53db20768a5") == UUID("59833787-2cf9-4fdf-8782-e53db20768a5")  # True
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, value: Any) -> "NotionId":
+        if isinstance(value, str):
+            raw = _from_hex(str(value))
+            if raw is None:
+                raise ValueError(f"Not a Notion id: {value!r}")
+            return _new(cls, raw)
+        if type(value) is cls:
+            return value
+        if isinstance(value, UUID):
+            return _new(cls, value.bytes)
+        if isinstance(value, (bytes, bytearray)) and len(value) == 16:
+            return _new(cls, value)
+        # A ValueError rather than a TypeError, for pydantic to report it as a validation error
+        raise ValueError(f"A Notion id must be a string or a UUID, not {type(value).__name__}")  # fmt: skip
+
+    def __str__(self) -> str:
+        h = bytes.hex(self)
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}('{self}')"
+
+    def __reduce__(self):
+        return (type(self), (bytes(self),))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, NotionId):
+            return bytes.__eq__(self, other)
+        if isinstance(other, UUID):
+            return bytes(self) == other.bytes
+        if isinstance(other, (bytes, bytearray)):
+            # Not equal to its raw bytes, whose hash differs: the reflected `bytes.__eq__` would say otherwise
+            return False
+        return NotImplemented
+
+    def __ne__(self, other: object) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self) -> int:
+        # The hash of the `UUID` of the same value
+        return hash(int.from_bytes(self, "big"))
+
+    @property
+    def int(self) -> int:
+        """The id as a 128-bit integer (as `UUID.int`)."""
+        return int.from_bytes(self, "big")
+
+    @property
+    def uuid(self) -> UUID:
+        """The id as a `UUID`."""
+        return UUID(bytes=bytes(self))
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            _validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                _serialize, info_arg=True
+            ),
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
+    ) -> JsonSchemaValue:
+        return {"type": "string", "format": "uuid"}
+
+
+__all__ = [
+    "NotionId",
+]
@@ -1,12 +1,17 @@
-from datetime import datetime
-from typing import Optional, Literal, Union, Dict, Any, Annotated
+import json
+from typing import Optional, Literal, Union, Dict, Any, Annotated, Iterator, Mapping
+from collections.abc import MutableMapping
 
-from uuid import UUID
-from pydantic import AnyHttpUrl, Field
+from .ids import NotionId
+from .timestamps import Timestamp
+from pydantic import AnyHttpUrl, Field, GetCoreSchemaHandler, TypeAdapter
+from pydantic.json_schema import GetJsonSchemaHandler, JsonSchemaValue
+from pydantic_core import CoreSchema, core_schema
 
-from pydantic_api.base import BaseModel
+from pydantic_api.notion.models.base import BaseModel
 from .user import PartialUser
 from .properties import PageProperty, TitleProperty
+from .properties.page_property import BasePageProperty
 from .common import IconObject, CoverObject
 from .parent import DatabaseParentObject, PageParentObject, WorkspaceParentObject
 
@@ -26,10 +31,10 @@ class Page(BaseModel):
     """Reference: https://developers.notion.com/reference/page"""
 
     object: Literal["page"] = "page"
-    id: UUID
-    created_time: datetime
+    id: NotionId
+    created_time: Timestamp
     created_by: PartialUser
-    last_edited_time: datetime
+    last_edited_time: Timestamp
     last_edited_by: PartialUser
     archived: bool
     in_trash: bool
@@ -41,17 +46,140 @@ class Page(BaseModel):
     public_url: Optional[AnyHttpUrl] = Field(None)
 
     @property
-    def title_property(self):
-        return TitleProperty.model_validate(self.properties.get("title"))
+    def title_property(self) -> Optional[TitleProperty]:
+        """The page's title property, found by type: it is named "title" for pages in a page, but after the title column for database rows."""
+        name = self._find_title_property()
+        if name is None:
+            return None
+        prop = self.properties[name]
+        return prop if prop.type == "title" else None
 
     @property
     def plain_text_title(self) -> str:
-        return "".join(
-            [t.plain_text for t in self.title_property.title if t.plain_text]
+        title_property = self.title_property
+        return title_property.plain_text if title_property is not None else ""
+
+    def _find_title_property(self) -> Optional[str]:
+        for name, prop in self.properties.items():
+            if prop.type == "title":
+                return name
+        return None
+
+
+_page_property_adapter: TypeAdapter | None = None
+
+
+class LazyPageProperties(MutableMapping[str, PageProperty]):
+    """The `properties` of a `LazyPage`: a mapping that keeps each property's raw payload and validates it into its `PageProperty` class on first access.
+
+    The decoded property replaces the raw payload, so each property is validated at most once. Iterating over the names, `len` and `in` do not decode anything; `values()`, `items()` and serialization decode every property.
+    """
+
+    __slots__ = ("_data", "_from_json")
+
+    def __init__(self, data: Mapping[str, Any] | None = None, from_json: bool = False):
+        self._data: dict[str, Any] = dict(data) if data else {}
+        # Payloads parsed from JSON are decoded in JSON mode, like `Page.model_validate_json` does (e.g. for dates).
+        self._from_json = from_json
+
+    def __getitem__(self, name: str) -> PageProperty:
+        value = self._data[name]
+        if not isinstance(value, BasePageProperty):
+            global _page_property_adapter
+            if _page_property_adapter is None:
+                _page_property_adapter = TypeAdapter(PageProperty)
+            if self._from_json:
+                value = _page_property_adapter.validate_json(json.dumps(value))
+            else:
+                value = _page_property_adapter.validate_python(value)
+            self._data[name] = value
+        return value
+
+    def __setitem__(self, name: str, value: PageProperty | dict[str, Any]):
+        self._data[name] = value
+
+    def __delitem__(self, name: str):
+        del self._data[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._data
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+    def is_decoded(self, name: str) -> bool:
+        """Whether the property `name` has already been validated."""
+        return isinstance(self._data[name], BasePageProperty)
+
+    def type_of(self, name: str) -> str:
+        """The type of the property `name`, without validating it."""
+        value = self._data[name]
+        return value.type if isinstance(value, BasePageProperty) else value.get("type")
+
+    def decode_all(self) -> Dict[str, PageProperty]:
+        """Validate every property, and return them as a plain dict."""
+        return {name: self[name] for name in self._data}
+
+    @classmethod
+    def _validate(cls, value: Any, from_json: bool = False) -> "LazyPageProperties":
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, Mapping):
+            return cls(value, from_json=from_json)
+        raise ValueError(f"properties must be a mapping, got {type(value).__name__}")
+
+    @classmethod
+    def _validate_json(cls, value: Any) -> "LazyPageProperties":
+        return cls._validate(value, from_json=True)
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        return core_schema.json_or_python_schema(
+            json_schema=core_schema.no_info_plain_validator_function(cls._validate_json),
+            python_schema=core_schema.no_info_plain_validator_function(cls._validate),
+            # Serialize exactly like `Page.properties`, decoding what has not been accessed yet.
+            serialization=core_schema.wrap_serializer_function_ser_schema(
+                lambda value, serializer: serializer(value.decode_all()),
+                schema=handler.generate_schema(Dict[str, PageProperty]),
+            ),
         )
 
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, schema: CoreSchema, handler: GetJsonSchemaHandler
+    ) -> JsonSchemaValue:
+        return handler(
+            core_schema.dict_schema(core_schema.str_schema(), core_schema.any_schema())
+        )
+
+
+class LazyPage(Page):
+    """A `Page` whose `properties` are only validated when accessed, see `LazyPageProperties`.
+
+    Useful for pages of wide databases when only a few properties are read: unaccessed properties are never validated, and serializing a `LazyPage` gives the same output as the eager `Page`.
+    """
+
+    # A `MutableMapping` of the same items as `Page.properties`, but not a `dict`: widening `Page.properties` to a mapping would change the schema of eager pages.
+    properties: LazyPageProperties = Field(default_factory=LazyPageProperties)  # type: ignore[assignment]
+
+    def _find_title_property(self) -> Optional[str]:
+        for name in self.properties:
+            if self.properties.type_of(name) == "title":
+                return name
+        return None
+
 
 __all__ = [
     "ParentOfPage",
     "Page",
+    "LazyPageProperties",
+    "LazyPage",
 ]
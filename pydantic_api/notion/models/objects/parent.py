@@ -4,10 +4,10 @@ Reference: https://developers.notion.com/reference/parent-object
 
 from typing import Literal, Union, Annotated
 
-from uuid import UUID
+from .ids import NotionId
 from pydantic import Field
 
-from pydantic_api.base import BaseModel
+from pydantic_api.notion.models.base import BaseModel
 
 
 ParentObjectTypeLiteral = Literal["database_id", "page_id", "workspace", "block_id"]
@@ -17,14 +17,14 @@ class DatabaseParentObject(BaseModel):
     """Database as a parent."""
 
     type: Literal["database_id"] = "database_id"
-    database_id: UUID
+    database_id: NotionId
 
 
 class PageParentObject(BaseModel):
     """Page as a parent."""
 
     type: Literal["page_id"] = "page_id"
-    page_id: UUID
+    page_id: NotionId
 
 
 class WorkspaceParentObject(BaseModel):
@@ -38,7 +38,7 @@ class BlockParentObject(BaseModel):
     """Block as a parent."""
 
     type: Literal["block_id"] = "block_id"
-    block_id: UUID
+    block_id: NotionId
 
 
 ParentObject = Annotated[
@@ -52,11 +52,11 @@ ParentObject = Annotated[
 # The following classes are util classes which are not mentioned in the Notion API documentation.
 class ParentObjectFactory:
     @classmethod
-    def new_page_parent(cls, page_id: UUID) -> PageParentObject:
+    def new_page_parent(cls, page_id: NotionId) -> PageParentObject:
         return PageParentObject(page_id=page_id)
 
     @classmethod
-    def new_database_parent(cls, database_id: UUID) -> DatabaseParentObject:
+    def new_database_parent(cls, database_id: NotionId) -> DatabaseParentObject:
         return DatabaseParentObject(database_id=database_id)
 
     @classmethod
@@ -64,7 +64,7 @@ class ParentObjectFactory:
         return WorkspaceParentObject()
 
     @classmethod
-    def new_block_parent(cls, block_id: UUID) -> BlockParentObject:
+    def new_block_parent(cls, block_id: NotionId) -> BlockParentObject:
         return BlockParentObject(block_id=block_id)
 
 
@@ -1,3 +1,84 @@
-from .common import *
-from .page_property import *
-from .database_property import *
+from typing import TYPE_CHECKING
+
+from ..._lazy import attach
+
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        ".common": [
+            "SelectOption",
+            "StatusOption",
+            "FormulaValueTypeLiteral",
+            "RelationTypeLiteral",
+            "RollupFunctionLiteral",
+            "RollupTypeLiteral",
+            "NumberFormatLiteral",
+            "VerificationStateLiteral",
+            "PagePropertyTypeLiteral",
+            "DatabasePropertyTypeLiteral",
+        ],
+        ".page_property": [
+            "ButtonProperty",
+            "CheckboxProperty",
+            "CreatedByProperty",
+            "CreatedTimeProperty",
+            "DateProperty",
+            "EmailProperty",
+            "FilesProperty",
+            "LastEditedByProperty",
+            "LastEditedTimeProperty",
+            "MultiSelectProperty",
+            "NumberProperty",
+            "PeopleProperty",
+            "PhoneNumberProperty",
+            "RichTextProperty",
+            "SelectProperty",
+            "StatusProperty",
+            "TitleProperty",
+            "URLProperty",
+            "FormulaProperty",
+            "RelationProperty",
+            "RollupProperty",
+            "UniqueIDProperty",
+            "VerificationProperty",
+            "PageProperty",
+        ],
+        ".database_property": [
+            "ButtonDatabaseProperty",
+            "CheckboxDatabaseProperty",
+            "CreatedByDatabaseProperty",
+            "CreatedTimeDatabaseProperty",
+            "DateDatabaseProperty",
+            "EmailDatabaseProperty",
+            "FilesDatabaseProperty",
+            "FormulaDatabaseProperty",
+            "LastEditedByDatabaseProperty",
+            "LastEditedTimeDatabaseProperty",
+            "MultiSelectDatabaseProperty",
+            "NumberDatabaseProperty",
+            "PeopleDatabaseProperty",
+            "PhoneNumberDatabaseProperty",
+            "RelationDatabaseProperty",
+            "SinglePropertyRelationDatabaseProperty",
+            "DualPropertyRelationDatabaseProperty",
+            "RichTextDatabaseProperty",
+            "RollupDatabaseProperty",
+            "SelectDatabaseProperty",
+            "StatusDatabaseProperty",
+            "TitleDatabaseProperty",
+            "URLDatabaseProperty",
+            "UniqueIdDatabaseProperty",
+            "DatabaseProperty",
+            "BaseDatabaseProperty",
+            "SelectPropertyConfig",
+            "MultiSelectPropertyConfig",
+        ],
+    },
+)
+
+
+if TYPE_CHECKING:
+    from .common import *
+    from .page_property import *
+    from .database_property import *
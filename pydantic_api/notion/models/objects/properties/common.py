@@ -2,7 +2,7 @@ from typing import Literal, Optional
 
 from pydantic import Field, model_validator
 
-from pydantic_api.base import BaseModel
+from pydantic_api.notion.models.base import BaseModel
 from ..common import ColorLiteral
 
 
@@ -2,12 +2,12 @@
 Reference: https://developers.notion.com/reference/property-schema-object
 """
 
-from typing import List, Optional, Literal, Union, Annotated
+from typing import List, Optional, Literal, Union, Annotated, Any
 
-from uuid import UUID
-from pydantic import ConfigDict, Field, model_validator
+from ..ids import NotionId
+from pydantic import ConfigDict, Field, model_validator, Discriminator, Tag
 
-from pydantic_api.base import BaseModel
+from pydantic_api.notion.models.base import BaseModel
 from ..common import ColorLiteral
 from .common import (
     SelectOption,
@@ -25,14 +25,15 @@ class EmptyConfig(BaseModel):
 
 class BaseDatabaseProperty(BaseModel):
     id: Optional[str] = Field(
-        None,
+        default=None,
         description='An identifier for the property, usually a short string of random letters and symbols. Some automatically generated property types have special human-readable IDs. For example, all Title properties have an id of "title".',
     )
     name: Optional[str] = Field(
-        None, description="The name of the property as it appears in Notion."
+        default=None, description="The name of the property as it appears in Notion."
     )
     description: Optional[str] = Field(
-        None, description="The description of the property as it appears in Notion."
+        default=None,
+        description="The description of the property as it appears in Notion.",
     )
     type: DatabasePropertyTypeLiteral
 
@@ -159,7 +160,7 @@ class SinglePropertyData(BaseModel):
 
 class SinglePropertyRelationData(BaseModel):
     type: Literal["single_property"] = "single_property"
-    database_id: UUID = Field(
+    database_id: NotionId = Field(
         ...,
         description="The database that the relation property refers to. The corresponding linked page values must belong to the database in order to be valid.",
     )
@@ -169,18 +170,22 @@ class SinglePropertyRelationData(BaseModel):
     )
 
 
-class SinglePropertyRelationDatabaseProperty(BaseModel):
+class SinglePropertyRelationDatabaseProperty(BaseDatabaseProperty):
     type: Literal["relation"] = "relation"
     relation: SinglePropertyRelationData
 
+    @classmethod
+    def define(cls, database_id: NotionId):  # type: ignore[override]  # a relation needs the database it points to
+        return cls(relation=SinglePropertyRelationData(database_id=database_id))
+
 
 class DualPropertyData(BaseModel):
     pass
 
 
-class DualPropertyData(BaseModel):
+class DualPropertyRelationData(BaseModel):
     type: Literal["dual_property"] = "dual_property"
-    database_id: UUID = Field(
+    database_id: NotionId = Field(
         ...,
         description="The database that the relation property refers to. The corresponding linked page values must belong to the database in order to be valid.",
     )
@@ -190,14 +195,34 @@ class DualPropertyData(BaseModel):
     )
 
 
-class DualPropertyRelationDatabaseProperty(BaseModel):
+class DualPropertyRelationDatabaseProperty(BaseDatabaseProperty):
     type: Literal["relation"] = "relation"
-    relation: DualPropertyData
-
+    relation: DualPropertyRelationData
 
-RelationDatabaseProperty = Union[
-    SinglePropertyRelationDatabaseProperty, DualPropertyRelationDatabaseProperty
+    @classmethod
+    def define(cls, database_id: NotionId):  # type: ignore[override]  # a relation needs the database it points to
+        return cls(relation=DualPropertyRelationData(database_id=database_id))
+
+
+def _relation_type_discriminator(value: Any) -> str | None:
+    """Pick the relation schema class from `relation.type`, since both share `type: "relation"`."""
+    if isinstance(value, dict):
+        relation = value.get("relation")
+    else:
+        relation = getattr(value, "relation", None)
+    if isinstance(relation, dict):
+        return relation.get("type")
+    return getattr(relation, "type", None)
+
+
+RelationDatabaseProperty = Annotated[
+    Union[
+        Annotated[SinglePropertyRelationDatabaseProperty, Tag("single_property")],
+        Annotated[DualPropertyRelationDatabaseProperty, Tag("dual_property")],
+    ],
+    Discriminator(_relation_type_discriminator),
 ]
+"""Reference: https://developers.notion.com/reference/property-schema-object#relation"""
 
 
 # rich_text
@@ -327,30 +352,34 @@ class UniqueIdDatabaseProperty(BaseDatabaseProperty):
 
 
 # Union for all Database Schema Properties
-DatabaseProperty = Union[
-    ButtonDatabaseProperty,
-    CheckboxDatabaseProperty,
-    CreatedByDatabaseProperty,
-    CreatedTimeDatabaseProperty,
-    DateDatabaseProperty,
-    EmailDatabaseProperty,
-    FilesDatabaseProperty,
-    FormulaDatabaseProperty,
-    LastEditedByDatabaseProperty,
-    LastEditedTimeDatabaseProperty,
-    MultiSelectDatabaseProperty,
-    NumberDatabaseProperty,
-    PeopleDatabaseProperty,
-    PhoneNumberDatabaseProperty,
-    RelationDatabaseProperty,
-    RichTextDatabaseProperty,
-    RollupDatabaseProperty,
-    SelectDatabaseProperty,
-    StatusDatabaseProperty,
-    TitleDatabaseProperty,
-    URLDatabaseProperty,
-    UniqueIdDatabaseProperty,
+DatabaseProperty = Annotated[
+    Union[
+        ButtonDatabaseProperty,
+        CheckboxDatabaseProperty,
+        CreatedByDatabaseProperty,
+        CreatedTimeDatabaseProperty,
+        DateDatabaseProperty,
+        EmailDatabaseProperty,
+        FilesDatabaseProperty,
+        FormulaDatabaseProperty,
+        LastEditedByDatabaseProperty,
+        LastEditedTimeDatabaseProperty,
+        MultiSelectDatabaseProperty,
+        NumberDatabaseProperty,
+        PeopleDatabaseProperty,
+        PhoneNumberDatabaseProperty,
+        RelationDatabaseProperty,
+        RichTextDatabaseProperty,
+        RollupDatabaseProperty,
+        SelectDatabaseProperty,
+        StatusDatabaseProperty,
+        TitleDatabaseProperty,
+        URLDatabaseProperty,
+        UniqueIdDatabaseProperty,
+    ],
+    Field(discriminator="type"),
 ]
+"""Union of all Database Property schemas, dispatched on `type` and, for relations, on `relation.type`."""
 
 
 __all__ = [
@@ -369,6 +398,8 @@ __all__ = [
     "PeopleDatabaseProperty",
     "PhoneNumberDatabaseProperty",
     "RelationDatabaseProperty",
+    "SinglePropertyRelationDatabaseProperty",
+    "DualPropertyRelationDatabaseProperty",
     "RichTextDatabaseProperty",
     "RollupDatabaseProperty",
     "SelectDatabaseProperty",
@@ -5,13 +5,13 @@ Reference: https://developers.notion.com/reference/page-property-values
 from typing import Literal, Union, List, Optional, Annotated
 from datetime import date, datetime
 
-from uuid import UUID
+from ..ids import NotionId
 from pydantic import AnyUrl, Field, EmailStr
 
-from pydantic_api.base import BaseModel
+from pydantic_api.notion.models.base import BaseModel
 from ..user import DeletedUserObject, UserObject, UserObjectFactory
 from ..file import FileObject, FileObjectFactory
-from ..block import RichTextObject, RichTextObjectFactory
+from ..block import RichTextObject, RichTextObjectFactory, join_plain_text
 from .common import (
     SelectOption,
     StatusOption,
@@ -254,7 +254,7 @@ class PhoneNumberProperty(BasePageProperty):
 
 # relation: Refer to https://developers.notion.com/reference/page-property-values#relation
 class PageReference(BaseModel):
-    id: UUID = Field(..., description="id of the referenced page")
+    id: NotionId = Field(..., description="id of the referenced page")
 
 
 class RelationProperty(BasePageProperty):
@@ -266,7 +266,7 @@ class RelationProperty(BasePageProperty):
     )
 
     @classmethod
-    def new(cls, relation: List[UUID]):
+    def new(cls, relation: List[NotionId]):
         return cls(relation=[PageReference(id=uuid) for uuid in relation])
 
 
@@ -330,6 +330,11 @@ class RichTextProperty(BasePageProperty):
     type: Literal["rich_text"] = "rich_text"
     rich_text: List[RichTextObject]
 
+    @property
+    def plain_text(self) -> str:
+        """The concatenated plain text."""
+        return join_plain_text(self.rich_text)
+
     @classmethod
     def new_text(
         cls,
@@ -396,6 +401,11 @@ class TitleProperty(BasePageProperty):
     type: Literal["title"] = "title"
     title: List[RichTextObject]
 
+    @property
+    def plain_text(self) -> str:
+        """The concatenated plain text."""
+        return join_plain_text(self.title)
+
     @classmethod
     def new(
         cls,
@@ -0,0 +1,89 @@
+"""
+Timestamps of Notion objects (`created_time` and `last_edited_time`).
+
+They are decoded as `datetime`, and can be stored as `EpochMillis` instead (see `pydantic_api.notion.models.compact`): both serialize to the same JSON.
+
+Reference: https://developers.notion.com/reference/intro#conventions
+"""
+
+from typing import Annotated, Any
+from datetime import datetime, timedelta, timezone
+
+from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import core_schema
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MILLISECOND = timedelta(milliseconds=1)
+_ZERO = timedelta(0)
+
+
+class EpochMillis(int):
+    """A UTC timestamp stored as the number of milliseconds since the epoch.
+
+    Notion timestamps have a millisecond precision, and are always in UTC. Sorting and comparing `EpochMillis` are integer operations, and `datetime` converts back on access. They do not make decoded objects measurably smaller.
+
+    Example:
+
+        ms = EpochMillis.from_datetime(page.last_edited_time)
+        ms.datetime == page.last_edited_time  # True
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_datetime(cls, value: datetime) -> "EpochMillis":
+        """
+        Args:
+            value: A timezone-aware datetime in UTC, with a whole number of milliseconds.
+
+        Raises:
+            ValueError: If `value` is naive, not in UTC or more precise than a millisecond, since it would not serialize back to the same text.
+        """
+        if value.utcoffset() != _ZERO or value.microsecond % 1000:
+            raise ValueError(f"Not a UTC timestamp in milliseconds: {value!r}")
+        return cls((value - _EPOCH) // _MILLISECOND)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({int(self)})"
+
+    @property
+    def datetime(self) -> datetime:
+        """The timestamp as a timezone-aware `datetime` in UTC."""
+        return _EPOCH + timedelta(milliseconds=int(self))
+
+
+class _TimestampSchema:
+    """Extends the `datetime` schema of a field to accept and serialize `EpochMillis` values.
+
+    The `EpochMillis` schema is a second choice of a union, so that `datetime` values are still validated and serialized by pydantic alone."""
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        schema = handler(source)
+        epoch_millis = core_schema.json_or_python_schema(
+            json_schema=schema,
+            python_schema=core_schema.is_instance_schema(EpochMillis),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda value: value.datetime, return_schema=schema
+            ),
+        )
+        return core_schema.union_schema([schema, epoch_millis])
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
+    ) -> JsonSchemaValue:
+        return handler(core_schema.datetime_schema())
+
+
+Timestamp = Annotated[datetime, _TimestampSchema]
+"""The type of `created_time` and `last_edited_time`: a `datetime` once decoded, or an `EpochMillis` after `compact_timestamps`."""
+
+
+__all__ = [
+    "EpochMillis",
+    "Timestamp",
+]
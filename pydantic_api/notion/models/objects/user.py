@@ -3,10 +3,10 @@ Reference: https://developers.notion.com/reference/user
 """
 
 from typing import Optional, Literal, Union, Annotated
-from uuid import UUID
+from .ids import NotionId
 from pydantic import AnyHttpUrl, Field, EmailStr
 
-from pydantic_api.base import BaseModel
+from pydantic_api.notion.models.base import BaseModel
 
 
 UserObjectTypeLiteral = Literal["person", "bot"]
@@ -24,7 +24,7 @@ class PartialUser(BaseModel):
     """
 
     object: Literal["user"] = "user"
-    id: UUID = Field(..., description="Unique identifier for this user.")
+    id: NotionId = Field(..., description="Unique identifier for this user.")
 
 
 class _BaseUserObject(PartialUser):
@@ -0,0 +1,211 @@
+"""
+Serialized size of models, without serializing them.
+
+`json_size` computes the exact length in bytes of `model_dump_json()`, e.g. to check a request body against Notion's size limits before building it. Each model caches the size of its scalar fields (strings, numbers, ids, dates, keys and punctuation), so measuring again after an edit only re-measures what changed: assigning an attribute drops the cache of that model, and nested models, lists and dicts are walked on every call, so their in-place changes are seen too.
+
+Sizes follow pydantic's JSON rules (`"Z"` for UTC datetimes, `1e20` for large floats, `null` for infinities, raw UTF-8 and escaped control characters), for models serialized as their own class and without custom serializers, as the Notion models are.
+
+Reference: https://developers.notion.com/reference/request-limits
+"""
+
+import re
+import math
+from enum import Enum
+from uuid import UUID
+from datetime import date, datetime, time
+from collections.abc import Mapping
+from typing import Any, Iterable, Optional
+
+import pydantic
+import pydantic_core
+
+from .objects.ids import NotionId
+from .objects.timestamps import EpochMillis
+
+_CACHE = "_json_size"
+"""Key of the cached sizes in the `__dict__` of a model, next to its fields."""
+
+_ESCAPED = re.compile(r'["\\\x00-\x1f]')
+_SHORT_ESCAPES = frozenset('"\\\n\r\t\b\f')
+"""Characters escaped as two bytes; the other control characters take six (`\\u00XX`)."""
+
+_LEAF, _MODEL, _MAPPING, _SEQUENCE = range(4)
+_KINDS: dict[type, int] = {}
+"""The kind of value of each type seen so far, to dispatch on `type(value)` rather than on slower `isinstance` checks."""
+
+_FIELDS: dict[type, tuple[tuple[str, int], ...]] = {}
+"""The serialized fields of each model class, with the size of their `"name":` key."""
+
+
+def _kind(cls: type) -> int:
+    kind = _KINDS.get(cls)
+    if kind is None:
+        if issubclass(cls, pydantic.BaseModel):
+            kind = _MODEL
+        elif issubclass(cls, Mapping):
+            kind = _MAPPING
+        elif issubclass(cls, (list, tuple, set, frozenset)):
+            kind = _SEQUENCE
+        else:
+            kind = _LEAF
+        _KINDS[cls] = kind
+    return kind
+
+
+def _str_size(value: str) -> int:
+    size = (len(value) if value.isascii() else len(value.encode())) + 2
+    if _ESCAPED.search(value) is None:
+        return size
+    for match in _ESCAPED.finditer(value):
+        size += 1 if match.group() in _SHORT_ESCAPES else 5
+    return size
+
+
+def _float_size(value: float) -> int:
+    if not math.isfinite(value):
+        return 4  # null
+    text = repr(value)
+    if "e" in text:
+        # `1e+20` and `1.5e-07` are written `1e20` and `1.5e-7`
+        mantissa, exponent = text.split("e")
+        sign = "-" if exponent[0] == "-" else ""
+        text = f"{mantissa}e{sign}{exponent.lstrip('+-').lstrip('0')}"
+    return len(text)
+
+
+def _datetime_size(value: datetime) -> int:
+    offset = value.utcoffset()
+    text = value.isoformat()
+    if offset is not None and not offset:
+        return len(text) - 6 + 1 + 2  # `+00:00` is written `Z`
+    return len(text) + 2
+
+
+def _leaf_size(value: Any) -> int:
+    """Size of a value that is neither a model nor a container."""
+    if value is None:
+        return 4
+    cls = type(value)
+    if cls is str:
+        return _str_size(value)
+    if cls is bool:
+        return 4 if value else 5
+    if cls is int:
+        return len(str(value))
+    if cls is float:
+        return _float_size(value)
+    if cls is NotionId or cls is UUID:
+        return 38
+    if cls is datetime:
+        return _datetime_size(value)
+    if cls is EpochMillis:
+        return _datetime_size(value.datetime)
+    if cls is date or cls is time:
+        return len(value.isoformat()) + 2
+    if isinstance(value, pydantic_core.Url):
+        return _str_size(str(value))
+    if isinstance(value, Enum):
+        return _size(value.value, False)
+    if isinstance(value, str):
+        return _str_size(value)
+    # timedelta, Decimal, bytes, ...: rare enough to be serialized instead
+    return len(pydantic_core.to_json(value))
+
+
+def _fields(cls: type[pydantic.BaseModel]) -> tuple[tuple[str, int], ...]:
+    """The serialized fields of model class `cls`, in order, with the size of their `"name":` key."""
+    fields = _FIELDS.get(cls)
+    if fields is None:
+        fields = _FIELDS[cls] = tuple(
+            (name, _str_size(name) + 1)
+            for name, field in cls.model_fields.items()
+            if not field.exclude
+        )
+    return fields
+
+
+def _scan(model: pydantic.BaseModel, exclude_none: bool, exclude: Optional[set[str]] = None) -> tuple[int, tuple[str, ...]]:  # fmt: skip
+    """The size of `model` without its nested models and containers, and the names of the fields holding those."""
+    fields: Iterable[tuple[str, int]] = _fields(type(model))
+    extra = model.__pydantic_extra__
+    if extra:
+        fields = [*fields, *((name, _str_size(name) + 1) for name in extra)]
+    values = model.__dict__
+    static, count = 0, 0
+    nested = []
+    for name, key_size in fields:
+        value = values[name] if name in values else (extra or {}).get(name)
+        if (exclude_none and value is None) or (exclude and name in exclude):
+            continue
+        count += 1
+        static += key_size
+        if _kind(type(value)) is _LEAF:
+            static += _leaf_size(value)
+        else:
+            nested.append(name)
+    return static + 2 + max(count - 1, 0), tuple(nested)
+
+
+def _model_size(model: pydantic.BaseModel, exclude_none: bool) -> int:
+    values = model.__dict__
+    cached: Optional[tuple[int, dict[bool, tuple[int, tuple[str, ...]]]]] = values.get(_CACHE)  # fmt: skip
+    # A copy of a model (`model_copy`) carries the cache of the original, hence the id.
+    if cached is None or cached[0] != id(model):
+        cached = values[_CACHE] = (id(model), {})
+    scanned = cached[1].get(exclude_none)
+    if scanned is None:
+        scanned = cached[1][exclude_none] = _scan(model, exclude_none)
+    size, nested = scanned
+    extra = model.__pydantic_extra__ or {}
+    for name in nested:
+        value = values[name] if name in values else extra[name]
+        size += _size(value, exclude_none)
+    return size
+
+
+def _size(value: Any, exclude_none: bool) -> int:
+    kind = _kind(type(value))
+    if kind is _MODEL:
+        return _model_size(value, exclude_none)
+    if kind is _SEQUENCE:
+        size = 1 + len(value) if value else 2  # brackets and commas
+        for item in value:
+            item_kind = _kind(type(item))
+            if item_kind is _MODEL:
+                size += _model_size(item, exclude_none)
+            elif item_kind is _LEAF:
+                size += _leaf_size(item)
+            else:
+                size += _size(item, exclude_none)
+        return size
+    if kind is _MAPPING:
+        size = 1 + len(value) if value else 2  # braces and commas
+        for key, item in value.items():
+            size += _str_size(str(key)) + 1 + _size(item, exclude_none)
+        return size
+    return _leaf_size(value)
+
+
+def json_size(
+    value: Any, *, exclude_none: bool = False, exclude: Optional[set[str]] = None
+) -> int:
+    """
+    The length in bytes of the JSON serialization of `value`, i.e. `len(value.model_dump_json(exclude_none=..., exclude=...).encode())` for a model, computed without building it.
+
+    Args:
+        value: A model, such as a request, or a list or dict of models and JSON values.
+        exclude_none: Whether fields set to None are left out, as with `model_dump_json(exclude_none=True)`.
+        exclude: Names of top-level fields to leave out, e.g. the path parameters of a request.
+
+    Returns:
+        The size in bytes.
+    """
+    if exclude and isinstance(value, pydantic.BaseModel):
+        static, nested = _scan(value, exclude_none, exclude)
+        return static + sum(_size(getattr(value, name), exclude_none) for name in nested)  # fmt: skip
+    return _size(value, exclude_none)
+
+
+__all__ = [
+    "json_size",
+]
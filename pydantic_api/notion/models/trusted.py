@@ -0,0 +1,118 @@
+"""
+Trusted construction of models from payloads returned by the Notion API.
+
+Responses from Notion are already well-formed, so re-running every validator (`EmailStr`, the emoji check, the model validators of select and status options, ...) over the whole nested tree is wasted work for a read-only consumer. `TrustedAdapter` builds the same nested model instances with a copy of the core schema from which all these validators are removed: discriminated unions are still resolved and ids, timestamps and URLs still converted to their Python types, but no custom validator runs.
+
+Only use it for data that comes from Notion. `sample_rate` validates a random fraction of the items normally, as a safety net against API changes.
+"""
+
+import json
+import random
+from typing import Any, Generic, TypeVar
+
+from pydantic import TypeAdapter
+from pydantic_core import CoreSchema, SchemaValidator
+
+T = TypeVar("T")
+
+_VALIDATOR_FUNCTIONS = frozenset({"function-after", "function-before", "function-wrap"})
+
+_trusted_validators: dict[Any, SchemaValidator] = {}
+
+
+def _strip_validators(schema: CoreSchema) -> CoreSchema:
+    """A copy of `schema` without the before/after/wrap validator functions, i.e. without `field_validator`, `model_validator` and validating types such as `EmailStr`.
+
+    Plain validators are kept since they produce the value themselves.
+    """
+    if isinstance(schema, dict):
+        # `type` can also be a field name, e.g. in the `fields` of a model schema.
+        kind = schema.get("type")
+        if isinstance(kind, str) and kind in _VALIDATOR_FUNCTIONS:
+            inner = _strip_validators(schema["schema"])
+            if "ref" in schema:
+                # Definition references point to the function schema.
+                inner = {**inner, "ref": schema["ref"]}
+            return inner
+        return {key: _strip_validators(value) for key, value in schema.items()}
+    if isinstance(schema, list):
+        return [_strip_validators(item) for item in schema]
+    return schema
+
+
+def _trusted_validator(type_: Any, adapter: TypeAdapter) -> SchemaValidator:
+    try:
+        return _trusted_validators[type_]
+    except KeyError:
+        pass
+    except TypeError:  # unhashable metadata
+        return SchemaValidator(_strip_validators(adapter.core_schema))
+    validator = _trusted_validators[type_] = SchemaValidator(
+        _strip_validators(adapter.core_schema)
+    )
+    return validator
+
+
+class TrustedAdapter(Generic[T]):
+    """Builds `type_` from trusted Notion payloads without running validators.
+
+    Works with any model or union of this package, e.g. `Page`, `Database`, `BlockObject`, `CommentObject` or a paginated response such as `QueryDatabaseResponse`. For paginated responses, `sample_rate` applies to each item of `results`; otherwise to each constructed object.
+
+    Example:
+
+        adapter = TrustedAdapter(QueryDatabaseResponse, sample_rate=0.01)
+        response = adapter.construct_json(raw_bytes)
+
+    Args:
+        type_: The model or annotation to construct.
+        sample_rate: Fraction of the items, between 0 and 1, that is also validated normally. Validation errors are raised.
+        seed: Seed of the sampling, for reproducible runs.
+    """
+
+    def __init__(
+        self, type_: Any, *, sample_rate: float = 0.0, seed: int | None = None
+    ):
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError(f"sample_rate must be between 0 and 1, got {sample_rate}")
+        self.type = type_
+        self.sample_rate = sample_rate
+        self._random = random.Random(seed)
+        self._adapter = TypeAdapter(type_)
+        self._validator = _trusted_validator(type_, self._adapter)
+        self._item_adapter: TypeAdapter | None = None
+        if _is_paginated(type_):
+            self._item_adapter = type_.results_adapter()
+
+    def construct_python(self, data: Any) -> T:
+        """Build an instance from decoded JSON (dicts and lists)."""
+        if self.sample_rate:
+            if self._item_adapter is None:
+                if self._random.random() < self.sample_rate:
+                    return self._adapter.validate_python(data)
+            elif isinstance(data, dict):
+                for item in data.get("results", ()):
+                    if self._random.random() < self.sample_rate:
+                        self._item_adapter.validate_python(item)
+        return self._validator.validate_python(data)
+
+    def construct_json(self, data: str | bytes | bytearray) -> T:
+        """Build an instance from a raw JSON payload."""
+        if self.sample_rate:
+            return self.construct_python(json.loads(data))
+        return self._validator.validate_json(data)
+
+
+def _is_paginated(type_: Any) -> bool:
+    # Imported here to keep `trusted` free of the endpoint modules.
+    from .endpoints.base import NotionPaginatedData
+
+    return (
+        isinstance(type_, type)
+        and issubclass(type_, NotionPaginatedData)
+        and bool(type_.__pydantic_generic_metadata__["args"])
+    )
+
+
+__all__ = [
+    "TrustedAdapter",
+]
@@ -0,0 +1,227 @@
+"""
+Requests encoded for the wire.
+
+Every request model mixes the parameters of the path, of the query string and of the body of its endpoint, which callers otherwise pick apart by hand: `model_dump`, pop the ids, format the URL, `json.dumps` the rest. `encode_request` does it in one pass, with a `RequestEncoder` compiled once per request class from its route: the method, the path template and which fields go where. The body is encoded by the class serializer, straight to compact bytes, keeping only the body fields the request was given (unset fields only hold their defaults, e.g. the empty `children` of `CreatePageRequest`). Nested `None` values are dropped, since Notion rejects them in many places, but not the `null`s that clear a value: the body fields the request was given as `None` (e.g. `icon=None` removes the icon of a page), and the properties whose value is `None` (e.g. a `DateProperty(date=None)` clears the date).
+
+Reference: https://developers.notion.com/reference/intro
+"""
+
+import re
+from urllib.parse import quote, urlencode
+from collections.abc import Iterable, Mapping
+from typing import Any, NamedTuple, Optional
+
+import pydantic
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+
+from .endpoints import (
+    ListAllUsersRequest,
+    RetrieveUserRequest,
+    RetrieveBotUserRequest,
+    CreatePageRequest,
+    RetrievePageRequest,
+    RetrievePagePropertyItemRequest,
+    UpdatePagePropertiesRequest,
+    SearchByTitleRequest,
+    CreateDatabaseRequest,
+    QueryDatabaseRequest,
+    RetrieveDatabaseRequest,
+    UpdateDatabaseRequest,
+    CreateCommentRequest,
+    RetrieveCommentsRequest,
+    AppendBlockChildrenRequest,
+    RetrieveBlockRequest,
+    RetrieveBlockChildrenRequest,
+    DeleteBlockRequest,
+)
+
+API_VERSION_PREFIX = "/v1"
+"""Prefix of the paths of all the endpoints."""
+
+_PATH_PARAMETER = re.compile(r"{(\w+)}")
+
+_PAGINATION = ("start_cursor", "page_size")
+
+
+class _Route(NamedTuple):
+    method: str
+    path: str
+    query: tuple[str, ...] = ()
+    body: bool = False
+
+
+_ROUTES: dict[type, _Route] = {
+    ListAllUsersRequest: _Route("GET", "/users", _PAGINATION),
+    RetrieveUserRequest: _Route("GET", "/users/{user_id}"),
+    RetrieveBotUserRequest: _Route("GET", "/users/me"),
+    CreatePageRequest: _Route("POST", "/pages", body=True),
+    RetrievePageRequest: _Route("GET", "/pages/{page_id}", ("filter_properties",)),
+    RetrievePagePropertyItemRequest: _Route("GET", "/pages/{page_id}/properties/{property_id}", _PAGINATION),  # fmt: skip
+    UpdatePagePropertiesRequest: _Route("PATCH", "/pages/{page_id}", body=True),
+    SearchByTitleRequest: _Route("POST", "/search", body=True),
+    CreateDatabaseRequest: _Route("POST", "/databases", body=True),
+    QueryDatabaseRequest: _Route("POST", "/databases/{database_id}/query", body=True),
+    RetrieveDatabaseRequest: _Route("GET", "/databases/{database_id}"),
+    UpdateDatabaseRequest: _Route("PATCH", "/databases/{database_id}", body=True),
+    CreateCommentRequest: _Route("POST", "/comments", body=True),
+    RetrieveCommentsRequest: _Route("GET", "/comments", ("block_id", *_PAGINATION)),
+    AppendBlockChildrenRequest: _Route("PATCH", "/blocks/{block_id}/children", body=True),  # fmt: skip
+    RetrieveBlockRequest: _Route("GET", "/blocks/{block_id}"),
+    RetrieveBlockChildrenRequest: _Route("GET", "/blocks/{block_id}/children", _PAGINATION),  # fmt: skip
+    DeleteBlockRequest: _Route("DELETE", "/blocks/{block_id}"),
+}
+"""The endpoint of every request model."""
+
+_encoders: dict[type, "RequestEncoder"] = {}
+
+
+class WireRequest(NamedTuple):
+    """A request ready to be sent, see `encode_request`."""
+
+    method: str
+    """The HTTP method, e.g. `"PATCH"`."""
+    path: str
+    """The path, parameters filled in, e.g. `"/v1/blocks/<block_id>/children"`."""
+    query: str
+    """The encoded query string, without the `?`; empty if there is none."""
+    body: Optional[bytes]
+    """The compact JSON body, or `None` for the endpoints without one."""
+
+
+def _query_value(value: Any) -> str:
+    return str(value).lower() if isinstance(value, bool) else str(value)
+
+
+def _cleared(value: Any) -> Optional[str]:
+    """The name of the field holding the value of a property, if it is `None`: the property is cleared."""
+    name = getattr(value, "type", None)
+    if type(name) is str and name in value.__dict__ and value.__dict__[name] is None:  # fmt: skip
+        return name
+    return None
+
+
+def _with_members(body: bytes, members: Iterable[tuple[str, bytes]]) -> bytes:
+    """The JSON object `body`, with the already encoded `members` appended."""
+    encoded = b",".join(to_json(name) + b":" + value for name, value in members)
+    return body[:-1] + (b"," if body != b"{}" else b"") + encoded + b"}"
+
+
+def _properties(properties: Mapping[str, Any]) -> bytes:
+    """The `properties` of a request, keeping the `null`s that clear or remove a property."""
+    members = []
+    for name, value in properties.items():
+        if value is None:
+            encoded = b"null"
+        else:
+            encoded = to_json(value, exclude_none=True)
+            cleared = _cleared(value)
+            if cleared is not None:
+                encoded = _with_members(encoded, [(cleared, b"null")])
+        members.append((name, encoded))
+    return _with_members(b"{}", members)
+
+
+class RequestEncoder:
+    """Encodes the requests of one class, see `encode_request`.
+
+    Attributes:
+        method: The HTTP method of the endpoint.
+        path: The path template of the endpoint, e.g. `"/v1/pages/{page_id}"`.
+        path_fields: The fields filled in the path.
+        query_fields: The fields sent in the query string.
+        body_fields: The fields sent in the body; empty for the endpoints without one.
+    """
+
+    __slots__ = ("method", "path", "path_fields", "query_fields", "body_fields", "_serializer")  # fmt: skip
+
+    def __init__(self, cls: type[pydantic.BaseModel]):
+        route = next((_ROUTES[base] for base in cls.__mro__ if base in _ROUTES), None)
+        if route is None:
+            raise TypeError(f"no Notion endpoint is known for {cls.__name__}")
+        self.method = route.method
+        self.path = API_VERSION_PREFIX + route.path
+        self.path_fields = tuple(_PATH_PARAMETER.findall(route.path))
+        self.query_fields = route.query
+        self.body_fields: frozenset[str] = (
+            frozenset(cls.model_fields).difference(self.path_fields, self.query_fields)
+            if route.body
+            else frozenset()
+        )
+        self._serializer = TypeAdapter(cls) if route.body else None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.method} {self.path})"
+
+    def encode(self, request: pydantic.BaseModel) -> WireRequest:
+        """Encode `request`, an instance of the class of the encoder."""
+        values = request.__dict__
+        path = self.path
+        if self.path_fields:
+            path = path.format_map({name: quote(str(values[name]), safe="%") for name in self.path_fields})  # fmt: skip
+        params: list[tuple[str, str]] = []
+        for name in self.query_fields:
+            value = values[name]
+            if isinstance(value, list):
+                params.extend((name, _query_value(item)) for item in value)
+            elif value is not None:
+                params.append((name, _query_value(value)))
+        body = None
+        if self._serializer is not None:
+            include = set(self.body_fields.intersection(request.model_fields_set))
+            # `exclude_none` drops the `null`s that clear a value too: they are appended after it
+            nulls = [(name, b"null") for name in include if values[name] is None]
+            include.difference_update(name for name, _ in nulls)
+            properties = values.get("properties") if "properties" in include else None
+            if properties and any(v is None or _cleared(v) for v in properties.values()):  # fmt: skip
+                include.discard("properties")
+                nulls.append(("properties", _properties(properties)))
+            body = self._serializer.dump_json(request, include=include, exclude_none=True)  # fmt: skip
+            if nulls:
+                body = _with_members(body, nulls)
+        return WireRequest(self.method, path, urlencode(params), body)
+
+
+def request_encoder(cls: type[pydantic.BaseModel]) -> RequestEncoder:
+    """
+    The encoder of the requests of class `cls`, compiled on first use.
+
+    Raises:
+        TypeError: If `cls` is not the request model of a known endpoint.
+    """
+    encoder = _encoders.get(cls)
+    if encoder is None:
+        encoder = _encoders[cls] = RequestEncoder(cls)
+    return encoder
+
+
+def encode_request(request: pydantic.BaseModel) -> WireRequest:
+    """
+    Encode a request for the wire: its method, its path, its query string and its body, in one pass.
+
+    Path parameters are percent-encoded, list query parameters are repeated (`?filter_properties=a&filter_properties=b`), and the body holds the body fields the request was given, as compact JSON. Nested `None` values are dropped, except the ones that clear a value: the body fields given as `None`, and the values of the properties set to `None`.
+
+    Example:
+
+        method, path, query, body = encode_request(AppendBlockChildrenRequest(block_id=block_id, children=blocks))
+        response = session.request(method, BASE_URL + path, params=query, data=body)
+
+    Args:
+        request: The request, e.g. an `AppendBlockChildrenRequest`.
+
+    Returns:
+        The encoded request.
+
+    Raises:
+        TypeError: If `request` is not the request model of a known endpoint.
+    """
+    return request_encoder(type(request)).encode(request)
+
+
+__all__ = [
+    "API_VERSION_PREFIX",
+    "WireRequest",
+    "RequestEncoder",
+    "request_encoder",
+    "encode_request",
+]
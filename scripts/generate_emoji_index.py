@@ -0,0 +1,43 @@
+"""
+Generate `pydantic_api/notion/models/objects/_emoji_index.py`, the precomputed set of valid emoji sequences used by `EmojiObject`.
+
+The index is built from the `emoji` package, so re-run this script after upgrading `emoji`:
+
+    python scripts/generate_emoji_index.py
+"""
+
+from pathlib import Path
+
+import emoji
+from emoji.unicode_codes import EMOJI_DATA
+
+
+OUTPUT = (
+    Path(__file__).resolve().parent.parent
+    / "pydantic_api/notion/models/objects/_emoji_index.py"
+)
+
+
+def main():
+    sequences = sorted(EMOJI_DATA)
+    lines = [
+        '"""',
+        f"Valid emoji sequences, generated by `scripts/generate_emoji_index.py` from emoji=={emoji.__version__}. Do not edit.",
+        "",
+        "Stored as one newline-separated string constant, so loading the module only unmarshals a single object.",
+        '"""',
+        "",
+        f'EMOJI_PACKAGE_VERSION = "{emoji.__version__}"',
+        "",
+        "EMOJI_SEQUENCES = (",
+    ]
+    for i, sequence in enumerate(sequences):
+        separator = "\n" if i < len(sequences) - 1 else ""
+        lines.append(f"    {sequence + separator!r}")
+    lines.append(")")
+    OUTPUT.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    print(f"Wrote {len(sequences)} emoji sequences to {OUTPUT}")
+
+
+if __name__ == "__main__":
+    main()
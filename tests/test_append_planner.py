@@ -0,0 +1,98 @@
+import uuid
+
+import pytest
+
+from pydantic_api.notion.models import (
+    ParagraphBlock,
+    BulletedListItemBlock,
+    AppendBlockChildrenRequest,
+    AppendBlockChildrenResponse,
+    lint_request,
+)
+
+PAGE_ID = str(uuid.uuid4())
+
+
+def _body(request: AppendBlockChildrenRequest) -> bytes:
+    """The JSON body Notion receives: `block_id` goes in the path."""
+    return request.model_dump_json(exclude={"block_id"}, exclude_none=True).encode()
+
+
+def _blocks(count: int, text: str = "héllo wörld") -> list[ParagraphBlock]:
+    return [ParagraphBlock.new(f"{text} {i:04}") for i in range(count)]
+
+
+def test_batches_are_capped_at_100_blocks():
+    requests = list(AppendBlockChildrenRequest.plan(PAGE_ID, _blocks(250)))
+    assert [len(r.children) for r in requests] == [100, 100, 50]
+    assert all(str(r.block_id) == PAGE_ID and r.after is None for r in requests)
+
+
+def test_batches_fit_in_max_bytes():
+    blocks = _blocks(40, "x" * 1000)
+    block_size = len(blocks[0].model_dump_json().encode())
+    max_bytes = 15 + 3 * block_size + 2
+    requests = list(AppendBlockChildrenRequest.plan(PAGE_ID, blocks, max_bytes=max_bytes))
+    assert [len(r.children) for r in requests] == [3] * 13 + [1]
+    assert [b for r in requests for b in r.children] == blocks
+    for request in requests:
+        assert len(request.model_dump_json(exclude={"block_id", "after"}).encode()) <= max_bytes  # fmt: skip
+
+
+def test_continuation_is_anchored_on_the_last_created_block():
+    anchor = str(uuid.uuid4())
+    planner = AppendBlockChildrenRequest.plan(PAGE_ID, _blocks(150), after=anchor)
+    first = next(planner)
+    assert str(first.after) == anchor
+    created = [
+        ParagraphBlock.new("x").model_copy(update={"id": uuid.uuid4()})
+        for _ in first.children
+    ]
+    response = AppendBlockChildrenResponse(
+        results=created, has_more=False, type="block", request_id=uuid.uuid4()
+    )
+    second = planner.send(response)
+    assert second.after == created[-1].id
+    assert len(second.children) == 50
+    with pytest.raises(StopIteration):
+        planner.send(str(uuid.uuid4()))
+
+
+def test_continuation_without_response_is_an_error():
+    planner = AppendBlockChildrenRequest.plan(PAGE_ID, _blocks(101), after=str(uuid.uuid4()))  # fmt: skip
+    next(planner)
+    with pytest.raises(ValueError):
+        next(planner)
+
+
+def test_block_larger_than_a_request_is_an_error():
+    with pytest.raises(ValueError):
+        list(AppendBlockChildrenRequest.plan(PAGE_ID, _blocks(1, "x" * 5000), max_bytes=1000))  # fmt: skip
+
+
+def test_requests_serialize_like_validated_requests():
+    (request,) = AppendBlockChildrenRequest.plan(PAGE_ID, _blocks(3))
+    validated = AppendBlockChildrenRequest(block_id=PAGE_ID, children=_blocks(3))
+    assert _body(request) == _body(validated)
+
+
+def test_deep_and_large_children_are_deferred_to_the_created_blocks():
+    deep = BulletedListItemBlock.new("a", children=[BulletedListItemBlock.new("b", children=[BulletedListItemBlock.new("c", children=_blocks(2))])])  # fmt: skip
+    wide = [BulletedListItemBlock.new(f"{i}", children=_blocks(90)) for i in range(12)]  # fmt: skip
+    planner = AppendBlockChildrenRequest.plan(PAGE_ID, [deep, *wide])
+    first = next(planner)
+    # `deep` without its children, and 91 blocks for each of 10 `wide` items
+    assert len(first.children) == 11 and lint_request(first) == []
+    assert first.children[0].bulleted_list_item.children == []
+    assert len(deep.bulleted_list_item.children) == 1
+    created = [block.model_copy(update={"id": uuid.uuid4()}) for block in first.children]  # fmt: skip
+    response = AppendBlockChildrenResponse(results=created, has_more=False, type="block", request_id=uuid.uuid4())  # fmt: skip
+    follow_up = planner.send(response)
+    assert follow_up.block_id == created[0].id and lint_request(follow_up) == []
+    assert follow_up.children == deep.bulleted_list_item.children
+    assert [len(r.children) for r in planner] == [2]
+
+    planner = AppendBlockChildrenRequest.plan(PAGE_ID, [deep])
+    next(planner)
+    with pytest.raises(ValueError):
+        next(planner)
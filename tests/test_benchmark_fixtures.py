@@ -0,0 +1,64 @@
+import pytest
+from pydantic import TypeAdapter
+
+from pydantic_api.notion.models import (
+    Page,
+    Database,
+    BlockObject,
+    PageProperty,
+    DatabaseProperty,
+    QueryDatabaseResponse,
+    RetrieveCommentsResponse,
+    RetrieveBlockChildrenResponse,
+)
+from benchmarks.fixtures import (
+    BLOCK_TYPES,
+    PAGE_PROPERTY_TYPES,
+    DATABASE_PROPERTY_TYPES,
+    PayloadGenerator,
+    encode,
+    parse_mix,
+)
+
+
+@pytest.mark.parametrize("type_", PAGE_PROPERTY_TYPES)
+def test_page_property_fixtures_validate(type_):
+    prop = TypeAdapter(PageProperty).validate_python(PayloadGenerator().page_property(type_))  # fmt: skip
+    assert prop.type == type_
+
+
+@pytest.mark.parametrize("type_", DATABASE_PROPERTY_TYPES)
+def test_database_property_fixtures_validate(type_):
+    prop = TypeAdapter(DatabaseProperty).validate_python(PayloadGenerator().database_property(type_))  # fmt: skip
+    assert prop.type == type_
+
+
+@pytest.mark.parametrize("type_", BLOCK_TYPES)
+def test_block_fixtures_validate(type_):
+    block = TypeAdapter(BlockObject).validate_json(encode(PayloadGenerator().block(type_)))  # fmt: skip
+    assert block.type == type_
+
+
+def test_envelope_fixtures_validate():
+    gen = PayloadGenerator()
+    mix = parse_mix("title=1,rich_text=3,relation=2,people=1")
+    Page.model_validate_json(encode(gen.page(mix)))
+    Database.model_validate_json(encode(gen.database(mix)))
+    response = QueryDatabaseResponse.model_validate_json(
+        encode(gen.paginated([gen.page(mix) for _ in range(3)], "page_or_database"))
+    )
+    assert len(response.results) == 3
+    assert len(response.results[0].properties) == 7
+    children = RetrieveBlockChildrenResponse.model_validate_json(
+        encode(gen.paginated(gen.block_tree(depth=3, width=2), "block"))
+    )
+    assert len(children.results) == 2
+    comments = RetrieveCommentsResponse.model_validate_json(
+        encode(gen.paginated(gen.comment_thread(5), "comment"))
+    )
+    assert len({comment.discussion_id for comment in comments.results}) == 1
+
+
+def test_fixtures_are_deterministic():
+    assert encode(PayloadGenerator(seed=1).page()) == encode(PayloadGenerator(seed=1).page())  # fmt: skip
+    assert encode(PayloadGenerator(seed=1).page()) != encode(PayloadGenerator(seed=2).page())  # fmt: skip
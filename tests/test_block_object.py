@@ -0,0 +1,43 @@
+import uuid
+
+from pydantic import TypeAdapter
+
+from pydantic_api.notion.models.objects.block.block import (
+    BlockObject,
+    OriginalSyncedBlock,
+    DupliateSyncedBlock,
+    ParagraphBlock,
+    TodoBlock,
+)
+
+
+block_adapter = TypeAdapter(BlockObject)
+
+
+def test_blockobject_dispatches_on_type():
+    block = block_adapter.validate_python(
+        {"type": "paragraph", "paragraph": {"rich_text": [], "color": "default"}}
+    )
+    assert isinstance(block, ParagraphBlock)
+
+
+def test_blockobject_dispatches_synced_block_on_synced_from():
+    original = block_adapter.validate_python(
+        {"type": "synced_block", "synced_block": {"synced_from": None}}
+    )
+    duplicate = block_adapter.validate_python(
+        {
+            "type": "synced_block",
+            "synced_block": {"synced_from": {"block_id": str(uuid.uuid4())}},
+        }
+    )
+    assert isinstance(original, OriginalSyncedBlock)
+    assert isinstance(duplicate, DupliateSyncedBlock)
+
+
+def test_todoblock_is_a_block():
+    block = TodoBlock.new("Buy milk")
+    assert block.type == "to_do"
+    assert block.object == "block"
+    assert block.to_do.checked is False
+    assert isinstance(block_adapter.validate_python(block.model_dump()), TodoBlock)
@@ -0,0 +1,131 @@
+import gc
+import sys
+import uuid
+
+import pytest
+
+from pydantic_api.notion.models import BlockTree, RetrieveBlockChildrenResponse
+from benchmarks.fixtures import PayloadGenerator
+
+
+def _tree(depth: int = 3, width: int = 4, page_size: int = 3) -> tuple[str, list, BlockTree]:  # fmt: skip
+    page_id = str(uuid.uuid4())
+    responses = PayloadGenerator().block_children_pages(page_id, depth, width, page_size)  # fmt: skip
+    pages = [(parent_id, RetrieveBlockChildrenResponse.model_validate(response)) for parent_id, response in responses]  # fmt: skip
+    tree = BlockTree(page_id)
+    for parent_id, page in pages:
+        tree.append(page, parent_id=parent_id)
+    return page_id, pages, tree
+
+
+def test_tree_indexes_every_block_in_order():
+    page_id, pages, tree = _tree()
+    assert len(tree) == 4 + 4 * 4 + 4 * 4 * 4
+    assert [node.block for node in tree.root.children] == pages[0][1].results + pages[1][1].results  # fmt: skip
+    for _, page in pages:
+        for block in page.results:
+            node = tree[str(block.id)]
+            assert node.block is block
+            assert block.id in tree
+            assert str(block.id).replace("-", "") in tree
+    assert tree.get(uuid.uuid4()) is None
+    assert "not-an-id" not in tree
+
+
+def test_parent_and_child_pointers():
+    page_id, _, tree = _tree()
+    for node in tree:
+        assert node in node.parent.children
+        assert all(child.parent is node for child in node.children)
+    leaf = next(node for node in tree if node.depth == 3)
+    assert leaf.parent.parent.parent is tree.root
+    assert tree.root.id == uuid.UUID(page_id)
+
+
+def test_traversal_orders():
+    _, _, tree = _tree(depth=2, width=2, page_size=100)
+    a, b = tree.root.children
+    assert list(tree.depth_first()) == [a, *a.children, b, *b.children]
+    assert list(tree.breadth_first()) == [a, b, *a.children, *b.children]
+    assert list(tree.depth_first(a.id)) == a.children
+
+
+def test_blocks_attach_to_their_recorded_parent():
+    page_id = str(uuid.uuid4())
+    responses = PayloadGenerator().block_children_pages(page_id, depth=2, width=2)
+    pages = [RetrieveBlockChildrenResponse.model_validate(r) for _, r in responses]
+    # Children arrive before their parents: nodes are created detached and attached later.
+    tree = BlockTree.new(page_id, reversed(pages))
+    assert [node.block for node in tree.root.children] == pages[0].results
+    assert [node.block for node in tree.root.children[0].children] == pages[1].results  # fmt: skip
+    assert len(tree) == 6
+
+
+def test_pending_lists_blocks_with_unretrieved_children():
+    page_id = str(uuid.uuid4())
+    responses = PayloadGenerator().block_children_pages(page_id, depth=2, width=3)
+    tree = BlockTree(page_id)
+    tree.append(RetrieveBlockChildrenResponse.model_validate(responses[0][1]))
+    assert tree.pending() == [node.id for node in tree.root.children]
+    for parent_id, response in responses[1:]:
+        tree.append(RetrieveBlockChildrenResponse.model_validate(response), parent_id)
+    assert tree.pending() == []
+
+
+def test_blocks_whose_children_came_back_empty_are_not_pending():
+    page_id = str(uuid.uuid4())
+    gen = PayloadGenerator()
+    ((_, response),) = gen.block_children_pages(page_id, depth=1, width=2)
+    for block in response["results"]:
+        block["has_children"] = True
+    tree = BlockTree(page_id)
+    tree.append(RetrieveBlockChildrenResponse.model_validate(response))
+    first, second = tree.pending()
+    tree.append(RetrieveBlockChildrenResponse.model_validate(gen.paginated([], "block")), parent_id=first)  # fmt: skip
+    assert tree[first].fetched and tree.pending() == [second]
+
+
+def test_appending_a_page_twice_does_not_duplicate_children():
+    page_id, pages, tree = _tree(depth=1, width=3)
+    tree.append(pages[0][1], parent_id=page_id)
+    assert len(tree.root.children) == 3
+
+
+def test_parent_references_are_weak():
+    _, _, tree = _tree(depth=2, width=2)
+    node = tree.root.children[0].children[0]
+    del tree
+    gc.collect()
+    assert node.parent is None
+
+
+def test_deep_tree_does_not_recurse():
+    page_id = uuid.uuid4()
+    tree = BlockTree(page_id)
+    template = PayloadGenerator().block("toggle")
+    block = RetrieveBlockChildrenResponse.model_validate(PayloadGenerator().paginated([template], "block")).results[0]  # fmt: skip
+    parent_id = page_id
+    count = sys.getrecursionlimit() * 2
+    for _ in range(count):
+        block = block.model_copy(update={"id": uuid.uuid4()})
+        tree.append([block], parent_id=parent_id)
+        parent_id = block.id
+    assert len(list(tree.depth_first())) == count
+    assert len(list(tree.breadth_first())) == count
+    assert tree[parent_id].depth == count
+
+
+def test_block_without_id_is_rejected():
+    block = RetrieveBlockChildrenResponse.model_validate(
+        {
+            "object": "list",
+            "results": [{"type": "divider", "divider": {}}],
+            "next_cursor": None,
+            "has_more": False,
+            "type": "block",
+            "block": {},
+            "request_id": str(uuid.uuid4()),
+        }
+    ).results[0]
+    with pytest.raises(ValueError):
+        BlockTree(uuid.uuid4()).append([block])
@@ -0,0 +1,96 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from pydantic_api.notion.models import (
+    NAT,
+    Page,
+    Column,
+    LazyPage,
+    NumberProperty,
+    extract_columns,
+)
+from benchmarks.fixtures import PayloadGenerator, parse_mix
+
+MIX = parse_mix("title=1,rich_text=1,number=1,checkbox=1,date=1,created_time=1,select=1,status=1,multi_select=1,relation=1,people=1,url=1,email=1,formula=1")  # fmt: skip
+
+
+def _payloads(count: int = 4) -> list[dict]:
+    gen = PayloadGenerator(seed=2)
+    pages = [gen.page(MIX) for _ in range(4)]
+    pages[1]["properties"]["Number"]["number"] = None
+    pages[1]["properties"]["Select"]["select"] = None
+    pages[1]["properties"]["Multi Select"]["multi_select"] = []
+    pages[2]["properties"]["Date"]["date"] = {"start": "2024-11-01T10:00:00.000+02:00", "end": "2024-11-02", "time_zone": None}  # fmt: skip
+    pages[3]["properties"]["Select"]["select"] = pages[0]["properties"]["Select"]["select"]  # fmt: skip
+    return pages[:count]
+
+
+def _rows(columns) -> list[dict]:
+    return [{name: columns[name][row] for name in columns} for row in range(columns.rows)]  # fmt: skip
+
+
+def test_payloads_pages_and_lazy_pages_give_the_same_columns():
+    payloads = _payloads()
+    expected = _rows(extract_columns(payloads))
+    assert _rows(extract_columns(Page.model_validate(p) for p in payloads)) == expected
+    lazy = [LazyPage.model_validate_json(json.dumps(p)) for p in payloads]
+    assert _rows(extract_columns(lazy)) == expected
+    assert not any(page.properties.is_decoded(name) for page in lazy for name in page.properties)  # fmt: skip
+
+
+def test_column_values():
+    payloads = _payloads()
+    columns = extract_columns(payloads)
+    assert "Formula" not in columns
+    assert columns.ids == [p["id"] for p in payloads]
+    assert columns["Number"][0] == payloads[0]["properties"]["Number"]["number"]
+    assert columns["Number"][1] is None
+    assert list(columns["Checkbox"]) == [p["properties"]["Checkbox"]["checkbox"] for p in payloads]  # fmt: skip
+    select = columns["Select"]
+    assert select.codes[1] == -1 and select.codes[0] == select.codes[3]
+    assert select[0] == payloads[0]["properties"]["Select"]["select"]["name"]
+    multi = columns["Multi Select"]
+    assert multi[1] == [] and multi[0] == [o["name"] for o in payloads[0]["properties"]["Multi Select"]["multi_select"]]  # fmt: skip
+    assert list(multi.offsets) == [0, 3, 3, 6, 9]
+    assert columns["Relation"][0] == [r["id"] for r in payloads[0]["properties"]["Relation"]["relation"]]  # fmt: skip
+    assert columns["People"][2] == [u["id"] for u in payloads[2]["properties"]["People"]["people"]]  # fmt: skip
+    assert columns["Date"][2] == datetime(2024, 11, 1, 8, tzinfo=timezone.utc)
+    assert columns["Date"].ends[2] == columns["Date"].values[0] + 86400 * 10**6
+    assert columns["Date"].ends[0] == NAT
+    assert columns["Created Time"][0] == datetime(2024, 11, 1, 10, tzinfo=timezone.utc)
+    assert columns["Title"][0] == "".join(t["plain_text"] for t in payloads[0]["properties"]["Title"]["title"])  # fmt: skip
+    assert columns["Url"][0] == "https://example.com/page"
+    with pytest.raises(TypeError):
+        Column("number")
+
+
+def test_missing_properties_and_selection():
+    payloads = _payloads(3)
+    del payloads[0]["properties"]["Number"]
+    payloads[2]["properties"]["Extra"] = NumberProperty(number=3).model_dump(mode="json")
+    columns = extract_columns(payloads)
+    assert list(columns["Number"]) == [None, None, payloads[2]["properties"]["Number"]["number"]]  # fmt: skip
+    assert list(columns["Extra"]) == [None, None, 3]
+    assert list(extract_columns(payloads, names=["Extra", "Title"])) == ["Title", "Extra"]  # fmt: skip
+
+
+def test_type_changes_are_errors():
+    payloads = _payloads(2)
+    payloads[1]["properties"]["Number"] = {"type": "checkbox", "checkbox": True}
+    with pytest.raises(ValueError):
+        extract_columns(payloads)
+
+
+def test_to_numpy_does_not_copy():
+    numpy = pytest.importorskip("numpy")
+    columns = extract_columns(_payloads())
+    numbers = columns["Number"].to_numpy()
+    assert numbers.dtype == numpy.float64 and numpy.isnan(numbers[1])
+    assert numbers.base is not None
+    assert columns["Date"].to_numpy()[2] == numpy.datetime64("2024-11-01T08:00:00", "us")
+    assert numpy.isnat(columns["Date"].end_to_numpy()[0])
+    assert columns["Checkbox"].to_numpy().dtype == numpy.bool_
+    offsets, codes = columns["Multi Select"].to_numpy()
+    assert offsets.tolist() == [0, 3, 3, 6, 9] and len(codes) == 9
@@ -0,0 +1,76 @@
+import pickle
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from pydantic_api.notion.models import (
+    Page,
+    LazyPage,
+    Database,
+    EpochMillis,
+    CommentObject,
+    ParagraphBlock,
+    QueryDatabaseResponse,
+    RetrieveBlockChildrenResponse,
+    json_size,
+    fingerprint,
+    compact_all,
+    compact_timestamps,
+)
+from benchmarks.fixtures import PayloadGenerator
+
+
+def test_epoch_millis_round_trip_datetimes():
+    value = datetime(2024, 1, 2, 3, 4, 5, 123000, tzinfo=timezone.utc)
+    ms = EpochMillis.from_datetime(value)
+    assert ms == 1704164645123 and repr(ms) == "EpochMillis(1704164645123)"
+    assert ms.datetime == value and ms.datetime.utcoffset() == timedelta(0)
+    assert EpochMillis.from_datetime(datetime(1969, 12, 31, 23, 59, 59, 999000, tzinfo=timezone.utc)) == -1  # fmt: skip
+    assert pickle.loads(pickle.dumps(ms)) == ms
+    for invalid in (
+        value.replace(tzinfo=None),
+        value.replace(microsecond=123456),
+        value.astimezone(timezone(timedelta(hours=2))),
+    ):
+        with pytest.raises(ValueError):
+            EpochMillis.from_datetime(invalid)
+
+
+def test_compacted_objects_serialize_to_the_same_json():
+    gen = PayloadGenerator(seed=0)
+    response = QueryDatabaseResponse.model_validate(gen.paginated([gen.page() for _ in range(5)], "page_or_database"))  # fmt: skip
+    page_id = gen.uuid()
+    blocks = RetrieveBlockChildrenResponse.model_validate(gen.block_children_pages(page_id, 1, 5)[0][1])  # fmt: skip
+    database = Database.model_validate(gen.database())
+    comment = CommentObject.model_validate(gen.comment())
+    for value in (response, blocks, database, comment):
+        dumped, python, size, token = value.model_dump_json(), value.model_dump(), json_size(value), fingerprint(value)  # fmt: skip
+        assert compact_timestamps(value) is value
+        assert value.model_dump_json() == dumped
+        assert value.model_dump() == python
+        assert json_size(value) == size
+        assert fingerprint(value) == token
+        assert type(value).model_validate_json(dumped).model_dump_json() == dumped
+
+    page = response.results[0]
+    assert type(page.created_time) is EpochMillis
+    assert type(blocks.results[0].last_edited_time) is EpochMillis
+    assert type(comment.created_time) is EpochMillis
+    assert Page.model_validate(page.model_dump()).created_time == page.created_time.datetime  # fmt: skip
+    # Compacted pages sort on integers
+    assert sorted(response.results, key=lambda p: p.last_edited_time)
+
+
+def test_exotic_timestamps_and_lazy_properties_are_kept():
+    payload = PayloadGenerator(seed=0).page()
+    payload["created_time"] = "2024-01-02T03:04:05.123456Z"
+    payload["last_edited_time"] = "2024-01-02T05:04:05.000+02:00"
+    page = compact_timestamps(Page.model_validate(payload))
+    assert type(page.created_time) is type(page.last_edited_time) is datetime
+
+    lazy = next(compact_all([LazyPage.model_validate(PayloadGenerator(seed=1).page())]))  # fmt: skip
+    assert type(lazy.created_time) is EpochMillis
+    assert not any(lazy.properties.is_decoded(name) for name in lazy.properties)
+
+    block = compact_timestamps(ParagraphBlock.new("no timestamps"))
+    assert block.created_time is None
@@ -0,0 +1,53 @@
+import uuid
+
+from pydantic import TypeAdapter
+
+from pydantic_api.notion.models.objects.properties.database_property import (
+    DatabaseProperty,
+    NumberDatabaseProperty,
+    SinglePropertyRelationDatabaseProperty,
+    DualPropertyRelationDatabaseProperty,
+)
+
+
+property_adapter = TypeAdapter(DatabaseProperty)
+
+
+def test_databaseproperty_dispatches_on_type():
+    prop = property_adapter.validate_python(
+        {"id": "abc", "name": "Price", "type": "number", "number": {"format": "dollar"}}
+    )
+    assert isinstance(prop, NumberDatabaseProperty)
+    assert prop.number.format == "dollar"
+
+
+def test_databaseproperty_dispatches_relation_on_relation_type():
+    database_id = str(uuid.uuid4())
+    single = property_adapter.validate_python(
+        {
+            "id": "rel1",
+            "name": "Tasks",
+            "type": "relation",
+            "relation": {
+                "type": "single_property",
+                "database_id": database_id,
+                "single_property": {},
+            },
+        }
+    )
+    dual = property_adapter.validate_python(
+        {
+            "id": "rel2",
+            "name": "Projects",
+            "type": "relation",
+            "relation": {
+                "type": "dual_property",
+                "database_id": database_id,
+                "dual_property": {},
+            },
+        }
+    )
+    assert isinstance(single, SinglePropertyRelationDatabaseProperty)
+    assert isinstance(dual, DualPropertyRelationDatabaseProperty)
+    assert single.name == "Tasks"
+    assert dual.relation.database_id == uuid.UUID(database_id)
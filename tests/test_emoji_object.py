@@ -0,0 +1,20 @@
+import emoji
+import pytest
+from pydantic import ValidationError
+
+from pydantic_api.notion.models.objects.emoji import EmojiObject, is_emoji
+from pydantic_api.notion.models.objects.common import IconObjectFactory
+
+
+def test_emoji_index_matches_emoji_package():
+    for sequence in emoji.EMOJI_DATA:
+        assert is_emoji(sequence)
+    for text in ["", "a", "😻😻", "😻 ", ":cat:"]:
+        assert is_emoji(text) == emoji.is_emoji(text)
+
+
+def test_emojiobject_validates_against_index():
+    assert EmojiObject(emoji="👩‍💻").emoji == "👩‍💻"
+    assert IconObjectFactory.from_emoji("😻").type == "emoji"
+    with pytest.raises(ValidationError):
+        EmojiObject(emoji="not an emoji")
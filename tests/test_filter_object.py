@@ -0,0 +1,52 @@
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from pydantic_api.notion.models.endpoints.base import (
+    FilterObject,
+    CheckboxFilterObject,
+    FormulaFilterObject,
+    CreatedTimeTimestampFilterObject,
+)
+
+
+filter_adapter = TypeAdapter(FilterObject)
+
+
+def test_filterobject_dispatches_on_operand_key():
+    checkbox = filter_adapter.validate_python(
+        {"property": "Done", "checkbox": {"equals": True}}
+    )
+    timestamp = filter_adapter.validate_python(
+        {"timestamp": "created_time", "created_time": {"past_week": {}}}
+    )
+    assert isinstance(checkbox, CheckboxFilterObject)
+    assert isinstance(timestamp, CreatedTimeTimestampFilterObject)
+
+
+def test_formula_filter_accepts_one_condition():
+    formula = filter_adapter.validate_python(
+        {"property": "Total", "formula": {"number": {"greater_than": 10}}}
+    )
+    assert isinstance(formula, FormulaFilterObject)
+    assert formula.formula.number == {"greater_than": 10}
+
+    with pytest.raises(ValidationError):
+        filter_adapter.validate_python(
+            {
+                "property": "Total",
+                "formula": {"number": {"greater_than": 10}, "string": {"contains": "a"}},
+            }
+        )
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"property": "Done", "checkbox": {"equals": True, "does_not_equal": False}},
+        {"property": "Done", "checkbox": {"equals": True}, "date": {"after": "2024-01-01"}},
+        {"property": "Done"},
+    ],
+)
+def test_filterobject_rejects_ambiguous_operands(data):
+    with pytest.raises(ValidationError):
+        filter_adapter.validate_python(data)
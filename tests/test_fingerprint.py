@@ -0,0 +1,78 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from pydantic_api.notion.models import (
+    Page,
+    Database,
+    BlockTree,
+    CommentObject,
+    FilesProperty,
+    UploadedFileObject,
+    TextRichTextObject,
+    QueryDatabaseResponse,
+    RetrieveBlockChildrenResponse,
+    DIGEST_SIZE,
+    fingerprint,
+    merkle_root,
+    merkle_hashes,
+    changed_nodes,
+)
+from benchmarks.fixtures import PayloadGenerator
+
+
+def _tree(seed: int = 0) -> BlockTree:
+    page_id = str(uuid.UUID(int=seed))
+    tree = BlockTree(page_id)
+    for parent_id, response in PayloadGenerator(seed=seed).block_children_pages(page_id, depth=3, width=3):  # fmt: skip
+        tree.append(RetrieveBlockChildrenResponse.model_validate(response), parent_id=parent_id)  # fmt: skip
+    return tree
+
+
+def test_fingerprints_are_stable_and_tell_content_apart():
+    gen = PayloadGenerator(seed=0)
+    page = gen.page()
+    for cls, payload in ((Page, page), (Database, gen.database()), (CommentObject, gen.comment())):  # fmt: skip
+        a, b = cls.model_validate(payload), cls.model_validate(payload)
+        assert len(fingerprint(a)) == DIGEST_SIZE
+        assert fingerprint(a) == fingerprint(b)
+    # Fingerprints are stored by mirrors: they must not change across processes or releases
+    assert fingerprint({"a": 1, "b": ["x", None, True]}).hex() == "e2a2f0c0503f09a69bda7f0aa7498727"  # fmt: skip
+    assert fingerprint([TextRichTextObject.new("a"), {"b": None, "a": 1}]) == fingerprint([TextRichTextObject.new("a"), {"a": 1}])  # fmt: skip
+    assert fingerprint("1") != fingerprint(1)
+    edited = Page.model_validate(page)
+    edited.properties["Title"].title[0].text.content += "!"
+    assert fingerprint(edited) != fingerprint(Page.model_validate(page))
+
+
+def test_volatile_fields_are_ignored():
+    gen = PayloadGenerator(seed=0)
+    pages = [gen.page() for _ in range(2)]
+    first = QueryDatabaseResponse.model_validate(gen.paginated(pages, "page_or_database"))  # fmt: skip
+    second = QueryDatabaseResponse.model_validate(gen.paginated(pages, "page_or_database"))  # fmt: skip
+    assert first.request_id != second.request_id
+    assert fingerprint(first) == fingerprint(second)
+
+    now = datetime.now(timezone.utc)
+    signed = [
+        FilesProperty(files=[UploadedFileObject.new(f"https://files.example.com/a.pdf?X-Signature={i}", expire_time=now + timedelta(hours=i))])  # fmt: skip
+        for i in range(2)
+    ]
+    assert fingerprint(signed[0]) == fingerprint(signed[1])
+    other = FilesProperty(files=[UploadedFileObject.new("https://files.example.com/b.pdf?X-Signature=0")])  # fmt: skip
+    assert fingerprint(other) != fingerprint(signed[0])
+
+
+def test_merkle_hashes_find_the_changed_subtrees():
+    tree, again = _tree(), _tree()
+    hashes = merkle_hashes(tree)
+    assert len(hashes) == len(tree) + 1
+    assert merkle_root(again) == hashes[tree.root.id] == next(iter(hashes.values()))
+    assert list(changed_nodes(again, hashes)) == []
+
+    leaf = next(node for node in again if node.depth == 3)
+    getattr(leaf.block, leaf.block.type).rich_text[0].text.content = "edited"
+    changed = list(changed_nodes(again, hashes))
+    assert [node.id for node in changed] == [leaf.parent.parent.id, leaf.parent.id, leaf.id]  # fmt: skip
+    assert merkle_root(again, leaf.parent.id) != hashes[leaf.parent.id]
+    sibling = next(node for node in again.root.children if node is not leaf.parent.parent)  # fmt: skip
+    assert merkle_root(again, sibling.id) == hashes[sibling.id]
@@ -0,0 +1,74 @@
+import pickle
+
+import pytest
+
+from pydantic_api.notion.models import (
+    Page,
+    LazyPage,
+    InternPool,
+    PartialUser,
+    SelectOption,
+    QueryDatabaseResponse,
+)
+from pydantic_api.notion.models.base import _frozen
+from benchmarks.fixtures import PayloadGenerator
+
+
+def _response(pages: int = 4) -> dict:
+    gen = PayloadGenerator(seed=0)
+    user, parent = gen.partial_user(), {"type": "database_id", "database_id": gen.uuid()}  # fmt: skip
+    payloads = [gen.page() for _ in range(pages)]
+    for payload in payloads:
+        payload["created_by"] = payload["last_edited_by"] = dict(user)
+        payload["parent"] = dict(parent)
+    return gen.paginated(payloads, "page_or_database")
+
+
+def test_identical_instances_are_shared():
+    raw = _response()
+    response = QueryDatabaseResponse.model_validate(raw)
+    expected = response.model_dump()
+    pool = InternPool()
+    assert pool.intern(response) is response
+    pages = response.results
+    assert all(page.created_by is pages[0].created_by for page in pages)
+    assert pages[0].last_edited_by is pages[0].created_by
+    annotations = [item.annotations for page in pages for item in page.properties["Title"].title]  # fmt: skip
+    assert all(a is annotations[0] for a in annotations)
+    assert all(page.parent is pages[0].parent for page in pages)
+    assert response.model_dump() == expected
+    assert pool.hits > 0 and pool.misses > 0
+
+    # Interning again only hits
+    misses = pool.misses
+    pool.intern(QueryDatabaseResponse.model_validate(raw))
+    assert pool.misses == misses
+
+
+def test_interned_instances_are_frozen_but_copies_are_not():
+    page = Page.model_validate(_response(1)["results"][0])
+    InternPool().intern(page)
+    with pytest.raises(TypeError):
+        page.created_by.id = None
+    copy = page.created_by.model_copy()
+    copy.id = PartialUser(id=PayloadGenerator(seed=1).uuid()).id
+    assert copy.id != page.created_by.id
+    page.created_by = copy  # the page itself is not frozen
+    # Nor are unpickled copies: only the instances of the pool are registered
+    unpickled = pickle.loads(pickle.dumps(page)).last_edited_by
+    unpickled.id = copy.id
+    assert _frozen.get(id(page.last_edited_by)) is page.last_edited_by
+    assert id(unpickled) not in _frozen
+
+
+def test_pool_is_bounded_and_skips_lazy_payloads():
+    pool = InternPool(maxsize=2)
+    options = [SelectOption.new(name) for name in "abc"]
+    assert [pool.intern(option) for option in options] == options
+    assert len(pool) == 2
+    assert pool.intern(SelectOption.new("c")) is options[2]
+    assert pool.intern(SelectOption.new("a")) is not options[0]
+
+    lazy = LazyPage.model_validate(_response(1)["results"][0])
+    pool.intern(lazy)
+    assert not any(lazy.properties.is_decoded(name) for name in lazy.properties)
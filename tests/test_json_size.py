@@ -0,0 +1,123 @@
+import uuid
+from datetime import datetime, timezone, timedelta
+
+import pytest
+from pydantic import TypeAdapter
+
+from pydantic_api.notion.models import (
+    Page,
+    Database,
+    BlockObject,
+    ParagraphBlock,
+    CreatePageRequest,
+    CreateDatabaseRequest,
+    TextRichTextObject,
+    AppendBlockChildrenRequest,
+    UpdatePagePropertiesRequest,
+    json_size,
+)
+from benchmarks.fixtures import BLOCK_TYPES, PayloadGenerator
+
+
+def _dumped(model, **kwargs) -> int:
+    return len(model.model_dump_json(**kwargs).encode())
+
+
+def _models():
+    gen = PayloadGenerator(seed=3)
+    page = Page.model_validate(gen.page())
+    database = Database.model_validate(gen.database())
+    blocks = [TypeAdapter(BlockObject).validate_python(gen.block(type_)) for type_ in BLOCK_TYPES]  # fmt: skip
+    return [
+        page,
+        database,
+        *blocks,
+        CreatePageRequest(
+            parent={"type": "database_id", "database_id": database.id},
+            properties=gen.page()["properties"],
+            children=blocks,
+            icon={"type": "emoji", "emoji": "📄"},
+        ),
+        UpdatePagePropertiesRequest(page_id=page.id, properties=page.properties),
+        CreateDatabaseRequest(
+            parent={"type": "page_id", "page_id": page.id},
+            title=database.title,
+            properties=gen.database()["properties"],
+        ),
+        AppendBlockChildrenRequest(block_id=str(page.id), children=blocks),
+    ]
+
+
+@pytest.mark.parametrize("exclude_none", [False, True])
+def test_size_matches_model_dump_json(exclude_none):
+    for model in _models():
+        assert json_size(model, exclude_none=exclude_none) == _dumped(model, exclude_none=exclude_none)  # fmt: skip
+
+
+def test_excluded_fields():
+    request = _models()[-1]
+    assert json_size(request, exclude={"block_id"}, exclude_none=True) == _dumped(request, exclude={"block_id"}, exclude_none=True)  # fmt: skip
+    assert json_size(request.children) == len(TypeAdapter(list[BlockObject]).dump_json(request.children))  # fmt: skip
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "plain",
+        "héllo wörld 😻",
+        'quotes " and \\ backslashes',
+        "new\nline\ttab\x01bell\x1f",
+        "",
+    ],
+)
+def test_strings_are_measured_as_escaped_utf8(content):
+    text = TextRichTextObject.new(content)
+    assert json_size(text) == _dumped(text)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [0, -12, 1.5, 1e20, 1.5e-7, -2.5e300, float("inf"), True, None, [1, "a", {"b": None}]],  # fmt: skip
+)
+def test_extra_json_values(value):
+    block = ParagraphBlock.new("x").model_copy(update={"extra": value})
+    block.__pydantic_extra__["extra"] = value
+    assert json_size(block) == _dumped(block)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        datetime(2024, 11, 1, 10, tzinfo=timezone.utc),
+        datetime(2024, 11, 1, 10, 0, 0, 123000, tzinfo=timezone(timedelta(hours=2))),  # fmt: skip
+        datetime(2024, 11, 1, 10, 0, 0, 5),
+    ],
+)
+def test_datetimes(value):
+    page = Page.model_validate(PayloadGenerator(seed=0).page())
+    page.last_edited_time = value
+    assert json_size(page) == _dumped(page)
+
+
+def test_size_follows_edits():
+    page, *_ = _models()
+    json_size(page)
+    page.url = page.url + "/é"
+    assert json_size(page) == _dumped(page)
+    page.created_by.id = uuid.uuid4()
+    page.icon = None
+    assert json_size(page) == _dumped(page)
+
+    request = AppendBlockChildrenRequest(block_id=uuid.uuid4(), children=[ParagraphBlock.new("a")])  # fmt: skip
+    json_size(request)
+    request.children.append(ParagraphBlock.new("longer text"))
+    request.children[0].paragraph.rich_text[0].text.content = "b" * 100
+    assert json_size(request) == _dumped(request)
+
+
+def test_copies_do_not_reuse_the_size_of_the_original():
+    block = ParagraphBlock.new("a")
+    json_size(block)
+    copy = block.model_copy(update={"has_children": True, "archived": True})
+    assert json_size(copy) == _dumped(copy)
+    assert json_size(block) == _dumped(block)
@@ -0,0 +1,84 @@
+import sys
+import importlib
+import subprocess
+
+import pytest
+
+
+LAZY_PACKAGES = {
+    "pydantic_api.notion.models.objects.block": [
+        "rich_text",
+        "block",
+        "tree",
+        "markdown",
+    ],
+    "pydantic_api.notion.models.objects.properties": [
+        "common",
+        "page_property",
+        "database_property",
+    ],
+    "pydantic_api.notion.models.objects": [
+        "ids",
+        "timestamps",
+        "common",
+        "user",
+        "file",
+        "page",
+        "emoji",
+        "block",
+        "parent",
+        "comment",
+        "database",
+        "properties",
+    ],
+    "pydantic_api.notion.models.endpoints": [
+        "base",
+        "pages",
+        "users",
+        "blocks",
+        "databases",
+        "comments",
+        "search",
+        "streaming",
+    ],
+}
+
+
+@pytest.mark.parametrize("package", LAZY_PACKAGES)
+def test_lazy_package_exports_match_submodules(package):
+    """The lazy name tables must stay in sync with the submodules' `__all__`."""
+    expected = set()
+    for submodule in LAZY_PACKAGES[package]:
+        expected.update(importlib.import_module(f"{package}.{submodule}").__all__)
+    lazy_package = importlib.import_module(package)
+    assert set(lazy_package.__all__) == expected
+    for name in lazy_package.__all__:
+        assert getattr(lazy_package, name) is not None
+
+
+def test_importing_page_does_not_load_unrelated_modules():
+    code = (
+        "import sys\n"
+        "from pydantic_api.notion.models import Page\n"
+        "unexpected = [m for m in ("
+        "'emoji', 'email_validator', "
+        "'pydantic_api.notion.models.objects.block.block', "
+        "'pydantic_api.notion.models.objects.properties.database_property', "
+        "'pydantic_api.notion.models.endpoints.base'"
+        ") if m in sys.modules]\n"
+        "assert not unexpected, unexpected\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_instances_of_deferred_models_serialize_by_inference():
+    """Instances built without the validator of their class (`model_construct`, nested members, `TrustedAdapter`) still serialize when their type is not known up front."""
+    code = (
+        "import uuid, pydantic_core\n"
+        "from pydantic_api.notion.models import PersonUserObject, TrustedAdapter, BlockObject\n"
+        "user = PersonUserObject.model_construct(id=uuid.uuid4(), object='user', type='person', person={})\n"
+        "assert pydantic_core.to_json(user).startswith(b'{\"object\":\"user\"')\n"
+        "block = TrustedAdapter(BlockObject).construct_python({'type': 'divider', 'divider': {}})\n"
+        "assert pydantic_core.to_json({'block': block}).endswith(b'\"divider\":{}}}')\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,53 @@
+import json
+import uuid
+
+from pydantic_api.notion.models import Page, LazyPage, EmailProperty
+
+
+def _page() -> dict:
+    user = {"object": "user", "id": str(uuid.uuid4())}
+    return {
+        "object": "page",
+        "id": str(uuid.uuid4()),
+        "created_time": "2024-11-01T10:00:00.000Z",
+        "created_by": user,
+        "last_edited_time": "2024-11-01T10:00:00.000Z",
+        "last_edited_by": user,
+        "archived": False,
+        "in_trash": False,
+        "parent": {"type": "database_id", "database_id": str(uuid.uuid4())},
+        "url": "https://www.notion.so/page",
+        "properties": {
+            "Email": {"id": "e", "type": "email", "email": "someone@example.com"},
+            "Due": {"id": "d", "type": "date", "date": {"start": "2024-01-01"}},
+            "Count": {"id": "n", "type": "number", "number": 3},
+        },
+    }
+
+
+def test_properties_are_decoded_on_access():
+    page = LazyPage.model_validate(_page())
+    assert not page.properties.is_decoded("Email")
+    assert isinstance(page.properties["Email"], EmailProperty)
+    assert page.properties.is_decoded("Email")
+    assert not page.properties.is_decoded("Due")
+    assert page.properties["Email"] is page.properties["Email"]
+    assert list(page.properties) == ["Email", "Due", "Count"]
+
+
+def test_lazy_page_serializes_like_page():
+    data = _page()
+    assert LazyPage.model_validate(data).model_dump() == Page.model_validate(data).model_dump()
+    raw = json.dumps(data)
+    assert (
+        LazyPage.model_validate_json(raw).model_dump_json()
+        == Page.model_validate_json(raw).model_dump_json()
+    )
+
+
+def test_assigned_properties_are_kept():
+    page = LazyPage.model_validate(_page())
+    page.properties["Email"] = EmailProperty.new(email="other@example.com")
+    del page.properties["Count"]
+    assert page.model_dump()["properties"]["Email"]["email"] == "other@example.com"
+    assert "Count" not in page.model_dump()["properties"]
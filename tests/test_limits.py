@@ -0,0 +1,111 @@
+import uuid
+
+from pydantic_api.notion.models import (
+    URLProperty,
+    EmailProperty,
+    TitleProperty,
+    ParagraphBlock,
+    RelationProperty,
+    CreatePageRequest,
+    PhoneNumberProperty,
+    TextRichTextObject,
+    CreateCommentRequest,
+    MultiSelectProperty,
+    BulletedListItemBlock,
+    EquationRichTextObject,
+    AppendBlockChildrenRequest,
+    UpdatePagePropertiesRequest,
+    LimitViolation,
+    lint_request,
+    lint_requests,
+)
+
+
+def _violations(request) -> list[tuple[str, str, int]]:
+    return [(v.path, v.limit, v.size) for v in lint_request(request)]
+
+
+def _page(**properties) -> CreatePageRequest:
+    return CreatePageRequest(
+        parent={"type": "database_id", "database_id": uuid.uuid4()},
+        properties={"Name": TitleProperty.new("Title"), **properties},
+    )
+
+
+def test_valid_requests_have_no_violations():
+    assert lint_request(_page(Link=URLProperty.new("https://example.com"))) == []
+    assert lint_request(AppendBlockChildrenRequest(block_id=uuid.uuid4(), children=[ParagraphBlock.new("x")] * 100)) == []  # fmt: skip
+
+
+def test_property_values():
+    request = UpdatePagePropertiesRequest(
+        page_id=uuid.uuid4(),
+        properties={
+            "Tags": MultiSelectProperty(multi_select=[{"name": f"tag {i}"} for i in range(101)]),  # fmt: skip
+            "Related": RelationProperty.new([uuid.uuid4() for _ in range(150)]),
+            "Link": URLProperty.new("https://example.com/" + "a" * 2000),
+            "Email": EmailProperty.model_construct(email="a" * 201),
+            "Phone": PhoneNumberProperty.new("1" * 250),
+        },
+    )
+    assert _violations(request) == [
+        ("properties['Tags'].multi_select", "array length", 101),
+        ("properties['Related'].relation", "array length", 150),
+        ("properties['Link'].url", "URL length", 2020),
+        ("properties['Email'].email", "email length", 201),
+        ("properties['Phone'].phone_number", "phone number length", 250),
+    ]
+
+
+def test_rich_text_and_nesting():
+    leaf = BulletedListItemBlock.new("leaf")
+    for _ in range(4):
+        leaf = BulletedListItemBlock.new("item", children=[leaf])
+    paragraph = ParagraphBlock.new(
+        [
+            TextRichTextObject(text={"content": "😻" * 1001}),
+            EquationRichTextObject.new("x" * 1001),
+            TextRichTextObject(text={"content": "link", "link": {"url": "https://example.com/" + "a" * 2000}}),  # fmt: skip
+        ]
+    )
+    request = AppendBlockChildrenRequest(block_id=uuid.uuid4(), children=[paragraph, leaf])
+    assert _violations(request) == [
+        ("children[0].paragraph.rich_text[0].text.content", "text length", 2002),
+        ("children[0].paragraph.rich_text[1].equation.expression", "equation length", 1001),  # fmt: skip
+        ("children[0].paragraph.rich_text[2].text.link.url", "URL length", 2020),
+        ("children[1].bulleted_list_item.children[0].bulleted_list_item.children[0].bulleted_list_item.children", "nesting depth", 3),  # fmt: skip
+    ]
+    # The leaves at the deepest level still have an empty list of children
+    two_levels = leaf.bulleted_list_item.children[0].bulleted_list_item.children[0]
+    assert two_levels.bulleted_list_item.children[0].bulleted_list_item.children[0].bulleted_list_item.children == []  # fmt: skip
+    assert _violations(AppendBlockChildrenRequest(block_id=uuid.uuid4(), children=[two_levels])) == []  # fmt: skip
+
+
+def test_block_count_and_body_size():
+    children = [
+        BulletedListItemBlock.new("x" * 1000, children=[ParagraphBlock.new("y" * 1000) for _ in range(10)])  # fmt: skip
+        for _ in range(101)
+    ]
+    request = AppendBlockChildrenRequest(block_id=uuid.uuid4(), children=children)
+    violations = lint_request(request)
+    assert [(v.path, v.limit) for v in violations] == [
+        ("children", "array length"),
+        ("children", "block count"),
+        ("", "body size"),
+    ]
+    assert violations[1].size == 1111
+    assert violations[2].size == len(request.model_dump_json(exclude={"block_id"}, exclude_none=True).encode())  # fmt: skip
+    assert str(violations[0]) == "children: array length is 101, the maximum is 100"
+    assert str(violations[2]).startswith("request body: body size is ")
+
+
+def test_batches_report_the_index_of_each_request():
+    comment = CreateCommentRequest(
+        discussion_id=uuid.uuid4(),
+        rich_text=[TextRichTextObject.new("x") for _ in range(101)],
+    )
+    requests = [_page(), comment, _page(), comment]
+    assert list(lint_requests(requests)) == [
+        (1, LimitViolation("rich_text", "array length", 101, 100)),
+        (3, LimitViolation("rich_text", "array length", 101, 100)),
+    ]
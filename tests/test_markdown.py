@@ -0,0 +1,321 @@
+import io
+import sys
+import uuid
+
+from pydantic_api.notion.models import (
+    BlockTree,
+    CodeBlock,
+    QuoteBlock,
+    TableBlock,
+    TodoBlock,
+    ImageBlock,
+    DividerBlock,
+    CalloutBlock,
+    TableRowBlock,
+    Heading2Block,
+    EquationBlock,
+    ParagraphBlock,
+    TextRichTextObject,
+    EquationRichTextObject,
+    NumberedListItemBlock,
+    BulletedListItemBlock,
+    AppendBlockChildrenRequest,
+    AppendBlockChildrenResponse,
+    RetrieveBlockChildrenResponse,
+    MAX_NESTING,
+    iter_markdown,
+    iter_markdown_blocks,
+    render_markdown,
+    rich_text_to_markdown,
+    lint_request,
+)
+from benchmarks.fixtures import PayloadGenerator
+
+
+def _with_id(block):
+    return block.model_copy(update={"id": uuid.uuid4()})
+
+
+def test_rich_text_annotations_and_links():
+    markdown = rich_text_to_markdown(
+        [
+            TextRichTextObject.new("Bold ", bold=True),
+            TextRichTextObject.new("too", bold=True),
+            TextRichTextObject.new(", "),
+            TextRichTextObject.new("docs", link_url="https://developers.notion.com"),
+            TextRichTextObject.new(" and "),
+            TextRichTextObject.new("a_b", code=True),
+            TextRichTextObject.new(" or *stars* "),
+            EquationRichTextObject.new("x^2"),
+        ]
+    )
+    assert markdown == (
+        "**Bold too**, [docs](https://developers.notion.com/) and `a_b` or \\*stars\\* $x^2$"  # fmt: skip
+    )
+
+
+def test_blocks_and_nested_children():
+    blocks = [
+        Heading2Block.new("Plan"),
+        ParagraphBlock.new("- not a list\nsecond line"),
+        BulletedListItemBlock.new(
+            "first",
+            children=[NumberedListItemBlock.new("a"), NumberedListItemBlock.new("b")],
+        ),
+        BulletedListItemBlock.new("second"),
+        TodoBlock.new("done", checked=True),
+        QuoteBlock.new("quoted\ntext"),
+        CodeBlock.new("x = 1\nprint(x)", language="python"),
+        DividerBlock.new(),
+        EquationBlock.new("e = mc^2"),
+        ImageBlock.new("https://example.com/a.png", caption="An image"),
+    ]
+    assert render_markdown(blocks) == (
+        "## Plan\n"
+        "\n"
+        "\\- not a list\n"
+        "second line\n"
+        "\n"
+        "- first\n"
+        "    1. a\n"
+        "    2. b\n"
+        "- second\n"
+        "- [x] done\n"
+        "\n"
+        "> quoted\n"
+        "> text\n"
+        "\n"
+        "```python\n"
+        "x = 1\n"
+        "print(x)\n"
+        "```\n"
+        "\n"
+        "---\n"
+        "\n"
+        "$$\n"
+        "e = mc^2\n"
+        "$$\n"
+        "\n"
+        "![An image](https://example.com/a.png)\n"
+    )
+
+
+def test_tree_nodes_with_tables_and_callouts():
+    table = _with_id(TableBlock.new(table_width=2, has_column_header=False, has_row_header=False))  # fmt: skip
+    callout = _with_id(CalloutBlock.new("Note"))
+    tree = BlockTree(uuid.uuid4())
+    tree.append([table, callout])
+    tree.append(
+        [
+            _with_id(TableRowBlock(table_row={"cells": [TextRichTextObject.new(f"a|{i}"), TextRichTextObject.new("b")]}))  # fmt: skip
+            for i in range(2)
+        ],
+        parent_id=table.id,
+    )
+    tree.append([_with_id(ParagraphBlock.new("inside"))], parent_id=callout.id)
+    assert render_markdown(tree.depth_first()) == (
+        "|   |   |\n"
+        "| --- | --- |\n"
+        "| a\\|0 | b |\n"
+        "| a\\|1 | b |\n"
+        "\n"
+        "> Note\n"
+        ">\n"
+        "> inside\n"
+    )
+
+
+def test_render_to_stream_matches_string():
+    gen = PayloadGenerator(seed=1)
+    page_id = str(uuid.uuid4())
+    tree = BlockTree(page_id)
+    for parent_id, response in gen.block_children_pages(page_id, depth=3, width=4):
+        tree.append(RetrieveBlockChildrenResponse.model_validate(response), parent_id)
+    stream = io.StringIO()
+    assert render_markdown(tree.depth_first(), stream) is None
+    assert stream.getvalue() == render_markdown(tree.depth_first())
+    assert render_markdown([]) == ""
+
+
+def test_iter_markdown_is_lazy_and_deep_nesting_does_not_recurse():
+    depth = sys.getrecursionlimit() * 2
+    block = BulletedListItemBlock.new("leaf")
+    for _ in range(depth - 1):
+        block = BulletedListItemBlock.new("item", children=[block])
+    chunks = iter_markdown(iter([block]))
+    assert next(chunks) == "- item"
+    assert sum(1 for _ in chunks) == depth - 1
+
+
+MARKDOWN = """\
+# Report
+
+Some **bold**, *italic*, ~~gone~~, `code`, [a link](https://example.com) and $x^2$ in snake_case.
+
+- one
+  - nested
+    - deeper
+      - deepest
+- [x] done
+1. first
+2. second
+
+> quoted
+> text
+
+```py
+print("hi")
+```
+
+| Name | Value |
+| --- | --- |
+| a | **1** |
+| b\\|c |
+
+---
+"""
+
+
+def test_markdown_compiles_to_blocks():
+    blocks = list(iter_markdown_blocks(MARKDOWN))
+    assert [block.type for block in blocks] == [
+        "heading_1",
+        "paragraph",
+        "bulleted_list_item",
+        "to_do",
+        "numbered_list_item",
+        "numbered_list_item",
+        "quote",
+        "code",
+        "table",
+        "divider",
+    ]
+    styles = [
+        (t.plain_text or t.text.content, t.annotations and t.annotations.model_dump(exclude={"color", "underline"}))  # fmt: skip
+        for t in blocks[1].paragraph.rich_text
+        if t.type == "text"
+    ]
+    assert ("bold", {"bold": True, "italic": False, "strikethrough": False, "code": False}) in styles  # fmt: skip
+    assert ("gone", {"bold": False, "italic": False, "strikethrough": True, "code": False}) in styles  # fmt: skip
+    assert (" in snake_case.", None) in styles
+    (link,) = [t for t in blocks[1].paragraph.rich_text if t.type == "text" and t.text.link]  # fmt: skip
+    assert (link.text.content, str(link.text.link.url)) == ("a link", "https://example.com/")  # fmt: skip
+    (equation,) = [t for t in blocks[1].paragraph.rich_text if t.type == "equation"]
+    assert equation.equation.expression == "x^2"
+    assert blocks[3].to_do.checked is True
+    assert blocks[7].code.language == "python"
+    assert blocks[8].table.table_width == 2
+    assert [row.table_row.cells[0].text.content for row in blocks[8].table.children] == ["Name", "a", "b|c"]  # fmt: skip
+
+
+def test_list_nesting_is_capped():
+    nested = iter_markdown_blocks(MARKDOWN)
+    next(nested), next(nested)
+    one = next(nested)
+    (child,) = one.bulleted_list_item.children
+    assert [c.plain_text for c in child.bulleted_list_item.children] == ["deeper", "deepest"]  # fmt: skip
+    assert MAX_NESTING == 2
+
+
+def test_markdown_round_trip():
+    assert render_markdown(iter_markdown_blocks(MARKDOWN)) == (
+        "# Report\n"
+        "\n"
+        "Some **bold**, *italic*, ~~gone~~, `code`, [a link](https://example.com/) and $x^2$ in snake\\_case.\n"  # fmt: skip
+        "\n"
+        "- one\n"
+        "    - nested\n"
+        "        - deeper\n"
+        "        - deepest\n"
+        "- [x] done\n"
+        "1. first\n"
+        "2. second\n"
+        "\n"
+        "> quoted\n"
+        "> text\n"
+        "\n"
+        "```python\n"
+        'print("hi")\n'
+        "```\n"
+        "\n"
+        "| Name | Value |\n"
+        "| --- | --- |\n"
+        "| a | **1** |\n"
+        "| b\\|c |  |\n"
+        "\n"
+        "---\n"
+    )
+
+
+def test_emphasis_follows_flanking_rules():
+    def styles(markdown):
+        (block,) = iter_markdown_blocks([markdown])
+        return [
+            (t.text.content, t.annotations and (t.annotations.bold, t.annotations.italic))  # fmt: skip
+            for t in block.paragraph.rich_text
+        ]
+
+    assert styles("***bold italic***") == [("bold italic", (True, True))]
+    assert styles("**bold *both***") == [("bold ", (True, False)), ("both", (True, True))]  # fmt: skip
+    assert styles("a * b * c") == [("a * b * c", None)]
+    assert styles("*a**b*") == [("a**b", (False, True))]
+
+
+def test_long_text_is_split_into_rich_text_objects():
+    (block,) = iter_markdown_blocks(["word " * 1000])
+    assert [len(t.text.content) for t in block.paragraph.rich_text] == [2000, 2000, 1000]  # fmt: skip
+
+
+def test_append_requests_are_batched_from_lines():
+    lines = io.StringIO("".join(f"- item {i}\n  - child {i}\n" for i in range(250)))
+    page_id = uuid.uuid4()
+    requests = list(AppendBlockChildrenRequest.from_markdown(page_id.hex, lines))
+    assert [len(request.children) for request in requests] == [100, 100, 50]
+    assert requests[0].block_id == page_id
+    assert requests[2].children[-1].bulleted_list_item.children[0].plain_text == "child 249"  # fmt: skip
+    body = requests[0].model_dump(mode="json", exclude_none=True)
+    assert AppendBlockChildrenRequest.model_validate(body) == requests[0]
+
+
+def _send(planner):
+    """Send each request to a fake Notion, which creates copies of its blocks with new ids."""
+    requests = []
+    try:
+        request = next(planner)
+        while True:
+            requests.append(request)
+            created = [_with_id(block) for block in request.children]
+            response = AppendBlockChildrenResponse(results=created, has_more=False, type="block", request_id=uuid.uuid4())  # fmt: skip
+            request = planner.send(response)
+    except StopIteration:
+        return requests
+
+
+def test_long_tables_and_lists_are_completed_by_follow_up_requests():
+    table = "| n |\n| - |\n" + "".join(f"| {i} |\n" for i in range(150))
+    page_id = uuid.uuid4()
+    requests = _send(AppendBlockChildrenRequest.from_markdown(page_id, table))
+    assert all(lint_request(request) == [] for request in requests)
+    assert [len(r.children) for r in requests] == [1, 51]
+    (sent,) = requests[0].children
+    assert len(sent.table.children) == 100
+    assert requests[1].block_id != page_id and requests[1].after is None
+    rows = sent.table.children + requests[1].children
+    assert [row.table_row.cells[0].text.content for row in rows] == ["n"] + [str(i) for i in range(150)]  # fmt: skip
+    # The planned blocks are left whole
+    (block,) = iter_markdown_blocks(table)
+    assert len(_send(AppendBlockChildrenRequest.plan(page_id, [block]))) == 2
+    assert len(block.table.children) == 151
+
+    items = "- top\n" + "".join(f"  - item {i}\n    - child {i}\n" for i in range(150))
+    requests = _send(AppendBlockChildrenRequest.from_markdown(page_id, items))
+    assert all(lint_request(request) == [] for request in requests)
+    assert [len(r.children) for r in requests] == [1, 50]
+    assert len(requests[0].children[0].bulleted_list_item.children) == 100
+    assert requests[1].block_id != page_id
+    assert requests[1].children[-1].bulleted_list_item.children[0].plain_text == "child 149"  # fmt: skip
+
+
+def test_tables_without_rows_omit_their_children():
+    table = TableBlock.new(table_width=1, has_column_header=False, has_row_header=False)  # fmt: skip
+    assert "children" not in table.model_dump(mode="json", exclude_none=True)["table"]
@@ -0,0 +1,62 @@
+import json
+import uuid
+import pickle
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import PydanticSerializationError, to_json
+
+from pydantic_api.notion.models import NotionId, Page, PartialUser
+from benchmarks.fixtures import PayloadGenerator
+
+
+def test_dashed_and_undashed_forms_are_the_same_id():
+    value = uuid.uuid4()
+    dashed, undashed = NotionId(str(value)), NotionId(value.hex)
+    assert dashed == undashed == NotionId(value) == value
+    assert str(undashed) == str(value)
+    assert undashed.hex() == value.hex and undashed.int == value.int
+    assert undashed.uuid == value
+    assert repr(dashed) == f"NotionId('{value}')"
+    assert NotionId(str(value).upper()) == value
+
+
+def test_ids_hash_like_uuids():
+    value = uuid.uuid4()
+    assert hash(NotionId(value)) == hash(value)
+    assert {value: 1}[NotionId(value)] == 1
+    assert NotionId(value) in {value}
+    assert NotionId(value) != uuid.uuid4()
+    assert NotionId(value) != str(value)  # as `UUID`, not equal to its string
+    assert NotionId(value) != value.bytes and value.bytes != NotionId(value)
+    assert NotionId(value) in {NotionId(value.hex)} and value.bytes not in {NotionId(value)}
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["page", "", "59833787-2cf9-4fdf-8782-e53db20768a", "59833787+2cf9+4fdf+8782+e53db20768a5", "598337872cf94fdf8782e53db20768a5 ", "g" * 32, b"short", 42, None],  # fmt: skip
+)
+def test_invalid_ids_are_rejected(value):
+    with pytest.raises(ValueError):
+        NotionId(value)
+    with pytest.raises(ValidationError):
+        PartialUser(id=value)
+
+
+def test_ids_round_trip_through_json_and_pickle():
+    page = Page.model_validate(PayloadGenerator(seed=0).page())
+    assert type(page.id) is NotionId and type(page.created_by.id) is NotionId
+    dumped = page.model_dump_json()
+    assert json.loads(dumped)["id"] == str(page.id)
+    assert Page.model_validate_json(dumped) == page
+    # In Python mode, as `UUID`, the type of ids before `NotionId`
+    assert type(page.model_dump()["id"]) is uuid.UUID and page.model_dump()["id"] == page.id  # fmt: skip
+    # Outside of a model, an id is serialized by inference, as bytes
+    with pytest.raises(PydanticSerializationError):
+        to_json({"id": page.id})
+    assert to_json({"id": page.id}, bytes_mode="hex") == b'{"id":"%s"}' % page.id.hex().encode()  # fmt: skip
+    assert pickle.loads(pickle.dumps(page.id)) == page.id
+
+    adapter = TypeAdapter(NotionId)
+    assert adapter.json_schema() == {"type": "string", "format": "uuid"}
+    assert adapter.validate_json(f'"{page.id.hex()}"') == page.id
@@ -0,0 +1,83 @@
+import json
+from datetime import timedelta
+
+from pydantic_api.notion.models import (
+    Page,
+    Database,
+    NumberProperty,
+    TitleProperty,
+    TrustedAdapter,
+    QueryDatabaseResponse,
+    compile_page_decoder,
+)
+from pydantic_api.notion.models import decoders
+from benchmarks.fixtures import PayloadGenerator
+
+
+def _database_and_response(pages: int = 5):
+    gen = PayloadGenerator(seed=0)
+    database = Database.model_validate(gen.database())
+    response = gen.paginated([gen.page() for _ in range(pages)], "page_or_database")
+    return database, response
+
+
+def test_decoded_pages_match_generic_decoding():
+    database, response = _database_and_response()
+    decoder = compile_page_decoder(database)
+    raw = json.dumps(response)
+    for decoded, expected in (
+        (decoder.validate_response(response), QueryDatabaseResponse.model_validate(response)),  # fmt: skip
+        (decoder.validate_response_json(raw), QueryDatabaseResponse.model_validate_json(raw)),  # fmt: skip
+    ):
+        assert isinstance(decoded, QueryDatabaseResponse)
+        assert all(isinstance(page, Page) for page in decoded.results)
+        assert decoded.model_dump() == expected.model_dump()
+    page = decoder.validate_page_json(json.dumps(response["results"][0]))
+    assert page.model_dump() == expected.results[0].model_dump()
+    assert type(page.properties["Title"]) is TitleProperty
+
+
+def test_property_names_are_shared_by_pages():
+    database, response = _database_and_response()
+    decoded = compile_page_decoder(database).validate_response(response)
+    first, second = decoded.results[0].properties, decoded.results[1].properties
+    assert [a is b for a, b in zip(first, second)] == [True] * len(first)
+
+
+def test_pages_that_do_not_match_the_schema_are_decoded_generically():
+    database, response = _database_and_response(2)
+    decoder = compile_page_decoder(database)
+    response["results"][0]["properties"]["Added later"] = NumberProperty(number=1).model_dump()  # fmt: skip
+    name = next(n for n, p in database.properties.items() if p.type == "number")
+    response["results"][1]["properties"][name] = TitleProperty.new("Now a title").model_dump()  # fmt: skip
+    for page in response["results"]:
+        decoded = decoder.validate_page(page)
+        assert type(decoded) is Page
+        assert decoded.model_dump() == Page.model_validate(page).model_dump()
+    assert decoder.validate_response(response).results[0].properties["Added later"].number == 1  # fmt: skip
+
+
+def test_decoders_are_cached_by_id_and_last_edited_time(monkeypatch):
+    monkeypatch.setattr(decoders, "DECODER_CACHE_SIZE", 2)
+    monkeypatch.setattr(decoders, "_decoders", type(decoders._decoders)())
+    database, _ = _database_and_response(0)
+    decoder = compile_page_decoder(database)
+    assert compile_page_decoder(database.model_copy()) is decoder
+    edited = database.model_copy(update={"last_edited_time": database.last_edited_time + timedelta(seconds=1)})  # fmt: skip
+    assert compile_page_decoder(edited) is not decoder
+    compile_page_decoder(database)
+    other = database.model_copy(update={"id": PayloadGenerator(seed=1).uuid()})
+    compile_page_decoder(other)
+    # `edited` was the least recently used
+    assert list(decoders._decoders) == [
+        (database.id, database.last_edited_time),
+        (other.id, other.last_edited_time),
+    ]
+
+
+def test_trusted_construction_of_compiled_responses():
+    database, response = _database_and_response()
+    decoder = compile_page_decoder(database)
+    raw = json.dumps(response)
+    constructed = TrustedAdapter(decoder.response_type).construct_json(raw)
+    assert constructed.model_dump() == QueryDatabaseResponse.model_validate_json(raw).model_dump()  # fmt: skip
@@ -0,0 +1,59 @@
+import io
+import json
+import uuid
+
+import pytest
+
+from pydantic_api.notion.models.endpoints.blocks import RetrieveBlockChildrenResponse
+from pydantic_api.notion.models.objects.block.block import ParagraphBlock, DividerBlock
+
+
+def _payload(count: int) -> bytes:
+    blocks = [
+        {
+            "type": "paragraph",
+            "paragraph": {"rich_text": [{"type": "text", "text": {"content": f"héllo 😻 {i}"}}]},
+        }
+        if i % 2 == 0
+        else {"type": "divider", "divider": {}}
+        for i in range(count)
+    ]
+    return json.dumps(
+        {
+            "object": "list",
+            "results": blocks,
+            "next_cursor": "cursor-1",
+            "has_more": True,
+            "type": "block",
+            "block": {},
+            "request_id": str(uuid.uuid4()),
+        },
+        ensure_ascii=False,
+        indent=2,
+    ).encode()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 64, 64 * 1024])
+def test_stream_yields_validated_results(chunk_size):
+    stream = RetrieveBlockChildrenResponse.stream(
+        io.BytesIO(_payload(10)), chunk_size=chunk_size
+    )
+    results = list(stream)
+    assert len(results) == 10
+    assert isinstance(results[0], ParagraphBlock)
+    assert isinstance(results[1], DividerBlock)
+    assert results[8].paragraph.rich_text[0].text.content == "héllo 😻 8"
+    assert stream.has_more is True
+    assert stream.next_cursor == "cursor-1"
+
+
+def test_stream_envelope_without_consuming_results():
+    stream = RetrieveBlockChildrenResponse.stream(_payload(3))
+    assert stream.next_cursor == "cursor-1"
+    assert list(stream) == []
+
+
+def test_stream_matches_eager_validation():
+    payload = _payload(4)
+    eager = RetrieveBlockChildrenResponse.model_validate_json(payload)
+    assert list(RetrieveBlockChildrenResponse.stream(payload.decode())) == eager.results
@@ -0,0 +1,85 @@
+from pydantic import TypeAdapter
+
+from pydantic_api.notion.models import (
+    Page,
+    LazyPage,
+    Database,
+    BlockObject,
+    CommentObject,
+    TitleProperty,
+    RichTextProperty,
+)
+from benchmarks.fixtures import PayloadGenerator, encode
+
+
+def _page() -> dict:
+    page = PayloadGenerator().page({"rich_text": 2})
+    page["properties"]["Task name"] = {
+        "id": "title",
+        "type": "title",
+        "title": [
+            {"type": "text", "text": {"content": "Ship "}, "plain_text": "Ship "},
+            {"type": "text", "text": {"content": "it"}, "plain_text": "it"},
+        ],
+    }
+    return page
+
+
+def test_title_property_is_found_by_type():
+    page = Page.model_validate(_page())
+    assert page.title_property is page.properties["Task name"]
+    assert page.plain_text_title == "Ship it"
+
+
+def test_lazy_page_finds_title_without_decoding_other_properties():
+    page = LazyPage.model_validate_json(encode(_page()))
+    assert page.plain_text_title == "Ship it"
+    decoded = [name for name in page.properties if page.properties.is_decoded(name)]
+    assert decoded == ["Task name"]
+
+
+def test_page_without_title():
+    page = Page.model_validate(PayloadGenerator().page({"number": 1}))
+    assert page.title_property is None
+    assert page.plain_text_title == ""
+
+
+def test_title_follows_mutation():
+    page = Page.model_validate(_page())
+    assert page.plain_text_title == "Ship it"
+    page.title_property.title[1].plain_text = "that"
+    assert page.plain_text_title == "Ship that"
+    page.properties["Renamed"] = page.properties.pop("Task name")
+    assert page.plain_text_title == "Ship that"
+    page.properties["Renamed"] = TitleProperty.new("Done")
+    assert page.plain_text_title == "Done"
+
+
+def test_text_follows_an_item_replaced_in_place():
+    block = TypeAdapter(BlockObject).validate_python(PayloadGenerator().block("paragraph"))  # fmt: skip
+    rich_text = block.paragraph.rich_text
+    assert block.plain_text == "".join(t.plain_text for t in rich_text)
+    rich_text[0] = TitleProperty.new("other").title[0]
+    assert block.plain_text == "other" + "".join(t.plain_text for t in rich_text[1:])
+    title = TitleProperty.new("a")
+    title.title[0] = TitleProperty.new("b").title[0]
+    assert title.plain_text == "b"
+
+
+def test_plain_text_of_blocks_comments_and_properties():
+    gen = PayloadGenerator()
+    raw = gen.block("heading_2")
+    block = TypeAdapter(BlockObject).validate_python(raw)
+    assert block.plain_text == "".join(
+        t["plain_text"] for t in raw["heading_2"]["rich_text"]
+    )
+    block.heading_2.rich_text.clear()
+    assert block.plain_text == ""
+    assert TypeAdapter(BlockObject).validate_python(gen.block("divider")).plain_text == ""  # fmt: skip
+
+    comment = CommentObject.model_validate(gen.comment())
+    assert comment.plain_text == "".join(t.plain_text for t in comment.rich_text)
+    assert RichTextProperty.new_text("a b").plain_text == "a b"
+
+    database = Database.model_validate(gen.database())
+    assert database.plain_text_title == "".join(t.plain_text for t in database.title)
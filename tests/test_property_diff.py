@@ -0,0 +1,89 @@
+import json
+
+from pydantic_api.notion.models import (
+    Page,
+    TitleProperty,
+    NumberProperty,
+    StatusProperty,
+    RelationProperty,
+    READ_ONLY_PROPERTY_TYPES,
+    diff_page,
+    encode_request,
+    diff_properties,
+    property_fingerprint,
+    property_fingerprints,
+)
+from benchmarks.fixtures import PAGE_PROPERTY_TYPES, PayloadGenerator
+
+
+def _page() -> Page:
+    gen = PayloadGenerator(seed=0)
+    return Page.model_validate(gen.page({type_: 1 for type_ in PAGE_PROPERTY_TYPES}))
+
+
+def _name(page: Page, type_: str) -> str:
+    return next(name for name, prop in page.properties.items() if prop.type == type_)
+
+
+def test_an_unchanged_page_has_no_diff():
+    page = _page()
+    again = Page.model_validate_json(page.model_dump_json())
+    assert diff_properties(page, again) == {}
+    assert diff_page(page, again) is None
+    assert diff_properties(property_fingerprints(page), again) == {}
+
+
+def test_only_changed_writable_properties_are_sent():
+    page = _page()
+    desired = Page.model_validate_json(page.model_dump_json())
+    title, number = _name(page, "title"), _name(page, "number")
+    desired.properties[title] = TitleProperty.new("Renamed")
+    desired.properties[number] = NumberProperty(number=-1)
+    desired.properties[_name(page, "formula")].formula.number = -1
+    request = diff_page(page, desired)
+    assert request.page_id == page.id
+    assert set(request.properties) == {title, number}
+    assert set(json.loads(request.model_dump_json(exclude_none=True))["properties"]) == {title, number}  # fmt: skip
+
+
+def test_fingerprints_ignore_what_notion_fills_in():
+    page = _page()
+    title = page.properties[_name(page, "title")]
+    written = TitleProperty.new(title.plain_text)
+    assert written.id is None and written.title[0].annotations is None
+    assert title.title[0].plain_text is not None
+    assert property_fingerprint(written) == property_fingerprint(title)
+    status = page.properties[_name(page, "status")]
+    assert property_fingerprint(StatusProperty.refer(status.status.name)) == property_fingerprint(status)  # fmt: skip
+    assert property_fingerprint(status.model_dump()) == property_fingerprint(status)
+    assert all(property_fingerprint(page.properties[_name(page, t)]) is None for t in READ_ONLY_PROPERTY_TYPES)  # fmt: skip
+
+
+def test_desired_properties_as_payloads_and_truncated_relations():
+    page = _page()
+    relation = _name(page, "relation")
+    truncated = RelationProperty.new([page.id])
+    truncated.has_more = True
+    desired = {
+        _name(page, "status"): StatusProperty.new("Done").model_dump(),
+        relation: truncated,
+        "New": NumberProperty(number=1),
+    }
+    assert sorted(diff_properties(page, desired)) == sorted([_name(page, "status"), "New"])  # fmt: skip
+
+
+def test_cleared_values_are_sent_as_null():
+    page = _page()
+    desired = Page.model_validate_json(page.model_dump_json())
+    cleared = [_name(page, t) for t in ("date", "select", "number")]
+    for name in cleared:
+        prop = desired.properties[name]
+        setattr(prop, prop.type, None)
+    request = diff_page(page, desired)
+    assert set(request.properties) == set(cleared)
+    method, path, _, body = encode_request(request)
+    assert (method, path) == ("PATCH", f"/v1/pages/{page.id}")
+    properties = json.loads(body)["properties"]
+    for name in cleared:
+        type_ = page.properties[name].type
+        assert type_ in properties[name] and properties[name][type_] is None
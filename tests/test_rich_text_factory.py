@@ -0,0 +1,54 @@
+import pytest
+
+from pydantic_api.notion.models import (
+    RichTextObjectFactory,
+    utf16_len,
+    iter_text_chunks,
+)
+
+
+def test_utf16_len_counts_astral_characters_twice():
+    assert utf16_len("abc") == 3
+    assert utf16_len("中文") == 2
+    assert utf16_len("😻a") == 3
+
+
+@pytest.mark.parametrize(
+    "text", ["word " * 1000, "😻 中文 " * 700, "😻" * 3001, "x" * 4001]
+)
+def test_chunks_fit_the_utf16_limit_and_are_lossless(text):
+    chunks = list(iter_text_chunks(text))
+    assert "".join(chunks) == text
+    assert all(0 < utf16_len(chunk) <= 2000 for chunk in chunks)
+
+
+def test_chunks_end_after_the_separator():
+    assert list(iter_text_chunks("aaa bbb ccc", max_segment_len=8)) == [
+        "aaa bbb ",
+        "ccc",
+    ]
+    assert list(iter_text_chunks("abcdef", max_segment_len=4)) == ["abcd", "ef"]
+    assert list(iter_text_chunks("😻😻😻", max_segment_len=5)) == ["😻😻", "😻"]
+
+
+def test_new_text_keeps_link_and_annotations_on_every_segment():
+    segments = RichTextObjectFactory.new_text(
+        "lorem ipsum " * 500, link_url="https://example.com", bold=True
+    )
+    assert len(segments) == 4
+    for segment in segments:
+        assert str(segment.text.link.url) == "https://example.com/"
+        assert segment.annotations.bold
+    segments[0].annotations.italic = True
+    assert not segments[1].annotations.italic
+
+
+def test_iter_text_is_lazy():
+    segments = RichTextObjectFactory.iter_text("a " * 10_000, max_segment_len=10)
+    assert next(segments).text.content == "a a a a a "
+
+
+def test_new_texts_converts_each_string():
+    batches = RichTextObjectFactory.new_texts(["a", "", "b " * 1500], code=True)
+    assert [len(batch) for batch in batches] == [1, 0, 2]
+    assert all(segment.annotations.code for segment in batches[2])
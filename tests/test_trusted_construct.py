@@ -0,0 +1,84 @@
+import json
+import uuid
+
+import pytest
+from pydantic import ValidationError
+
+from pydantic_api.notion.models import (
+    Page,
+    BlockObject,
+    TrustedAdapter,
+    QueryDatabaseResponse,
+)
+from pydantic_api.notion.models.objects.block.block import OriginalSyncedBlock
+
+
+def _page(email: str = "someone@example.com") -> dict:
+    user = {"object": "user", "id": str(uuid.uuid4())}
+    return {
+        "object": "page",
+        "id": str(uuid.uuid4()),
+        "created_time": "2024-11-01T10:00:00.000Z",
+        "created_by": user,
+        "last_edited_time": "2024-11-01T10:00:00.000Z",
+        "last_edited_by": user,
+        "archived": False,
+        "in_trash": False,
+        "icon": {"type": "emoji", "emoji": "😻"},
+        "cover": None,
+        "parent": {"type": "database_id", "database_id": str(uuid.uuid4())},
+        "url": "https://www.notion.so/page",
+        "public_url": None,
+        "properties": {
+            "Email": {"id": "e", "type": "email", "email": email},
+            "Stage": {
+                "id": "s",
+                "type": "select",
+                "select": {"id": "1", "name": "Done", "color": "green"},
+            },
+        },
+    }
+
+
+def _response(pages: list[dict]) -> dict:
+    return {
+        "object": "list",
+        "results": pages,
+        "next_cursor": None,
+        "has_more": False,
+        "type": "page_or_database",
+        "page_or_database": {},
+        "request_id": str(uuid.uuid4()),
+    }
+
+
+def test_trusted_page_equals_validated_page():
+    data = _page()
+    page = TrustedAdapter(Page).construct_python(data)
+    assert page == Page.model_validate(data)
+    assert page.model_dump_json() == Page.model_validate(data).model_dump_json()
+
+
+def test_trusted_construct_resolves_nested_discriminators():
+    block = TrustedAdapter(BlockObject).construct_json(
+        json.dumps({"type": "synced_block", "synced_block": {"synced_from": None}})
+    )
+    assert isinstance(block, OriginalSyncedBlock)
+
+
+def test_trusted_construct_skips_validators():
+    response = TrustedAdapter(QueryDatabaseResponse).construct_python(
+        _response([_page(email="not-an-email")])
+    )
+    assert response.results[0].properties["Email"].email == "not-an-email"
+
+
+def test_sampled_items_are_validated():
+    adapter = TrustedAdapter(QueryDatabaseResponse, sample_rate=1.0)
+    with pytest.raises(ValidationError):
+        adapter.construct_json(json.dumps(_response([_page(email="not-an-email")])))
+
+
+def test_sample_rate_must_be_a_fraction():
+    with pytest.raises(ValueError):
+        TrustedAdapter(Page, sample_rate=2)
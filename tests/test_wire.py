@@ -0,0 +1,83 @@
+import json
+import uuid
+
+import pytest
+
+from pydantic_api.notion.models import (
+    Page,
+    TitleProperty,
+    DateProperty,
+    NumberProperty,
+    ParagraphBlock,
+    CreatePageRequest,
+    RetrievePageRequest,
+    QueryDatabaseRequest,
+    RetrieveBotUserRequest,
+    RetrieveCommentsRequest,
+    AppendBlockChildrenRequest,
+    UpdatePagePropertiesRequest,
+    RetrievePagePropertyItemRequest,
+    RetrieveBlockChildrenRequest,
+    WireRequest,
+    encode_request,
+    request_encoder,
+)
+from benchmarks.fixtures import PayloadGenerator
+
+
+def test_path_query_and_body_are_split():
+    block_id = str(uuid.uuid4())
+    request = AppendBlockChildrenRequest(block_id=block_id, children=[ParagraphBlock.new("x")])  # fmt: skip
+    method, path, query, body = encode_request(request)
+    assert (method, path, query) == ("PATCH", f"/v1/blocks/{block_id}/children", "")
+    assert json.loads(body) == json.loads(request.model_dump_json(exclude={"block_id"}, exclude_none=True))  # fmt: skip
+    assert b" " not in body.replace(b'"x"', b"")
+
+    page_id = uuid.uuid4()
+    assert encode_request(RetrievePageRequest(page_id=page_id, filter_properties=["iAk8", "b7 dh"])) == WireRequest(  # fmt: skip
+        "GET", f"/v1/pages/{page_id}", "filter_properties=iAk8&filter_properties=b7+dh", None  # fmt: skip
+    )
+    assert encode_request(RetrieveCommentsRequest(block_id=page_id, page_size=10)).query == f"block_id={page_id}&page_size=10"  # fmt: skip
+    assert encode_request(RetrieveBlockChildrenRequest(block_id=page_id.hex)).path == f"/v1/blocks/{page_id}/children"  # fmt: skip
+    assert encode_request(RetrievePagePropertyItemRequest(page_id=page_id, property_id="%3ABnv")).path.endswith("/properties/%3ABnv")  # fmt: skip
+    assert encode_request(RetrieveBotUserRequest()) == ("GET", "/v1/users/me", "", None)
+
+
+def test_body_keeps_the_given_fields_without_nested_none():
+    parent = {"type": "database_id", "database_id": uuid.uuid4()}
+    request = CreatePageRequest(parent=parent, properties={"Name": TitleProperty.new("Title")})  # fmt: skip
+    body = json.loads(encode_request(request).body)
+    assert list(body) == ["parent", "properties"]
+    assert "href" not in body["properties"]["Name"]["title"][0]
+
+    database_id = uuid.uuid4()
+    query = encode_request(QueryDatabaseRequest(database_id=database_id, page_size=5))
+    assert (query.method, query.path, query.body) == ("POST", f"/v1/databases/{database_id}/query", b'{"page_size":5}')  # fmt: skip
+
+    page = Page.model_validate(PayloadGenerator(seed=0).page())
+    update = UpdatePagePropertiesRequest(page_id=page.id)
+    assert encode_request(update).body == b"{}"
+    update.archived = True
+    assert encode_request(update).body == b'{"archived":true}'
+
+
+def test_encoders_are_compiled_once_per_class():
+    encoder = request_encoder(AppendBlockChildrenRequest)
+    assert request_encoder(AppendBlockChildrenRequest) is encoder
+    assert encoder.path_fields == ("block_id",)
+    assert encoder.body_fields == {"children", "after"}
+    with pytest.raises(TypeError):
+        encode_request(Page.model_validate(PayloadGenerator(seed=0).page()))
+
+
+def test_nulls_that_clear_a_value_are_sent():
+    page_id = uuid.uuid4()
+    assert encode_request(UpdatePagePropertiesRequest(page_id=page_id, icon=None)).body == b'{"icon":null}'  # fmt: skip
+    properties = {"Date": DateProperty(id="eb20", date=None), "Number": NumberProperty(number=None), "Title": TitleProperty.new("x")}  # fmt: skip
+    update = UpdatePagePropertiesRequest.model_validate({"page_id": page_id, "properties": properties, "cover": None})  # fmt: skip
+    body = json.loads(encode_request(update).body)
+    assert body["cover"] is None
+    assert body["properties"]["Date"] == {"id": "eb20", "type": "date", "date": None}
+    assert body["properties"]["Number"] == {"type": "number", "number": None}
+    # Nested `None` values are still dropped
+    assert "href" not in body["properties"]["Title"]["title"][0]